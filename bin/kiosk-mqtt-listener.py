@@ -39,6 +39,7 @@ from pulse.speaker import SpeakerConfig, check_speaker
 from pulse.stock_ticker import (
     TICKER_HOURS_MODES,
     StockTicker,
+    TickerQuote,
     annotate_staleness,
     parse_symbols,
     ticker_visible,
@@ -46,7 +47,9 @@ from pulse.stock_ticker import (
 )
 from pulse.utils import parse_bool, parse_int, sanitize_hostname_for_entity_id
 from pulse.weather_alerts import (
+    WeatherAlert,
     WeatherAlertClient,
+    banner_active,
     parse_banner_minutes,
     parse_exclusions,
     parse_min_severity,
@@ -121,6 +124,7 @@ class OverlayConfig:
     ticker_label_mode: str
     ticker_api_key: str | None
     ticker_stale_after: int  # seconds before a quote is marked stale (0 disables)
+    ticker_stream: bool  # push Finnhub trades into the bar during US sessions (needs the API key)
     weather_alerts_enabled: bool  # show a pill/banner for active NWS alerts (US only)
     weather_alerts_tiers: tuple[str, ...]  # subset of warning/watch/advisory/statement
     weather_alerts_min_severity: str  # NWS severity floor: extreme|severe|moderate|minor|unknown
@@ -566,6 +570,7 @@ def load_config() -> EnvConfig:
         ticker_label_mode=ticker_label_mode,
         ticker_api_key=(os.environ.get("PULSE_TICKER_API_KEY") or "").strip() or None,
         ticker_stale_after=max(0, parse_int(os.environ.get("PULSE_TICKER_STALE_AFTER"), 300)),
+        ticker_stream=parse_bool(os.environ.get("PULSE_TICKER_STREAM"), False),
         weather_alerts_enabled=parse_bool(os.environ.get("PULSE_WEATHER_ALERTS_ENABLED"), False),
         weather_alerts_tiers=parse_tiers(os.environ.get("PULSE_WEATHER_ALERTS_TIERS")),
         weather_alerts_min_severity=parse_min_severity(os.environ.get("PULSE_WEATHER_ALERTS_MIN_SEVERITY")),
@@ -865,6 +870,9 @@ class KioskMqttListener:
                     afterhours=self.overlay_config.ticker_afterhours,
                     api_key=self.overlay_config.ticker_api_key,
                     log=self.log,
+                    stream=self.overlay_config.ticker_stream,
+                    on_update=self._publish_ticker,
+                    poll_interval=self.overlay_config.ticker_interval,
                 )
             if (
                 self.overlay_config.weather_alerts_enabled
@@ -1054,6 +1062,8 @@ class KioskMqttListener:
         if not client or not state:
             return
         previous_ids: set[str] = set()
+        published: list[WeatherAlert] | None = None
+        banner_minutes = self.overlay_config.weather_alerts_banner_minutes
         # The first poll can't distinguish "just issued" from "already running when this
         # kiosk booted", so it never chimes — a display restarted mid-storm would otherwise
         # announce a warning everyone has been looking at for two days.
@@ -1062,7 +1072,6 @@ class KioskMqttListener:
             while not self._weather_alerts_stop_event.is_set():
                 try:
                     alerts = client.fetch()
-                    payload = [alert.as_dict() for alert in alerts]
                     current_ids = {alert.id for alert in alerts}
                     arrived = [alert for alert in alerts if alert.id not in previous_ids]
                     for alert in arrived:
@@ -1075,15 +1084,23 @@ class KioskMqttListener:
                         self.log(f"weather-alerts: {len(previous_ids - current_ids)} alert(s) cleared")
                     previous_ids = current_ids
                     first_poll = False
-                    change = state.set_weather_alerts(
-                        payload,
-                        banner_minutes=self.overlay_config.weather_alerts_banner_minutes,
+                    # An unchanged feed (304, or the same alerts reparsed) has nothing new for
+                    # the state, except that a timed banner ages out on a poll where nothing
+                    # else changes, so alerts still inside their window are always handed over.
+                    in_banner_window = banner_minutes > 0 and any(
+                        banner_active(alert.as_dict(), banner_minutes=banner_minutes) for alert in alerts
                     )
-                    # set_weather_alerts bumps only when the alert set or a banner window
-                    # changes, so a reissued-but-identical alert doesn't reload the photo
-                    # card every poll.
-                    if change.changed:
-                        self._emit_overlay_refresh(change.version, change.reason)
+                    if alerts != published or in_banner_window:
+                        published = alerts
+                        change = state.set_weather_alerts(
+                            [alert.as_dict() for alert in alerts],
+                            banner_minutes=banner_minutes,
+                        )
+                        # set_weather_alerts bumps only when the alert set or a banner window
+                        # changes, so a reissued-but-identical alert doesn't reload the photo
+                        # card every poll.
+                        if change.changed:
+                            self._emit_overlay_refresh(change.version, change.reason)
                 except Exception as exc:  # nosec B110 - never let a fetch error kill the loop
                     self.log(f"weather-alerts: poll loop error: {exc}")
                 if self._weather_alerts_stop_event.wait(self.overlay_config.weather_alerts_interval):
@@ -1152,45 +1169,55 @@ class KioskMqttListener:
         finally:
             self._speaker_offline_streak = 0
 
+    def _publish_ticker(self, quotes: list[TickerQuote]) -> str:
+        """Push quotes to the overlay (or hide the bar) and return the US session phase.
+
+        Called from the poll loop and, with streaming enabled, from the trade-stream thread
+        whenever a displayed price moves.
+        """
+        state = self.overlay_state
+        payload = [quote.as_dict() for quote in quotes]
+        # Derive the current US session from the freshest quotes (Yahoo's
+        # marketState honors holidays/half-days) and hide the bar entirely when
+        # the configured hours mode says it shouldn't show — pushing an empty
+        # ticker reclaims the strip rather than freezing a stale bar. The cache
+        # inside StockTicker keeps last-good quotes warm, so the bar repopulates
+        # the instant it becomes visible again.
+        phase = us_market_phase(payload)
+        if not state:
+            return phase
+        # Mark quotes the cache has been carrying for too long, so a provider
+        # that has quietly stopped answering shows up on the bar instead of
+        # looking like a market that stopped moving.
+        annotate_staleness(
+            payload,
+            stale_after=self.overlay_config.ticker_stale_after,
+            phase=phase,
+        )
+        visible = ticker_visible(self.overlay_config.ticker_hours, phase)
+        change = state.set_ticker(payload if visible else [])
+        # set_ticker bumps the version only when the symbol set changes — the bar
+        # first populating after boot, or flipping visible<->hidden here — so this
+        # emit moves the refresh sensor and the photo-card refetches, instead of
+        # re-publishing the same version (which the card ignores). Price-only
+        # updates while visible don't bump/emit.
+        if change.changed:
+            self._emit_overlay_refresh(change.version, change.reason)
+        return phase
+
     def _ticker_loop(self) -> None:
         ticker = self._stock_ticker
         state = self.overlay_state
         if not ticker or not state:
             return
-        mode = self.overlay_config.ticker_hours
         try:
             while not self._ticker_stop_event.is_set():
                 # Baseline the session on the wall clock, so a fetch error still paces the
                 # loop correctly instead of assuming the market is open; a successful fetch
-                # refines it from the live quotes below.
+                # refines it from the live quotes.
                 phase = us_market_phase()
                 try:
-                    quotes = ticker.fetch()
-                    payload = [quote.as_dict() for quote in quotes]
-                    # Derive the current US session from the freshest quotes (Yahoo's
-                    # marketState honors holidays/half-days) and hide the bar entirely when
-                    # the configured hours mode says it shouldn't show — pushing an empty
-                    # ticker reclaims the strip rather than freezing a stale bar. The cache
-                    # inside StockTicker keeps last-good quotes warm, so the bar repopulates
-                    # the instant it becomes visible again.
-                    phase = us_market_phase(payload)
-                    # Mark quotes the cache has been carrying for too long, so a provider
-                    # that has quietly stopped answering shows up on the bar instead of
-                    # looking like a market that stopped moving.
-                    annotate_staleness(
-                        payload,
-                        stale_after=self.overlay_config.ticker_stale_after,
-                        phase=phase,
-                    )
-                    visible = ticker_visible(mode, phase)
-                    change = state.set_ticker(payload if visible else [])
-                    # set_ticker bumps the version only when the symbol set changes — the bar
-                    # first populating after boot, or flipping visible<->hidden here — so this
-                    # emit moves the refresh sensor and the photo-card refetches, instead of
-                    # re-publishing the same version (which the card ignores). Price-only
-                    # updates while visible don't bump/emit.
-                    if change.changed:
-                        self._emit_overlay_refresh(change.version, change.reason)
+                    phase = self._publish_ticker(ticker.fetch())
                 except Exception as exc:  # nosec B110 - never let a fetch error kill the loop
                     self.log(f"ticker: fetch loop error: {exc}")
                 # Poll fast while any US session (pre/regular/post) is active, slow when fully
@@ -20,9 +20,11 @@ from pulse.assistant.calendar_manager import CalendarEventManager
 from pulse.assistant.calendar_sync import CalendarSyncService
 from pulse.assistant.config import AssistantConfig, AssistantPreferences
 from pulse.assistant.conversation_manager import ConversationManager, build_conversation_stop_prefixes
+from pulse.assistant.deadline_scheduler import DeadlineScheduler
 from pulse.assistant.earmuffs import EarmuffsManager
 from pulse.assistant.event_handlers import EventHandlerManager
 from pulse.assistant.home_assistant import HomeAssistantClient
+from pulse.assistant.info_prefetch import InfoPrefetcher
 from pulse.assistant.info_query_handler import InfoQueryHandler
 from pulse.assistant.info_service import InfoService
 from pulse.assistant.llm import SUPPORTED_PROVIDERS, LLMProvider, build_llm_provider_with_overrides
@@ -38,7 +40,9 @@ from pulse.assistant.schedule_intents import ScheduleIntentParser
 from pulse.assistant.schedule_service import ScheduleService
 from pulse.assistant.schedule_shortcuts import ScheduleShortcutHandler
 from pulse.assistant.scheduler import AssistantScheduler
+from pulse.assistant.tts_cache import TtsCache
 from pulse.assistant.wake_detector import WakeDetector, compute_rms
+from pulse.assistant.wyoming import WyomingClientPool
 from pulse.sound_library import SoundLibrary
 
 LOGGER = logging.getLogger("pulse-assistant")
@@ -52,6 +56,12 @@ class PulseAssistant:
         mic_bytes = config.mic.bytes_per_chunk
         self.mic = ArecordStream(config.mic.command, mic_bytes, LOGGER)
         self.player = AplaySink(logger=LOGGER)
+        self.tts_cache: TtsCache | None = None
+        if config.tts_cache.enabled:
+            self.tts_cache = TtsCache(config.tts_cache.directory, max_bytes=config.tts_cache.max_bytes, logger=LOGGER)
+        self.wyoming_pool: WyomingClientPool | None = None
+        if config.wyoming_keepalive:
+            self.wyoming_pool = WyomingClientPool(idle_timeout=config.wyoming_idle_timeout, logger=LOGGER)
         self.mqtt = AssistantMqtt(config.mqtt, logger=LOGGER)
         action_defs = load_action_definitions(config.action_file, config.inline_actions)
         self.actions = ActionEngine(action_defs)
@@ -63,10 +73,15 @@ class PulseAssistant:
             except ValueError as exc:
                 LOGGER.warning("[assistant] Home Assistant config invalid: %s", exc)
         self.info_service = InfoService(config.info, logger=LOGGER)
+        self.info_prefetcher: InfoPrefetcher | None = None
+        if config.info.prefetch:
+            self.info_prefetcher = InfoPrefetcher(self.info_service.sources, config.info)
         self.scheduler = AssistantScheduler(
             self.home_assistant, config.home_assistant, self._handle_scheduler_notification
         )
         schedule_path = self._determine_schedule_file()
+        # One deadline heap and waiter task for alarms, timers, reminders and calendar events.
+        self.deadlines: DeadlineScheduler[tuple[str, str]] = DeadlineScheduler(logger=LOGGER)
         self.schedule_service = ScheduleService(
             storage_path=schedule_path,
             hostname=self.config.hostname,
@@ -76,6 +91,7 @@ class PulseAssistant:
             sound_settings=self.config.sounds,
             skip_dates=set(self.config.work_pause.skip_dates),
             skip_weekdays=set(self.config.work_pause.skip_weekdays),
+            deadlines=self.deadlines,
         )
         self._sound_library = SoundLibrary(custom_dir=self.config.sounds.custom_dir)
 
@@ -120,19 +136,22 @@ class PulseAssistant:
             schedule_service=self.schedule_service,
             ooo_summary_marker=getattr(self.config.calendar, "ooo_summary_marker", "OOO"),
             calendar_enabled=self.config.calendar.enabled,
-            calendar_has_feeds=bool(self.config.calendar.feeds),
+            calendar_has_feeds=bool(self.config.calendar.feeds) or self.config.calendar.share_mode != "off",
             logger=LOGGER,
         )
         self.calendar_manager.set_events_changed_callback(self._on_calendar_events_changed)
 
         self.calendar_sync: CalendarSyncService | None = None
         if self.config.calendar.enabled:
-            if self.config.calendar.feeds:
+            if self.config.calendar.feeds or self.config.calendar.share_mode in {"follower", "auto"}:
                 self.calendar_sync = CalendarSyncService(
                     config=self.config.calendar,
                     trigger_callback=self.calendar_manager.trigger_calendar_reminder,
                     snapshot_callback=self.calendar_manager.handle_calendar_snapshot,
                     logger=logging.getLogger("pulse.calendar_sync"),
+                    deadlines=self.deadlines,
+                    mqtt=self.mqtt,
+                    hostname=self.config.hostname,
                 )
             else:
                 LOGGER.warning(
@@ -141,6 +160,7 @@ class PulseAssistant:
 
         self._shutdown = asyncio.Event()
         self._loop: asyncio.AbstractEventLoop | None = None
+        self._tts_warm_task: asyncio.Task[None] | None = None
         self._heartbeat_topic = f"{self.config.mqtt.topic_base}/assistant/heartbeat"
         self._self_audio_trigger_level = max(2, self.config.self_audio_trigger_level)
 
@@ -220,6 +240,8 @@ class PulseAssistant:
             scheduler=self.scheduler,
             player=self.player,
             sound_library=self._sound_library,
+            tts_cache=self.tts_cache,
+            wyoming_pool=self.wyoming_pool,
             logger=LOGGER,
         )
 
@@ -297,6 +319,10 @@ class PulseAssistant:
                 )
             else:
                 LOGGER.warning("[assistant] calendar_sync is None, cannot start calendar sync service")
+            if self.info_prefetcher:
+                await self.info_prefetcher.start()
+            if self.home_assistant and self.config.home_assistant.state_mirror:
+                await self.home_assistant.start_state_mirror()
 
             self.publisher._publish_preferences(
                 self.preferences,
@@ -317,6 +343,7 @@ class PulseAssistant:
             await self.mic.start()
             self.orchestrator._set_assist_stage("pulse", "idle")
             self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+            self._tts_warm_task = asyncio.create_task(self.orchestrator.warm_tts_cache())
             from pulse.systemd_notify import ready as sd_ready
 
             sd_ready()
@@ -357,15 +384,26 @@ class PulseAssistant:
                 await heartbeat
             except asyncio.CancelledError:
                 pass  # expected when cancelling the heartbeat task
+        tts_warm, self._tts_warm_task = self._tts_warm_task, None
+        if tts_warm:
+            tts_warm.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await tts_warm
         if self.calendar_sync:
             await self.calendar_sync.stop()
         await self.mic.stop()
         await self.schedule_service.stop()
+        await self.deadlines.close()
+        if self.info_prefetcher:
+            await self.info_prefetcher.stop()
+        await self.info_service.close()
         self.mqtt.disconnect()
         await self.player.stop()
         self.media_controller.cancel_media_resume_task()
         if self.home_assistant:
             await self.home_assistant.close()
+        if self.wyoming_pool:
+            await self.wyoming_pool.close()
 
     def _pipeline_for_wake_word(self, wake_word: str) -> str:
         return self.config.wake_routes.get(wake_word, "pulse")
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Benchmark alarm next-fire computation with many alarms and a long skip-date list."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--alarms", type=int, default=100, help="Number of recurring alarms")
+    parser.add_argument("--skip-days", type=int, default=365, help="Days ahead covered by the skip-date list")
+    parser.add_argument("--skip-ratio", type=float, default=0.9, help="Fraction of those days that are skipped")
+    parser.add_argument("--rounds", type=int, default=50, help="Timed rounds per scenario")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for alarm times and skip dates")
+    return parser.parse_args()
+
+
+def _timed(label: str, rounds: int, func) -> None:
+    func()  # warm caches
+    started = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    per_round = (time.perf_counter() - started) / rounds
+    print(f"{label:<48} {per_round * 1000:8.3f} ms/round")
+
+
+def main() -> None:
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+    # pylint: disable=import-outside-toplevel
+    from pulse.assistant.schedule_service import PlaybackConfig, ScheduledEvent, ScheduleService, _now
+    from pulse.overlay import _compute_next_n_alarm_fires
+
+    args = parse_args()
+    rng = random.Random(args.seed)
+    today = _now().date()
+    # Skip most days for the coming year (worst case for the search), plus one dismissal per alarm.
+    skip_dates = {
+        (today + timedelta(days=offset)).isoformat()
+        for offset in range(args.skip_days)
+        if rng.random() < args.skip_ratio
+    }
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        service = ScheduleService(storage_path=Path(tmpdir) / "schedules.json", hostname="bench", skip_dates=skip_dates)
+        alarms: list[dict] = []
+        for idx in range(args.alarms):
+            time_of_day = f"{rng.randrange(24):02d}:{rng.randrange(60):02d}"
+            days = sorted(rng.sample(range(7), rng.randint(1, 7)))
+            event = ScheduledEvent(
+                event_id=f"alarm-{idx}",
+                event_type="alarm",
+                label=None,
+                time_of_day=time_of_day,
+                repeat_days=days,
+                single_shot=False,
+                duration_seconds=None,
+                target_time=None,
+                next_fire=_now().isoformat(),
+                playback=PlaybackConfig(),
+                created_at=_now().isoformat(),
+            )
+            service._events[event.event_id] = event
+            service._dismissed_dates[event.event_id] = {(today + timedelta(days=rng.randrange(30))).isoformat()}
+            alarms.append({"time": time_of_day, "repeat_days": days})
+
+        def recompute_all() -> None:
+            for event in service._events.values():
+                service._compute_alarm_fire(event.time_of_day or "08:00", event.repeat_days, event_id=event.event_id)
+
+        def recompute_after_skip_change() -> None:
+            service._skip_ordinals = None  # what set_ooo_skip_dates / set_ui_pause_date do
+            recompute_all()
+
+        def overlay_cards() -> None:
+            for alarm in alarms:
+                _compute_next_n_alarm_fires(alarm, 12)
+
+        print(f"{args.alarms} alarms, {len(skip_dates)} skip dates, {args.rounds} rounds")
+        _timed("next fire for every alarm (cached skip index)", args.rounds, recompute_all)
+        _timed("next fire for every alarm (rebuilt skip index)", args.rounds, recompute_after_skip_change)
+        _timed("overlay: next 12 fires for every alarm", args.rounds, overlay_cards)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Benchmark resolving spoken entity names with a per-action linear scan versus the entity index."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+AREAS = ["kitchen", "living_room", "bedroom", "office", "garage", "hallway", "porch", "basement", "attic", "nursery"]
+DEVICES = {
+    "light": ["Ceiling Light", "Lamp", "Strip", "Pendant", "Spotlight"],
+    "switch": ["Outlet", "Heater", "Kettle", "Fountain"],
+    "fan": ["Fan", "Ceiling Fan"],
+    "sensor": ["Temperature", "Humidity", "Power", "Energy", "Illuminance", "Battery"],
+    "binary_sensor": ["Motion", "Door", "Window", "Occupancy"],
+}
+DOMAIN_WEIGHTS = {"light": 3, "switch": 2, "fan": 1, "sensor": 8, "binary_sensor": 4}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entities", type=int, default=3_000, help="Number of entities in the synthetic install")
+    parser.add_argument("--queries", type=int, default=500, help="Number of name lookups to time")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for names and queries")
+    return parser.parse_args()
+
+
+def _synthetic_states(count: int, rng: random.Random) -> list[dict]:
+    domains = [domain for domain, weight in DOMAIN_WEIGHTS.items() for _ in range(weight)]
+    states = []
+    for idx in range(count):
+        domain = rng.choice(domains)
+        area = rng.choice(AREAS)
+        device = rng.choice(DEVICES[domain])
+        friendly = f"{area.replace('_', ' ').title()} {device} {idx}"
+        entity_id = f"{domain}.{re.sub(r'[^a-z0-9]+', '_', friendly.lower())}"
+        states.append(
+            {"entity_id": entity_id, "state": "off", "attributes": {"friendly_name": friendly, "area_id": area}}
+        )
+    return states
+
+
+def _linear_resolve(states: list[dict], name: str, domain: str) -> list[str]:
+    """The per-action scan the index replaces: score every entity against every hint token."""
+    tokens = [t for t in re.split(r"[^a-z0-9]+", name.lower()) if t]
+    best: tuple[int, str] | None = None
+    for state in states:
+        entity_id = state["entity_id"]
+        if not entity_id.startswith(f"{domain}."):
+            continue
+        friendly = state["attributes"]["friendly_name"].lower()
+        area = state["attributes"]["area_id"]
+        score = 5 if name.lower() in friendly else 0
+        for token in tokens:
+            if token in friendly:
+                score += 3
+            elif token in area:
+                score += 2
+            elif token in entity_id:
+                score += 1
+        if score and (best is None or score > best[0]):
+            best = (score, entity_id)
+    return [best[1]] if best else []
+
+
+def _measure(label: str, func, repeat: int) -> None:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<32} {elapsed * 1000:9.2f} ms total  {elapsed / repeat * 1_000_000:9.1f} µs each")
+
+
+def main() -> None:
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+    # pylint: disable=import-outside-toplevel
+    from pulse.assistant.entity_index import EntityIndex, EntityIndexCache
+
+    args = parse_args()
+    rng = random.Random(args.seed)
+    states = _synthetic_states(args.entities, rng)
+    queries = []
+    for _ in range(args.queries):
+        domain = rng.choice(["light", "switch", "fan"])
+        queries.append((f"{rng.choice(AREAS).replace('_', ' ')} {rng.choice(DEVICES[domain]).lower()}", domain))
+    print(f"Synthetic install: {len(states)} entities, {len(queries)} queries")
+
+    lookups = iter(queries)
+    _measure("linear scan per action", lambda: _linear_resolve(states, *next(lookups)), len(queries))
+    _measure("index build", lambda: EntityIndex(states), 10)
+
+    index = EntityIndex(states)
+
+    def indexed() -> list[str]:
+        name, domain = next(lookups)
+        return index.resolve(domain, name=name)
+
+    lookups = iter(queries)
+    _measure("indexed resolve", indexed, len(queries))
+
+    cache = EntityIndexCache()
+    cache.for_states(states)
+    _measure("cache hit (REST fingerprint)", lambda: cache.for_states(states), 100)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Benchmark parsing a large ICS export with and without the streaming past-event filter."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=10_000, help="Number of VEVENTs in the synthetic feed")
+    parser.add_argument("--future-ratio", type=float, default=0.05, help="Fraction of events that are upcoming")
+    parser.add_argument("--chunk", type=int, default=65_536, help="Bytes per simulated network chunk")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for event times")
+    return parser.parse_args()
+
+
+def _synthetic_feed(count: int, future_ratio: float, rng: random.Random, now: datetime) -> bytes:
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//pulse//bench//EN"]
+    stamp = now.strftime("%Y%m%dT%H%M%SZ")
+    for idx in range(count):
+        roll = rng.random()
+        if roll < future_ratio:
+            start = now + timedelta(hours=rng.randrange(1, 24 * 14))
+            rule = None
+        elif roll < future_ratio + 0.1:
+            start = now - timedelta(days=rng.randrange(400, 3000))
+            until = start + timedelta(days=rng.randrange(30, 300))
+            rule = f"FREQ=WEEKLY;UNTIL={until.strftime('%Y%m%dT%H%M%SZ')}"
+        else:
+            start = now - timedelta(days=rng.randrange(3, 3000), minutes=rng.randrange(1440))
+            rule = None
+        end = start + timedelta(minutes=rng.choice((30, 60, 90)))
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:bench-{idx}@pulse",
+            f"DTSTAMP:{stamp}",
+            f"DTSTART:{start.strftime('%Y%m%dT%H%M%SZ')}",
+            f"DTEND:{end.strftime('%Y%m%dT%H%M%SZ')}",
+            f"SUMMARY:Synthetic event {idx}",
+            "DESCRIPTION:" + "Lorem ipsum dolor sit amet " * 4,
+        ]
+        if rule:
+            lines.append(f"RRULE:{rule}")
+        lines += ["BEGIN:VALARM", "ACTION:DISPLAY", "TRIGGER:-PT10M", "END:VALARM", "END:VEVENT"]
+    lines.append("END:VCALENDAR")
+    return ("\r\n".join(lines) + "\r\n").encode()
+
+
+def _measure(label: str, func) -> None:
+    tracemalloc.start()
+    started = time.perf_counter()
+    events = func()
+    elapsed = time.perf_counter() - started
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} {elapsed * 1000:9.1f} ms  peak {peak / 1_048_576:7.1f} MiB  {events:6d} events")
+
+
+def main() -> None:
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+    # pylint: disable=import-outside-toplevel
+    from icalendar import Calendar  # type: ignore[import-untyped]
+    from pulse.assistant.calendar_sync import STREAM_DISCARD_MARGIN
+    from pulse.assistant.ics_stream import IcsWindowFilter
+
+    args = parse_args()
+    now = datetime.now(UTC).replace(microsecond=0, tzinfo=None)
+    body = _synthetic_feed(args.events, args.future_ratio, random.Random(args.seed), now)
+    print(f"Synthetic feed: {args.events} events, {len(body) / 1_048_576:.1f} MiB")
+
+    def buffered() -> int:
+        return len(Calendar.from_ical(body).walk("VEVENT"))
+
+    def streamed() -> int:
+        ics_filter = IcsWindowFilter(now - STREAM_DISCARD_MARGIN)
+        parts = [ics_filter.feed(body[offset : offset + args.chunk]) for offset in range(0, len(body), args.chunk)]
+        parts.append(ics_filter.close())
+        return len(Calendar.from_ical(b"".join(parts)).walk("VEVENT"))
+
+    _measure("buffered from_ical", buffered)
+    _measure("streamed filter + from_ical", streamed)
+
+
+if __name__ == "__main__":
+    main()
@@ -26,10 +26,12 @@ for cross-device synchronization and reboot survival.
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
 import logging
 import re
-from collections.abc import Iterable
+from collections.abc import Awaitable, Callable, Hashable, Iterable
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -39,11 +41,15 @@ from unittest.mock import patch
 from pulse.audio import set_volume
 from pulse.datetime_utils import parse_datetime, parse_duration_seconds, utc_now
 
-from .home_assistant import HomeAssistantError, kelvin_to_mired
+from .entity_index import EntityIndex, EntityIndexCache
+from .home_assistant import HomeAssistantError, HomeAssistantStateMirror, kelvin_to_mired
 from .schedule_service import PlaybackConfig, parse_day_tokens
 
 LOGGER = logging.getLogger("pulse-assistant")
 
+# Entity-name indexes shared by every action; see entity_index.py.
+_ENTITY_INDEXES = EntityIndexCache()
+
 if TYPE_CHECKING:  # pragma: no cover
     from .home_assistant import HomeAssistantClient
     from .media_controller import MediaController
@@ -60,6 +66,8 @@ class ActionDefinition:
     payload: str
     retain: bool = False
     qos: int = 0
+    # Slugs that must finish first when they appear earlier in the same reply.
+    after: tuple[str, ...] = ()
 
     def to_prompt_dict(self) -> dict[str, str]:
         return {
@@ -92,6 +100,9 @@ def load_action_definitions(action_file: Path | None, inline_json: str | None) -
             continue
 
         description = str(candidate.get("description") or slug)
+        after = candidate.get("after") or ()
+        if isinstance(after, str):
+            after = (after,)
         action_type = (candidate.get("type") or "mqtt").lower()
         if action_type != "mqtt":
             # Only MQTT actions are supported for now
@@ -106,6 +117,7 @@ def load_action_definitions(action_file: Path | None, inline_json: str | None) -
                 payload=json.dumps(payload) if isinstance(payload, (dict, list)) else str(payload),
                 retain=bool(candidate.get("retain", False)),
                 qos=int(candidate.get("qos", 0)),
+                after=tuple(str(item).strip() for item in after if str(item).strip()),
             )
         )
     return definitions
@@ -151,39 +163,124 @@ class ActionEngine:
         schedule_service: ScheduleService | None = None,
         media_controller: MediaController | None = None,
     ) -> list[str]:
-        executed: list[str] = []
-
-        seen: set[str] = set()
+        """Run every action in ``tokens`` and return the slugs that were handled, in token order.
+
+        Actions on different targets (see ``_action_lanes``) run concurrently, so a reply that
+        dims a light, starts a timer and pauses music waits for the slowest round trip rather
+        than the sum. Actions sharing a target keep their token order, as do definitions whose
+        ``after`` names a slug earlier in the reply. A failing action is logged and left out
+        of the result without affecting the others.
+        """
+        runs: dict[str, asyncio.Task[bool]] = {}
+        lanes: dict[tuple[Hashable, ...], asyncio.Task[bool]] = {}
         for token in tokens:
             slug, arg_string = _split_action_token(token)
-            if not slug or slug in seen:
+            if not slug or slug in runs:
                 continue
-            seen.add(slug)
             definition = self._definitions.get(slug)
-            if not definition:
-                handled = await _maybe_execute_home_assistant_action(slug, arg_string, ha_client)
-                if handled:
-                    executed.append(slug)
-                continue
-            if definition.type == "mqtt" and mqtt_client:
-                mqtt_client.publish(
-                    definition.topic,
-                    definition.payload,
-                    retain=definition.retain,
-                    qos=definition.qos,
-                )
-                executed.append(slug)
-            elif definition.type == "ha":
-                handled = await _maybe_execute_home_assistant_action(slug, arg_string, ha_client)
-                if handled:
-                    executed.append(slug)
-            else:
-                handled = await _maybe_execute_scheduler_action(slug, arg_string, scheduler, schedule_service)
-                if not handled:
-                    handled = await _maybe_execute_media_action(slug, arg_string, media_controller)
-                if handled:
-                    executed.append(slug)
-        return executed
+            keys = waits_on = _action_lanes(slug, arg_string, definition)
+            if keys == (_HA_ANY,):
+                # A name-resolved target may be any entity, so it waits for every HA lane...
+                keys = waits_on = (_HA_ANY, *(key for key in lanes if key[0] == "ha"))
+            elif keys[0][0] == "ha":
+                # ...and every later HA action waits for it.
+                waits_on = (*keys, _HA_ANY)
+            waits = list({lanes[key] for key in waits_on if key in lanes})
+            if definition:
+                waits.extend(runs[dependency] for dependency in definition.after if dependency in runs)
+            action = functools.partial(
+                self._dispatch,
+                slug,
+                arg_string,
+                definition,
+                mqtt_client,
+                ha_client,
+                scheduler,
+                schedule_service,
+                media_controller,
+            )
+            runs[slug] = asyncio.create_task(_run_action(slug, action, waits))
+            for key in keys:
+                lanes[key] = runs[slug]
+        results = await asyncio.gather(*runs.values())
+        return [slug for slug, handled in zip(runs, results, strict=True) if handled]
+
+    async def _dispatch(
+        self,
+        slug: str,
+        arg_string: str,
+        definition: ActionDefinition | None,
+        mqtt_client,
+        ha_client: HomeAssistantClient | None,
+        scheduler: AssistantScheduler | None,
+        schedule_service: ScheduleService | None,
+        media_controller: MediaController | None,
+    ) -> bool:
+        if not definition:
+            # Built-in slugs: ha.* first, then the timer/reminder/media ones the prompt advertises.
+            if await _maybe_execute_home_assistant_action(slug, arg_string, ha_client):
+                return True
+        elif definition.type == "mqtt" and mqtt_client:
+            mqtt_client.publish(
+                definition.topic,
+                definition.payload,
+                retain=definition.retain,
+                qos=definition.qos,
+            )
+            return True
+        elif definition.type == "ha":
+            return await _maybe_execute_home_assistant_action(slug, arg_string, ha_client)
+        handled = await _maybe_execute_scheduler_action(slug, arg_string, scheduler, schedule_service)
+        if not handled:
+            handled = await _maybe_execute_media_action(slug, arg_string, media_controller)
+        return handled
+
+
+async def _run_action(slug: str, action: Callable[[], Awaitable[bool]], waits: list[asyncio.Task[bool]]) -> bool:
+    if waits:
+        await asyncio.wait(waits)
+    try:
+        return bool(await action())
+    except Exception as exc:
+        LOGGER.warning("[actions] Action %s failed: %s", slug, exc)
+        return False
+
+
+# Lane of an HA action whose target is only known after name resolution.
+_HA_ANY: tuple[Hashable, ...] = ("ha", None)
+
+
+def _action_lanes(slug: str, arg_string: str, definition: ActionDefinition | None) -> tuple[tuple[Hashable, ...], ...]:
+    """Keys of the lanes an action occupies; actions sharing a key must not run concurrently.
+
+    An HA action takes one lane per entity or scene ID it names, or ``_HA_ANY`` when it
+    names none and resolves its target by name.
+    """
+    if definition is not None and definition.type == "mqtt":
+        return (("mqtt", definition.topic),)
+    family = slug.split(".", 1)[0]
+    if family == "ha" or (definition is not None and definition.type == "ha"):
+        targets = dict.fromkeys(("ha", target.lower()) for target in _named_targets(arg_string))
+        return tuple(targets) or (_HA_ANY,)
+    if family in {"alarm", "timer", "reminder"}:
+        return (("schedule",),)
+    if family in {"media", "volume"}:
+        return (("media",),)
+    return ((family,),)
+
+
+def _named_targets(arg_string: str) -> list[str]:
+    """Entity and scene IDs spelled out in an action's arguments, bare or as entity_id=/scene=."""
+    targets = []
+    for segment in arg_string.split(","):
+        piece = segment.strip()
+        if "=" in piece:
+            key, value = piece.split("=", 1)
+            if key.strip() in {"entity_id", "scene"} and value.strip():
+                targets.append(value.strip())
+        elif piece and " " not in piece:
+            targets.append(piece)
+    return targets
 
 
 def _split_action_token(token: str) -> tuple[str, str]:
@@ -356,6 +453,17 @@ def _preferred_domains(args: dict[str, str]) -> list[str | None]:
     return ["light", "fan", "switch", None]
 
 
+async def _entity_index(ha_client: HomeAssistantClient, domain: str | None) -> tuple[EntityIndex, str | None]:
+    """Index to resolve against, plus the domain to scope lookups to within it.
+
+    The mirror index covers every entity. A REST listing is already filtered to ``domain``.
+    """
+    mirror = getattr(ha_client, "state_mirror", None)
+    if isinstance(mirror, HomeAssistantStateMirror) and mirror.ready:
+        return _ENTITY_INDEXES.for_mirror(mirror), domain
+    return _ENTITY_INDEXES.for_states(await ha_client.list_entities(domain)), None
+
+
 async def _resolve_entities(
     args: dict[str, str], ha_client: HomeAssistantClient, domain: str | None = None
 ) -> list[str]:
@@ -366,73 +474,12 @@ async def _resolve_entities(
     room_hint = args.get("room") or args.get("area") or args.get("group")
     name_hint = args.get("name")
     scope_all = str(args.get("all") or "").lower() in {"true", "1", "yes", "on"}
-    entities = await ha_client.list_entities(domain)
-    if scope_all:
-        return [e["entity_id"] for e in entities if e.get("entity_id")]
-    if not room_hint and not name_hint:
+    if not scope_all and not room_hint and not name_hint:
         return []
-
-    def _tokenize(text: str) -> list[str]:
-        return [t for t in re.split(r"[^a-z0-9]+", text.lower()) if t]
-
-    tokens: list[str] = []
-    if room_hint:
-        tokens.extend(_tokenize(room_hint))
-    if name_hint:
-        tokens.extend(_tokenize(name_hint))
-
-    def _score_entity(state: dict[str, Any]) -> int:
-        ent = state.get("entity_id") or ""
-        attrs = state.get("attributes") or {}
-        friendly = str(attrs.get("friendly_name") or ent).lower()
-        area = str(attrs.get("area_id") or "").lower()
-        score = 0
-        # Strong boost for exact name_hint substring in friendly name
-        if name_hint and name_hint.lower() in friendly:
-            score += 5
-        # Token matches across friendly, area, and entity_id
-        for token in tokens:
-            if token in friendly:
-                score += 3
-            elif token in area:
-                score += 2
-            elif token in ent.lower():
-                score += 1
-        return score
-
-    scored: list[tuple[int, str]] = []
-    for state in entities:
-        ent = state.get("entity_id")
-        if not ent:
-            continue
-        score = _score_entity(state)
-        if score > 0:
-            scored.append((score, ent))
-
-    if scored:
-        # Pick the top-scoring entity (or entities tied for top)
-        scored.sort(key=lambda pair: pair[0], reverse=True)
-        top_score = scored[0][0]
-        top_entities = [ent for score, ent in scored if score == top_score]
-        return [top_entities[0]] if top_entities else []
-
-    # Fallback: substring match on friendly/entity/area if scoring produced nothing
-    fallback_matches: list[str] = []
-    name_lower = name_hint.lower() if name_hint else ""
-    for state in entities:
-        ent = state.get("entity_id") or ""
-        attrs = state.get("attributes") or {}
-        friendly = str(attrs.get("friendly_name") or ent).lower()
-        area = str(attrs.get("area_id") or "").lower()
-        if name_lower and (name_lower in friendly or name_lower in ent.lower() or name_lower in area):
-            fallback_matches.append(ent)
-            continue
-        if tokens and any(token in ent.lower() for token in tokens):
-            fallback_matches.append(ent)
-    if fallback_matches:
-        return [fallback_matches[0]]
-
-    return []
+    index, scope = await _entity_index(ha_client, domain)
+    if scope_all:
+        return index.entity_ids(scope)
+    return index.resolve(scope, name=name_hint, room=room_hint)
 
 
 async def _resolve_light_entities(args: dict[str, str], ha_client: HomeAssistantClient) -> list[str]:
@@ -8,10 +8,14 @@ import logging
 import os
 import shutil
 import subprocess  # nosec B404 - subprocess used for audio helpers
+import time
 from asyncio.subprocess import Process
 
 from pulse import audio as pulse_audio
 
+# How long a pre-warmed output sink is trusted before ``start`` checks it again.
+SINK_PREWARM_TTL_SECONDS = 15.0
+
 
 class ArecordStream:
     """Capture PCM audio by shelling out to ``arecord`` (ALSA)."""
@@ -80,11 +84,20 @@ class AplaySink:
         self.binary = binary or "auto"
         self._proc: Process | None = None
         self._logger = logger or logging.getLogger(__name__)
+        self._prepared: tuple[dict[str, str], str | None, float] | None = None
+
+    async def prewarm(self, rate: int = 22050, width: int = 2, channels: int = 1) -> None:
+        """Resolve and wake the output sink off the event loop so the next ``start`` skips it."""
+        player_env, sink = await asyncio.to_thread(self._prepare_sink, rate, width, channels)
+        self._prepared = (player_env, sink, time.monotonic())
 
     async def start(self, rate: int, width: int, channels: int) -> None:
         await self.stop()
-        player_env, sink = _player_env_with_sink()
-        _warmup_sink(player_env, sink, rate, width, channels)
+        prepared = self._take_prepared()
+        if prepared is not None:
+            player_env, sink = prepared
+        else:
+            player_env, sink = self._prepare_sink(rate, width, channels)
         player = self._resolve_player()
         try:
             cmd = self._build_command(player, rate, width, channels)
@@ -143,6 +156,18 @@ class AplaySink:
     def _resolve_player(self) -> str:
         return _determine_player(self.binary, self._logger)
 
+    @staticmethod
+    def _prepare_sink(rate: int, width: int, channels: int) -> tuple[dict[str, str], str | None]:
+        player_env, sink = _player_env_with_sink()
+        _warmup_sink(player_env, sink, rate, width, channels)
+        return player_env, sink
+
+    def _take_prepared(self) -> tuple[dict[str, str], str | None] | None:
+        prepared, self._prepared = self._prepared, None
+        if prepared is None or time.monotonic() - prepared[2] > SINK_PREWARM_TTL_SECONDS:
+            return None
+        return prepared[0], prepared[1]
+
     @staticmethod
     def _build_command(player: str, rate: int, width: int, channels: int) -> list[str]:
         return _build_command_for_player(player, rate, width, channels)
@@ -4,10 +4,19 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import hashlib
+import json
 import logging
+import multiprocessing
+import os
+import random
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass, field
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field, fields, replace
 from datetime import UTC, date, datetime, time, timedelta
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 from urllib.parse import unquote, urlparse
 
 import httpx
@@ -15,9 +24,32 @@ import recurring_ical_events
 from icalendar import Calendar, Component  # type: ignore[import-untyped]
 
 from .config import CalendarConfig
+from .deadline_scheduler import DeadlineScheduler
+from .ics_stream import IcsWindowFilter
+
+if TYPE_CHECKING:
+    from .mqtt import AssistantMqtt
 
 LOGGER = logging.getLogger("pulse.calendar_sync")
 
+FEED_TIMEOUT_SECONDS = 45.0
+# Each feed's next poll is moved by up to this fraction of its interval so devices
+# sharing a calendar do not all hit the server at once.
+REFRESH_JITTER = 0.1
+# Feeds are expanded this far past the lookahead so an unchanged feed can reuse the
+# result for a day before the window has to be expanded again.
+EXPANSION_MARGIN = timedelta(hours=24)
+CACHE_VERSION = 1
+# Events that ended more than this long before now are dropped while streaming. The
+# margin covers the 1 h look-back and any TZID offset, since the filter compares wall-clock times.
+STREAM_DISCARD_MARGIN = timedelta(days=2)
+SHARE_VERSION = 2
+# A shared payload older than this many max-refresh intervals means the leader is gone.
+SHARE_STALE_INTERVALS = 3
+# How long an "auto" device listens for an existing leader before claiming the role.
+SHARE_CLAIM_SECONDS = 10.0
+_REMINDER_DATETIME_FIELDS = ("start", "end", "trigger_time")
+
 
 def _now() -> datetime:
     return datetime.now().astimezone()
@@ -58,12 +90,28 @@ def _guess_google_calendar_email(feed_url: str) -> str | None:
     return calendar_id.lower()
 
 
+def _url_owner_tokens(url: str) -> set[str]:
+    """Owner identity that can be read off the feed URL itself (Google ICS links)."""
+    guessed = _guess_google_calendar_email(url)
+    token = _normalize_attendee_identifier(guessed) if guessed else ""
+    return {token} if token else set()
+
+
 def _owner_tokens_for_feed(url: str, config: CalendarConfig) -> set[str]:
     tokens = {_normalize_attendee_identifier(email) for email in config.attendee_emails if email}
-    guessed = _guess_google_calendar_email(url)
-    if guessed:
-        tokens.add(_normalize_attendee_identifier(guessed))
-    return {token for token in tokens if token}
+    return {token for token in tokens if token} | _url_owner_tokens(url)
+
+
+def _share_feed_id(url: str) -> str:
+    """Opaque key for a feed in the shared payload; private ICS URLs embed their access secret."""
+    return hashlib.sha256(url.encode()).hexdigest()[:16]
+
+
+def _shared_owner_tokens(entry: dict[str, Any]) -> set[str]:
+    tokens = entry.get("owner_tokens")
+    if not isinstance(tokens, list):
+        return set()
+    return {token for token in tokens if isinstance(token, str) and token}
 
 
 @dataclass(slots=True, frozen=True)
@@ -83,6 +131,37 @@ class CalendarReminder:
     url: str | None = None
     sequence: int | None = None
     declined: bool = False
+    # Attendees (normalized emails) who declined, so other devices can apply their own owner emails.
+    declined_by: tuple[str, ...] = ()
+
+
+def _reminder_to_dict(reminder: CalendarReminder) -> dict[str, Any]:
+    payload = {item.name: getattr(reminder, item.name) for item in fields(CalendarReminder)}
+    for name in _REMINDER_DATETIME_FIELDS:
+        if payload[name] is not None:
+            payload[name] = payload[name].isoformat()
+    return payload
+
+
+def _reminder_from_dict(payload: dict[str, Any]) -> CalendarReminder:
+    end = payload.get("end")
+    sequence = payload.get("sequence")
+    return CalendarReminder(
+        uid=str(payload["uid"]),
+        summary=str(payload["summary"]),
+        description=payload.get("description"),
+        location=payload.get("location"),
+        start=datetime.fromisoformat(payload["start"]),
+        end=datetime.fromisoformat(end) if end is not None else None,
+        all_day=bool(payload["all_day"]),
+        trigger_time=datetime.fromisoformat(payload["trigger_time"]),
+        calendar_name=payload.get("calendar_name"),
+        source_url=str(payload["source_url"]),
+        url=payload.get("url"),
+        sequence=int(sequence) if sequence is not None else None,
+        declined=bool(payload.get("declined", False)),
+        declined_by=tuple(payload.get("declined_by") or ()),
+    )
 
 
 @dataclass(slots=True)
@@ -93,192 +172,56 @@ class _FeedState:
     calendar_name: str | None = None
     label: str | None = None
     active_keys: set[str] = field(default_factory=set)
+    # Scheduled reminder keys per event UID, so a rescheduled event cancels its old triggers in O(1).
+    uid_keys: dict[str, set[str]] = field(default_factory=dict)
+    # This feed's slice of the overlay window, keyed by (uid, start).
+    window: dict[tuple[str, datetime], CalendarReminder] = field(default_factory=dict)
     owner_tokens: set[str] = field(default_factory=set)
+    body: bytes | None = None
+    content_hash: str | None = None
+    expanded: _ExpandedFeed | None = None
+    interval: float = 0.0
+    next_due: float = 0.0  # event-loop time of the next poll
 
 
-class CalendarSyncService:
-    """Poll ICS/WebCal feeds and trigger reminders before each event."""
+def _read_cache_file(path: Path) -> dict[str, Any]:
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(payload, dict):
+        raise ValueError("cache root is not an object")
+    return payload
 
-    def __init__(
-        self,
-        *,
-        config: CalendarConfig,
-        trigger_callback: Callable[[CalendarReminder], Awaitable[None]],
-        logger: logging.Logger | None = None,
-        snapshot_callback: Callable[[list[CalendarReminder]], Awaitable[None]] | None = None,
-    ) -> None:
-        self._config = config
-        self._trigger_callback = trigger_callback
-        self._snapshot_callback = snapshot_callback
-        self._logger = logger or LOGGER
-        self._client: httpx.AsyncClient | None = None
-        self._runner: asyncio.Task | None = None
-        self._stop_event = asyncio.Event()
-        self._feed_states = {
-            url: _FeedState(
-                url=url,
-                owner_tokens=_owner_tokens_for_feed(url, config),
-                label=f"calendar {idx + 1}",
-            )
-            for idx, url in enumerate(config.feeds)
-        }
-        self._scheduled: dict[str, asyncio.Task] = {}
-        self._scheduled_reminders: dict[str, CalendarReminder] = {}
-        self._key_to_feed: dict[str, str] = {}
-        self._triggered: dict[str, datetime] = {}
-        self._latest_events: list[CalendarReminder] = []
-        self._last_sync_started: datetime | None = None
-        self._last_sync_completed: datetime | None = None
-        self._retry_tasks: dict[str, asyncio.Task] = {}
-        self._failed_feeds: set[str] = set()
-        self._windowed_events: dict[str, CalendarReminder] = {}
 
-    async def start(self) -> None:
-        if not self._config.feeds:
-            self._logger.warning("[calendar] Calendar sync start() called but no feeds configured")
-            return
-        if self._runner:
-            return
-        self._stop_event.clear()
-        # Keep per-request timeouts tight so a slow network (e.g., while music
-        # is streaming) cannot stall the sync loop.
-        self._client = httpx.AsyncClient(
-            follow_redirects=True,
-            timeout=httpx.Timeout(25.0, connect=8.0, read=18.0, write=12.0, pool=12.0),
-        )
-        self._runner = asyncio.create_task(self._run_loop())
+def _write_cache_file(path: Path, payload: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(payload, encoding="utf-8")
+    os.replace(tmp_path, path)
 
-    async def stop(self) -> None:
-        self._stop_event.set()
-        runner = self._runner
-        self._runner = None
-        if runner:
-            runner.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await runner
-        for task in list(self._scheduled.values()):
-            task.cancel()
-        self._scheduled.clear()
-        self._scheduled_reminders.clear()
-        self._key_to_feed.clear()
-        for task in list(self._retry_tasks.values()):
-            task.cancel()
-        self._retry_tasks.clear()
-        self._failed_feeds.clear()
-        if self._client:
-            await self._client.aclose()
-            self._client = None
 
-    async def _run_loop(self) -> None:
-        refresh_seconds = max(1, self._config.refresh_minutes) * 60
-        while not self._stop_event.is_set():
-            try:
-                await asyncio.wait_for(self._sync_once(), timeout=30.0)
-            except TimeoutError:
-                # Avoid noisy tracebacks when a slow sync exceeds the loop budget
-                self._logger.warning("[calendar] Calendar sync loop timed out after 30s; continuing")
-            except Exception:
-                self._logger.exception("[calendar] Calendar sync loop failed; continuing")
-            try:
-                await asyncio.wait_for(self._stop_event.wait(), timeout=refresh_seconds)
-            except TimeoutError:
-                pass
-            if self._stop_event.is_set():
-                break
-            now = _now()
-            stale_after = refresh_seconds * 2 + 10
-            if not self._last_sync_completed or (now - self._last_sync_completed).total_seconds() > stale_after:
-                last_start = self._last_sync_started.isoformat() if self._last_sync_started else "never"
-                last_done = self._last_sync_completed.isoformat() if self._last_sync_completed else "never"
-                self._logger.warning(
-                    "[calendar] Calendar sync has not completed in %d seconds (last_start=%s, last_done=%s)",
-                    stale_after,
-                    last_start,
-                    last_done,
-                )
+class _ReminderParser:
+    """Turn a parsed ICS calendar into reminders.
 
-    async def _sync_once(self) -> None:
-        now = _now()
-        self._last_sync_started = now
-        self._prune_triggered(now)
-        self._windowed_events.clear()
-        for state in self._feed_states.values():
-            feed_label = self._feed_label(state)
-            try:
-                await asyncio.wait_for(self._sync_feed(state, now), timeout=60.0)
-            except TimeoutError:
-                self._logger.warning("[calendar] Calendar sync timed out for feed '%s'", feed_label)
-            except Exception:
-                self._logger.exception("[calendar] Calendar sync failed for feed '%s'", feed_label)
-        try:
-            await self._emit_event_snapshot()
-        except Exception:
-            self._logger.exception("[calendar] Calendar snapshot emit failed")
-        else:
-            self._last_sync_completed = _now()
+    Holds only the calendar config, so it can be rebuilt in the parse worker process.
+    """
 
-    async def _sync_feed(self, state: _FeedState, now: datetime) -> None:
-        if not self._client:
-            return
-        feed_label = self._feed_label(state)
-        headers: dict[str, str] = {}
-        if state.etag:
-            headers["If-None-Match"] = state.etag
-        if state.last_modified:
-            headers["If-Modified-Since"] = state.last_modified
-        try:
-            response = await self._client.get(state.url, headers=headers)
-        except httpx.ReadTimeout as exc:
-            self._logger.warning("[calendar] Calendar fetch timed out for '%s': %s", feed_label, exc)
-            self._schedule_retry(state.url)
-            return
-        except httpx.HTTPError as exc:
-            self._logger.warning("[calendar] Calendar fetch failed for '%s': %s", feed_label, exc)
-            self._schedule_retry(state.url)
-            return
-        if response.status_code == 304:
-            # Successful response (not modified) - clear any retry
-            self._cancel_retry(state.url)
-            return
-        if response.status_code >= 400:
-            self._logger.warning("[calendar] Calendar fetch returned %s for '%s'", response.status_code, feed_label)
-            self._schedule_retry(state.url)
-            return
-        # Successful fetch - clear any retry
-        self._cancel_retry(state.url)
-        state.etag = response.headers.get("etag") or state.etag
-        state.last_modified = response.headers.get("last-modified") or state.last_modified
-        try:
-            calendar = Calendar.from_ical(response.content)
-        except Exception as exc:
-            self._logger.warning("[calendar] Calendar parse failed for '%s': %s", feed_label, exc)
-            self._schedule_retry(state.url)
-            return
-        calendar_name = calendar.get("X-WR-CALNAME")
-        if calendar_name:
-            state.calendar_name = str(calendar_name)
-            state.label = state.calendar_name
-        reminders = self._collect_reminders(calendar, state, now)
-        if not reminders:
-            self._logger.debug(
-                "[calendar] Calendar feed '%s' produced no reminders at %s",
-                self._feed_label(state),
-                now.isoformat(),
-            )
-        await self._schedule_reminders(state, reminders, now)
+    def __init__(self, config: CalendarConfig, logger: logging.Logger | None = None) -> None:
+        self._config = config
+        self._logger = logger or LOGGER
 
     def _collect_reminders(
         self,
         calendar: Component,
         state: _FeedState,
         now: datetime,
+        window_end: datetime | None = None,
     ) -> list[CalendarReminder]:
         reminders: list[CalendarReminder] = []
         # Expand recurring events (RRULE/RDATE/EXDATE) within the lookahead window.
         # Use a 1-hour backward buffer so events that started recently but haven't
         # ended yet are still captured (_process_vevent filters truly past events).
         window_start = now - timedelta(hours=1)
-        window_end = now + timedelta(hours=self._config.lookahead_hours)
+        if window_end is None:
+            window_end = now + timedelta(hours=self._config.lookahead_hours)
         try:
             expanded = recurring_ical_events.of(calendar).between(window_start, window_end)
         except Exception:
@@ -328,7 +271,8 @@ class CalendarSyncService:
         uid = component.get("UID")
         if not uid:
             return []
-        declined = self._event_declined(component, state.owner_tokens)
+        declined_by = self._declined_attendees(component)
+        declined = bool(state.owner_tokens.intersection(declined_by))
         summary = str(component.get("SUMMARY") or "Calendar event").strip() or "Calendar event"
         try:
             start_value = component.decoded("DTSTART")
@@ -386,6 +330,7 @@ class CalendarSyncService:
                 url=url,
                 sequence=int(sequence) if sequence is not None else None,
                 declined=declined,
+                declined_by=declined_by,
             )
             reminders.append(reminder)
         return reminders
@@ -443,7 +388,8 @@ class CalendarSyncService:
         url = str(component.get("URL")).strip() if component.get("URL") else None
         sequence = component.get("SEQUENCE")
         # VTODO might not have attendees, but check anyway
-        declined = self._event_declined(component, state.owner_tokens)
+        declined_by = self._declined_attendees(component)
+        declined = bool(state.owner_tokens.intersection(declined_by))
         triggers = self._extract_alarm_triggers(component, start_dt, now.tzinfo or UTC)
         # Merge default notifications with VALARM triggers, avoiding duplicates
         trigger_times = {trigger for trigger in triggers if trigger}
@@ -477,6 +423,7 @@ class CalendarSyncService:
                 url=url,
                 sequence=int(sequence) if sequence is not None else None,
                 declined=declined,
+                declined_by=declined_by,
             )
             reminders.append(reminder)
         return reminders
@@ -484,24 +431,28 @@ class CalendarSyncService:
     def _event_declined(self, component, owner_tokens: set[str]) -> bool:
         if not owner_tokens:
             return False
+        return bool(owner_tokens.intersection(self._declined_attendees(component)))
+
+    def _declined_attendees(self, component) -> tuple[str, ...]:
         attendees = component.get("ATTENDEE")
         if not attendees:
-            return False
+            return ()
         if not isinstance(attendees, list):
             attendees = [attendees]
+        declined: list[str] = []
         for attendee in attendees:
             params = getattr(attendee, "params", {}) or {}
             email_param = params.get("EMAIL")
             identifier = _normalize_attendee_identifier(email_param) or _normalize_attendee_identifier(attendee)
-            if not identifier or identifier not in owner_tokens:
+            if not identifier:
                 continue
             partstat = params.get("PARTSTAT")
             if isinstance(partstat, bytes):
                 partstat = partstat.decode("utf-8", errors="ignore")
             partstat = str(partstat or "").strip().upper()
-            if partstat == "DECLINED":
-                return True
-        return False
+            if partstat == "DECLINED" and identifier not in declined:
+                declined.append(identifier)
+        return tuple(declined)
 
     def _extract_alarm_triggers(
         self,
@@ -553,17 +504,432 @@ class CalendarSyncService:
             return datetime.combine(value, time.min, tzinfo=tzinfo), True
         return None, False
 
+
+@dataclass(slots=True)
+class _ExpandedFeed:
+    """A feed's reminders expanded up to ``window_end``, reusable until the lookahead passes it."""
+
+    content_hash: str
+    calendar_name: str | None
+    window_end: datetime
+    reminders: list[CalendarReminder]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "content_hash": self.content_hash,
+            "calendar_name": self.calendar_name,
+            "window_end": self.window_end.isoformat(),
+            "reminders": [_reminder_to_dict(reminder) for reminder in self.reminders],
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> _ExpandedFeed:
+        return cls(
+            content_hash=str(payload["content_hash"]),
+            calendar_name=payload.get("calendar_name"),
+            window_end=datetime.fromisoformat(payload["window_end"]),
+            reminders=[_reminder_from_dict(item) for item in payload.get("reminders", [])],
+        )
+
+
+def _expand_feed(
+    config: CalendarConfig,
+    state: _FeedState,
+    body: bytes,
+    content_hash: str,
+    now: datetime,
+    window_end: datetime,
+) -> _ExpandedFeed:
+    """Parse an ICS body and expand its reminders; runs in the parse worker process."""
+    calendar = Calendar.from_ical(body)
+    calendar_name = calendar.get("X-WR-CALNAME")
+    if calendar_name:
+        state.calendar_name = str(calendar_name)
+    reminders = _ReminderParser(config)._collect_reminders(calendar, state, now, window_end)
+    return _ExpandedFeed(content_hash, state.calendar_name, window_end, reminders)
+
+
+class CalendarSyncService(_ReminderParser):
+    """Poll ICS/WebCal feeds and trigger reminders before each event.
+
+    With ``share_mode`` set, one device in the fleet (the leader) fetches and expands the
+    feeds and publishes the expanded reminders as a retained MQTT payload; followers
+    schedule from that payload instead of polling. Declined and hidden events are decided
+    on each device from its own owner emails.
+    """
+
+    def __init__(
+        self,
+        *,
+        config: CalendarConfig,
+        trigger_callback: Callable[[CalendarReminder], Awaitable[None]],
+        logger: logging.Logger | None = None,
+        snapshot_callback: Callable[[list[CalendarReminder]], Awaitable[None]] | None = None,
+        deadlines: DeadlineScheduler[tuple[str, str]] | None = None,
+        parse_executor: Executor | None = None,
+        mqtt: AssistantMqtt | None = None,
+        hostname: str = "",
+    ) -> None:
+        super().__init__(config, logger)
+        self._trigger_callback = trigger_callback
+        self._snapshot_callback = snapshot_callback
+        self._client: httpx.AsyncClient | None = None
+        self._runner: asyncio.Task | None = None
+        self._stop_event = asyncio.Event()
+        self._feed_states = {
+            url: _FeedState(
+                url=url,
+                owner_tokens=_owner_tokens_for_feed(url, config),
+                label=f"calendar {idx + 1}",
+            )
+            for idx, url in enumerate(config.feeds)
+        }
+        # Reminder deadlines share one heap-backed scheduler instead of a sleeping task each.
+        self._owns_deadlines = deadlines is None
+        self._deadlines: DeadlineScheduler[tuple[str, str]] = deadlines or DeadlineScheduler(
+            clock=lambda: _now(), logger=self._logger
+        )
+        self._scheduled_reminders: dict[str, CalendarReminder] = {}
+        self._key_to_feed: dict[str, str] = {}
+        self._triggered: dict[str, datetime] = {}
+        self._latest_events: list[CalendarReminder] = []
+        self._last_sync_started: datetime | None = None
+        self._last_sync_completed: datetime | None = None
+        self._retry_tasks: dict[str, asyncio.Task] = {}
+        self._failed_feeds: set[str] = set()
+        # Set when any feed's window changed since the last snapshot (starts set so the
+        # first snapshot is always published).
+        self._window_changed = True
+        self._fetch_slots = asyncio.Semaphore(max(1, config.max_concurrent_feeds))
+        # ICS parsing and RRULE expansion are pure CPU; they run in a worker process
+        # (created by start()) so the event loop never blocks on icalendar.
+        self._owns_parse_executor = parse_executor is None
+        self._parse_executor = parse_executor
+        self._cache_dirty = False
+        # Fleet sharing. "auto" devices start as followers and claim leadership when no
+        # fresh payload from another device shows up.
+        self._mqtt = mqtt
+        self._hostname = hostname
+        self._sharing = config.share_mode != "off"
+        self._share_role = {"off": "off", "leader": "leader"}.get(config.share_mode, "follower")
+        # Leaders expand without the hide-declined filter; each device applies it in _localize().
+        self._parse_config = replace(config, hide_declined_events=False) if self._sharing else config
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._share_leader: str | None = None
+        self._share_revision = 0
+        self._share_seen_at: float | None = None  # event-loop time the leader's payload was current
+        self._share_digest: str | None = None
+        self._share_published_at: float | None = None
+
+    async def start(self) -> None:
+        if not self._config.feeds and self._share_role != "follower":
+            self._logger.warning("[calendar] Calendar sync start() called but no feeds configured")
+            return
+        if self._runner:
+            return
+        self._stop_event.clear()
+        self._loop = asyncio.get_running_loop()
+        await self._restore_from_cache()
+        if self._config.feeds:
+            if self._parse_executor is None:
+                # Processes are spawned on the first parse, not here.
+                self._parse_executor = ProcessPoolExecutor(
+                    max_workers=1, mp_context=multiprocessing.get_context("spawn")
+                )
+            # Keep per-request timeouts tight so a slow network (e.g., while music
+            # is streaming) cannot stall the sync loop.
+            self._client = httpx.AsyncClient(
+                follow_redirects=True,
+                timeout=httpx.Timeout(25.0, connect=8.0, read=18.0, write=12.0, pool=12.0),
+            )
+        self._subscribe_shared()
+        self._runner = asyncio.create_task(self._run_loop())
+
+    async def stop(self) -> None:
+        self._stop_event.set()
+        self._loop = None
+        runner = self._runner
+        self._runner = None
+        if runner:
+            runner.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await runner
+        if self._owns_deadlines:
+            await self._deadlines.close()
+        else:
+            for key in self._scheduled_reminders:
+                self._deadlines.cancel(("calendar", key))
+        self._scheduled_reminders.clear()
+        self._key_to_feed.clear()
+        for state in self._feed_states.values():
+            state.active_keys.clear()
+            state.uid_keys.clear()
+        for task in list(self._retry_tasks.values()):
+            task.cancel()
+        self._retry_tasks.clear()
+        self._failed_feeds.clear()
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+        if self._owns_parse_executor and self._parse_executor is not None:
+            self._parse_executor.shutdown(wait=False, cancel_futures=True)
+            self._parse_executor = None
+
+    async def _run_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        stale_after = max(1, self._config.max_refresh_minutes) * 60 * 2 + 10
+        if self._config.share_mode == "auto":
+            # Give a retained payload from an existing leader a chance to arrive first.
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._stop_event.wait(), timeout=SHARE_CLAIM_SECONDS)
+        while not self._stop_event.is_set():
+            await self._review_share_role()
+            if self._share_role == "follower":
+                try:
+                    await self._refresh_shared_window()
+                except Exception:
+                    self._logger.exception("[calendar] Shared calendar refresh failed; continuing")
+                wait = max(1, self._config.refresh_minutes) * 60.0
+            else:
+                due = [state for state in self._feed_states.values() if state.next_due <= loop.time()]
+                if due:
+                    try:
+                        await self._sync_once(due)
+                    except Exception:
+                        self._logger.exception("[calendar] Calendar sync loop failed; continuing")
+                next_due = min((state.next_due for state in self._feed_states.values()), default=0.0)
+                # A feed whose schedule was not advanced (e.g. the cycle failed) is retried a minute later.
+                wait = next_due - loop.time() if next_due > loop.time() else 60.0
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=wait)
+            except TimeoutError:
+                pass
+            if self._stop_event.is_set():
+                break
+            now = _now()
+            if not self._last_sync_completed or (now - self._last_sync_completed).total_seconds() > stale_after:
+                last_start = self._last_sync_started.isoformat() if self._last_sync_started else "never"
+                last_done = self._last_sync_completed.isoformat() if self._last_sync_completed else "never"
+                self._logger.warning(
+                    "[calendar] Calendar sync has not completed in %d seconds (last_start=%s, last_done=%s)",
+                    stale_after,
+                    last_start,
+                    last_done,
+                )
+
+    async def _sync_once(self, states: list[_FeedState] | None = None) -> None:
+        """Sync ``states`` (default: every feed) concurrently, then publish the merged window."""
+        now = _now()
+        self._last_sync_started = now
+        self._prune_triggered(now)
+        targets = list(self._feed_states.values()) if states is None else states
+        await asyncio.gather(*(self._sync_feed_bounded(state, now) for state in targets))
+        await self._save_cache()
+        self._publish_shared()
+        try:
+            await self._emit_event_snapshot()
+        except Exception:
+            self._logger.exception("[calendar] Calendar snapshot emit failed")
+        else:
+            self._last_sync_completed = _now()
+
+    async def _sync_feed_bounded(self, state: _FeedState, now: datetime) -> None:
+        feed_label = self._feed_label(state)
+        changed: bool | None = None
+        try:
+            async with self._fetch_slots:
+                changed = await asyncio.wait_for(self._sync_feed(state, now), timeout=FEED_TIMEOUT_SECONDS)
+        except TimeoutError:
+            self._logger.warning("[calendar] Calendar sync timed out for feed '%s'", feed_label)
+        except Exception:
+            self._logger.exception("[calendar] Calendar sync failed for feed '%s'", feed_label)
+        self._plan_refresh(state, changed if isinstance(changed, bool) else None)
+
+    def _plan_refresh(self, state: _FeedState, changed: bool | None) -> None:
+        """Pick the feed's next poll: reset on change, back off while unchanged, keep on failure."""
+        base = max(1, self._config.refresh_minutes) * 60.0
+        ceiling = max(base, self._config.max_refresh_minutes * 60.0)
+        if changed or not state.interval:
+            state.interval = base
+        elif changed is False:
+            state.interval = min(ceiling, state.interval * 2)
+        jitter = random.uniform(-REFRESH_JITTER, REFRESH_JITTER) * state.interval  # nosec B311 - not crypto
+        state.next_due = asyncio.get_running_loop().time() + state.interval + jitter
+
+    async def _sync_feed(self, state: _FeedState, now: datetime) -> bool | None:
+        """Fetch and apply one feed; returns whether its content changed, or ``None`` on failure."""
+        if not self._client:
+            return None
+        feed_label = self._feed_label(state)
+        headers: dict[str, str] = {}
+        lookahead_end = now + timedelta(hours=self._config.lookahead_hours)
+        # A feed restored from the disk cache has no body; once its expansion no longer
+        # covers the lookahead a 304 would be useless, so fetch it unconditionally.
+        revalidate = state.body is not None or (
+            state.expanded is not None and state.expanded.window_end >= lookahead_end
+        )
+        if state.etag and revalidate:
+            headers["If-None-Match"] = state.etag
+        if state.last_modified and revalidate:
+            headers["If-Modified-Since"] = state.last_modified
+        body: bytes | None = None
+        content_hash: str | None = None
+        try:
+            async with self._client.stream("GET", state.url, headers=headers) as response:
+                if 200 <= response.status_code < 300:
+                    body, content_hash = await self._read_body(state, response, now)
+        except httpx.ReadTimeout as exc:
+            self._logger.warning("[calendar] Calendar fetch timed out for '%s': %s", feed_label, exc)
+            self._schedule_retry(state.url)
+            return None
+        except httpx.HTTPError as exc:
+            self._logger.warning("[calendar] Calendar fetch failed for '%s': %s", feed_label, exc)
+            self._schedule_retry(state.url)
+            return None
+        if response.status_code == 304:
+            # Successful response (not modified) - clear any retry
+            self._cancel_retry(state.url)
+            content_hash, changed = state.content_hash, False
+        elif response.status_code >= 300 or body is None:
+            self._logger.warning("[calendar] Calendar fetch returned %s for '%s'", response.status_code, feed_label)
+            self._schedule_retry(state.url)
+            return None
+        else:
+            # Successful fetch - clear any retry
+            self._cancel_retry(state.url)
+            etag = response.headers.get("etag") or state.etag
+            last_modified = response.headers.get("last-modified") or state.last_modified
+            if (etag, last_modified) != (state.etag, state.last_modified):
+                state.etag, state.last_modified = etag, last_modified
+                self._cache_dirty = True
+            changed = content_hash != state.content_hash
+        expanded = state.expanded
+        if changed or expanded is None or expanded.window_end < lookahead_end:
+            source = body if body is not None else state.body
+            if source is None or content_hash is None:
+                return False
+            try:
+                expanded = await self._expand(state, source, content_hash, now, lookahead_end + EXPANSION_MARGIN)
+            except Exception as exc:
+                self._logger.warning("[calendar] Calendar parse failed for '%s': %s", feed_label, exc)
+                self._schedule_retry(state.url)
+                return None
+            state.body, state.content_hash, state.expanded = source, content_hash, expanded
+            self._cache_dirty = True
+        if expanded.calendar_name:
+            state.calendar_name = expanded.calendar_name
+            state.label = state.calendar_name
+        reminders = expanded.reminders
+        if not reminders:
+            self._logger.debug(
+                "[calendar] Calendar feed '%s' produced no reminders at %s",
+                self._feed_label(state),
+                now.isoformat(),
+            )
+        await self._schedule_reminders(state, self._localize(state, reminders), now)
+        return changed
+
+    async def _read_body(self, state: _FeedState, response: httpx.Response, now: datetime) -> tuple[bytes, str]:
+        """Stream the body through the ICS window filter; returns (filtered body, hash of the raw body)."""
+        digest = hashlib.sha256()
+        cutoff = now.astimezone(UTC).replace(tzinfo=None) - STREAM_DISCARD_MARGIN
+        ics_filter = IcsWindowFilter(cutoff)
+        body = bytearray()
+        async for chunk in response.aiter_bytes():
+            digest.update(chunk)
+            body += ics_filter.feed(chunk)
+        body += ics_filter.close()
+        if ics_filter.dropped:
+            self._logger.debug(
+                "[calendar] Dropped %d past event(s) from '%s' while streaming (%d kept)",
+                ics_filter.dropped,
+                self._feed_label(state),
+                ics_filter.kept,
+            )
+        return bytes(body), digest.hexdigest()
+
+    async def _restore_from_cache(self) -> None:
+        """Schedule reminders and publish a snapshot from the disk cache before any network I/O."""
+        path = self._config.cache_file
+        if path is None:
+            return
+        try:
+            payload = await asyncio.to_thread(_read_cache_file, path)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as exc:
+            self._logger.warning("[calendar] Ignoring unreadable calendar cache %s: %s", path, exc)
+            return
+        if payload.get("version") != CACHE_VERSION:
+            return
+        now = _now()
+        restored = 0
+        for url, entry in (payload.get("feeds") or {}).items():
+            state = self._feed_states.get(url)
+            if state is None and self._share_role == "follower" and isinstance(entry, dict):
+                state = self._state_for_url(url)
+                state.owner_tokens |= _shared_owner_tokens(entry)
+            if state is None or not isinstance(entry, dict) or state.expanded is not None:
+                continue
+            try:
+                expanded = _ExpandedFeed.from_dict(entry["expanded"])
+            except (KeyError, TypeError, ValueError) as exc:
+                self._logger.debug("[calendar] Skipping cached feed '%s': %s", self._feed_label(state), exc)
+                continue
+            state.etag = entry.get("etag")
+            state.last_modified = entry.get("last_modified")
+            state.content_hash = expanded.content_hash
+            state.expanded = expanded
+            if expanded.calendar_name:
+                state.calendar_name = state.label = expanded.calendar_name
+            await self._schedule_reminders(state, self._localize(state, expanded.reminders), now)
+            restored += 1
+        if restored:
+            self._logger.info("[calendar] Restored %d calendar feed(s) from %s", restored, path)
+            await self._emit_event_snapshot()
+
+    async def _save_cache(self) -> None:
+        path = self._config.cache_file
+        if path is None or not self._cache_dirty:
+            return
+        self._cache_dirty = False
+        feeds = {
+            state.url: {
+                "etag": state.etag,
+                "last_modified": state.last_modified,
+                "owner_tokens": sorted(state.owner_tokens),
+                "expanded": state.expanded.to_dict(),
+            }
+            for state in self._feed_states.values()
+            if state.expanded is not None
+        }
+        payload = json.dumps({"version": CACHE_VERSION, "feeds": feeds}, separators=(",", ":"))
+        try:
+            await asyncio.to_thread(_write_cache_file, path, payload)
+        except OSError as exc:
+            self._logger.warning("[calendar] Failed to write calendar cache %s: %s", path, exc)
+
+    async def _expand(
+        self, state: _FeedState, body: bytes, content_hash: str, now: datetime, window_end: datetime
+    ) -> _ExpandedFeed:
+        # Ship a stripped copy of the state; the worker only needs the feed identity.
+        snapshot = _FeedState(url=state.url, calendar_name=state.calendar_name, owner_tokens=set(state.owner_tokens))
+        job = partial(_expand_feed, self._parse_config, snapshot, body, content_hash, now, window_end)
+        return await asyncio.get_running_loop().run_in_executor(self._parse_executor, job)
+
     async def _schedule_reminders(
         self,
         state: _FeedState,
         reminders: list[CalendarReminder],
         now: datetime,
     ) -> None:
+        """Apply a feed's current reminders as a diff against what is already scheduled."""
         lookahead_end = now + timedelta(hours=self._config.lookahead_hours)
         valid_keys: set[str] = set()
+        window: dict[tuple[str, datetime], CalendarReminder] = {}
         # First pass: collect all valid reminders and their trigger times per UID
         valid_reminders: list[CalendarReminder] = []
-        uids_to_schedule: dict[str, dict[str, set[datetime]]] = {}  # uid -> {source_url: {trigger_times}}
+        uids_to_schedule: dict[str, set[datetime]] = {}
         skipped_past_events = 0
         skipped_past_triggers = 0
         skipped_beyond_lookahead = 0
@@ -575,10 +941,10 @@ class CalendarSyncService:
                 continue
             include_in_window = reminder.start <= lookahead_end or reminder.trigger_time <= lookahead_end
             if include_in_window and not reminder.declined:
-                window_key = self._window_key(reminder)
-                existing = self._windowed_events.get(window_key)
+                window_key = (reminder.uid, reminder.start)
+                existing = window.get(window_key)
                 if not existing or reminder.trigger_time < existing.trigger_time:
-                    self._windowed_events[window_key] = reminder
+                    window[window_key] = reminder
             trigger_time = reminder.trigger_time
             if trigger_time < now - timedelta(minutes=1):
                 skipped_past_triggers += 1
@@ -592,38 +958,31 @@ class CalendarSyncService:
             key = self._reminder_key(reminder)
             valid_keys.add(key)
             # Track this UID and its trigger time
-            if reminder.uid not in uids_to_schedule:
-                uids_to_schedule[reminder.uid] = {}
-            if reminder.source_url not in uids_to_schedule[reminder.uid]:
-                uids_to_schedule[reminder.uid][reminder.source_url] = set()
-            uids_to_schedule[reminder.uid][reminder.source_url].add(trigger_time)
+            uids_to_schedule.setdefault(reminder.uid, set()).add(trigger_time)
             if key in self._triggered:
                 continue
-            if key in self._scheduled:
+            if key in self._scheduled_reminders:
                 continue
             valid_reminders.append(reminder)
         # Cancel old reminders for UIDs we're about to schedule
         # This handles the case where an event time changed
-        for uid, url_to_times in uids_to_schedule.items():
-            for source_url, trigger_times in url_to_times.items():
-                self._cancel_old_reminders_for_uid(uid, source_url, trigger_times, state)
+        for uid, trigger_times in uids_to_schedule.items():
+            self._cancel_old_reminders_for_uid(uid, state.url, trigger_times, state)
         # Now schedule all valid reminders
         for reminder in valid_reminders:
             key = self._reminder_key(reminder)
-            task = asyncio.create_task(self._await_and_fire(key, reminder))
-            self._scheduled[key] = task
-            self._scheduled_reminders[key] = reminder
-            self._key_to_feed[key] = state.url
-            state.active_keys.add(key)
-        stale_keys = state.active_keys - valid_keys
-        for key in stale_keys:
-            task = self._scheduled.pop(key, None)  # type: ignore[arg-type]
-            if task:
-                task.cancel()
-            self._scheduled_reminders.pop(key, None)
-            self._key_to_feed.pop(key, None)
-        state.active_keys = {key for key in valid_keys if key in self._scheduled}
-        if reminders and not valid_reminders:
+            self._log_scheduled(reminder)
+            self._deadlines.schedule(
+                ("calendar", key), reminder.trigger_time, partial(self._fire_reminder, key, reminder)
+            )
+            self._track_reminder(state, key, reminder)
+        for key in state.active_keys - valid_keys:
+            self._deadlines.cancel(("calendar", key))
+            self._forget_reminder(key)
+        if window != state.window:
+            state.window = window
+            self._window_changed = True
+        if reminders and not valid_keys:
             self._logger.warning(
                 "[calendar] Calendar feed '%s' had %d reminder(s) but none were scheduled "
                 "(past events=%d, past triggers=%d, beyond lookahead=%d)",
@@ -634,7 +993,27 @@ class CalendarSyncService:
                 skipped_beyond_lookahead,
             )
 
-    async def _await_and_fire(self, key: str, reminder: CalendarReminder) -> None:
+    def _track_reminder(self, state: _FeedState, key: str, reminder: CalendarReminder) -> None:
+        self._scheduled_reminders[key] = reminder
+        self._key_to_feed[key] = state.url
+        state.active_keys.add(key)
+        state.uid_keys.setdefault(reminder.uid, set()).add(key)
+
+    def _forget_reminder(self, key: str) -> None:
+        reminder = self._scheduled_reminders.pop(key, None)
+        feed_url = self._key_to_feed.pop(key, None)
+        state = self._feed_states.get(feed_url) if feed_url else None
+        if state is None:
+            return
+        state.active_keys.discard(key)
+        if reminder is not None:
+            keys = state.uid_keys.get(reminder.uid)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del state.uid_keys[reminder.uid]
+
+    def _log_scheduled(self, reminder: CalendarReminder) -> None:
         delay = (reminder.trigger_time - _now()).total_seconds()
         if delay > 0:
             self._logger.info(
@@ -651,15 +1030,10 @@ class CalendarSyncService:
                 reminder.uid,
                 reminder.trigger_time.isoformat(),
             )
-        if delay > 0:
-            try:
-                await asyncio.wait_for(self._stop_event.wait(), timeout=delay)
-                self._logger.debug("[calendar] Reminder '%s' cancelled by stop event", reminder.summary)
-                return
-            except TimeoutError:
-                pass
+
+    async def _fire_reminder(self, key: str, reminder: CalendarReminder) -> None:
         if self._stop_event.is_set():
-            self._logger.debug("[calendar] Reminder '%s' skipped (stop event set after delay)", reminder.summary)
+            self._logger.debug("[calendar] Reminder '%s' skipped (stop event set)", reminder.summary)
             return
         try:
             if not reminder.declined:
@@ -681,13 +1055,7 @@ class CalendarSyncService:
                 reminder.summary,
             )
         finally:
-            self._scheduled.pop(key, None)
-            self._scheduled_reminders.pop(key, None)
-            feed_url = self._key_to_feed.pop(key, None)
-            if feed_url:
-                state = self._feed_states.get(feed_url)
-                if state:
-                    state.active_keys.discard(key)
+            self._forget_reminder(key)
             self._triggered[key] = reminder.start
 
     def _prune_triggered(self, now: datetime) -> None:
@@ -699,9 +1067,6 @@ class CalendarSyncService:
     def _reminder_key(self, reminder: CalendarReminder) -> str:
         return f"{reminder.source_url}|{reminder.uid}|{reminder.trigger_time.isoformat()}"
 
-    def _window_key(self, reminder: CalendarReminder) -> str:
-        return f"{reminder.source_url}|{reminder.uid}|{reminder.start.isoformat()}"
-
     def _cancel_old_reminders_for_uid(
         self,
         uid: str,
@@ -714,24 +1079,27 @@ class CalendarSyncService:
         This handles the case where an event time changed - we need to cancel the old reminder(s)
         and schedule new one(s) with the updated time.
         """
-        keys_to_cancel: list[str] = []
-        for key, scheduled_reminder in self._scheduled_reminders.items():
-            # Only cancel reminders from the same source URL and UID
-            if scheduled_reminder.source_url != source_url or scheduled_reminder.uid != uid:
-                continue
+        for key in list(state.uid_keys.get(uid, ())):
+            scheduled_reminder = self._scheduled_reminders.get(key)
             # Cancel if the trigger time is different from any of the new trigger times
+            if scheduled_reminder is None or scheduled_reminder.source_url != source_url:
+                continue
             if scheduled_reminder.trigger_time not in new_trigger_times:
-                keys_to_cancel.append(key)
-        for key in keys_to_cancel:
-            task = self._scheduled.pop(key, None)  # type: ignore[arg-type]
-            if task:
-                task.cancel()
-            self._scheduled_reminders.pop(key, None)
-            self._key_to_feed.pop(key, None)
-            state.active_keys.discard(key)
+                self._deadlines.cancel(("calendar", key))
+                self._forget_reminder(key)
+
+    def _merged_window(self) -> list[CalendarReminder]:
+        return sorted(
+            (reminder for state in self._feed_states.values() for reminder in state.window.values()),
+            key=lambda reminder: (reminder.start, reminder.trigger_time),
+        )
 
     async def _emit_event_snapshot(self) -> None:
-        ordered = sorted(self._windowed_events.values(), key=lambda reminder: (reminder.start, reminder.trigger_time))
+        """Publish the merged window, but only if some feed's window changed since the last call."""
+        if not self._window_changed:
+            return
+        self._window_changed = False
+        ordered = self._merged_window()
         if not ordered:
             self._logger.debug(
                 "[calendar] No upcoming calendar events found within the next %d hour(s)",
@@ -785,6 +1153,7 @@ class CalendarSyncService:
             await self._sync_feed(state, now)
             # Emit snapshot after retry to update any changes
             await self._emit_event_snapshot()
+            self._publish_shared()
         except asyncio.CancelledError:
             pass
         except Exception:
@@ -793,6 +1162,210 @@ class CalendarSyncService:
         finally:
             self._retry_tasks.pop(feed_url, None)
 
+    # ------------------------------------------------------------------
+    # Fleet sharing
+    # ------------------------------------------------------------------
+
+    def _localize(self, state: _FeedState, reminders: list[CalendarReminder]) -> list[CalendarReminder]:
+        """Apply this device's owner emails and hide-declined setting to shared or cached reminders."""
+        if not self._sharing:
+            return reminders
+        localized: list[CalendarReminder] = []
+        for reminder in reminders:
+            declined = bool(state.owner_tokens.intersection(reminder.declined_by))
+            if declined and self._config.hide_declined_events:
+                continue
+            if declined != reminder.declined:
+                reminder = replace(reminder, declined=declined)
+            localized.append(reminder)
+        return localized
+
+    def _state_for_url(self, url: str) -> _FeedState:
+        state = self._feed_states.get(url)
+        if state is None:
+            state = _FeedState(
+                url=url,
+                owner_tokens=_owner_tokens_for_feed(url, self._config),
+                label=f"calendar {len(self._feed_states) + 1}",
+            )
+            self._feed_states[url] = state
+        return state
+
+    def _share_stale_after(self) -> float:
+        return SHARE_STALE_INTERVALS * max(1, self._config.max_refresh_minutes) * 60.0
+
+    def _subscribe_shared(self) -> None:
+        if not self._sharing:
+            return
+        if self._mqtt is None:
+            self._logger.warning("[calendar] Calendar sharing needs MQTT; sharing is disabled")
+            return
+        if self._config.share_mode == "leader":
+            return
+        try:
+            self._mqtt.subscribe(self._config.share_topic, self.handle_shared_message)
+        except RuntimeError as exc:
+            self._logger.warning("[calendar] Could not subscribe to shared calendar topic: %s", exc)
+
+    def handle_shared_message(self, payload: str) -> None:
+        """MQTT callback for the shared calendar topic; hands the payload to the event loop."""
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            data = json.loads(payload)
+        except json.JSONDecodeError:
+            self._logger.debug("[calendar] Ignoring malformed shared calendar payload")
+            return
+        if isinstance(data, dict):
+            asyncio.run_coroutine_threadsafe(self._apply_shared(data), loop)
+
+    async def _apply_shared(self, payload: dict[str, Any]) -> None:
+        try:
+            await self._apply_shared_payload(payload)
+        except Exception:
+            self._logger.exception("[calendar] Failed to apply shared calendar payload")
+
+    async def _apply_shared_payload(self, payload: dict[str, Any]) -> None:
+        leader = str(payload.get("leader") or "")
+        if payload.get("version") != SHARE_VERSION or not leader or leader == self._hostname:
+            return
+        try:
+            revision = int(payload.get("revision") or 0)
+            published_at = datetime.fromisoformat(str(payload["published_at"]))
+        except (KeyError, TypeError, ValueError):
+            self._logger.debug("[calendar] Ignoring shared calendar payload without revision/published_at")
+            return
+        if self._share_role == "leader":
+            if self._config.share_mode != "auto" or leader > self._hostname:
+                self._logger.debug("[calendar] Ignoring shared calendar from %s; this device leads", leader)
+                return
+            self._logger.info("[calendar] Deferring to shared calendar leader %s", leader)
+            self._share_role = "follower"
+            self._share_digest = None
+        elif self._share_role != "follower":
+            return
+        age = max(0.0, (_now() - published_at).total_seconds())
+        if age < self._share_stale_after():
+            self._share_seen_at = asyncio.get_running_loop().time() - age
+            self._last_sync_completed = _now()
+        if leader == self._share_leader and revision <= self._share_revision:
+            return
+        feeds = payload.get("feeds")
+        if not isinstance(feeds, dict):
+            return
+        now = _now()
+        # A shared feed this device also polls keeps its local state (and URL) as the key.
+        local_urls = {_share_feed_id(url): url for url in self._config.feeds}
+        applied: set[str] = set()
+        for feed_id, entry in feeds.items():
+            try:
+                expanded = _ExpandedFeed.from_dict(entry)
+            except (KeyError, TypeError, ValueError) as exc:
+                self._logger.debug("[calendar] Skipping shared feed %s: %s", feed_id, exc)
+                continue
+            url = local_urls.get(str(feed_id), str(feed_id))
+            expanded.reminders = [replace(reminder, source_url=url) for reminder in expanded.reminders]
+            state = self._state_for_url(url)
+            state.owner_tokens |= _shared_owner_tokens(entry)
+            state.content_hash, state.expanded = expanded.content_hash, expanded
+            if expanded.calendar_name:
+                state.calendar_name = state.label = expanded.calendar_name
+            elif isinstance(entry.get("label"), str):
+                state.label = entry["label"]
+            await self._schedule_reminders(state, self._localize(state, expanded.reminders), now)
+            applied.add(url)
+        for url in [url for url in self._feed_states if url not in applied]:
+            await self._drop_shared_feed(url, now)
+        self._share_leader, self._share_revision = leader, revision
+        self._logger.info(
+            "[calendar] Applied shared calendar revision %d from %s (%d feed(s))", revision, leader, len(applied)
+        )
+        self._cache_dirty = True
+        await self._save_cache()
+        await self._emit_event_snapshot()
+
+    async def _drop_shared_feed(self, url: str, now: datetime) -> None:
+        state = self._feed_states[url]
+        state.expanded = None
+        await self._schedule_reminders(state, [], now)
+        if url not in self._config.feeds:
+            del self._feed_states[url]
+
+    async def _refresh_shared_window(self) -> None:
+        """Re-evaluate the last shared payload against the clock, as a poll would for a local feed."""
+        now = _now()
+        self._prune_triggered(now)
+        for state in list(self._feed_states.values()):
+            if state.expanded is not None:
+                await self._schedule_reminders(state, self._localize(state, state.expanded.reminders), now)
+        await self._emit_event_snapshot()
+
+    async def _review_share_role(self) -> None:
+        """Promote an "auto" follower that has local feeds once the leader's payload goes stale."""
+        if self._config.share_mode != "auto" or self._share_role != "follower" or not self._config.feeds:
+            return
+        loop = asyncio.get_running_loop()
+        if self._share_seen_at is not None and loop.time() - self._share_seen_at < self._share_stale_after():
+            return
+        self._logger.info("[calendar] No current shared calendar from another device; taking over as leader")
+        self._share_role = "leader"
+        self._share_leader = None
+        self._share_revision = 0
+        now = _now()
+        for url in [url for url in self._feed_states if url not in self._config.feeds]:
+            await self._drop_shared_feed(url, now)
+        for state in self._feed_states.values():
+            state.next_due = 0.0
+
+    def _publish_shared(self) -> None:
+        """Publish the expanded feeds (retained) when they changed, or as a heartbeat."""
+        if self._share_role != "leader" or self._mqtt is None:
+            return
+        expanded = {
+            url: state.expanded
+            for url, state in sorted(self._feed_states.items())
+            if url in self._config.feeds and state.expanded is not None
+        }
+        if not expanded:
+            return
+        fingerprint = [f"{url} {item.content_hash} {item.window_end.isoformat()}" for url, item in expanded.items()]
+        digest = hashlib.sha256("\n".join(fingerprint).encode()).hexdigest()
+        loop_time = asyncio.get_running_loop().time()
+        heartbeat = max(1, self._config.max_refresh_minutes) * 60.0
+        if (
+            digest == self._share_digest
+            and self._share_published_at is not None
+            and loop_time - self._share_published_at < heartbeat
+        ):
+            return
+        now = _now()
+        if digest != self._share_digest:
+            self._share_digest = digest
+            self._share_revision = max(self._share_revision + 1, int(now.timestamp() * 1000))
+        # Feeds are keyed by an opaque ID: the payload is retained on the broker, and the URL
+        # would hand every subscriber the feed's secret. Followers only need the owner tokens.
+        feeds: dict[str, Any] = {}
+        for url, item in expanded.items():
+            feed_id = _share_feed_id(url)
+            entry = item.to_dict()
+            for reminder in entry["reminders"]:
+                # Declined is decided per device from declined_by.
+                reminder["declined"] = False
+                reminder["source_url"] = feed_id
+            entry["owner_tokens"] = sorted(_url_owner_tokens(url))
+            entry["label"] = self._feed_states[url].label
+            feeds[feed_id] = entry
+        payload = {
+            "version": SHARE_VERSION,
+            "leader": self._hostname,
+            "revision": self._share_revision,
+            "published_at": now.isoformat(),
+            "feeds": feeds,
+        }
+        self._mqtt.publish(self._config.share_topic, json.dumps(payload, separators=(",", ":")), retain=True, qos=1)
+        self._share_published_at = loop_time
+
     def _feed_label(self, state: _FeedState | None) -> str:
         if not state:
             return "calendar"
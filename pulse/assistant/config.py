@@ -30,6 +30,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Literal, cast
 
+from pulse.datetime_utils import parse_time_of_day
 from pulse.location_resolver import resolve_location_defaults
 from pulse.sound_library import SoundSettings
 from pulse.utils import (
@@ -202,6 +203,7 @@ class HomeAssistantConfig:
     timer_entity: str | None
     reminder_service: str | None
     presence_entity: str | None
+    state_mirror: bool = True
 
 
 @dataclass(frozen=True)
@@ -247,6 +249,11 @@ class InfoConfig:
     weather: WeatherConfig
     sports: SportsConfig
     what3words_api_key: str | None
+    prefetch: bool = False
+    # News is opt-in: refreshing it ahead of expiry outruns a free NewsAPI quota.
+    prefetch_news: bool = False
+    # Local (start, end) as (hour, minute); the window may wrap past midnight.
+    prefetch_quiet_hours: tuple[tuple[int, int], tuple[int, int]] | None = None
 
 
 @dataclass(frozen=True)
@@ -259,6 +266,11 @@ class CalendarConfig:
     default_notifications: tuple[int, ...]  # Minutes before event start (e.g., (10, 5) for 10-min and 5-min reminders)
     hide_declined_events: bool  # If True, filter out declined events entirely (default False)
     ooo_summary_marker: str = "OOO"
+    max_refresh_minutes: int = 30  # Unchanged feeds back off up to this poll interval
+    max_concurrent_feeds: int = 4
+    cache_file: Path | None = None  # Feed validators + expanded reminders, reloaded at startup
+    share_mode: Literal["off", "leader", "follower", "auto"] = "off"  # Fleet-wide feed sharing over MQTT
+    share_topic: str = "pulse/shared/calendar"
 
 
 @dataclass(frozen=True)
@@ -268,6 +280,14 @@ class WorkPauseConfig:
     ooo_marker: str  # Summary marker for all-day OOO events
 
 
+@dataclass(frozen=True)
+class TtsCacheConfig:
+    enabled: bool
+    directory: Path
+    max_bytes: int
+    warm_phrases: tuple[str, ...]
+
+
 @dataclass(frozen=True)
 class AssistantConfig:
     hostname: str
@@ -281,6 +301,12 @@ class AssistantConfig:
     stt_endpoint: WyomingEndpoint
     tts_endpoint: WyomingEndpoint
     tts_voice: str | None
+    tts_cache: TtsCacheConfig
+    tts_pipeline: bool
+    wyoming_keepalive: bool
+    wyoming_idle_timeout: float
+    prewarm: bool
+    speculative_llm: bool
     llm: LLMConfig
     mqtt: MqttConfig
     action_file: Path | None
@@ -349,6 +375,14 @@ class AssistantConfig:
             model=None,
         )
 
+        tts_cache_dir = (source.get("PULSE_ASSISTANT_TTS_CACHE_DIR") or "").strip()
+        tts_cache = TtsCacheConfig(
+            enabled=parse_bool(source.get("PULSE_ASSISTANT_TTS_CACHE"), True),
+            directory=Path(tts_cache_dir).expanduser() if tts_cache_dir else DEFAULT_TTS_CACHE_DIR,
+            max_bytes=max(0, parse_int(source.get("PULSE_ASSISTANT_TTS_CACHE_MAX_MB"), 32)) * 1024 * 1024,
+            warm_phrases=_parse_phrase_list(source.get("PULSE_ASSISTANT_TTS_CACHE_PHRASES"), DEFAULT_TTS_CACHE_PHRASES),
+        )
+
         system_prompt = source.get("PULSE_ASSISTANT_SYSTEM_PROMPT", "").strip()
         prompt_file = source.get("PULSE_ASSISTANT_SYSTEM_PROMPT_FILE")
         if not system_prompt and prompt_file:
@@ -452,6 +486,7 @@ class AssistantConfig:
             timer_entity=ha_timer_entity,
             reminder_service=ha_reminder_service,
             presence_entity=ha_presence_entity,
+            state_mirror=parse_bool(source.get("HOME_ASSISTANT_STATE_MIRROR"), True),
         )
 
         preferences = AssistantPreferences(
@@ -578,6 +613,9 @@ class AssistantConfig:
             weather=weather_config,
             sports=sports_config,
             what3words_api_key=(source.get("WHAT3WORDS_API_KEY") or "").strip() or None,
+            prefetch=parse_bool(source.get("PULSE_INFO_PREFETCH"), False),
+            prefetch_news=parse_bool(source.get("PULSE_INFO_PREFETCH_NEWS"), False),
+            prefetch_quiet_hours=_parse_time_window(source.get("PULSE_INFO_PREFETCH_QUIET_HOURS")),
         )
 
         raw_calendar_urls = split_csv(source.get("PULSE_CALENDAR_ICS_URLS"))
@@ -587,6 +625,8 @@ class AssistantConfig:
             if normalized
         )
         refresh_minutes = max(1, parse_int(source.get("PULSE_CALENDAR_REFRESH_MINUTES"), 5))
+        max_refresh_minutes = max(refresh_minutes, parse_int(source.get("PULSE_CALENDAR_MAX_REFRESH_MINUTES"), 30))
+        max_concurrent_feeds = max(1, parse_int(source.get("PULSE_CALENDAR_MAX_CONCURRENT_FEEDS"), 4))
         lookahead_hours = max(1, parse_int(source.get("PULSE_CALENDAR_LOOKAHEAD_HOURS"), 72))
         owner_emails = tuple(
             email.strip().lower()
@@ -615,8 +655,19 @@ class AssistantConfig:
 
         hide_declined_events = parse_bool(source.get("PULSE_CALENDAR_HIDE_DECLINED"), False)
         ooo_marker = (source.get("PULSE_CALENDAR_OOO_MARKER") or "OOO").strip() or "OOO"
+        calendar_cache_file = (source.get("PULSE_CALENDAR_CACHE_FILE") or "").strip()
+        calendar_cache_path: Path | None = None
+        if parse_bool(source.get("PULSE_CALENDAR_CACHE"), True):
+            calendar_cache_path = (
+                Path(calendar_cache_file).expanduser() if calendar_cache_file else DEFAULT_CALENDAR_CACHE_FILE
+            )
+        share_mode = cast(
+            Literal["off", "leader", "follower", "auto"],
+            _normalize_choice(source.get("PULSE_CALENDAR_SHARE_MODE"), {"off", "leader", "follower", "auto"}, "off"),
+        )
+        share_topic = (source.get("PULSE_CALENDAR_SHARE_TOPIC") or "").strip().rstrip("/") or "pulse/shared/calendar"
         calendar_config = CalendarConfig(
-            enabled=bool(feeds),
+            enabled=bool(feeds) or share_mode in {"follower", "auto"},
             feeds=feeds,
             refresh_minutes=refresh_minutes,
             lookahead_hours=lookahead_hours,
@@ -624,6 +675,11 @@ class AssistantConfig:
             default_notifications=default_notifications,
             hide_declined_events=hide_declined_events,
             ooo_summary_marker=ooo_marker,
+            max_refresh_minutes=max_refresh_minutes,
+            max_concurrent_feeds=max_concurrent_feeds,
+            cache_file=calendar_cache_path,
+            share_mode=share_mode,
+            share_topic=share_topic,
         )
 
         def _parse_skip_dates(raw: str | None) -> tuple[str, ...]:
@@ -690,6 +746,12 @@ class AssistantConfig:
             stt_endpoint=stt_endpoint,
             tts_endpoint=tts_endpoint,
             tts_voice=source.get("PULSE_ASSISTANT_TTS_VOICE"),
+            tts_cache=tts_cache,
+            tts_pipeline=parse_bool(source.get("PULSE_ASSISTANT_TTS_PIPELINE"), True),
+            wyoming_keepalive=parse_bool(source.get("PULSE_ASSISTANT_WYOMING_KEEPALIVE"), True),
+            wyoming_idle_timeout=max(1.0, parse_float(source.get("PULSE_ASSISTANT_WYOMING_IDLE_SECONDS"), 60.0)),
+            prewarm=parse_bool(source.get("PULSE_ASSISTANT_PREWARM"), True),
+            speculative_llm=parse_bool(source.get("PULSE_ASSISTANT_SPECULATIVE_LLM"), True),
             llm=llm,
             mqtt=mqtt,
             action_file=action_file,
@@ -714,6 +776,26 @@ class AssistantConfig:
         )
 
 
+DEFAULT_TTS_CACHE_DIR = Path.home() / ".cache" / "pulse" / "tts"
+
+DEFAULT_CALENDAR_CACHE_FILE = Path.home() / ".cache" / "pulse" / "calendar.json"
+
+DEFAULT_TTS_CACHE_PHRASES: tuple[str, ...] = (
+    "Okay, no problem.",
+    "Sorry, I didn't catch that.",
+    "I didn't hear anything, so let's try again later.",
+    "Alarm cancelled.",
+    "Timer cancelled.",
+    "You do not have any alarms scheduled.",
+    "You do not have any timers running.",
+    "You do not have any reminders scheduled.",
+    "Here are your upcoming events.",
+    "Paused the music.",
+    "Stopped the music.",
+    "Skipping to the next song.",
+    "Nothing is playing right now.",
+)
+
 DEFAULT_SYSTEM_PROMPT = """You are Pulse, a calm and concise desk assistant.
 - Answer questions directly using no more than three sentences unless the user
   explicitly asks for more detail.
@@ -754,6 +836,24 @@ def _optional_wyoming_endpoint(
     return WyomingEndpoint(host=host, port=port, model=model)
 
 
+def _parse_phrase_list(value: str | None, default: tuple[str, ...]) -> tuple[str, ...]:
+    """Parse a ``|``-separated phrase list (phrases may contain commas)."""
+    phrases = tuple(dict.fromkeys(phrase.strip() for phrase in (value or "").split("|") if phrase.strip()))
+    return phrases or default
+
+
+def _parse_time_window(value: str | None) -> tuple[tuple[int, int], tuple[int, int]] | None:
+    """Parse ``"23:00-06:00"`` (or ``"11pm-6am"``) into start/end times; ``None`` if unset or invalid."""
+    start_raw, separator, end_raw = (value or "").partition("-")
+    if not separator:
+        return None
+    start = parse_time_of_day(start_raw)
+    end = parse_time_of_day(end_raw)
+    if start is None or end is None or start == end:
+        return None
+    return start, end
+
+
 def _normalize_choice(value: str | None, allowed: set[str], default: str) -> str:
     if not value:
         return default
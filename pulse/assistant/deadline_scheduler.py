@@ -0,0 +1,172 @@
+"""Shared wall-clock deadline scheduler for alarms, timers, reminders and calendar events.
+
+Instead of one sleeping task per scheduled item, every deadline lives in a single
+min-heap ordered by wall-clock fire time and one waiter task sleeps until the earliest
+entry is due. Scheduling and cancelling are O(log n) (cancel is a dictionary removal;
+stale heap entries are skipped lazily when they reach the top).
+
+The waiter never sleeps longer than ``max_sleep`` seconds and re-reads the wall clock
+every time it wakes, so deadlines stay accurate across system suspend and clock changes
+(``asyncio`` timers run on the monotonic clock, which does neither).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+import logging
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import count
+
+LOGGER = logging.getLogger(__name__)
+
+DeadlineCallback = Callable[[], Awaitable[None]]
+
+DEFAULT_MAX_SLEEP_SECONDS = 30.0
+# Rebuild the heap once cancelled entries outnumber live ones by this factor.
+_COMPACT_RATIO = 2
+
+
+def _now() -> datetime:
+    return datetime.now().astimezone()
+
+
+@dataclass(slots=True)
+class _Deadline:
+    when: datetime
+    seq: int
+    callback: DeadlineCallback
+
+
+class DeadlineScheduler[K: Hashable]:
+    """Run callbacks at wall-clock deadlines from a single waiter task.
+
+    Each key has at most one pending deadline; scheduling an existing key replaces it.
+    Due callbacks are started as their own tasks so a slow callback never delays the
+    next deadline. Cancelling a key only affects a deadline that has not fired yet.
+    """
+
+    def __init__(
+        self,
+        *,
+        clock: Callable[[], datetime] = _now,
+        max_sleep: float = DEFAULT_MAX_SLEEP_SECONDS,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self._clock = clock
+        self._max_sleep = max(0.01, max_sleep)
+        self._logger = logger or LOGGER
+        self._entries: dict[K, _Deadline] = {}
+        self._heap: list[tuple[datetime, int, K]] = []
+        self._seq = count()
+        self._wakeup = asyncio.Event()
+        self._waiter: asyncio.Task[None] | None = None
+        self._running: set[asyncio.Task[None]] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def deadline(self, key: K) -> datetime | None:
+        """Return the pending fire time for ``key``, if any."""
+        entry = self._entries.get(key)
+        return entry.when if entry else None
+
+    def schedule(self, key: K, when: datetime, callback: DeadlineCallback) -> None:
+        """Fire ``callback`` at ``when`` (immediately if already past), replacing any pending deadline for ``key``."""
+        entry = _Deadline(when, next(self._seq), callback)
+        self._entries[key] = entry
+        heapq.heappush(self._heap, (when, entry.seq, key))
+        if self._heap[0][1] == entry.seq:
+            self._wakeup.set()
+        self._ensure_waiter()
+
+    def schedule_many(self, deadlines: Iterable[tuple[K, datetime, DeadlineCallback]]) -> None:
+        """Replace several deadlines at once with a single O(n) heap rebuild."""
+        changed = False
+        for key, when, callback in deadlines:
+            self._entries[key] = _Deadline(when, next(self._seq), callback)
+            changed = True
+        if not changed:
+            return
+        self._rebuild()
+        self._wakeup.set()
+        self._ensure_waiter()
+
+    def cancel(self, key: K) -> bool:
+        """Drop the pending deadline for ``key``. Returns ``True`` when one was pending."""
+        if self._entries.pop(key, None) is None:
+            return False
+        if len(self._heap) > _COMPACT_RATIO * len(self._entries) + 16:
+            self._rebuild()
+        return True
+
+    def clear(self) -> None:
+        """Drop every pending deadline."""
+        self._entries.clear()
+        self._heap.clear()
+
+    async def close(self) -> None:
+        """Drop pending deadlines and stop the waiter and any callbacks still running."""
+        self.clear()
+        tasks = [task for task in (self._waiter, *self._running) if task is not None]
+        self._waiter = None
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
+        self._running.clear()
+
+    def _rebuild(self) -> None:
+        self._heap = [(entry.when, entry.seq, key) for key, entry in self._entries.items()]
+        heapq.heapify(self._heap)
+
+    def _ensure_waiter(self) -> None:
+        if self._waiter is None or self._waiter.done():
+            self._waiter = asyncio.create_task(self._run())
+
+    def _peek(self) -> tuple[datetime, K] | None:
+        """Return the earliest live deadline, discarding stale heap entries on the way."""
+        while self._heap:
+            when, seq, key = self._heap[0]
+            entry = self._entries.get(key)
+            if entry is not None and entry.seq == seq:
+                return when, key
+            heapq.heappop(self._heap)
+        return None
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            head = self._peek()
+            if head is None:
+                await self._wakeup.wait()
+                continue
+            when, key = head
+            delay = (when - self._clock()).total_seconds()
+            if delay > 0:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=min(delay, self._max_sleep))
+                continue
+            heapq.heappop(self._heap)
+            entry = self._entries.pop(key)
+            self._start_callback(key, entry.callback)
+
+    def _start_callback(self, key: K, callback: DeadlineCallback) -> None:
+        task = asyncio.create_task(self._invoke(key, callback))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _invoke(self, key: K, callback: DeadlineCallback) -> None:
+        try:
+            await callback()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self._logger.exception("[scheduler] Deadline callback for %r failed", key)
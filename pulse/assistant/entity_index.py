@@ -0,0 +1,199 @@
+"""Token index over Home Assistant entity names for resolving action targets.
+
+A spoken "turn off the kitchen lights" reaches the action engine as
+``ha.turn_off: name=kitchen lights``. Scoring every entity against every hint token
+costs O(entities × tokens) per action, which adds up on an install with a few thousand
+entities. ``EntityIndex`` splits friendly names, aliases, areas and entity_ids into
+tokens once. It keeps one posting list per token and domain, so resolving a hint is a
+few dict lookups followed by scoring only the entities that share a token with it.
+
+Tokens are lowercased alphanumeric runs with a trailing plural "s" dropped, so "lights"
+finds "Light". A hint token with no exact posting falls back to the indexed tokens that
+start with it ("bed" → "bedroom") through a bisect over the sorted vocabulary.
+
+``EntityIndexCache`` keeps the last few indexes. An index built from the state mirror is
+keyed by the mirror's ``catalog_revision`` and reused until an entity is added, removed
+or renamed. An index built from a REST listing is keyed by the naming fields of that
+listing.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from .home_assistant import HomeAssistantStateMirror
+
+NAME_WEIGHT = 3
+AREA_WEIGHT = 2
+ENTITY_ID_WEIGHT = 1
+PHRASE_BONUS = 5
+PREFIX_MIN_LENGTH = 3
+INDEX_CACHE_ENTRIES = 4
+
+_SPLIT_RE = re.compile(r"[^a-z0-9]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Normalized tokens of ``text`` in order (duplicates kept)."""
+    tokens = []
+    for token in _SPLIT_RE.split(text.lower()):
+        if not token:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+def naming_key(state: dict[str, Any]) -> tuple[Any, ...]:
+    """The parts of a state payload the index depends on (see ``ENTITY_NAMING_ATTRIBUTES``), hashable."""
+    attrs = state.get("attributes") or {}
+    aliases = attrs.get("aliases")
+    return (
+        state.get("entity_id"),
+        attrs.get("friendly_name"),
+        attrs.get("area_id"),
+        tuple(aliases) if isinstance(aliases, list) else aliases,
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    order: int
+    size: int
+    phrases: tuple[str, ...]
+
+
+# Posting lists for one scope, strongest field first: names and aliases, area, entity_id.
+_Fields = tuple[dict[str, list[str]], dict[str, list[str]], dict[str, list[str]]]
+_FIELD_WEIGHTS = (NAME_WEIGHT, AREA_WEIGHT, ENTITY_ID_WEIGHT)
+
+
+class EntityIndex:
+    """Posting lists from name/area/entity_id tokens to entity IDs, per domain."""
+
+    def __init__(self, states: Iterable[dict[str, Any]]) -> None:
+        self._entries: dict[str, _Entry] = {}
+        self._by_domain: dict[str | None, list[str]] = {None: []}
+        self._fields: dict[str | None, _Fields] = {None: ({}, {}, {})}
+        for state in states:
+            entity_id = str(state.get("entity_id") or "")
+            if not entity_id or entity_id in self._entries:
+                continue
+            attrs = state.get("attributes") or {}
+            names = [str(attrs.get("friendly_name") or entity_id)]
+            aliases = attrs.get("aliases")
+            if isinstance(aliases, list | tuple):
+                names.extend(str(alias) for alias in aliases if alias)
+            name_tokens = [tokenize(name) for name in names]
+            self._entries[entity_id] = _Entry(
+                order=len(self._entries),
+                size=len(name_tokens[0]),
+                phrases=tuple(f" {' '.join(tokens)} " for tokens in name_tokens),
+            )
+            field_tokens = (
+                {token for tokens in name_tokens for token in tokens},
+                set(tokenize(str(attrs.get("area_id") or ""))),
+                set(tokenize(entity_id.split(".", 1)[-1])),
+            )
+            domain = entity_id.split(".", 1)[0].lower()
+            for scope in (None, domain):
+                self._by_domain.setdefault(scope, []).append(entity_id)
+                fields = self._fields.get(scope)
+                if fields is None:
+                    fields = self._fields[scope] = ({}, {}, {})
+                for postings, tokens in zip(fields, field_tokens, strict=True):
+                    for token in tokens:
+                        postings.setdefault(token, []).append(entity_id)
+        self._vocabulary = {
+            scope: sorted({token for postings in fields for token in postings})
+            for scope, fields in self._fields.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def entity_ids(self, domain: str | None = None) -> list[str]:
+        return list(self._by_domain.get(domain, ()))
+
+    def resolve(self, domain: str | None = None, *, name: str | None = None, room: str | None = None) -> list[str]:
+        """Best match for the hints, as a one-element list (empty if nothing shares a token).
+
+        Each hint token scores its strongest field (name or alias, then area, then
+        entity_id), and the whole name hint appearing in a friendly name or alias adds a
+        bonus. Ties go to the entity whose friendly name has the fewest tokens, then to
+        the listing order.
+        """
+        fields = self._fields.get(domain)
+        if fields is None:
+            return []
+        name_tokens = tokenize(name or "")
+        scores: dict[str, int] = {}
+        for token in dict.fromkeys(tokenize(room or "") + name_tokens):
+            terms = self._expand(domain, token)
+            credited: set[str] = set()
+            for postings, weight in zip(fields, _FIELD_WEIGHTS, strict=True):
+                for term in terms:
+                    for entity_id in postings.get(term, ()):
+                        if entity_id not in credited:
+                            credited.add(entity_id)
+                            scores[entity_id] = scores.get(entity_id, 0) + weight
+        if not scores:
+            return []
+        if name_tokens:
+            phrase = f" {' '.join(name_tokens)} "
+            # Only entities that can still reach the top need the substring check.
+            floor = max(scores.values()) - PHRASE_BONUS
+            for entity_id, score in scores.items():
+                if score >= floor and any(phrase in text for text in self._entries[entity_id].phrases):
+                    scores[entity_id] = score + PHRASE_BONUS
+
+        def rank(entity_id: str) -> tuple[int, int, int]:
+            entry = self._entries[entity_id]
+            return (-scores[entity_id], entry.size, entry.order)
+
+        return [min(scores, key=rank)]
+
+    def _expand(self, domain: str | None, token: str) -> list[str]:
+        vocabulary = self._vocabulary[domain]
+        start = bisect_left(vocabulary, token)
+        if start < len(vocabulary) and vocabulary[start] == token:
+            return [token]
+        if len(token) < PREFIX_MIN_LENGTH:
+            return []
+        end = start
+        while end < len(vocabulary) and vocabulary[end].startswith(token):
+            end += 1
+        return vocabulary[start:end]
+
+
+class EntityIndexCache:
+    """Keeps the most recently used indexes so unchanged entity sets are never re-indexed."""
+
+    def __init__(self, max_entries: int = INDEX_CACHE_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._indexes: OrderedDict[Hashable, EntityIndex] = OrderedDict()
+
+    def for_mirror(self, mirror: HomeAssistantStateMirror) -> EntityIndex:
+        return self._get(("mirror", id(mirror), mirror.catalog_revision), lambda: EntityIndex(mirror.states()))
+
+    def for_states(self, states: list[dict[str, Any]]) -> EntityIndex:
+        return self._get(("states", tuple(naming_key(state) for state in states)), lambda: EntityIndex(states))
+
+    def clear(self) -> None:
+        self._indexes.clear()
+
+    def _get(self, key: Hashable, build: Callable[[], EntityIndex]) -> EntityIndex:
+        index = self._indexes.get(key)
+        if index is None:
+            index = self._indexes[key] = build()
+            while len(self._indexes) > self._max_entries:
+                self._indexes.popitem(last=False)
+        else:
+            self._indexes.move_to_end(key)
+        return index
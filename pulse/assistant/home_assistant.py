@@ -9,7 +9,8 @@ Features:
 - WebSocket API: Assist pipeline (speech-to-speech), real-time event streaming
 - Authentication: Bearer token auth with automatic header injection
 - SSL verification: Configurable for local HA instances without certificates
-- Entity queries: List entities by domain (light, switch, sensor, etc.)
+- Entity queries: List entities by domain (light, switch, sensor, etc.), served from a
+  live state mirror kept over one websocket when it is running, REST otherwise
 - Service calls: Generic service invocation with JSON payloads
 - Assist pipeline: Speech-to-speech conversation via Wyoming protocol integration
 
@@ -21,11 +22,14 @@ the websockets library for Assist pipeline functionality.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import logging
 import ssl
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Callable, Iterable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from dataclasses import dataclass, field
+from functools import partial
 from typing import Any
 
 import httpx
@@ -41,6 +45,15 @@ except ImportError:
 
 from .config import HomeAssistantConfig
 
+LOGGER = logging.getLogger("pulse.home_assistant")
+
+MIRROR_RECONNECT_SECONDS = 1.0
+MIRROR_RECONNECT_MAX_SECONDS = 60.0
+# websockets' default frame limit; a larger incoming message closes the connection (1009).
+WEBSOCKET_MAX_SIZE = 2**20
+# State attributes that name an entity; changes to these bump the mirror's catalog revision.
+ENTITY_NAMING_ATTRIBUTES = ("friendly_name", "area_id", "aliases")
+
 
 class HomeAssistantError(RuntimeError):
     """Generic Home Assistant API failure."""
@@ -50,12 +63,173 @@ class HomeAssistantAuthError(HomeAssistantError):
     """Raised when HA returns 401/403."""
 
 
+class HomeAssistantStateMirror:
+    """In-memory copy of every HA entity state, kept live over one websocket.
+
+    On each connection the mirror subscribes to ``state_changed`` first and then asks for
+    ``get_states``. Events that arrive before the snapshot are replayed on top of it,
+    and the newer ``last_updated`` wins, so nothing that changes during the resync is
+    lost. After that every event replaces one entity's state dict. The dicts are never
+    mutated in place, and callers must treat them as read-only. A dropped connection
+    marks the mirror not ready, so callers fall back to REST, and it reconnects with
+    backoff and resyncs from scratch.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], AbstractAsyncContextManager[Any]],
+        *,
+        timeout: float = 10.0,
+        reconnect_delay: float = MIRROR_RECONNECT_SECONDS,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self._connect = connect
+        self._timeout = timeout
+        self._reconnect_delay = reconnect_delay
+        self._logger = logger or LOGGER
+        self._states: dict[str, dict[str, Any]] = {}
+        self._by_domain: dict[str, dict[str, dict[str, Any]]] = {}
+        self._ready = False
+        self._synced = asyncio.Event()
+        self._runner: asyncio.Task[None] | None = None
+        # Bumped on every applied change so callers can cheaply tell whether to rebuild.
+        self.revision = 0
+        # Bumped only when entities appear, disappear or are renamed (see ENTITY_NAMING_ATTRIBUTES).
+        self.catalog_revision = 0
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def get(self, entity_id: str) -> dict[str, Any] | None:
+        return self._states.get(entity_id)
+
+    def states(self, domain: str | None = None) -> list[dict[str, Any]]:
+        if domain:
+            return list(self._by_domain.get(domain, {}).values())
+        return list(self._states.values())
+
+    async def start(self) -> None:
+        if self._runner is None:
+            self._runner = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        runner, self._runner = self._runner, None
+        if runner:
+            runner.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await runner
+        self._mark_lost()
+
+    async def wait_synced(self, timeout: float) -> bool:
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._synced.wait(), timeout)
+        return self._ready
+
+    async def _run(self) -> None:
+        delay = self._reconnect_delay
+        while True:
+            try:
+                async with self._connect() as ws:
+                    await self._sync(ws)
+                    delay = self._reconnect_delay
+                    self._logger.info("[home_assistant] State mirror synced (%d entities)", len(self._states))
+                    async for raw in ws:
+                        self._handle(raw)
+                self._logger.warning("[home_assistant] State mirror connection closed; resyncing")
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self._logger.warning("[home_assistant] State mirror unavailable (retry in %.0fs): %s", delay, exc)
+            finally:
+                self._mark_lost()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MIRROR_RECONNECT_MAX_SECONDS)
+
+    async def _sync(self, ws: Any) -> None:
+        await ws.send(json.dumps({"id": 1, "type": "subscribe_events", "event_type": "state_changed"}))
+        await ws.send(json.dumps({"id": 2, "type": "get_states"}))
+        early: list[dict[str, Any]] = []
+        while True:
+            raw = await asyncio.wait_for(ws.recv(), timeout=self._timeout)
+            message = json.loads(raw)
+            if message.get("type") == "event":
+                early.append(message)
+                continue
+            if message.get("type") != "result":
+                continue
+            if not message.get("success"):
+                raise HomeAssistantError(f"State mirror command {message.get('id')} failed: {message.get('error')}")
+            if message.get("id") == 2:
+                snapshot = message.get("result")
+                break
+        self._states = {}
+        self._by_domain = {}
+        for state in snapshot if isinstance(snapshot, list) else []:
+            if isinstance(state, dict) and state.get("entity_id"):
+                self._store(str(state["entity_id"]), state)
+        for message in early:
+            self._apply_event(message)
+        self.revision += 1
+        self.catalog_revision += 1
+        self._ready = True
+        self._synced.set()
+
+    def _handle(self, raw: str | bytes) -> None:
+        try:
+            message = json.loads(raw)
+        except ValueError:
+            return
+        if isinstance(message, dict) and message.get("type") == "event":
+            self._apply_event(message)
+
+    def _apply_event(self, message: dict[str, Any]) -> None:
+        event = message.get("event") or {}
+        data = event.get("data") or {}
+        entity_id = data.get("entity_id")
+        if event.get("event_type") != "state_changed" or not entity_id:
+            return
+        new_state = data.get("new_state")
+        if not isinstance(new_state, dict):
+            if entity_id in self._states:
+                self._remove(entity_id)
+                self.revision += 1
+                self.catalog_revision += 1
+            return
+        current = self._states.get(entity_id)
+        if current is not None and str(current.get("last_updated") or "") > str(new_state.get("last_updated") or ""):
+            return
+        self._store(entity_id, new_state)
+        self.revision += 1
+        if current is None or _naming(current) != _naming(new_state):
+            self.catalog_revision += 1
+
+    def _store(self, entity_id: str, state: dict[str, Any]) -> None:
+        self._states[entity_id] = state
+        self._by_domain.setdefault(entity_id.split(".", 1)[0], {})[entity_id] = state
+
+    def _remove(self, entity_id: str) -> None:
+        self._states.pop(entity_id, None)
+        self._by_domain.get(entity_id.split(".", 1)[0], {}).pop(entity_id, None)
+
+    def _mark_lost(self) -> None:
+        self._ready = False
+        self._synced.clear()
+
+
+def _naming(state: dict[str, Any]) -> tuple[Any, ...]:
+    attrs = state.get("attributes") or {}
+    return tuple(attrs.get(name) for name in ENTITY_NAMING_ATTRIBUTES)
+
+
 @dataclass(slots=True)
 class HomeAssistantClient:
     config: HomeAssistantConfig
     timeout: float = 10.0
     _client: httpx.AsyncClient = field(init=False, repr=False)
     _closed: bool = field(init=False, default=True, repr=False)
+    _pipeline_ids: dict[str, str] = field(init=False, default_factory=dict, repr=False)
+    _mirror: HomeAssistantStateMirror | None = field(init=False, default=None, repr=False)
 
     def __post_init__(self) -> None:
         if not self.config.base_url:
@@ -92,13 +266,37 @@ class HomeAssistantClient:
         if self._closed:
             return
         self._closed = True
+        if self._mirror is not None:
+            await self._mirror.stop()
         await self._client.aclose()
 
+    @property
+    def state_mirror(self) -> HomeAssistantStateMirror | None:
+        return self._mirror
+
+    async def start_state_mirror(self) -> None:
+        """Keep a live websocket mirror of entity states for ``get_state``/``list_entities``."""
+        if self._mirror is not None or websockets is None:
+            return
+        # The get_states snapshot of a large install easily exceeds the default frame limit,
+        # and a connection closed for that would only resync into the same snapshot again.
+        self._mirror = HomeAssistantStateMirror(
+            partial(self._connect_websocket, max_size=None),
+            timeout=self.timeout,
+            reconnect_delay=MIRROR_RECONNECT_SECONDS,
+        )
+        await self._mirror.start()
+
     async def get_info(self) -> dict[str, Any]:
         """Return `/api/` payload with HA metadata."""
         return await self._request("GET", "/api/")
 
     async def get_state(self, entity_id: str) -> dict[str, Any]:
+        mirror = self._mirror
+        if mirror is not None and mirror.ready:
+            state = mirror.get(entity_id)
+            if state is not None:
+                return state
         return await self._request("GET", f"/api/states/{entity_id}")
 
     async def list_states(self) -> list[dict[str, Any]]:
@@ -119,7 +317,13 @@ class HomeAssistantClient:
         return entries
 
     async def list_entities(self, domain: str | None = None) -> list[dict[str, Any]]:
-        """List entities, optionally filtered by domain (e.g., 'light')."""
+        """List entities, optionally filtered by domain (e.g., 'light').
+
+        Served from the state mirror while it is synced; otherwise a full ``/api/states``.
+        """
+        mirror = self._mirror
+        if mirror is not None and mirror.ready:
+            return mirror.states(domain)
         states = await self.list_states()
         if not domain:
             return states
@@ -191,6 +395,9 @@ class HomeAssistantClient:
         # If it looks like a UUID/ID (long alphanumeric string), assume it's already an ID
         if len(pipeline_name_or_id) > 20 and pipeline_name_or_id.replace("-", "").replace("_", "").isalnum():
             return pipeline_name_or_id
+        cached = self._pipeline_ids.get(pipeline_name_or_id)
+        if cached:
+            return cached
 
         # Otherwise, list pipelines and find by name
         list_payload = {"id": 1, "type": "assist_pipeline/pipeline/list"}
@@ -207,28 +414,37 @@ class HomeAssistantClient:
                 if isinstance(pipeline, dict) and pipeline.get("name") == pipeline_name_or_id:
                     pipeline_id = pipeline.get("id")
                     if pipeline_id:
+                        self._pipeline_ids[pipeline_name_or_id] = pipeline_id
                         return pipeline_id
 
         # If not found, raise an error
         raise HomeAssistantError(f"Pipeline '{pipeline_name_or_id}' not found")
 
-    async def assist_audio(
-        self,
-        audio_bytes: bytes,
-        *,
-        sample_rate: int,
-        sample_width: int,
-        channels: int,
-        pipeline_id: str | None = None,
-        language: str | None = None,
-    ) -> dict[str, Any]:
-        """Run Assist pipeline with audio input via WebSocket."""
+    async def prewarm(self, *, resolve_pipeline: bool = False) -> None:
+        """Refresh the pooled HTTP connection and optionally resolve the Assist pipeline ID.
+
+        Called when a wake word fires so the request that follows the recording does not
+        pay for the TCP/TLS handshake or the ``assist_pipeline/pipeline/list`` round-trip.
+        """
+        await self.get_info()
+        pipeline = self.config.assist_pipeline
+        if not resolve_pipeline or not pipeline or pipeline in self._pipeline_ids or websockets is None:
+            return
+        async with self._connect_websocket() as ws:
+            await self._resolve_pipeline_id(ws, pipeline)
+
+    @asynccontextmanager
+    async def _connect_websocket(
+        self, *, max_size: int | None = WEBSOCKET_MAX_SIZE
+    ) -> AsyncIterator[WebSocketClientProtocol | Any]:
+        """Open an authenticated WebSocket API connection.
+
+        ``max_size`` caps incoming messages in bytes; ``None`` lifts the cap.
+        """
         if websockets is None:
             raise HomeAssistantError(
                 "websockets library is required for audio assist (install with: pip install websockets)"
             )
-
-        pipeline_name_or_id = pipeline_id or self.config.assist_pipeline
         if not self.config.base_url:
             raise HomeAssistantError("Home Assistant base_url is not configured")
         base_url = self.config.base_url.rstrip("/")
@@ -245,9 +461,7 @@ class HomeAssistantClient:
                 ssl_context.check_hostname = False
                 ssl_context.verify_mode = ssl.CERT_NONE
 
-        # Connect to WebSocket
-        async with websockets.connect(ws_uri, ssl=ssl_context) as ws:
-            # First, authenticate via WebSocket
+        async with websockets.connect(ws_uri, ssl=ssl_context, max_size=max_size) as ws:
             auth_msg_raw = await ws.recv()
             auth_msg = json.loads(auth_msg_raw)
             if auth_msg.get("type") != "auth_required":
@@ -258,7 +472,21 @@ class HomeAssistantClient:
             auth_result = json.loads(auth_result_raw)
             if auth_result.get("type") != "auth_ok":
                 raise HomeAssistantAuthError("WebSocket authentication failed")
+            yield ws
 
+    async def assist_audio(
+        self,
+        audio_bytes: bytes,
+        *,
+        sample_rate: int,
+        sample_width: int,
+        channels: int,
+        pipeline_id: str | None = None,
+        language: str | None = None,
+    ) -> dict[str, Any]:
+        """Run Assist pipeline with audio input via WebSocket."""
+        pipeline_name_or_id = pipeline_id or self.config.assist_pipeline
+        async with self._connect_websocket() as ws:
             # Resolve pipeline name to ID if needed
             resolved_pipeline_id: str | None = None
             if pipeline_name_or_id:
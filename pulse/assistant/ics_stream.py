@@ -0,0 +1,152 @@
+"""Incremental ICS filter that drops events which ended before a cutoff.
+
+Large calendar exports carry every VEVENT since the calendar was created, and most of
+them are years in the past. ``IcsWindowFilter`` consumes the response body chunk by
+chunk and buffers one VEVENT at a time. Once an event is complete it decides from the
+raw DTSTART/DTEND/DURATION/RRULE text whether any occurrence can still end after the
+cutoff, and drops it if not. Nothing else in the stream is touched. ``Calendar.from_ical``
+then builds components only for events that can still matter, and peak memory is
+bounded by the filtered body plus one event.
+
+Only events that can never intersect ``[cutoff, ∞)`` are dropped. A filtered body
+therefore stays valid for any later window, which is what lets the sync service cache it.
+Times are compared as naive wall-clock values. The caller's cutoff carries enough margin
+to absorb any TZID offset.
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import datetime, timedelta
+
+from icalendar.prop import vDuration  # type: ignore[import-untyped]
+
+_DATE_RE = re.compile(rb"^(\d{4})(\d{2})(\d{2})(?:T(\d{2})(\d{2})(\d{2}))?")
+_UNTIL_RE = re.compile(rb"(?:^|;)UNTIL=([0-9TZ]+)", re.IGNORECASE)
+_BOUNDING_PROPS = {b"DTSTART", b"DTEND", b"DURATION", b"RRULE", b"RDATE", b"RECURRENCE-ID"}
+
+
+def _parse_ical_time(value: bytes) -> datetime | None:
+    match = _DATE_RE.match(value.strip())
+    if not match:
+        return None
+    year, month, day, hour, minute, second = (int(part) for part in match.groups(b"0"))
+    try:
+        return datetime(year, month, day, hour, minute, second)
+    except ValueError:
+        return None
+
+
+def _split_property(line: bytes) -> tuple[bytes, bytes]:
+    """Return ``(NAME, value)`` for an unfolded content line, honouring quoted parameters."""
+    in_quotes = False
+    for idx, byte in enumerate(line):
+        if byte == 0x22:  # "
+            in_quotes = not in_quotes
+        elif byte == 0x3A and not in_quotes:  # :
+            name = line[:idx].split(b";", 1)[0]
+            return name.strip().upper(), line[idx + 1 :]
+    return line.strip().upper(), b""
+
+
+def _unfold(lines: list[bytes]) -> list[bytes]:
+    logical: list[bytes] = []
+    for line in lines:
+        if line[:1] in (b" ", b"\t") and logical:
+            logical[-1] += line[1:]
+        else:
+            logical.append(line)
+    return logical
+
+
+def _event_may_end_after(lines: list[bytes], cutoff: datetime) -> bool:
+    """Whether any occurrence of the VEVENT in ``lines`` can end at or after ``cutoff``."""
+    props: dict[bytes, bytes] = {}
+    depth = 0
+    for line in _unfold(lines):
+        name, value = _split_property(line)
+        if name == b"BEGIN":
+            depth += 1
+        elif name == b"END":
+            depth -= 1
+        elif depth == 1 and name in _BOUNDING_PROPS:
+            props.setdefault(name, value)
+    if b"RECURRENCE-ID" in props:
+        # An override also cancels the master's original slot; dropping it would bring that slot back.
+        return True
+    start = _parse_ical_time(props.get(b"DTSTART", b""))
+    if start is None or b"RDATE" in props:
+        return True
+    duration = timedelta(0)
+    end = _parse_ical_time(props[b"DTEND"]) if b"DTEND" in props else None
+    if end is not None:
+        duration = max(duration, end - start)
+    elif b"DURATION" in props:
+        try:
+            duration = max(duration, vDuration.from_ical(props[b"DURATION"].strip().decode("ascii")))
+        except (ValueError, UnicodeDecodeError):
+            return True
+    last_start = start
+    if b"RRULE" in props:
+        until = _UNTIL_RE.search(props[b"RRULE"])
+        if not until:
+            # COUNT or open-ended rules are not bounded cheaply; keep them.
+            return True
+        last_start = _parse_ical_time(until.group(1)) or datetime.max
+        if last_start == datetime.max:
+            return True
+    return last_start + duration >= cutoff
+
+
+class IcsWindowFilter:
+    """Feed raw ICS bytes in; get back the same stream minus VEVENTs that ended before ``cutoff``."""
+
+    def __init__(self, cutoff: datetime) -> None:
+        self.cutoff = cutoff
+        self.kept = 0
+        self.dropped = 0
+        self._partial = b""
+        self._event: list[bytes] | None = None
+        self._depth = 0
+
+    def feed(self, chunk: bytes) -> bytes:
+        data = self._partial + chunk
+        lines = data.split(b"\n")
+        self._partial = lines.pop()
+        return self._process(lines)
+
+    def close(self) -> bytes:
+        lines = [self._partial] if self._partial else []
+        self._partial = b""
+        out = self._process(lines)
+        if self._event is not None:
+            # Truncated event at end of stream: pass it through and let the parser decide.
+            out += b"".join(line + b"\n" for line in self._event)
+            self._event = None
+        return out
+
+    def _process(self, lines: list[bytes]) -> bytes:
+        out = bytearray()
+        for raw in lines:
+            line = raw.rstrip(b"\r")
+            marker = line.strip().upper()
+            if self._event is None:
+                if marker == b"BEGIN:VEVENT":
+                    self._event = [line]
+                    self._depth = 1
+                else:
+                    out += raw + b"\n"
+                continue
+            self._event.append(line)
+            if marker.startswith(b"BEGIN:"):
+                self._depth += 1
+            elif marker.startswith(b"END:"):
+                self._depth -= 1
+                if self._depth == 0:
+                    event, self._event = self._event, None
+                    if _event_may_end_after(event, self.cutoff):
+                        self.kept += 1
+                        out += b"\r\n".join(event) + b"\r\n"
+                    else:
+                        self.dropped += 1
+        return bytes(out)
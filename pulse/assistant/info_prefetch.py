@@ -0,0 +1,114 @@
+"""Keep the likely info answers warm so a spoken question never waits on upstream APIs.
+
+``InfoPrefetcher`` reads the forecast for the configured location, a team snapshot for
+each favorite team and, when enabled, the default news topic on a short tick. Each read goes
+through the clients' caches (see ``TTLCache`` in info_sources.py), so a tick costs
+nothing while the entries are fresh. Once an entry is within ``REFRESH_AHEAD_SECONDS``
+of expiry, the read starts a background refresh. "What's the weather" then finds a
+fresh forecast in the cache instead of waiting on Open-Meteo.
+
+During the configured quiet hours nobody is asking, so ticks are skipped and the
+entries are allowed to age past their stale window. Ticks resume
+``QUIET_WAKE_AHEAD_SECONDS`` before the window ends, so the first question of the
+morning finds fresh answers again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any
+
+from .config import InfoConfig
+from .info_sources import REFRESH_AHEAD_SECONDS, InfoSources
+
+LOGGER = logging.getLogger("pulse.info_prefetch")
+
+# Well inside REFRESH_AHEAD_SECONDS, so every warmed entry is seen at least once in its
+# refresh window.
+PREFETCH_TICK_SECONDS = REFRESH_AHEAD_SECONDS / 3
+# Prefetching resumes this long before quiet hours end; several ticks, so one failed
+# read still leaves time to retry.
+QUIET_WAKE_AHEAD_SECONDS = 300.0
+
+
+def in_quiet_hours(now: datetime, window: tuple[tuple[int, int], tuple[int, int]] | None) -> bool:
+    """Whether ``now`` falls in ``[start, end)``; windows may wrap past midnight."""
+    if window is None:
+        return False
+    start, end = window
+    current = (now.hour, now.minute)
+    if start < end:
+        return start <= current < end
+    return current >= start or current < end
+
+
+class InfoPrefetcher:
+    """Periodically warms the weather, news and favorite-team caches of an ``InfoSources``."""
+
+    def __init__(
+        self,
+        sources: InfoSources,
+        config: InfoConfig,
+        *,
+        tick_seconds: float = PREFETCH_TICK_SECONDS,
+        clock: Callable[[], datetime] = datetime.now,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self._sources = sources
+        self._config = config
+        self._tick = tick_seconds
+        self._clock = clock
+        self._logger = logger or LOGGER
+        self._runner: asyncio.Task[None] | None = None
+
+    @property
+    def has_targets(self) -> bool:
+        return bool(self._targets())
+
+    async def start(self) -> None:
+        if self._runner or not self.has_targets:
+            return
+        self._runner = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        runner, self._runner = self._runner, None
+        if runner:
+            runner.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await runner
+
+    async def warm(self) -> None:
+        """Read every prefetch target once; failures are logged, never raised."""
+        targets = self._targets()
+        results = await asyncio.gather(*(read() for _, read in targets), return_exceptions=True)
+        for (name, _), result in zip(targets, results, strict=True):
+            if isinstance(result, Exception):
+                self._logger.warning("[info] Prefetch of %s failed: %s", name, result)
+
+    def _targets(self) -> list[tuple[str, Callable[[], Awaitable[Any]]]]:
+        targets: list[tuple[str, Callable[[], Awaitable[Any]]]] = []
+        if self._config.weather.location:
+            targets.append(("weather", self._sources.weather.forecast))
+        if self._config.prefetch_news and self._config.news.api_key:
+            targets.append(("news", self._sources.news.latest))
+        for team in self._config.sports.favorite_teams:
+            if team:
+                targets.append((f"team {team}", partial(self._sources.sports.team_snapshot, team)))
+        return targets
+
+    def _paused(self) -> bool:
+        now = self._clock()
+        window = self._config.prefetch_quiet_hours
+        wake_at = now + timedelta(seconds=QUIET_WAKE_AHEAD_SECONDS)
+        return in_quiet_hours(now, window) and in_quiet_hours(wake_at, window)
+
+    async def _run(self) -> None:
+        while True:
+            if not self._paused():
+                await self.warm()
+            await asyncio.sleep(self._tick)
@@ -8,6 +8,8 @@ import os
 from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any
 
+from pulse.assistant.intent_router import IntentConfidence
+
 if TYPE_CHECKING:
     from pulse.assistant.info_service import InfoService
     from pulse.assistant.media_controller import MediaController
@@ -71,6 +73,12 @@ class InfoQueryHandler:
         """Set callback for _set_assist_stage(pipeline, stage, extra)."""
         self._stage_callback = callback
 
+    def classify(self, transcript: str) -> IntentConfidence:
+        """Cheaply predict whether ``maybe_handle`` would answer ``transcript``."""
+        if not self.info_service:
+            return IntentConfidence.NONE
+        return self.info_service.classify(transcript)
+
     async def maybe_handle(self, transcript: str, wake_word: str, *, follow_up: bool = False) -> bool:
         """Check if transcript is an info query and handle it.
 
@@ -28,6 +28,7 @@ from typing import Any
 
 from .config import InfoConfig
 from .info_sources import InfoSources, NewsHeadline, TeamSnapshot, WeatherForecast
+from .intent_router import IntentConfidence
 
 STOP_WORDS = {
     "what",
@@ -122,6 +123,32 @@ class InfoService:
         self.sources = sources or InfoSources(config)
         self.logger = logger or logging.getLogger(__name__)
 
+    async def close(self) -> None:
+        await self.sources.close()
+
+    def classify(self, transcript: str) -> IntentConfidence:
+        """Cheaply predict whether ``maybe_answer`` would answer ``transcript``.
+
+        Weather, news, sports and league keywords are a likely match. Anything else is
+        answered only if it names a team, which is checked against the rosters already
+        indexed; until they are, the lookup has to run to find out.
+        """
+        simple = _normalize_text(transcript.strip())
+        if not simple:
+            return IntentConfidence.NONE
+        if (
+            self._is_weather(simple)
+            or self._is_news(simple)
+            or "sports" in simple
+            or "happening" in simple
+            or _extract_league(simple)
+        ):
+            return IntentConfidence.LIKELY
+        names_team = self.sources.sports.cached_team_match(_team_phrases(simple))
+        if names_team is None:
+            return IntentConfidence.POSSIBLE
+        return IntentConfidence.LIKELY if names_team else IntentConfidence.NONE
+
     async def maybe_answer(self, transcript: str) -> InfoResponse | None:
         normalized = transcript.strip()
         if not normalized:
@@ -288,16 +315,10 @@ class InfoService:
         return None
 
     async def _find_team_snapshot(self, text: str, leagues: Sequence[str] | None) -> TeamSnapshot | None:
-        words = [word for word in re.split(r"\s+", text) if word and word not in STOP_WORDS]
-        max_length = min(3, len(words))
-        for size in range(max_length, 0, -1):
-            for idx in range(len(words) - size + 1):
-                phrase = " ".join(words[idx : idx + size])
-                if len(phrase) < 3:
-                    continue
-                snapshot = await self.sources.sports.team_snapshot(phrase, leagues=leagues)
-                if snapshot:
-                    return snapshot
+        for phrase in _team_phrases(text):
+            snapshot = await self.sources.sports.team_snapshot(phrase, leagues=leagues)
+            if snapshot:
+                return snapshot
         return None
 
     def _format_team_snapshot(self, snapshot: TeamSnapshot, emphasize_next: bool) -> tuple[str, str] | None:
@@ -328,6 +349,18 @@ def _normalize_text(value: str) -> str:
     return value
 
 
+def _team_phrases(text: str) -> list[str]:
+    """Candidate team names in ``text``: runs of up to three non-stop-words, longest first."""
+    words = [word for word in re.split(r"\s+", text) if word and word not in STOP_WORDS]
+    phrases = []
+    for size in range(min(3, len(words)), 0, -1):
+        for idx in range(len(words) - size + 1):
+            phrase = " ".join(words[idx : idx + size])
+            if len(phrase) >= 3:
+                phrases.append(phrase)
+    return phrases
+
+
 def _describe_day(date_str: str, idx: int) -> str:
     try:
         date_obj = datetime.fromisoformat(date_str)
@@ -1,11 +1,20 @@
-"""External information sources for news, weather, and sports."""
+"""External information sources for news, weather, and sports.
+
+Every client issues its requests through one long-lived ``httpx.AsyncClient`` owned by
+``InfoSources``. Keep-alive connections survive between spoken questions, so a follow-up
+"and the news?" skips the DNS lookup, TCP connect and TLS handshake that otherwise
+dominate latency on a Pi.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import difflib
 import logging
 import re
 import time
-from collections.abc import Iterable, Sequence
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable, Sequence
 from dataclasses import dataclass
 from typing import Any
 
@@ -41,26 +50,188 @@ LEAGUE_PATHS: dict[str, tuple[str, str]] = {
 }
 
 
-class TTLCache:
-    """Simple in-memory cache with per-key TTL."""
+# Most answers touch one or two hosts, but a cold weather lookup can chain geocoding and
+# forecast calls; a handful of pooled connections covers that without letting a burst of
+# sports lookups open dozens of sockets. Idle connections are kept for a minute, which
+# spans a typical back-and-forth with the assistant.
+HTTP_TIMEOUT = 10.0
+HTTP_LIMITS = httpx.Limits(max_connections=8, max_keepalive_connections=4, keepalive_expiry=60.0)
+
+# Answers likely to be asked for (see info_prefetch.py) are refreshed in the background
+# once they are this close to expiry. Must exceed the prefetcher's tick so every entry
+# is caught inside its window.
+REFRESH_AHEAD_SECONDS = 90.0
+
+
+class SharedHttpClient:
+    """Lazily created ``httpx.AsyncClient`` shared by the info clients.
+
+    Created on first use so constructing ``InfoSources`` stays free of I/O, and recreated
+    if it was closed, so a lookup that races shutdown fails over to a fresh pool rather
+    than raising.
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: float = HTTP_TIMEOUT,
+        limits: httpx.Limits = HTTP_LIMITS,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self._timeout = timeout
+        self._limits = limits
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+
+    def get(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=self._timeout, limits=self._limits, transport=self._transport)
+        return self._client
+
+    async def aclose(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+
+# Marks a lookup that came back empty, so the cache can tell "known missing" from "unknown".
+_MISSING = object()
+
+
+# Fuzzy team matching only runs after every exact lookup missed. The _find_team_snapshot
+# phrase window feeds it arbitrary words from the question, so it stays strict: short
+# phrases never match fuzzily, and the similarity cutoff only admits small slips.
+TEAM_FUZZY_MIN_LENGTH = 5
+TEAM_FUZZY_CUTOFF = 0.88
+
+
+def _match_team(
+    query: str, indexes: Iterable[tuple[str, dict[str, dict[str, Any]]]]
+) -> tuple[str, dict[str, Any]] | None:
+    """(league, team) for ``query``: an exact token in the earliest league, else a close fuzzy match."""
+    searched = list(indexes)
+    normalized_query = query.strip().lower()
+    for league, index in searched:
+        team_obj = index.get(normalized_query)
+        if team_obj is not None:
+            return league, team_obj
+    if len(normalized_query) < TEAM_FUZZY_MIN_LENGTH:
+        return None
+    owners: dict[str, tuple[str, dict[str, Any]]] = {}
+    for league, index in searched:
+        for token, team_obj in index.items():
+            owners.setdefault(token, (league, team_obj))
+    matches = difflib.get_close_matches(normalized_query, list(owners), n=1, cutoff=TEAM_FUZZY_CUTOFF)
+    return owners[matches[0]] if matches else None
 
-    def __init__(self, ttl_seconds: int = 300) -> None:
+
+class TTLCache:
+    """Size-bounded LRU cache with per-key TTL, stale-while-revalidate and negative caching.
+
+    Entries are ``(fresh_until, stale_until, value)``. ``get``/``set`` only ever see fresh
+    values. ``get_or_fetch`` is what the clients use:
+
+    - a fresh entry is returned as is, and a background refresh starts once it is within
+      ``refresh_ahead_seconds`` of expiry, so a regularly read key never goes stale;
+    - an expired entry still inside ``stale_seconds`` is returned immediately while a
+      single background task refreshes it, so a repeated question never waits on upstream;
+    - anything else is fetched inline, and concurrent callers for one key share the fetch.
+
+    A fetch that returns ``None`` is remembered for ``negative_ttl_seconds``, so a place
+    name that doesn't geocode or an API that is down is not retried on every question. A
+    failed refresh keeps serving the stale value and retries after the same interval, but
+    never past ``stale_until``. The least recently used entries are evicted beyond
+    ``max_entries``, which bounds memory on devices that run for months.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 300,
+        *,
+        max_entries: int = 128,
+        stale_seconds: float = 0,
+        negative_ttl_seconds: float = 60,
+        refresh_ahead_seconds: float = 0,
+    ) -> None:
         self.ttl = ttl_seconds
-        self._values: dict[str, tuple[float, Any]] = {}
+        self.max_entries = max(1, max_entries)
+        self.stale_seconds = stale_seconds
+        self.negative_ttl = negative_ttl_seconds
+        self.refresh_ahead = refresh_ahead_seconds
+        self._values: OrderedDict[str, tuple[float, float, Any]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
 
     def get(self, key: str) -> Any | None:
         now = time.monotonic()
         entry = self._values.get(key)
         if not entry:
             return None
-        expires, value = entry
-        if expires < now:
+        fresh_until, stale_until, value = entry
+        if stale_until <= now:
             self._values.pop(key, None)
             return None
+        if fresh_until <= now or value is _MISSING:
+            return None
+        self._values.move_to_end(key)
         return value
 
     def set(self, key: str, value: Any) -> None:
-        self._values[key] = (time.monotonic() + self.ttl, value)
+        fresh_until = time.monotonic() + self.ttl
+        self._put(key, (fresh_until, fresh_until + self.stale_seconds, value))
+
+    async def get_or_fetch(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any | None:
+        """Return the cached value for ``key``, calling ``fetch`` when it is missing or stale."""
+        now = time.monotonic()
+        entry = self._values.get(key)
+        if entry is not None:
+            fresh_until, stale_until, value = entry
+            if now < stale_until:
+                self._values.move_to_end(key)
+                if value is _MISSING:
+                    return None
+                if now >= fresh_until - self.refresh_ahead and key not in self._inflight:
+                    self._start_fetch(key, fetch).add_done_callback(_log_refresh_failure)
+                return value
+            del self._values[key]
+        task = self._inflight.get(key) or self._start_fetch(key, fetch)
+        # Shielded so a cancelled voice turn doesn't abort a fetch other callers share.
+        return await asyncio.shield(task)
+
+    def cancel_pending(self) -> None:
+        for task in list(self._inflight.values()):
+            task.cancel()
+        self._inflight.clear()
+
+    def _start_fetch(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> asyncio.Task[Any]:
+        task = asyncio.create_task(self._run_fetch(key, fetch))
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._inflight.pop(key, None) if self._inflight.get(key) is done else None)
+        return task
+
+    async def _run_fetch(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any | None:
+        value = await fetch()
+        if value is not None:
+            self.set(key, value)
+            return value
+        now = time.monotonic()
+        retry_at = now + self.negative_ttl
+        entry = self._values.get(key)
+        if entry is not None and entry[2] is not _MISSING and now < entry[1]:
+            self._put(key, (min(retry_at, entry[1]), entry[1], entry[2]))
+        elif self.negative_ttl > 0:
+            self._put(key, (retry_at, retry_at, _MISSING))
+        return None
+
+    def _put(self, key: str, entry: tuple[float, float, Any]) -> None:
+        self._values[key] = entry
+        self._values.move_to_end(key)
+        while len(self._values) > self.max_entries:
+            self._values.popitem(last=False)
+
+
+def _log_refresh_failure(task: asyncio.Task[Any]) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        LOGGER.warning("[info] Background cache refresh failed: %s", task.exception())
 
 
 async def _get_json(
@@ -68,9 +239,14 @@ async def _get_json(
     *,
     params: dict[str, Any] | None = None,
     headers: dict[str, str] | None = None,
+    http: SharedHttpClient | None = None,
 ) -> dict | None:
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        if http is not None:
+            response = await http.get().get(url, params=params, headers=headers)
+            response.raise_for_status()
+            return response.json()
+        async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
             response = await client.get(url, params=params, headers=headers)
             response.raise_for_status()
             return response.json()
@@ -86,40 +262,45 @@ class NewsHeadline:
 
 
 class NewsClient:
-    def __init__(self, config: NewsConfig) -> None:
+    def __init__(self, config: NewsConfig, http: SharedHttpClient | None = None) -> None:
         self.config = config
-        self._cache = TTLCache(ttl_seconds=300)
+        self._http = http
+        self._cache = TTLCache(
+            ttl_seconds=300, max_entries=32, stale_seconds=1800, refresh_ahead_seconds=REFRESH_AHEAD_SECONDS
+        )
 
     async def latest(self, topic: str | None = None) -> list[NewsHeadline]:
-        if not self.config.api_key:
+        api_key = self.config.api_key
+        if not api_key:
             return []
-        cache_key = topic or "__default__"
-        cached = self._cache.get(cache_key)
-        if cached is not None:
-            return cached
+        results = await self._cache.get_or_fetch(topic or "__default__", lambda: self._fetch_latest(topic, api_key))
+        return results or []
 
+    async def _fetch_latest(self, topic: str | None, api_key: str) -> list[NewsHeadline] | None:
         params = {
             "country": self.config.country,
             "category": topic or self.config.category,
             "language": self.config.language,
             "pageSize": self.config.max_articles,
         }
-        headers = {"X-Api-Key": self.config.api_key}
-        payload = await _get_json(f"{self.config.base_url}/top-headlines", params=params, headers=headers)
+        headers = {"X-Api-Key": api_key}
+        payload = await _get_json(
+            f"{self.config.base_url}/top-headlines", params=params, headers=headers, http=self._http
+        )
+        if not payload:
+            return None
         results: list[NewsHeadline] = []
-        if payload:
-            for article in (payload.get("articles") or [])[: self.config.max_articles]:
-                title = (article.get("title") or "").strip()
-                if not title:
-                    continue
-                results.append(
-                    NewsHeadline(
-                        title=title,
-                        description=(article.get("description") or "").strip() or None,
-                        source=(article.get("source") or {}).get("name"),
-                    )
+        for article in (payload.get("articles") or [])[: self.config.max_articles]:
+            title = (article.get("title") or "").strip()
+            if not title:
+                continue
+            results.append(
+                NewsHeadline(
+                    title=title,
+                    description=(article.get("description") or "").strip() or None,
+                    source=(article.get("source") or {}).get("name"),
                 )
-        self._cache.set(cache_key, results)
+            )
         return results
 
 
@@ -150,11 +331,23 @@ class WeatherForecast:
 
 
 class WeatherClient:
-    def __init__(self, config: WeatherConfig, what3words_api_key: str | None) -> None:
+    def __init__(
+        self,
+        config: WeatherConfig,
+        what3words_api_key: str | None,
+        http: SharedHttpClient | None = None,
+    ) -> None:
         self.config = config
+        self._http = http
         self.what3words_api_key = what3words_api_key
-        self._location_cache = TTLCache(ttl_seconds=3600)
-        self._forecast_cache = TTLCache(ttl_seconds=600)
+        # Place names resolve to the same coordinates for years; the TTL only bounds how
+        # long a corrected geocoder answer takes to show up.
+        self._location_cache = TTLCache(
+            ttl_seconds=3600, max_entries=64, stale_seconds=86400, refresh_ahead_seconds=REFRESH_AHEAD_SECONDS
+        )
+        self._forecast_cache = TTLCache(
+            ttl_seconds=600, max_entries=16, stale_seconds=1800, refresh_ahead_seconds=REFRESH_AHEAD_SECONDS
+        )
 
     async def forecast(self) -> WeatherForecast | None:
         if not self.config.location:
@@ -166,9 +359,9 @@ class WeatherClient:
             f"{location.latitude:.4f},{location.longitude:.4f}:"
             f"{self.config.units}:{self.config.language}:{self.config.forecast_days}"
         )
-        cached = self._forecast_cache.get(cache_key)
-        if cached:
-            return cached
+        return await self._forecast_cache.get_or_fetch(cache_key, lambda: self._fetch_forecast(location))
+
+    async def _fetch_forecast(self, location: _Location) -> WeatherForecast | None:
         params = {
             "latitude": location.latitude,
             "longitude": location.longitude,
@@ -187,7 +380,7 @@ class WeatherClient:
             params["windspeed_unit"] = "kmh"
             params["precipitation_unit"] = "mm"
 
-        payload = await _get_json(self.config.base_url, params=params)
+        payload = await _get_json(self.config.base_url, params=params, http=self._http)
         if not payload:
             return None
         daily = payload.get("daily") or {}
@@ -214,49 +407,39 @@ class WeatherClient:
             windspeed=float(current_payload["windspeed"]) if "windspeed" in current_payload else None,
             time=str(current_payload.get("time")) if current_payload.get("time") else None,
         )
-        forecast = WeatherForecast(location.display_name, location.latitude, location.longitude, days, current=current)
-        self._forecast_cache.set(cache_key, forecast)
-        return forecast
+        return WeatherForecast(location.display_name, location.latitude, location.longitude, days, current=current)
 
     async def _resolve_location(self, raw: str):
         normalized = raw.strip()
-        cached = self._location_cache.get(normalized)
-        if cached:
-            return cached
+        return await self._location_cache.get_or_fetch(normalized, lambda: self._lookup_location(normalized))
+
+    async def _lookup_location(self, normalized: str):
         match = LAT_LON_PATTERN.match(normalized)
         if match:
             lat = float(match.group(1))
             lon = float(match.group(2))
-            result = _Location(latitude=lat, longitude=lon, display_name=f"{lat:.2f}, {lon:.2f}")
-            self._location_cache.set(normalized, result)
-            return result
+            return _Location(latitude=lat, longitude=lon, display_name=f"{lat:.2f}, {lon:.2f}")
         if WHAT3WORDS_PATTERN.match(normalized.lower()) and self.what3words_api_key:
             coords = await self._resolve_what3words(normalized)
             if coords:
-                self._location_cache.set(normalized, coords)
                 return coords
         postal_match = POSTAL_CODE_PATTERN.match(normalized)
         if postal_match:
             coords = await self._resolve_postal_code(postal_match.group(1))
             if coords:
-                self._location_cache.set(normalized, coords)
                 return coords
         if "+" in normalized and not normalized.startswith("http"):
             coords = _decode_plus_code(normalized)
             if coords:
-                self._location_cache.set(normalized, coords)
                 return coords
-        geocoded = await self._geocode_text(normalized)
-        if geocoded:
-            self._location_cache.set(normalized, geocoded)
-            return geocoded
-        return None
+        return await self._geocode_text(normalized)
 
     async def _geocode_text(self, query: str):
         for candidate in _expand_geocode_queries(query):
             payload = await _get_json(
                 "https://geocoding-api.open-meteo.com/v1/search",
                 params={"name": candidate, "count": 1, "language": self.config.language},
+                http=self._http,
             )
             if not payload:
                 continue
@@ -275,6 +458,7 @@ class WeatherClient:
         payload = await _get_json(
             "https://api.what3words.com/v3/convert-to-coordinates",
             params={"words": words, "key": self.what3words_api_key},
+            http=self._http,
         )
         if not payload:
             return None
@@ -288,7 +472,7 @@ class WeatherClient:
         )
 
     async def _resolve_postal_code(self, postal_code: str):
-        payload = await _get_json(f"https://api.zippopotam.us/us/{postal_code}")
+        payload = await _get_json(f"https://api.zippopotam.us/us/{postal_code}", http=self._http)
         if not payload:
             return None
         places = payload.get("places") or []
@@ -323,38 +507,43 @@ class TeamSnapshot:
 
 
 class SportsClient:
-    def __init__(self, config: SportsConfig) -> None:
+    def __init__(self, config: SportsConfig, http: SharedHttpClient | None = None) -> None:
         self.config = config
-        self._headline_cache = TTLCache(ttl_seconds=300)
-        self._league_cache = TTLCache(ttl_seconds=300)
-        self._team_cache = TTLCache(ttl_seconds=3600)
+        self._http = http
+        self._headline_cache = TTLCache(ttl_seconds=300, max_entries=8, stale_seconds=1800)
+        self._league_cache = TTLCache(ttl_seconds=300, max_entries=32, stale_seconds=1800)
+        self._team_cache = TTLCache(
+            ttl_seconds=3600,
+            max_entries=len(LEAGUE_PATHS),
+            stale_seconds=3600,
+            refresh_ahead_seconds=REFRESH_AHEAD_SECONDS,
+        )
+        # league -> (roster list the index was built from, token -> team)
+        self._team_indexes: dict[str, tuple[list[dict[str, Any]], dict[str, dict[str, Any]]]] = {}
 
     async def general_headlines(self, limit: int = 5) -> list[SportsHeadline]:
         cache_key = f"general:{limit}:{self.config.headline_country}"
-        cached = self._headline_cache.get(cache_key)
-        if cached is not None:
-            return cached
-        url = f"{self.config.base_url}/site/v2/sports/news"
-        payload = await _get_json(url, params={"region": self.config.headline_country})
-        headlines = self._extract_headlines(payload, limit=limit, league=None)
-        self._headline_cache.set(cache_key, headlines)
-        return headlines
+
+        async def fetch() -> list[SportsHeadline] | None:
+            url = f"{self.config.base_url}/site/v2/sports/news"
+            payload = await _get_json(url, params={"region": self.config.headline_country}, http=self._http)
+            return self._extract_headlines(payload, limit=limit, league=None) if payload else None
+
+        return await self._headline_cache.get_or_fetch(cache_key, fetch) or []
 
     async def league_headlines(self, league: str, limit: int = 5) -> list[SportsHeadline]:
         league = league.lower()
-        cache_key = f"league:{league}:{limit}"
-        cached = self._league_cache.get(cache_key)
-        if cached is not None:
-            return cached
         path = self._league_path(league)
         if not path:
             return []
         sport, league_slug = path
-        url = f"{self.config.base_url}/site/v2/sports/{sport}/{league_slug}/news"
-        payload = await _get_json(url)
-        headlines = self._extract_headlines(payload, limit=limit, league=league)
-        self._league_cache.set(cache_key, headlines)
-        return headlines
+
+        async def fetch() -> list[SportsHeadline] | None:
+            url = f"{self.config.base_url}/site/v2/sports/{sport}/{league_slug}/news"
+            payload = await _get_json(url, http=self._http)
+            return self._extract_headlines(payload, limit=limit, league=league) if payload else None
+
+        return await self._league_cache.get_or_fetch(f"league:{league}:{limit}", fetch) or []
 
     async def league_standings(self, league: str, limit: int = 5) -> list[dict[str, Any]]:
         league = league.lower()
@@ -363,7 +552,7 @@ class SportsClient:
             return []
         sport, league_slug = path
         url = f"{self.config.base_url}/site/v2/sports/{sport}/{league_slug}/standings"
-        payload = await _get_json(url, params={"region": self.config.default_country})
+        payload = await _get_json(url, params={"region": self.config.default_country}, http=self._http)
         standings: list[dict[str, Any]] = []
         if not payload:
             return standings
@@ -400,47 +589,80 @@ class SportsClient:
         return standings[:limit]
 
     async def team_snapshot(self, query: str, leagues: Sequence[str] | None = None) -> TeamSnapshot | None:
-        leagues_to_search: Iterable[str] = leagues or self.config.default_leagues
-        normalized_query = query.strip().lower()
-        for league in leagues_to_search:
-            teams = await self._league_teams(league)
-            for team in teams:
-                team_obj = team.get("team") or {}
-                if not team_obj:
-                    continue
-                values = _team_name_tokens(team_obj)
-                if normalized_query in values:
-                    record = _team_record(team_obj)
-                    next_event = self._pick_next_event(team_obj)
-                    previous_event = self._pick_previous_event(team_obj)
-                    return TeamSnapshot(
-                        name=team_obj.get("displayName") or team_obj.get("name") or query,
-                        record=record,
-                        next_event=next_event,
-                        previous_event=previous_event,
-                        league=league,
-                    )
-        return None
+        """Find a team by name, nickname, abbreviation or slug across ``leagues``.
+
+        Rosters are fetched concurrently and looked up through a per-league token index.
+        An exact hit in an earlier league wins. Only when no league has one is the query
+        matched fuzzily, which catches transcription slips like "philadelphia eagle".
+        """
+        leagues_to_search = [league.lower() for league in (leagues or self.config.default_leagues)]
+        indexes = await asyncio.gather(*(self._league_index(league) for league in leagues_to_search))
+        match = _match_team(query, zip(leagues_to_search, indexes, strict=True))
+        if match is None:
+            return None
+        league, team_obj = match
+        return self._snapshot(team_obj, league, query)
+
+    def cached_team_match(self, queries: Iterable[str]) -> bool | None:
+        """Whether any of ``queries`` names a team in the default leagues, without fetching.
+
+        Uses the same exact-then-fuzzy rule as ``team_snapshot`` over the rosters indexed so
+        far. Returns None while any default league has not been indexed yet, since only a
+        real lookup can tell then.
+        """
+        indexed = []
+        for league in self.config.default_leagues:
+            built = self._team_indexes.get(league.lower())
+            if built is None:
+                return None
+            indexed.append((league.lower(), built[1]))
+        return any(_match_team(query, indexed) is not None for query in queries)
+
+    def _snapshot(self, team_obj: dict[str, Any], league: str, query: str) -> TeamSnapshot:
+        return TeamSnapshot(
+            name=team_obj.get("displayName") or team_obj.get("name") or query,
+            record=_team_record(team_obj),
+            next_event=self._pick_next_event(team_obj),
+            previous_event=self._pick_previous_event(team_obj),
+            league=league,
+        )
+
+    async def _league_index(self, league: str) -> dict[str, dict[str, Any]]:
+        """Token -> team for ``league``, rebuilt only when its roster was refetched."""
+        teams = await self._league_teams(league)
+        built = self._team_indexes.get(league)
+        if built is not None and built[0] is teams:
+            return built[1]
+        index: dict[str, dict[str, Any]] = {}
+        for team in teams:
+            team_obj = team.get("team") or {}
+            if not team_obj:
+                continue
+            for token in _team_name_tokens(team_obj):
+                # First team wins, as the old linear scan did.
+                index.setdefault(token, team_obj)
+        self._team_indexes[league] = (teams, index)
+        return index
 
     async def _league_teams(self, league: str):
         league = league.lower()
-        cached = self._team_cache.get(league)
-        if cached is not None:
-            return cached
         path = self._league_path(league)
         if not path:
             return []
         sport, league_slug = path
-        url = f"{self.config.base_url}/site/v2/sports/{sport}/{league_slug}/teams"
-        payload = await _get_json(url, params={"limit": 400})
-        teams: list[dict[str, str]] = []
-        if payload:
-            sports_block = payload.get("sports") or []
-            for sport_entry in sports_block:
+
+        async def fetch() -> list[dict[str, Any]] | None:
+            url = f"{self.config.base_url}/site/v2/sports/{sport}/{league_slug}/teams"
+            payload = await _get_json(url, params={"limit": 400}, http=self._http)
+            if not payload:
+                return None
+            teams: list[dict[str, Any]] = []
+            for sport_entry in payload.get("sports") or []:
                 for league_entry in sport_entry.get("leagues") or []:
                     teams.extend(league_entry.get("teams") or [])
-        self._team_cache.set(league, teams)
-        return teams
+            return teams
+
+        return await self._team_cache.get_or_fetch(league, fetch) or []
 
     def _league_path(self, league: str) -> tuple[str, str] | None:
         league = league.lower()
@@ -617,8 +839,22 @@ def _simplify_event(event: dict[str, Any]) -> dict[str, Any]:
 class InfoSources:
     """Aggregates the individual data clients into a single facade."""
 
-    def __init__(self, config: InfoConfig) -> None:
+    def __init__(self, config: InfoConfig, http: SharedHttpClient | None = None) -> None:
         self.config = config
-        self.news = NewsClient(config.news)
-        self.weather = WeatherClient(config.weather, config.what3words_api_key)
-        self.sports = SportsClient(config.sports)
+        self.http = http or SharedHttpClient()
+        self.news = NewsClient(config.news, self.http)
+        self.weather = WeatherClient(config.weather, config.what3words_api_key, self.http)
+        self.sports = SportsClient(config.sports, self.http)
+
+    async def close(self) -> None:
+        """Cancel background cache refreshes and close the pooled connections; safe to call twice."""
+        for cache in (
+            self.news._cache,
+            self.weather._location_cache,
+            self.weather._forecast_cache,
+            self.sports._headline_cache,
+            self.sports._league_cache,
+            self.sports._team_cache,
+        ):
+            cache.cancel_pending()
+        await self.http.aclose()
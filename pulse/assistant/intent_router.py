@@ -0,0 +1,96 @@
+"""Route transcripts to shortcut handlers before falling back to the LLM.
+
+Each shortcut handler (stop phrase, music, schedules, info) exposes a cheap synchronous
+classifier alongside its async ``maybe_handle``. The router classifies the transcript
+against every handler in one pass, skips handlers that are certain to decline, and runs
+the remaining ones in priority order.
+
+When no handler recognises the request outright, the LLM request is started
+speculatively so it overlaps with handlers that still need I/O to decide (e.g. a
+sports team lookup). If a shortcut ends up handling the transcript, the speculative
+task is cancelled; the LLM providers make the request on the event loop, so this closes
+the connection rather than leaving it running in a worker thread. Tokens the provider
+generated before the connection closed may still be billed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Coroutine, Sequence
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any
+
+LOGGER = logging.getLogger(__name__)
+
+
+class IntentConfidence(IntEnum):
+    """How sure a handler's classifier is that it will handle a transcript."""
+
+    NONE = 0
+    """The handler would decline; it is skipped entirely."""
+    POSSIBLE = 1
+    """The handler has to run to find out (it may need a lookup)."""
+    LIKELY = 2
+    """The handler recognised the request."""
+
+
+@dataclass(frozen=True)
+class IntentRoute:
+    name: str
+    classify: Callable[[str], IntentConfidence]
+    handle: Callable[[str], Awaitable[bool]]
+
+
+@dataclass
+class RouteResult[T]:
+    handled_by: str | None
+    """Name of the route that handled the transcript, or ``None`` if all declined."""
+    fallback: asyncio.Task[T] | None = None
+    """Speculatively started fallback request, when one was started and is still needed."""
+
+
+def classify_routes(routes: Sequence[IntentRoute], transcript: str) -> list[tuple[IntentRoute, IntentConfidence]]:
+    """Classify ``transcript`` against every route, keeping priority order and dropping certain misses."""
+    classified: list[tuple[IntentRoute, IntentConfidence]] = []
+    for route in routes:
+        confidence = route.classify(transcript)
+        if confidence is not IntentConfidence.NONE:
+            classified.append((route, confidence))
+    return classified
+
+
+async def route_transcript[T](
+    transcript: str,
+    routes: Sequence[IntentRoute],
+    *,
+    speculate: Callable[[], Coroutine[Any, Any, T]] | None = None,
+    logger: logging.Logger | None = None,
+) -> RouteResult[T]:
+    """Run matching routes in priority order, optionally overlapping the fallback request.
+
+    ``speculate`` is started as a task only when no route classified the transcript as
+    ``LIKELY``; it is cancelled if a route handles the transcript, otherwise it is
+    returned in ``RouteResult.fallback`` for the caller to await. Cancellation only stops
+    the work if ``speculate`` awaits it cooperatively; a call parked in a thread runs on.
+    """
+
+    log = logger or LOGGER
+    candidates = classify_routes(routes, transcript)
+    speculative: asyncio.Task[T] | None = None
+    if speculate is not None and not any(confidence is IntentConfidence.LIKELY for _, confidence in candidates):
+        log.debug("[intent] No confident shortcut match; starting fallback request speculatively")
+        speculative = asyncio.create_task(speculate())
+    try:
+        for route, _ in candidates:
+            if await route.handle(transcript):
+                if speculative is not None:
+                    speculative.cancel()
+                    log.debug("[intent] Cancelled speculative fallback; handled by %s", route.name)
+                return RouteResult(route.name)
+    except BaseException:
+        if speculative is not None:
+            speculative.cancel()
+        raise
+    return RouteResult(None, speculative)
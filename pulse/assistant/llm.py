@@ -5,12 +5,15 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import socket
 import urllib.error
 import urllib.parse
 import urllib.request
 from collections.abc import Iterable
 from dataclasses import dataclass
 
+import httpx
+
 from .config import LLMConfig
 
 # Registry of supported LLM providers
@@ -48,6 +51,7 @@ def _error_response(exc: Exception) -> str:
 
 class LLMProvider:
     async def generate(self, user_text: str, actions_for_prompt: Iterable[dict[str, str]]) -> LLMResult:
+        """Answer a transcript. Cancelling the awaiting task aborts the HTTP request."""
         raise NotImplementedError
 
     async def simple_chat(self, system_prompt: str, user_message: str, *, timeout: int = 5) -> str:
@@ -62,6 +66,71 @@ class LLMProvider:
         """
         return True
 
+    async def prewarm(self) -> None:
+        """Prepare for an imminent request (called when a wake word fires).
+
+        Requests go through ``urllib`` and open a fresh connection each time, so the only
+        reusable work is name resolution. Concrete providers resolve their API host here.
+        That only saves time when a caching resolver (systemd-resolved, nscd, dnsmasq) sits
+        in front of glibc; a stock Pi OS has none, and the later lookup goes out again.
+        """
+
+    def _build_request(self, payload: dict) -> tuple[str, dict[str, str]]:
+        """URL and headers for one completion request; raises if the provider is not configured."""
+        raise NotImplementedError
+
+    def _default_timeout(self) -> int:
+        raise NotImplementedError
+
+    def _http_error(self, status: int, body: str) -> RuntimeError:
+        raise NotImplementedError
+
+    def _extract_text(self, body: str) -> str:
+        """The model's reply text from a successful response body."""
+        raise NotImplementedError
+
+    def _call_api(self, payload: dict, *, timeout: int | None = None) -> str:
+        """Blocking completion request through ``urllib``, for callers that run it in a thread."""
+        url, headers = self._build_request(payload)
+        request = urllib.request.Request(
+            url=url, data=json.dumps(payload).encode("utf-8"), headers=headers, method="POST"
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=timeout or self._default_timeout()) as response:  # nosec B310 - timeout in kwargs
+                body = response.read().decode("utf-8")
+        except urllib.error.HTTPError as exc:
+            raise self._http_error(exc.code, _http_error_body(exc)) from exc
+        return self._extract_text(body)
+
+    async def _call_api_async(self, payload: dict, *, timeout: int | None = None) -> str:
+        """Completion request on the event loop.
+
+        Unlike ``_call_api`` in a worker thread, cancelling the awaiting task closes the
+        connection, so a speculative request that a shortcut made redundant stops holding
+        resources at once. A provider may still bill for tokens generated before that.
+        """
+        url, headers = self._build_request(payload)
+        async with httpx.AsyncClient(timeout=timeout or self._default_timeout()) as client:
+            response = await client.post(url, content=json.dumps(payload).encode("utf-8"), headers=headers)
+        if response.status_code >= 400:
+            raise self._http_error(response.status_code, response.text)
+        return self._extract_text(response.text)
+
+
+def _http_error_body(exc: urllib.error.HTTPError) -> str:
+    try:
+        return exc.read().decode("utf-8", errors="replace")
+    except Exception:
+        return ""  # Best-effort: the error body is optional context
+
+
+async def _resolve_api_host(base_url: str) -> None:
+    parts = urllib.parse.urlsplit(base_url)
+    if not parts.hostname:
+        return
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    await asyncio.get_running_loop().getaddrinfo(parts.hostname, port, type=socket.SOCK_STREAM)
+
 
 def _extract_first_json_object(text: str) -> dict[str, object] | None:
     """Find and parse the first valid JSON object in *text*, skipping non-JSON preamble."""
@@ -190,10 +259,13 @@ class OpenAICompatibleProvider(LLMProvider):
             self._logger.warning("[llm] %s API key validation inconclusive: %s", name, exc)
             return True  # network issue — don't block startup
 
+    async def prewarm(self) -> None:
+        await _resolve_api_host(self._get_base_url())
+
     async def generate(self, user_text: str, actions_for_prompt: Iterable[dict[str, str]]) -> LLMResult:
         payload = self._build_payload(user_text, list(actions_for_prompt))
         try:
-            response_text = await asyncio.to_thread(self._call_api, payload)
+            response_text = await self._call_api_async(payload)
         except Exception as exc:
             self._logger.exception("[llm] LLM call failed: %s", exc)
             return LLMResult(response=_error_response(exc), actions=[])
@@ -220,27 +292,20 @@ class OpenAICompatibleProvider(LLMProvider):
         }
         return payload
 
-    def _call_api(self, payload: dict, *, timeout: int | None = None) -> str:
+    def _build_request(self, payload: dict) -> tuple[str, dict[str, str]]:
         api_key = self._get_api_key()
         if not api_key:
             raise RuntimeError(f"{self._get_provider_name().upper()}_API_KEY is not set")
+        url = f"{self._get_base_url().rstrip('/')}/chat/completions"
+        return url, {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
 
-        data = json.dumps(payload).encode("utf-8")
-        request = urllib.request.Request(
-            url=f"{self._get_base_url().rstrip('/')}/chat/completions",
-            data=data,
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
-            method="POST",
-        )
-        try:
-            with urllib.request.urlopen(request, timeout=timeout or self._get_timeout()) as response:  # nosec B310 - timeout in kwargs
-                body = response.read().decode("utf-8")
-        except urllib.error.HTTPError as exc:
-            raise RuntimeError(f"{self._get_provider_name()} HTTP error: {exc.code}") from exc
+    def _default_timeout(self) -> int:
+        return self._get_timeout()
 
+    def _http_error(self, status: int, body: str) -> RuntimeError:
+        return RuntimeError(f"{self._get_provider_name()} HTTP error: {status}")
+
+    def _extract_text(self, body: str) -> str:
         parsed = json.loads(body)
         choices = parsed.get("choices") or []
         if not choices:
@@ -379,10 +444,13 @@ class AnthropicProvider(LLMProvider):
             self._logger.warning("[llm] Anthropic API key validation inconclusive: %s", exc)
             return True
 
+    async def prewarm(self) -> None:
+        await _resolve_api_host(self.config.anthropic_base_url)
+
     async def generate(self, user_text: str, actions_for_prompt: Iterable[dict[str, str]]) -> LLMResult:
         payload = self._build_payload(user_text, list(actions_for_prompt))
         try:
-            response_text = await asyncio.to_thread(self._call_api, payload)
+            response_text = await self._call_api_async(payload)
         except Exception as exc:
             self._logger.exception("LLM call failed: %s", exc)
             return LLMResult(response=_error_response(exc), actions=[])
@@ -406,33 +474,23 @@ class AnthropicProvider(LLMProvider):
         }
         return payload
 
-    def _call_api(self, payload: dict, *, timeout: int | None = None) -> str:
+    def _build_request(self, payload: dict) -> tuple[str, dict[str, str]]:
         if not self.config.anthropic_api_key:
             raise RuntimeError("ANTHROPIC_API_KEY is not set")
+        url = f"{self.config.anthropic_base_url.rstrip('/')}/messages"
+        return url, {
+            "x-api-key": self.config.anthropic_api_key,
+            "anthropic-version": "2023-06-01",
+            "Content-Type": "application/json",
+        }
 
-        data = json.dumps(payload).encode("utf-8")
-        request = urllib.request.Request(
-            url=f"{self.config.anthropic_base_url.rstrip('/')}/messages",
-            data=data,
-            headers={
-                "x-api-key": self.config.anthropic_api_key,
-                "anthropic-version": "2023-06-01",
-                "Content-Type": "application/json",
-            },
-            method="POST",
-        )
+    def _default_timeout(self) -> int:
+        return self.config.anthropic_timeout
 
-        try:
-            with urllib.request.urlopen(request, timeout=timeout or self.config.anthropic_timeout) as response:  # nosec B310 - timeout in kwargs
-                body = response.read().decode("utf-8")
-        except urllib.error.HTTPError as exc:
-            error_body = ""
-            try:
-                error_body = exc.read().decode("utf-8", errors="replace")
-            except Exception:
-                pass  # Best-effort: error body is optional context for the RuntimeError
-            raise RuntimeError(f"Anthropic HTTP {exc.code}: {error_body}") from exc
+    def _http_error(self, status: int, body: str) -> RuntimeError:
+        return RuntimeError(f"Anthropic HTTP {status}: {body}")
 
+    def _extract_text(self, body: str) -> str:
         # Parse Anthropic response format: {"content": [{"type": "text", "text": "..."}]}
         parsed = json.loads(body)
         content = parsed.get("content") or []
@@ -493,10 +551,13 @@ class GeminiProvider(LLMProvider):
             self._logger.warning("[llm] Gemini API key validation inconclusive: %s", exc)
             return True
 
+    async def prewarm(self) -> None:
+        await _resolve_api_host(self.config.gemini_base_url)
+
     async def generate(self, user_text: str, actions_for_prompt: Iterable[dict[str, str]]) -> LLMResult:
         payload = self._build_payload(user_text, list(actions_for_prompt))
         try:
-            response_text = await asyncio.to_thread(self._call_api, payload)
+            response_text = await self._call_api_async(payload)
         except Exception as exc:
             self._logger.exception("[llm] LLM call failed: %s", exc)
             return LLMResult(response=_error_response(exc), actions=[])
@@ -527,32 +588,22 @@ class GeminiProvider(LLMProvider):
             }
         return payload
 
-    def _call_api(self, payload: dict, *, timeout: int | None = None) -> str:
+    def _build_request(self, payload: dict) -> tuple[str, dict[str, str]]:
         if not self.config.gemini_api_key:
             raise RuntimeError("GEMINI_API_KEY is not set")
         model = (self.config.gemini_model or "").strip()
         if not model:
             raise RuntimeError("GEMINI_MODEL is not set")
-        base_url = self.config.gemini_base_url.rstrip("/")
-        endpoint = f"{base_url}/models/{model}:generateContent"
-        url = endpoint
+        url = f"{self.config.gemini_base_url.rstrip('/')}/models/{model}:generateContent"
+        return url, {"Content-Type": "application/json", "x-goog-api-key": self.config.gemini_api_key}
 
-        data = json.dumps(payload).encode("utf-8")
-        request = urllib.request.Request(
-            url=url,
-            data=data,
-            headers={
-                "Content-Type": "application/json",
-                "x-goog-api-key": self.config.gemini_api_key,
-            },
-            method="POST",
-        )
-        try:
-            with urllib.request.urlopen(request, timeout=timeout or self.config.gemini_timeout) as response:  # nosec B310 - timeout in kwargs
-                body = response.read().decode("utf-8")
-        except urllib.error.HTTPError as exc:
-            raise RuntimeError(f"Gemini HTTP error: {exc.code}") from exc
+    def _default_timeout(self) -> int:
+        return self.config.gemini_timeout
+
+    def _http_error(self, status: int, body: str) -> RuntimeError:
+        return RuntimeError(f"Gemini HTTP error: {status}")
 
+    def _extract_text(self, body: str) -> str:
         parsed = json.loads(body)
         candidates = parsed.get("candidates") or []
         for candidate in candidates:
@@ -8,6 +8,8 @@ import logging
 from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING
 
+from pulse.assistant.intent_router import IntentConfidence
+
 if TYPE_CHECKING:
     from pulse.assistant.home_assistant import HomeAssistantClient
     from pulse.assistant.llm import LLMProvider
@@ -24,6 +26,31 @@ _PLAY_PREFIXES = (
     "i want to hear ",
 )
 
+_CONTROL_COMMANDS: tuple[tuple[tuple[str, ...], str, str], ...] = (
+    (("pause the music", "pause music", "pause the song", "pause song"), "media_pause", "Paused the music."),
+    (
+        ("stop the music", "stop music", "stop the song", "stop song"),
+        "media_stop",
+        "Stopped the music.",
+    ),
+    (
+        ("next song", "skip song", "skip this song", "next track"),
+        "media_next_track",
+        "Skipping to the next song.",
+    ),
+)
+
+_TRACK_INFO_PHRASES = (
+    "what song is this",
+    "what song am i listening to",
+    "what is this song",
+    "what's this song",
+    "what's playing",
+    "what song",
+    "who is this",
+    "who's this",
+)
+
 _COMPANION_SYSTEM_PROMPT = (
     "You are a music expert. Some tracks are famous for being inseparable pairs that "
     "should always be played together (e.g., 'Eruption' always followed by 'You Really "
@@ -92,6 +119,20 @@ class MusicCommandHandler:
         """
         self._on_log_response = callback
 
+    def classify(self, transcript: str) -> IntentConfidence:
+        """Cheaply predict whether ``maybe_handle`` would act on ``transcript``."""
+        query = (transcript or "").strip().lower()
+        if not query or not self.home_assistant or not self.media_player_entity:
+            return IntentConfidence.NONE
+        if any(phrase in query for phrases, _, _ in _CONTROL_COMMANDS for phrase in phrases):
+            return IntentConfidence.LIKELY
+        if any(phrase in query for phrase in _TRACK_INFO_PHRASES):
+            return IntentConfidence.LIKELY
+        for prefix in _PLAY_PREFIXES:
+            if query.startswith(prefix):
+                return IntentConfidence.LIKELY if query[len(prefix) :].strip() else IntentConfidence.NONE
+        return IntentConfidence.NONE
+
     async def maybe_handle(self, transcript: str) -> bool:
         """Check if transcript is a music command and handle it.
 
@@ -102,34 +143,11 @@ class MusicCommandHandler:
         if not query or not self.home_assistant or not self.media_player_entity:
             return False
 
-        controls = [
-            (("pause the music", "pause music", "pause the song", "pause song"), "media_pause", "Paused the music."),
-            (
-                ("stop the music", "stop music", "stop the song", "stop song"),
-                "media_stop",
-                "Stopped the music.",
-            ),
-            (
-                ("next song", "skip song", "skip this song", "next track"),
-                "media_next_track",
-                "Skipping to the next song.",
-            ),
-        ]
-        for phrases, service, success_text in controls:
+        for phrases, service, success_text in _CONTROL_COMMANDS:
             if any(phrase in query for phrase in phrases):
                 return await self._call_service(service, success_text)
 
-        info_phrases = (
-            "what song is this",
-            "what song am i listening to",
-            "what is this song",
-            "what's this song",
-            "what's playing",
-            "what song",
-            "who is this",
-            "who's this",
-        )
-        if any(phrase in query for phrase in info_phrases):
+        if any(phrase in query for phrase in _TRACK_INFO_PHRASES):
             return await self._describe_current_track("who" in query)
 
         # Play commands — detect prefix on lowered text, extract from original transcript
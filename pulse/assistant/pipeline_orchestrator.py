@@ -7,16 +7,25 @@ import base64
 import json
 import logging
 import time
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
+from functools import partial
 from typing import TYPE_CHECKING
 
 from pulse.assistant.conversation_manager import (
     looks_like_noise_initial_transcript,
     should_listen_for_follow_up,
 )
+from pulse.assistant.intent_router import IntentConfidence, IntentRoute, route_transcript
 from pulse.assistant.response_modes import select_ha_response
-from pulse.assistant.wyoming import play_tts_stream, transcribe_audio
+from pulse.assistant.wyoming import (
+    SynthesizedAudio,
+    WyomingClientPool,
+    play_tts_pipelined,
+    play_tts_stream,
+    synthesize_audio,
+    transcribe_audio,
+)
 from pulse.audio import play_sound, play_volume_feedback
 from pulse.utils import normalize_for_tts
 
@@ -37,11 +46,16 @@ if TYPE_CHECKING:
     from pulse.assistant.schedule_service import ScheduleService
     from pulse.assistant.schedule_shortcuts import ScheduleShortcutHandler
     from pulse.assistant.scheduler import AssistantScheduler
+    from pulse.assistant.tts_cache import TtsCache
     from pulse.assistant.wake_detector import WakeDetector
     from pulse.sound_library import SoundLibrary
 
 LOGGER = logging.getLogger(__name__)
 
+TTS_WARMUP_TIMEOUT = 30.0
+STOP_ROUTE = "stop"
+PREWARM_TIMEOUT = 5.0
+
 
 @dataclass
 class AssistRunTracker:
@@ -51,6 +65,7 @@ class AssistRunTracker:
     stage_start: float = field(default_factory=time.monotonic)
     current_stage: str | None = None
     stage_durations: dict[str, int] = field(default_factory=dict)
+    timings: dict[str, int] = field(default_factory=dict)
 
     def begin_stage(self, stage: str) -> None:
         now = time.monotonic()
@@ -59,6 +74,12 @@ class AssistRunTracker:
         self.current_stage = stage
         self.stage_start = now
 
+    def record_timings(self, prefix: str, metrics: dict[str, int]) -> None:
+        """Accumulate sub-stage timings such as ``stt_connect_ms`` / ``stt_inference_ms``."""
+        for key, value in metrics.items():
+            name = f"{prefix}_{key}"
+            self.timings[name] = self.timings.get(name, 0) + value
+
     def finalize(self, status: str) -> dict[str, object]:
         now = time.monotonic()
         if self.current_stage:
@@ -69,6 +90,7 @@ class AssistRunTracker:
             "status": status,
             "total_ms": int((now - self.start) * 1000),
             "stages": self.stage_durations,
+            "timings": self.timings,
         }
 
 
@@ -95,6 +117,8 @@ class PipelineOrchestrator:
         scheduler: AssistantScheduler,
         player: AplaySink,
         sound_library: SoundLibrary,
+        tts_cache: TtsCache | None = None,
+        wyoming_pool: WyomingClientPool | None = None,
         logger: logging.Logger | None = None,
     ) -> None:
         self.config = config
@@ -114,9 +138,12 @@ class PipelineOrchestrator:
         self.scheduler = scheduler
         self.player = player
         self._sound_library = sound_library
+        self.tts_cache = tts_cache
+        self.wyoming_pool = wyoming_pool
         self.logger = logger or LOGGER
 
         self._current_tracker: AssistRunTracker | None = None
+        self._prewarm_tasks: set[asyncio.Task[None]] = set()
         self._assist_stage = "idle"
         self._assist_pipeline: str | None = None
 
@@ -161,6 +188,7 @@ class PipelineOrchestrator:
         tracker.begin_stage("listening")
         self._current_tracker = tracker
         self._set_assist_stage("pulse", "listening", {"wake_word": wake_word})
+        self._start_prewarm("pulse")
         await self._maybe_play_wake_sound()
         await self.media_controller.maybe_pause_media_playback()
         await self.schedule_service.pause_active_audio()
@@ -182,6 +210,7 @@ class PipelineOrchestrator:
                     wake_word,
                     transcript,
                 )
+                self._cancel_prewarm()
                 self._finalize_assist_run(status="no_transcript")
                 return
             if self.config.log_transcripts:
@@ -189,19 +218,13 @@ class PipelineOrchestrator:
             if self.preference_manager.log_llm_messages:
                 transcript_payload = {"text": transcript, "wake_word": wake_word}
                 self.publisher._publish_message(self.config.transcript_topic, json.dumps(transcript_payload))
-            if await self._maybe_handle_stop_phrase(transcript, wake_word, tracker):
+            handled_by, llm_result = await self._dispatch_transcript(transcript, wake_word, tracker)
+            if handled_by == STOP_ROUTE:
                 self._finalize_assist_run(status="cancelled")
                 return
-            if await self.music_handler.maybe_handle(transcript):
-                self._finalize_assist_run(status="success")
-                return
-            if await self.schedule_shortcuts.maybe_handle_schedule_shortcut(transcript):
-                self._finalize_assist_run(status="success")
-                return
-            if await self.info_query_handler.maybe_handle(transcript, wake_word):
+            if handled_by:
                 self._finalize_assist_run(status="success")
                 return
-            llm_result = await self._execute_llm_turn(transcript, wake_word, tracker)
             follow_up_needed = should_listen_for_follow_up(llm_result)
             follow_up_attempts = 0
             max_follow_up_attempts = 2
@@ -251,28 +274,18 @@ class PipelineOrchestrator:
                         await self.speak("Sorry, I didn't catch that.")
                         break
                     continue
-                if await self._maybe_handle_stop_phrase(
+                handled_by, llm_result = await self._dispatch_transcript(
                     follow_up_transcript,
                     wake_word,
                     tracker,
                     follow_up=True,
-                ):
+                )
+                if handled_by == STOP_ROUTE:
                     self._finalize_assist_run(status="cancelled")
                     return
-                if await self.music_handler.maybe_handle(follow_up_transcript):
-                    follow_up_needed = False
-                    continue
-                if await self.schedule_shortcuts.maybe_handle_schedule_shortcut(follow_up_transcript):
-                    follow_up_needed = False
-                    continue
-                if await self.info_query_handler.maybe_handle(
-                    follow_up_transcript,
-                    wake_word,
-                    follow_up=True,
-                ):
+                if handled_by:
                     follow_up_needed = False
                     continue
-                llm_result = await self._execute_llm_turn(follow_up_transcript, wake_word, tracker, follow_up=True)
                 follow_up_needed = should_listen_for_follow_up(llm_result)
             self._finalize_assist_run(status="success")
         finally:
@@ -287,6 +300,7 @@ class PipelineOrchestrator:
         tracker.begin_stage("listening")
         self._current_tracker = tracker
         self._set_assist_stage("home_assistant", "listening", {"wake_word": wake_word})
+        self._start_prewarm("home_assistant")
         await self._maybe_play_wake_sound()
         await self.media_controller.maybe_pause_media_playback()
         ha_config = self.config.home_assistant
@@ -382,6 +396,72 @@ class PipelineOrchestrator:
             await self.schedule_service.resume_active_audio()
             self.media_controller.ensure_media_resume()
 
+    def _intent_routes(
+        self,
+        wake_word: str,
+        tracker: AssistRunTracker,
+        *,
+        follow_up: bool,
+    ) -> list[IntentRoute]:
+        """Shortcut handlers in priority order; the LLM is the fallback when all decline."""
+        return [
+            IntentRoute(
+                STOP_ROUTE,
+                self._classify_stop_phrase,
+                partial(self._maybe_handle_stop_phrase, wake_word=wake_word, tracker=tracker, follow_up=follow_up),
+            ),
+            IntentRoute("music", self.music_handler.classify, self.music_handler.maybe_handle),
+            IntentRoute(
+                "schedule",
+                self.schedule_shortcuts.classify_schedule_shortcut,
+                self.schedule_shortcuts.maybe_handle_schedule_shortcut,
+            ),
+            IntentRoute(
+                "info",
+                self.info_query_handler.classify,
+                partial(self.info_query_handler.maybe_handle, wake_word=wake_word, follow_up=follow_up),
+            ),
+        ]
+
+    def _classify_stop_phrase(self, transcript: str) -> IntentConfidence:
+        if self.conversation_manager.is_conversation_stop(transcript):
+            return IntentConfidence.LIKELY
+        return IntentConfidence.NONE
+
+    async def _dispatch_transcript(
+        self,
+        transcript: str,
+        wake_word: str,
+        tracker: AssistRunTracker,
+        *,
+        follow_up: bool = False,
+    ) -> tuple[str | None, LLMResult | None]:
+        """Route a transcript to a shortcut handler, falling back to an LLM turn.
+
+        Returns the name of the route that handled it (``None`` for the LLM) and the LLM result.
+        """
+        speculate = partial(self._generate_llm_result, transcript) if self.config.speculative_llm else None
+        routed = await route_transcript(
+            transcript,
+            self._intent_routes(wake_word, tracker, follow_up=follow_up),
+            speculate=speculate,
+            logger=self.logger,
+        )
+        if routed.handled_by:
+            return routed.handled_by, None
+        llm_result = await self._execute_llm_turn(
+            transcript,
+            wake_word,
+            tracker,
+            follow_up=follow_up,
+            pending=routed.fallback,
+        )
+        return None, llm_result
+
+    async def _generate_llm_result(self, transcript: str) -> LLMResult:
+        prompt_actions = self.actions.describe_for_prompt() + self._home_assistant_prompt_actions()
+        return await self.llm.generate(transcript, prompt_actions)
+
     async def _execute_llm_turn(
         self,
         transcript: str,
@@ -389,9 +469,12 @@ class PipelineOrchestrator:
         tracker: AssistRunTracker,
         *,
         follow_up: bool = False,
+        pending: asyncio.Task[LLMResult] | None = None,
     ) -> LLMResult | None:
-        prompt_actions = self.actions.describe_for_prompt() + self._home_assistant_prompt_actions()
-        llm_result = await self.llm.generate(transcript, prompt_actions)
+        if pending is not None:
+            llm_result = await pending
+        else:
+            llm_result = await self._generate_llm_result(transcript)
         self.logger.debug(
             "[pipeline] LLM response [%s]: actions=%s, response=%s",
             wake_word,
@@ -572,6 +655,7 @@ class PipelineOrchestrator:
         tracker = self._current_tracker
         if tracker is None:
             return
+        self._cancel_prewarm()
         metrics = tracker.finalize(status)
         self.publisher._publish_message(self._assist_metrics_topic, json.dumps(metrics))
         self._set_assist_stage(tracker.pipeline, "idle", {"wake_word": tracker.wake_word, "status": status})
@@ -586,13 +670,59 @@ class PipelineOrchestrator:
         if not target:
             self.logger.warning("[pipeline] No STT endpoint configured")
             return None
-        return await transcribe_audio(
-            audio_bytes,
-            endpoint=target,
-            mic=self.config.mic,
-            language=self.config.language,
-            logger=self.logger,
-        )
+        metrics: dict[str, int] = {}
+        try:
+            return await transcribe_audio(
+                audio_bytes,
+                endpoint=target,
+                mic=self.config.mic,
+                language=self.config.language,
+                logger=self.logger,
+                pool=self.wyoming_pool,
+                metrics=metrics,
+            )
+        finally:
+            self._record_timings("stt", metrics)
+
+    def _record_timings(self, prefix: str, metrics: dict[str, int]) -> None:
+        tracker = self._current_tracker
+        if tracker is not None and metrics:
+            tracker.record_timings(prefix, metrics)
+
+    def _start_prewarm(self, pipeline: str) -> None:
+        """Warm downstream connections while the wake sound plays and the user speaks."""
+        if not self.config.prewarm:
+            return
+        steps: list[tuple[str, Callable[[], Awaitable[object]]]] = []
+        pool = self.wyoming_pool
+        if pipeline == "pulse":
+            if pool is not None:
+                for endpoint in {self.config.stt_endpoint, self.config.tts_endpoint}:
+                    if endpoint:
+                        steps.append(("wyoming", partial(pool.prewarm, endpoint, timeout=PREWARM_TIMEOUT)))
+            if self._get_llm is not None:
+                steps.append(("llm", self.llm.prewarm))
+        if self.home_assistant is not None:
+            resolve_pipeline = pipeline == "home_assistant"
+            steps.append(("home_assistant", partial(self.home_assistant.prewarm, resolve_pipeline=resolve_pipeline)))
+        steps.append(("playback", self.player.prewarm))
+        for name, step in steps:
+            task = asyncio.create_task(self._run_prewarm_step(name, step))
+            self._prewarm_tasks.add(task)
+            task.add_done_callback(self._prewarm_tasks.discard)
+
+    async def _run_prewarm_step(self, name: str, step: Callable[[], Awaitable[object]]) -> None:
+        try:
+            await asyncio.wait_for(step(), timeout=PREWARM_TIMEOUT)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            self.logger.debug("[pipeline] Pre-warm step %s failed: %s", name, exc)
+
+    def _cancel_prewarm(self) -> None:
+        """Abandon outstanding pre-warm work (e.g. when the recording turned out to be noise)."""
+        for task in list(self._prewarm_tasks):
+            task.cancel()
 
     async def speak(self, text: str) -> None:
         await self._speak_via_endpoint(normalize_for_tts(text), self.config.tts_endpoint, self.config.tts_voice)
@@ -607,14 +737,61 @@ class PipelineOrchestrator:
         if not target:
             self.logger.warning("[pipeline] No TTS endpoint configured; cannot speak response")
             return
-        await play_tts_stream(
-            text,
-            endpoint=target,
-            sink=self.player,
-            voice_name=voice_name,
-            audio_guard=self.wake_detector.local_audio_block(),
-            logger=self.logger,
-        )
+        cache = self.tts_cache
+        cacheable = cache is not None and cache.accepts(text)
+        if cache is not None and cacheable:
+            cached = await cache.get(text, target, voice_name)
+            if cached is not None:
+                self.logger.debug("[pipeline] Replaying cached TTS audio for %r", text)
+                await self._play_pcm_audio(cached.audio, cached.rate, cached.width, cached.channels)
+                return
+        metrics: dict[str, int] = {}
+        try:
+            if not cacheable and self.config.tts_pipeline:
+                await play_tts_pipelined(
+                    text,
+                    endpoint=target,
+                    sink=self.player,
+                    voice_name=voice_name,
+                    audio_guard=self.wake_detector.local_audio_block(),
+                    logger=self.logger,
+                    pool=self.wyoming_pool,
+                    metrics=metrics,
+                )
+                return
+            audio = await play_tts_stream(
+                text,
+                endpoint=target,
+                sink=self.player,
+                voice_name=voice_name,
+                audio_guard=self.wake_detector.local_audio_block(),
+                logger=self.logger,
+                capture=cacheable,
+                pool=self.wyoming_pool,
+                metrics=metrics,
+            )
+        finally:
+            self._record_timings("tts", metrics)
+        if cache is not None and audio is not None:
+            await cache.put(text, target, voice_name, audio)
+
+    async def warm_tts_cache(self) -> None:
+        """Pre-synthesize the configured fixed phrases so they replay without a TTS round-trip."""
+        cache = self.tts_cache
+        target = self.config.tts_endpoint
+        if cache is None or not target:
+            return
+        voice_name = self.config.tts_voice
+
+        async def _synthesize(text: str) -> SynthesizedAudio | None:
+            return await synthesize_audio(
+                text, endpoint=target, voice_name=voice_name, timeout=TTS_WARMUP_TIMEOUT, pool=self.wyoming_pool
+            )
+
+        phrases = [normalize_for_tts(phrase) for phrase in self.config.tts_cache.warm_phrases]
+        added = await cache.warm(phrases, target, voice_name, _synthesize)
+        if added:
+            self.logger.info("[pipeline] Warmed TTS cache with %d phrase(s)", added)
 
     async def _maybe_play_wake_sound(self) -> None:
         if not self.preferences.wake_sound:
@@ -0,0 +1,119 @@
+"""Next-occurrence engine for weekly alarms.
+
+Repeat days are a 7-bit weekday mask (Monday = bit 0) and skip/enable/dismiss dates are
+sets of proleptic ordinals (``date.toordinal()``), so finding the next N fire times never
+formats or parses a date string. A per-mask gap table jumps straight from one matching
+weekday to the next; the only per-candidate work is a set lookup for skipped dates.
+"""
+
+from __future__ import annotations
+
+import bisect
+from collections.abc import Iterable, Set
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+from pulse.datetime_utils import parse_time_string
+
+ALL_WEEKDAYS = 0b1111111
+
+
+def weekday_mask(days: Iterable[int] | None) -> int:
+    """Return the weekday bitmask for ``days`` (0 = Monday; values wrap modulo 7)."""
+    mask = 0
+    for day in days or ():
+        mask |= 1 << (day % 7)
+    return mask
+
+
+def iso_ordinals(dates: Iterable[str]) -> frozenset[int]:
+    """Convert ISO ``YYYY-MM-DD`` strings to date ordinals, dropping anything unparsable."""
+    ordinals: set[int] = set()
+    for value in dates:
+        try:
+            ordinals.add(date.fromisoformat(value).toordinal())
+        except (TypeError, ValueError):
+            continue
+    return frozenset(ordinals)
+
+
+@lru_cache(maxsize=128)
+def _weekday_gaps(mask: int) -> tuple[int, ...]:
+    """For each weekday, the number of days until the next weekday in ``mask`` (0 if it is in it)."""
+    gaps = []
+    for weekday in range(7):
+        gap = 0
+        while not mask >> ((weekday + gap) % 7) & 1:
+            gap += 1
+        gaps.append(gap)
+    return tuple(gaps)
+
+
+@dataclass(frozen=True, slots=True)
+class AlarmRule:
+    """An alarm's time of day and repeat weekdays; ``weekdays == 0`` means a one-time alarm."""
+
+    hour: int
+    minute: int
+    weekdays: int = 0
+
+    @classmethod
+    def parse(cls, time_str: str, repeat_days: Iterable[int] | None) -> AlarmRule:
+        """Build a rule from an ``HH:MM`` string; raises ``ValueError`` for an invalid time."""
+        hour, minute = parse_time_string(time_str)
+        return cls(hour, minute, weekday_mask(repeat_days))
+
+    def next_fires(
+        self,
+        after: datetime,
+        n: int = 1,
+        *,
+        skip: Iterable[Set[int]] = (),
+        skip_weekdays: int = 0,
+        enable: Set[int] | None = None,
+    ) -> list[datetime]:
+        """Return up to ``n`` fire times strictly after ``after``, in ``after``'s timezone.
+
+        ``skip`` holds sets of date ordinals that must not fire. ``skip_weekdays`` is a weekday
+        mask that is ignored when it covers the whole week. When ``enable`` is given (a paused
+        alarm), only those ordinals may fire and the skip lists do not apply. One-time alarms
+        ignore every skip list and yield a single fire time. The result is empty when no day
+        can ever fire.
+        """
+        base = after.replace(hour=self.hour, minute=self.minute, second=0, microsecond=0)
+        offset = 0 if base > after else 1
+        if not self.weekdays:
+            return [base + timedelta(days=offset)] if n > 0 else []
+        first_ordinal = after.toordinal()
+        first_weekday = after.weekday()
+        fires: list[datetime] = []
+        if enable is not None:
+            enabled = sorted(enable)
+            for ordinal in enabled[bisect.bisect_left(enabled, first_ordinal + offset) :]:
+                if len(fires) >= n:
+                    break
+                days = ordinal - first_ordinal
+                if self.weekdays >> ((first_weekday + days) % 7) & 1:
+                    fires.append(base + timedelta(days=days))
+            return fires
+        if skip_weekdays == ALL_WEEKDAYS:
+            skip_weekdays = 0
+        mask = self.weekdays & ~skip_weekdays
+        if not mask:
+            return fires
+        skip_sets = [dates for dates in skip if dates]
+        gaps = _weekday_gaps(mask)
+        weekday = (first_weekday + offset) % 7
+        while len(fires) < n:
+            gap = gaps[weekday]
+            offset += gap
+            ordinal = first_ordinal + offset
+            for dates in skip_sets:
+                if ordinal in dates:
+                    break
+            else:
+                fires.append(base + timedelta(days=offset))
+            offset += 1
+            weekday = (weekday + gap + 1) % 7
+        return fires
@@ -9,31 +9,42 @@ import json
 import logging
 import os
 import re
+import wave
 from collections.abc import Callable
 from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
 from typing import Any, Literal
 from uuid import uuid4
 
 from pulse import audio as pulse_audio
-from pulse.datetime_utils import combine_time, parse_time_string
+from pulse.datetime_utils import combine_time
 from pulse.sound_library import SoundKind, SoundLibrary, SoundSettings
 from pulse.utils import sanitize_hostname_for_entity_id
 
+from .deadline_scheduler import DeadlineCallback, DeadlineScheduler
 from .home_assistant import HomeAssistantClient
+from .recurrence import AlarmRule, iso_ordinals, weekday_mask
+from .schedule_store import ScheduleStore
+from .tone_engine import Tone, ToneLoop, load_tone
 
 EventType = Literal["alarm", "timer", "reminder"]
 PlaybackMode = Literal["beep", "music"]
 
 StateCallback = Callable[[dict[str, Any]], None]
 ActiveCallback = Callable[[EventType, dict[str, Any] | None], None]
+DeadlineKey = tuple[str, str]
+EventDeadline = tuple[DeadlineKey, datetime, DeadlineCallback]
 
 LOGGER = logging.getLogger("pulse.schedule_service")
 
 # How long before an alarm fires to show a "dismiss this occurrence" warning modal.
 PRE_ALARM_WARNING_MINUTES = 20
 
+# Days ahead of the candidate time used as next_fire for an alarm that can never fire.
+_NO_FIRE_PLACEHOLDER_DAYS = 61
+
 
 def _now() -> datetime:
     return datetime.now().astimezone()
@@ -353,6 +364,23 @@ def day_indexes_to_names(indexes: list[int] | None) -> list[str]:
     return [names[i % 7] for i in indexes]
 
 
+def _alarm_fire_from_rule(
+    rule: AlarmRule,
+    after: datetime,
+    *,
+    skip: tuple[frozenset[int], ...] = (),
+    skip_weekdays: int = 0,
+    enable: frozenset[int] | None = None,
+) -> datetime:
+    fires = rule.next_fires(after, skip=skip, skip_weekdays=skip_weekdays, enable=enable)
+    if fires:
+        return fires[0]
+    # No day can fire (every repeat day skipped, or a paused alarm with nothing enabled);
+    # keep a far-off placeholder so next_fire stays populated.
+    placeholder = after.replace(hour=rule.hour, minute=rule.minute, second=0, microsecond=0)
+    return placeholder + timedelta(days=_NO_FIRE_PLACEHOLDER_DAYS)
+
+
 def _compute_next_alarm_fire(
     time_str: str,
     repeat_days: list[int] | None,
@@ -363,56 +391,13 @@ def _compute_next_alarm_fire(
     enable_dates: set[str] | None = None,
 ) -> datetime:
     """Compute the next alarm fire time honoring skip/enable dates for recurring alarms."""
-    hour, minute = parse_time_string(time_str)
-    now = after or _now()
-    candidate = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-    effective_skip_weekdays = None if skip_weekdays and len(set(skip_weekdays)) >= 7 else skip_weekdays
-
-    def _is_skipped(dt: datetime) -> bool:
-        date_str = dt.date().isoformat()
-
-        # If enable_dates is set (paused alarm), only fire on enabled dates
-        if enable_dates is not None:
-            return date_str not in enable_dates
-
-        # Normal skip logic for active alarms
-        if skip_dates and date_str in skip_dates:
-            return True
-        if effective_skip_weekdays and dt.weekday() in effective_skip_weekdays:
-            return True
-        return False
-
-    if not repeat_days:
-        # For one-time alarms, do not apply skip lists; just move to the next day if already past.
-        if candidate <= now:
-            candidate += timedelta(days=1)
-        return candidate
-
-    day_set = {d % 7 for d in repeat_days}
-    for offset in range(0, 21):
-        attempt = candidate + timedelta(days=offset)
-        if attempt <= now:
-            continue
-        if attempt.weekday() not in day_set:
-            continue
-        if _is_skipped(attempt):
-            continue
-        return attempt
-    # Fallback: advance until we find a matching repeat day that is not skipped.
-    attempt = candidate + timedelta(days=1)
-    for _ in range(60):
-        if attempt <= now:
-            attempt += timedelta(days=1)
-            continue
-        if attempt.weekday() not in day_set:
-            attempt += timedelta(days=1)
-            continue
-        if _is_skipped(attempt):
-            attempt += timedelta(days=1)
-            continue
-        return attempt
-    # If we somehow didn't find a valid day, return the last attempt.
-    return attempt
+    return _alarm_fire_from_rule(
+        AlarmRule.parse(time_str, repeat_days),
+        after or _now(),
+        skip=(iso_ordinals(skip_dates),) if skip_dates else (),
+        skip_weekdays=weekday_mask(skip_weekdays),
+        enable=iso_ordinals(enable_dates) if enable_dates is not None else None,
+    )
 
 
 @dataclass(slots=True)
@@ -571,8 +556,6 @@ class PlaybackHandle:
         self._loop = asyncio.get_running_loop()
         self._stop_event = asyncio.Event()
         self._task: asyncio.Task | None = None
-        self._sink: str | None = None
-        self._orig_volume: int | None = None
         self._pause_flag = False
         self._pause_condition = asyncio.Event()
         self._pause_condition.set()
@@ -600,7 +583,6 @@ class PlaybackHandle:
                 await self._task
         if self.playback.mode == "music" and self.ha_client:
             await self._stop_music()
-        await self._restore_volume()
         self._pause_condition.set()
 
     async def pause(self) -> None:
@@ -689,40 +671,37 @@ class PlaybackHandle:
             LOGGER.debug("[schedule] Failed to resume media_player for alarm", exc_info=True)
 
     async def _beep_loop(self) -> None:
-        self._sink = pulse_audio.find_audio_sink()
-        if self._sink:
-            current = pulse_audio.get_current_volume(self._sink)
-            # Never save 0 as original volume - use minimum of 20% if volume is 0 or None
-            # This prevents accidentally restoring to 0% later
-            self._orig_volume = current if current and current > 0 else 20
+        sound_kind: SoundKind = "timer" if self.event_type == "timer" else "alarm"
+        resolved_sound = self._sound_path(sound_kind, self.playback.sound_id) or pulse_audio.alarm_sample()
+        tone: Tone | None = None
+        if resolved_sound is not None:
+            try:
+                tone = await asyncio.to_thread(load_tone, resolved_sound)
+            except (OSError, EOFError, wave.Error, ValueError) as exc:
+                LOGGER.info("[schedule] Playing %s per beep (cannot stream it: %s)", resolved_sound.name, exc)
+        if tone is None:
+            await self._beep_per_process(resolved_sound)
+            return
+        # Timers start at full gain; alarms ramp from half to full over 30 seconds.
         force_full_volume = self.event_type == "timer"
-        start_volume = 100 if force_full_volume else _clamp_volume((self._orig_volume or 50) // 2)
-        ramp_duration = 0.0 if force_full_volume else 30.0  # Ramp volume over 30 seconds
-        ramp_end = self._loop.time() + ramp_duration
+        tone_loop = ToneLoop(
+            tone,
+            start_gain=1.0 if force_full_volume else 0.5,
+            ramp_seconds=0.0 if force_full_volume else 30.0,
+            duration=60.0,
+            gap_seconds=0.8,
+        )
+        await tone_loop.run(self._stop_event, self._pause_condition)
+
+    async def _beep_per_process(self, sound: Path | None) -> None:
+        """Fallback for sounds the tone engine cannot decode (e.g. OGG): one player per beep."""
         stop_at = self._loop.time() + 60.0
-        sound_kind: SoundKind = "timer" if self.event_type == "timer" else "alarm"
-        resolved_sound = self._sound_path(sound_kind, self.playback.sound_id)
-        try:
-            while not self._stop_event.is_set() and self._loop.time() < stop_at:
-                await self._wait_if_paused()
-                if self._stop_event.is_set():
-                    break
-                now = self._loop.time()
-                if self._sink:
-                    if force_full_volume:
-                        target = 100
-                    elif now < ramp_end:
-                        progress = (now - (ramp_end - ramp_duration)) / ramp_duration
-                        target = start_volume + int(progress * (100 - start_volume))
-                    else:
-                        target = 100
-                    pulse_audio.set_volume(target, self._sink)
-                await asyncio.to_thread(pulse_audio.play_sound, resolved_sound, pulse_audio.play_alarm_sound)
-                await asyncio.sleep(0.8)
-        except asyncio.CancelledError:
-            raise
-        finally:
-            await self._restore_volume()
+        while not self._stop_event.is_set() and self._loop.time() < stop_at:
+            await self._wait_if_paused()
+            if self._stop_event.is_set():
+                break
+            await asyncio.to_thread(pulse_audio.play_sound, sound, pulse_audio.play_alarm_sound)
+            await asyncio.sleep(0.8)
 
     async def _play_reminder_tone(self) -> None:
         # Play reminder sound twice for better noticeability
@@ -735,13 +714,6 @@ class PlaybackHandle:
         while self._pause_flag and not self._stop_event.is_set():
             await asyncio.sleep(0.05)
 
-    async def _restore_volume(self) -> None:
-        if self._sink is None or self._orig_volume is None:
-            return
-        # Never restore to 0% - use minimum of 20% to prevent silent audio
-        restore_volume = max(20, self._orig_volume) if self._orig_volume > 0 else 20
-        await asyncio.to_thread(pulse_audio.set_volume, restore_volume, self._sink)
-
 
 class ScheduleService:
     """Manage alarm & timer scheduling."""
@@ -757,8 +729,14 @@ class ScheduleService:
         sound_settings: SoundSettings | None = None,
         skip_dates: set[str] | None = None,
         skip_weekdays: set[int] | None = None,
+        deadlines: DeadlineScheduler[DeadlineKey] | None = None,
     ) -> None:
         self._storage_path = storage_path
+        self._store = ScheduleStore(storage_path, logger=LOGGER)
+        self._persisted_settings: dict[str, Any] | None = None
+        # Set when the snapshot could not be read, so the next write replaces it rather than
+        # appending to a log that could never be replayed.
+        self._snapshot_stale = False
         self._hostname = hostname
         self._state_cb = on_state_changed
         self._active_cb = on_active_event
@@ -767,8 +745,12 @@ class ScheduleService:
         self._sound_library = SoundLibrary(custom_dir=self._sound_settings.custom_dir)
         self._sound_library.ensure_custom_dir()
         self._events: dict[str, ScheduledEvent] = {}
-        self._tasks: dict[str, asyncio.Task] = {}
-        self._pre_alarm_tasks: dict[str, asyncio.Task] = {}
+        # Fire and pre-alarm deadlines live in one heap (optionally shared with other services)
+        # instead of a sleeping task per event.
+        self._owns_deadlines = deadlines is None
+        self._deadlines: DeadlineScheduler[DeadlineKey] = deadlines or DeadlineScheduler(
+            clock=lambda: _now(), logger=LOGGER
+        )
         self._active: dict[str, ActiveEvent] = {}
         self._lock = asyncio.Lock()
         self._started = False
@@ -776,6 +758,7 @@ class ScheduleService:
         self._skip_weekdays: set[int] = {d % 7 for d in (skip_weekdays or set())}
         self._ooo_skip_dates: set[str] = set()
         self._ui_pause_dates: set[str] = set()
+        self._skip_ordinals: frozenset[int] | None = None
         self._ui_enable_dates: dict[str, set[str]] = {}  # date -> set of alarm_ids for paused alarms
         # Per-alarm dismissed dates: alarm_id -> set of ISO date strings. Honored as additional
         # skip dates so a user-dismissed occurrence stays dismissed even when other recomputes
@@ -797,6 +780,7 @@ class ScheduleService:
     async def set_manual_skip_dates(self, dates: set[str]) -> None:
         async with self._lock:
             self._manual_skip_dates = set(dates)
+            self._skip_ordinals = None
             await self._reschedule_all_alarms_locked()
             await self._persist_events()
             await self._publish_state()
@@ -804,6 +788,7 @@ class ScheduleService:
     async def set_ooo_skip_dates(self, dates: set[str]) -> None:
         async with self._lock:
             self._ooo_skip_dates = set(dates)
+            self._skip_ordinals = None
             await self._reschedule_all_alarms_locked()
             await self._persist_events()
             await self._publish_state()
@@ -817,6 +802,7 @@ class ScheduleService:
                 self._ui_pause_dates.add(date_str)
             else:
                 self._ui_pause_dates.discard(date_str)
+            self._skip_ordinals = None
             await self._reschedule_all_alarms_locked()
             await self._persist_events()
             await self._publish_state()
@@ -850,21 +836,25 @@ class ScheduleService:
         if self._started:
             return
         await self._load_events()
+        if self._store.log_records or self._store.log_corrupt:
+            self._compact_store()
         for event in self._events.values():
             self._schedule_event(event)
         await self._publish_state()
         self._started = True
 
     async def stop(self) -> None:
-        for task in self._tasks.values():
-            task.cancel()
-        self._tasks.clear()
-        for task in self._pre_alarm_tasks.values():
-            task.cancel()
-        self._pre_alarm_tasks.clear()
+        if self._owns_deadlines:
+            await self._deadlines.close()
+        else:
+            for event_id in list(self._events):
+                self._cancel_event_tasks(event_id)
         active = list(self._active.keys())
         for event_id in active:
             await self.stop_event(event_id, reason="shutdown")
+        if self._started and self._store.log_records:
+            self._compact_store()
+        await self._store.flush()
         self._started = False
 
     def update_sound_settings(self, settings: SoundSettings) -> None:
@@ -896,29 +886,35 @@ class ScheduleService:
         is_paused_alarm: bool = False,
         event_id: str | None = None,
     ) -> datetime:
-        skip_dates = None if is_paused_alarm else self._effective_skip_dates()
         # Per-alarm dismissed dates always count as skip dates, including for paused alarms,
         # so user dismisses survive subsequent reschedules.
         dismissed = self._dismissed_dates.get(event_id) if event_id else None
-        if dismissed:
-            skip_dates = (skip_dates or set()) | dismissed
-        # For paused alarms, get enable dates that belong to this specific alarm
-        enable_dates: set[str] | None = None
-        if is_paused_alarm and event_id:
-            enable_dates = {date for date, alarm_ids in self._ui_enable_dates.items() if event_id in alarm_ids}
-            if dismissed:
-                enable_dates -= dismissed
-
-        return _compute_next_alarm_fire(
-            time_str,
-            days,
-            after=after or _now(),
-            skip_dates=skip_dates,
-            skip_weekdays=None if is_paused_alarm else self._skip_weekdays,
-            enable_dates=enable_dates,
+        dismissed_ordinals = iso_ordinals(dismissed) if dismissed else frozenset()
+        if is_paused_alarm:
+            # Paused alarms only fire on enable dates that belong to this specific alarm.
+            enable_ordinals = iso_ordinals(
+                date for date, alarm_ids in self._ui_enable_dates.items() if event_id and event_id in alarm_ids
+            )
+            return _alarm_fire_from_rule(
+                AlarmRule.parse(time_str, days),
+                after or _now(),
+                enable=enable_ordinals - dismissed_ordinals if event_id else None,
+            )
+        return _alarm_fire_from_rule(
+            AlarmRule.parse(time_str, days),
+            after or _now(),
+            skip=(self._skip_date_index(), dismissed_ordinals),
+            skip_weekdays=weekday_mask(self._skip_weekdays),
         )
 
+    def _skip_date_index(self) -> frozenset[int]:
+        """Ordinals of every globally skipped date, rebuilt only after the skip lists change."""
+        if self._skip_ordinals is None:
+            self._skip_ordinals = iso_ordinals(self._effective_skip_dates())
+        return self._skip_ordinals
+
     async def _reschedule_all_alarms_locked(self) -> None:
+        deadlines: list[EventDeadline] = []
         for event in self._events.values():
             if event.event_type != "alarm":
                 continue
@@ -928,7 +924,10 @@ class ScheduleService:
                         event.time_of_day, event.repeat_days, is_paused_alarm=event.paused, event_id=event.event_id
                     )
                 )
-                self._reschedule_event(event)
+                self._cancel_event_tasks(event.event_id)
+                deadlines.extend(self._event_deadlines(event))
+        # One heap rebuild for every alarm rather than a push per deadline.
+        self._deadlines.schedule_many(deadlines)
 
     async def create_alarm(
         self,
@@ -956,7 +955,7 @@ class ScheduleService:
         async with self._lock:
             self._events[event.event_id] = event
             self._schedule_event(event)
-            await self._persist_events()
+            await self._persist_events(event.event_id)
             await self._publish_state()
         return event
 
@@ -990,7 +989,7 @@ class ScheduleService:
         async with self._lock:
             self._events[event.event_id] = event
             self._schedule_event(event)
-            await self._persist_events()
+            await self._persist_events(event.event_id)
             await self._publish_state()
         return event
 
@@ -1029,7 +1028,7 @@ class ScheduleService:
         async with self._lock:
             self._events[event.event_id] = event
             self._schedule_event(event)
-            await self._persist_events()
+            await self._persist_events(event.event_id)
             await self._publish_state()
         return event
 
@@ -1062,7 +1061,7 @@ class ScheduleService:
                     )
                 )
             self._reschedule_event(event)
-            await self._persist_events()
+            await self._persist_events(event.event_id)
             await self._publish_state()
             return True
 
@@ -1095,7 +1094,7 @@ class ScheduleService:
                     self._ui_enable_dates[date_str].discard(event_id)
                     if not self._ui_enable_dates[date_str]:
                         del self._ui_enable_dates[date_str]
-            await self._persist_events()
+            await self._persist_events(event_id)
             await self._publish_state()
             return True
 
@@ -1112,7 +1111,7 @@ class ScheduleService:
                 if not self._ui_enable_dates[date_str]:
                     del self._ui_enable_dates[date_str]
             self._dismissed_dates.pop(event_id, None)
-            await self._persist_events()
+            await self._persist_events(event_id)
             await self._publish_state()
             return True
 
@@ -1163,7 +1162,7 @@ class ScheduleService:
             else:
                 self._events.pop(event_id, None)
                 self._cancel_event_tasks(event_id)
-            await self._persist_events()
+            await self._persist_events(event_id)
             await self._publish_state()
         if handle:
             with contextlib.suppress(Exception):
@@ -1205,7 +1204,7 @@ class ScheduleService:
                 self._events.pop(event_id, None)
                 self._cancel_event_tasks(event_id)
                 self._dismissed_dates.pop(event_id, None)
-            await self._persist_events()
+            await self._persist_events(event_id)
             await self._publish_state()
         self._notify_active("alarm", None)
         return True
@@ -1223,7 +1222,7 @@ class ScheduleService:
             event.set_next_fire(_now() + timedelta(minutes=minutes))
             self._events[event.event_id] = event
             self._reschedule_event(event)
-            await self._persist_events()
+            await self._persist_events(event.event_id)
             await self._publish_state()
         self._notify_active("alarm", None)
         return True
@@ -1245,7 +1244,7 @@ class ScheduleService:
                 meta = _ensure_reminder_meta(event)
                 meta["start"] = _serialize_dt(target)
             self._reschedule_event(event)
-            await self._persist_events()
+            await self._persist_events(event.event_id)
             await self._publish_state()
             return True
 
@@ -1259,7 +1258,7 @@ class ScheduleService:
             event.set_target(target)
             event.set_next_fire(target)
             self._reschedule_event(event)
-            await self._persist_events()
+            await self._persist_events(event.event_id)
             await self._publish_state()
             return True
 
@@ -1351,59 +1350,49 @@ class ScheduleService:
         return None
 
     def _cancel_event_tasks(self, event_id: str) -> None:
-        task = self._tasks.pop(event_id, None)
-        if task:
-            task.cancel()
-        pre_task = self._pre_alarm_tasks.pop(event_id, None)
-        if pre_task:
-            pre_task.cancel()
+        self._deadlines.cancel(("fire", event_id))
+        self._deadlines.cancel(("pre_alarm", event_id))
 
-    def _schedule_event(self, event: ScheduledEvent) -> None:
-        self._cancel_event_tasks(event.event_id)
+    def _event_deadlines(self, event: ScheduledEvent) -> list[EventDeadline]:
         if event.event_type == "alarm" and event.paused:
-            return
-        self._tasks[event.event_id] = asyncio.create_task(self._wait_for_event(event.event_id))
+            return []
+        fire_at = event.next_fire_dt()
+        deadlines: list[EventDeadline] = [
+            (("fire", event.event_id), fire_at, partial(self._fire_event, event.event_id))
+        ]
         if event.event_type == "alarm":
-            self._pre_alarm_tasks[event.event_id] = asyncio.create_task(self._wait_for_pre_alarm(event.event_id))
+            warning_at = fire_at - timedelta(minutes=PRE_ALARM_WARNING_MINUTES)
+            deadlines.append((("pre_alarm", event.event_id), warning_at, partial(self._fire_pre_alarm, event.event_id)))
+        return deadlines
 
-    def _reschedule_event(self, event: ScheduledEvent) -> None:
+    def _schedule_event(self, event: ScheduledEvent) -> None:
         self._cancel_event_tasks(event.event_id)
+        for key, when, callback in self._event_deadlines(event):
+            self._deadlines.schedule(key, when, callback)
+
+    def _reschedule_event(self, event: ScheduledEvent) -> None:
         self._schedule_event(event)
 
-    async def _wait_for_event(self, event_id: str) -> None:
-        while True:
-            async with self._lock:
-                event = self._events.get(event_id)
-                if not event:
-                    return
-                if event.event_type == "alarm" and event.paused:
-                    return
-                delay = (event.next_fire_dt() - _now()).total_seconds()
-            if delay > 0:
-                try:
-                    await asyncio.sleep(delay)
-                except asyncio.CancelledError:
-                    return
-            await self._activate_event(event_id)
-            return
+    async def _fire_event(self, event_id: str) -> None:
+        async with self._lock:
+            event = self._events.get(event_id)
+            if not event:
+                return
+            if event.event_type == "alarm" and event.paused:
+                return
+            fire_at = event.next_fire_dt()
+            if fire_at > _now():
+                # The event moved while this deadline was firing; wait for the new time.
+                self._deadlines.schedule(("fire", event_id), fire_at, partial(self._fire_event, event_id))
+                return
+        await self._activate_event(event_id)
 
-    async def _wait_for_pre_alarm(self, event_id: str) -> None:
+    async def _fire_pre_alarm(self, event_id: str) -> None:
         """Show a pre-alarm warning modal PRE_ALARM_WARNING_MINUTES before an alarm fires.
 
         The user can dismiss the modal to skip this single occurrence. If they ignore it,
         the regular alarm modal will replace it when the alarm actually fires.
         """
-        async with self._lock:
-            event = self._events.get(event_id)
-            if not event or event.event_type != "alarm" or event.paused:
-                return
-            warning_dt = event.next_fire_dt() - timedelta(minutes=PRE_ALARM_WARNING_MINUTES)
-            delay = (warning_dt - _now()).total_seconds()
-        if delay > 0:
-            try:
-                await asyncio.sleep(delay)
-            except asyncio.CancelledError:
-                return
         async with self._lock:
             event = self._events.get(event_id)
             if not event or event.event_type != "alarm" or event.paused:
@@ -1454,32 +1443,58 @@ class ScheduleService:
             return
         await self.stop_event(event_id, reason="auto_timeout")
 
-    async def _persist_events(self) -> None:
-        self._prune_dismissed_dates()
-        payload = {
-            "events": [event.to_json_dict() for event in self._events.values()],
+    def _settings_payload(self) -> dict[str, Any]:
+        return {
             "paused_dates": sorted(self._ui_pause_dates),
             "enabled_dates": {
                 date: sorted(alarm_ids) for date, alarm_ids in self._ui_enable_dates.items()
             },  # dict[str, list[str]] of date -> alarm_ids
             "dismissed_dates": {alarm_id: sorted(dates) for alarm_id, dates in self._dismissed_dates.items()},
         }
-        self._storage_path.parent.mkdir(parents=True, exist_ok=True)
-        tmp_path = self._storage_path.with_suffix(".tmp")
-        tmp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-        tmp_path.replace(self._storage_path)
 
-    async def _load_events(self) -> None:
-        if not self._storage_path.exists():
+    def _compact_store(self) -> None:
+        settings = self._settings_payload()
+        self._store.write_snapshot({"events": [event.to_json_dict() for event in self._events.values()], **settings})
+        self._persisted_settings = settings
+        self._snapshot_stale = False
+
+    async def _persist_events(self, *event_ids: str) -> None:
+        """Append the given events (and any settings change) to the schedule log.
+
+        Only changed events are serialized, so a snooze or delete costs the same no matter
+        how many events are stored. The log is folded into a full snapshot periodically.
+        """
+        self._prune_dismissed_dates()
+        if self._snapshot_stale:
+            self._compact_store()
             return
+        for event_id in event_ids:
+            event = self._events.get(event_id)
+            if event:
+                self._store.put_event(event.to_json_dict())
+            else:
+                self._store.delete_event(event_id)
+        settings = self._settings_payload()
+        if settings != self._persisted_settings:
+            self._store.put_settings(settings)
+            self._persisted_settings = settings
+        if self._store.needs_compaction:
+            self._compact_store()
+
+    async def _load_events(self) -> None:
         try:
-            data = json.loads(self._storage_path.read_text(encoding="utf-8"))
+            data = self._store.load()
         except (json.JSONDecodeError, OSError) as exc:
             LOGGER.warning("[schedule] Failed to load schedules file %s: %s", self._storage_path, exc)
+            self._snapshot_stale = True
+            return
+        if data is None:
+            self._persisted_settings = self._settings_payload()
             return
         paused_dates = data.get("paused_dates") or []
         if isinstance(paused_dates, list):
             self._ui_pause_dates = {item for item in paused_dates if isinstance(item, str)}
+            self._skip_ordinals = None
         enabled_dates = data.get("enabled_dates") or {}
         if isinstance(enabled_dates, dict):
             # New format: dict[str, list[str]] of date -> alarm_ids
@@ -1523,6 +1538,7 @@ class ScheduleService:
                 if not target or target <= _now():
                     continue
             self._events[event.event_id] = event
+        self._persisted_settings = self._settings_payload()
 
     async def _publish_state(self) -> None:
         if not self._state_cb:
@@ -16,6 +16,7 @@ from collections.abc import Awaitable, Callable
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
+from pulse.assistant.intent_router import IntentConfidence
 from pulse.assistant.schedule_intents import ScheduleIntentParser
 
 if TYPE_CHECKING:
@@ -27,6 +28,9 @@ LOGGER = logging.getLogger(__name__)
 
 CALENDAR_EVENT_INFO_LIMIT = 25
 
+_SCHEDULE_KEYWORDS = re.compile(r"\b(?:alarms?|timers?|remind(?:er|ers)?|calendar|events?)\b")
+_TIMER_EXTEND_RE = re.compile(r"(add|plus)\s+(\d+)\s*(minute|min|minutes|mins)")
+
 
 class ScheduleShortcutHandler:
     """Handles voice shortcuts for timers, alarms, reminders, and calendar.
@@ -447,6 +451,34 @@ class ScheduleShortcutHandler:
     # Main Dispatcher
     # ========================================================================
 
+    @staticmethod
+    def normalize_command(transcript: str) -> str:
+        """Lowercase and strip punctuation/wake-word prefixes from a spoken command."""
+        lowered = transcript.strip().lower()
+        normalized = re.sub(r"[^\w\s:]", " ", lowered)
+        normalized = re.sub(r"\b([ap])\s+m\b", r"\1m", normalized)
+        normalized = re.sub(r"^(?:hey|ok|okay)\s+(?:jarvis|pulse)\s+", "", normalized)
+        normalized = re.sub(r"^(?:jarvis|pulse)\s+", "", normalized)
+        return re.sub(r"\s+", " ", normalized).strip()
+
+    def classify_schedule_shortcut(self, transcript: str) -> IntentConfidence:
+        """Cheaply predict whether ``maybe_handle_schedule_shortcut`` would act on ``transcript``.
+
+        Every shortcut needs an alarm, timer, reminder or calendar keyword, a stop phrase, or
+        an "add N minutes" extension, so anything else is skipped without running the
+        dispatcher.
+        """
+        if not transcript or not transcript.strip() or not self.schedule_service:
+            return IntentConfidence.NONE
+        normalized = self.normalize_command(transcript)
+        if (
+            _SCHEDULE_KEYWORDS.search(normalized)
+            or self.is_stop_phrase(normalized)
+            or _TIMER_EXTEND_RE.search(normalized)
+        ):
+            return IntentConfidence.LIKELY
+        return IntentConfidence.NONE
+
     async def maybe_handle_schedule_shortcut(self, transcript: str) -> bool:
         """Check if transcript is a schedule shortcut and handle it.
 
@@ -460,12 +492,7 @@ class ScheduleShortcutHandler:
             return False
         if not self.schedule_service:
             return False
-        lowered = transcript.strip().lower()
-        normalized = re.sub(r"[^\w\s:]", " ", lowered)
-        normalized = re.sub(r"\b([ap])\s+m\b", r"\1m", normalized)
-        normalized = re.sub(r"^(?:hey|ok|okay)\s+(?:jarvis|pulse)\s+", "", normalized)
-        normalized = re.sub(r"^(?:jarvis|pulse)\s+", "", normalized)
-        normalized = re.sub(r"\s+", " ", normalized).strip()
+        normalized = self.normalize_command(transcript)
 
         alarm_intent = self.schedule_intents.extract_alarm_start_intent(normalized)
 
@@ -614,7 +641,7 @@ class ScheduleShortcutHandler:
                 return True
 
         # Handle timer extend ("add X minutes")
-        add_match = re.search(r"(add|plus)\s+(\d+)\s*(minute|min|minutes|mins)", normalized)
+        add_match = _TIMER_EXTEND_RE.search(normalized)
         if add_match:
             minutes = int(add_match.group(2))
             seconds = minutes * 60
@@ -0,0 +1,189 @@
+"""Snapshot + write-ahead log persistence for the schedule service.
+
+``schedules.json`` holds a full snapshot. Individual mutations are appended as compact
+JSON lines to a sibling ``.wal`` file, so persisting a snooze or delete costs one small
+record regardless of how many events are stored. Once the log grows past
+``compact_after`` records the owner writes a fresh snapshot and the log is truncated.
+
+Writes happen on a worker thread. Records queued while a write is in flight are written
+together with a single ``fsync``.
+
+Log records are full replacements (``put`` an event, ``delete`` an event id, or
+``settings``), so replaying a log over a snapshot that already includes it is harmless.
+That covers a crash between replacing the snapshot and truncating the log.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+LOGGER = logging.getLogger("pulse.schedule_store")
+
+DEFAULT_COMPACT_AFTER = 200
+
+
+class ScheduleStore:
+    """Persist schedule state as a JSON snapshot plus an append-only mutation log."""
+
+    def __init__(
+        self,
+        snapshot_path: Path,
+        *,
+        compact_after: int = DEFAULT_COMPACT_AFTER,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self.snapshot_path = snapshot_path
+        self.log_path = snapshot_path.with_name(f"{snapshot_path.name}.wal")
+        self._compact_after = max(1, compact_after)
+        self._logger = logger or LOGGER
+        self._log_records = 0
+        self._log_corrupt = False
+        # Ordered write operations: ("append", line) or ("snapshot", payload).
+        self._pending: list[tuple[str, str]] = []
+        self._writer: asyncio.Task[None] | None = None
+
+    @property
+    def log_records(self) -> int:
+        """Number of records in the log since the last snapshot."""
+        return self._log_records
+
+    @property
+    def log_corrupt(self) -> bool:
+        """Whether the last ``load`` stopped at an unreadable log record.
+
+        Replay never reads past that record, so anything appended after it would be lost
+        on the next load; the owner must write a snapshot before appending again.
+        """
+        return self._log_corrupt
+
+    @property
+    def needs_compaction(self) -> bool:
+        return self._log_records >= self._compact_after
+
+    def load(self) -> dict[str, Any] | None:
+        """Return the snapshot with the log replayed on top, or ``None`` if nothing is stored.
+
+        Raises ``OSError``/``json.JSONDecodeError`` when the snapshot itself is unreadable.
+        """
+        data: dict[str, Any] | None = None
+        if self.snapshot_path.exists():
+            loaded = json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+            data = loaded if isinstance(loaded, dict) else {}
+        self._log_corrupt = False
+        records = self._read_log()
+        self._log_records = len(records)
+        if not records:
+            return data
+        data = data if data is not None else {}
+        events: dict[str, Any] = {
+            item["event_id"]: item
+            for item in data.get("events", [])
+            if isinstance(item, dict) and isinstance(item.get("event_id"), str)
+        }
+        for record in records:
+            op = record.get("op")
+            if op == "put" and isinstance(record.get("event"), dict):
+                event = record["event"]
+                event_id = event.get("event_id")
+                if isinstance(event_id, str):
+                    events.pop(event_id, None)
+                    events[event_id] = event
+            elif op == "delete" and isinstance(record.get("event_id"), str):
+                events.pop(record["event_id"], None)
+            elif op == "settings" and isinstance(record.get("settings"), dict):
+                data.update(record["settings"])
+        data["events"] = list(events.values())
+        return data
+
+    def _read_log(self) -> list[dict[str, Any]]:
+        try:
+            raw = self.log_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return []
+        except OSError as exc:
+            self._logger.warning("[schedule] Failed to read schedule log %s: %s", self.log_path, exc)
+            return []
+        records: list[dict[str, Any]] = []
+        for line in raw.splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A torn final write after a crash; everything before it is intact.
+                self._logger.warning("[schedule] Ignoring corrupt record in schedule log %s", self.log_path)
+                self._log_corrupt = True
+                break
+            if isinstance(record, dict):
+                records.append(record)
+        return records
+
+    def put_event(self, event: dict[str, Any]) -> None:
+        self._append({"op": "put", "event": event})
+
+    def delete_event(self, event_id: str) -> None:
+        self._append({"op": "delete", "event_id": event_id})
+
+    def put_settings(self, settings: dict[str, Any]) -> None:
+        self._append({"op": "settings", "settings": settings})
+
+    def write_snapshot(self, payload: dict[str, Any]) -> None:
+        """Queue a full snapshot; the log is truncated once it is durably written."""
+        self._pending.append(("snapshot", json.dumps(payload, indent=2)))
+        self._log_records = 0
+        self._log_corrupt = False
+        self._ensure_writer()
+
+    async def flush(self) -> None:
+        """Wait until every queued write has reached disk."""
+        while self._writer is not None and not self._writer.done():
+            await asyncio.shield(self._writer)
+
+    def _append(self, record: dict[str, Any]) -> None:
+        self._pending.append(("append", json.dumps(record, separators=(",", ":"))))
+        self._log_records += 1
+        self._ensure_writer()
+
+    def _ensure_writer(self) -> None:
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._drain())
+
+    async def _drain(self) -> None:
+        while self._pending:
+            batch, self._pending = self._pending, []
+            try:
+                await asyncio.to_thread(self._write_batch, batch)
+            except OSError as exc:
+                self._logger.warning("[schedule] Failed to persist schedules to %s: %s", self.snapshot_path, exc)
+
+    def _write_batch(self, batch: list[tuple[str, str]]) -> None:
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        lines: list[str] = []
+        for kind, payload in batch:
+            if kind == "append":
+                lines.append(payload)
+                continue
+            # Records queued before the snapshot are part of it; drop them.
+            lines.clear()
+            self._replace_snapshot(payload)
+        if lines:
+            with self.log_path.open("a", encoding="utf-8") as handle:
+                handle.write("\n".join(lines) + "\n")
+                handle.flush()
+                os.fsync(handle.fileno())
+
+    def _replace_snapshot(self, payload: str) -> None:
+        tmp_path = self.snapshot_path.with_suffix(".tmp")
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            handle.write(payload)
+            handle.flush()
+            os.fsync(handle.fileno())
+        tmp_path.replace(self.snapshot_path)
+        with contextlib.suppress(FileNotFoundError):
+            self.log_path.unlink()
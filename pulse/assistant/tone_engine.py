@@ -0,0 +1,197 @@
+"""In-process repeating tone for alarms and timers.
+
+The chosen WAV is decoded once and streamed to a single long-lived player process as
+``tone + silence`` periods. The volume ramp is applied to the samples themselves, so each
+beep starts on an exact sample boundary, its loudness follows the stream position rather
+than wall-clock jitter, and the output sink volume is never touched.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import sys
+import wave
+from array import array
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Protocol
+
+from .audio import AplaySink
+
+LOGGER = logging.getLogger("pulse.tone_engine")
+
+# Gains are quantised so a ramp renders a bounded number of distinct beeps.
+_GAIN_STEPS = 100
+
+
+@dataclass(frozen=True, slots=True)
+class Tone:
+    """Decoded signed 16-bit little-endian PCM."""
+
+    frames: bytes
+    rate: int
+    channels: int
+    width: int = 2
+
+    @property
+    def frame_bytes(self) -> int:
+        return self.width * self.channels
+
+    @property
+    def frame_count(self) -> int:
+        return len(self.frames) // self.frame_bytes
+
+    def silence(self, seconds: float) -> bytes:
+        return bytes(max(0, round(self.rate * seconds)) * self.frame_bytes)
+
+
+@lru_cache(maxsize=8)
+def _decode_wav(path: str, _mtime_ns: int) -> Tone:
+    with wave.open(path, "rb") as wav_file:
+        width = wav_file.getsampwidth()
+        if width != 2:
+            raise ValueError(f"unsupported sample width {width * 8} bits")
+        if wav_file.getcomptype() != "NONE":
+            raise ValueError(f"unsupported compression {wav_file.getcomptype()}")
+        rate = wav_file.getframerate()
+        channels = wav_file.getnchannels()
+        frames = wav_file.readframes(wav_file.getnframes())
+    frames = frames[: len(frames) - len(frames) % (width * channels)]
+    if not frames:
+        raise ValueError("no audio frames")
+    return Tone(frames=frames, rate=rate, channels=channels)
+
+
+def load_tone(path: Path) -> Tone:
+    """Decode a 16-bit PCM WAV, reusing the previous decode while the file is unchanged.
+
+    Raises ``OSError``, ``EOFError``, ``wave.Error`` or ``ValueError`` for files that
+    cannot be streamed (missing, OGG, 8/24-bit or compressed WAVs).
+    """
+    return _decode_wav(str(path), path.stat().st_mtime_ns)
+
+
+def scale_pcm16(frames: bytes, gain: float) -> bytes:
+    """Return little-endian 16-bit PCM ``frames`` multiplied by ``gain`` (0.0-1.0)."""
+    if gain >= 1.0:
+        return frames
+    samples = array("h")
+    samples.frombytes(frames)
+    if sys.byteorder == "big":
+        samples.byteswap()
+    scaled = array("h", [int(sample * gain) for sample in samples])
+    if sys.byteorder == "big":
+        scaled.byteswap()
+    return scaled.tobytes()
+
+
+class ToneSink(Protocol):
+    """The part of ``AplaySink`` a ``ToneLoop`` streams through."""
+
+    async def prewarm(self, rate: int, width: int, channels: int) -> None: ...
+
+    async def start(self, rate: int, width: int, channels: int) -> None: ...
+
+    async def write(self, chunk: bytes) -> None: ...
+
+    async def stop(self) -> None: ...
+
+
+class ToneLoop:
+    """Stream a tone repeatedly with a linear gain ramp through one player process.
+
+    The gain for each beep is taken at the beep's first sample: ``start_gain`` at stream
+    position zero rising linearly to 1.0 at ``ramp_seconds``. Playback ends after
+    ``duration`` seconds of audio. While paused the player is closed so other audio can
+    use the device; it is reopened on resume and the ramp carries on where it left off.
+    """
+
+    def __init__(
+        self,
+        tone: Tone,
+        *,
+        gap_seconds: float = 0.8,
+        duration: float = 60.0,
+        start_gain: float = 1.0,
+        ramp_seconds: float = 0.0,
+        chunk_seconds: float = 0.1,
+        lead_seconds: float = 0.3,
+        sink_factory: Callable[[], ToneSink] | None = None,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self.tone = tone
+        self._gap = tone.silence(gap_seconds)
+        self._total_frames = round(duration * tone.rate)
+        self._start_gain = min(1.0, max(0.0, start_gain))
+        self._ramp_frames = max(0, round(ramp_seconds * tone.rate))
+        self._chunk_bytes = max(1, round(chunk_seconds * tone.rate)) * tone.frame_bytes
+        self._lead = lead_seconds
+        self._sink_factory = sink_factory or AplaySink
+        self._logger = logger or LOGGER
+        self._scaled: dict[int, bytes] = {}
+
+    def gain_at(self, frame: int) -> float:
+        if not self._ramp_frames or frame >= self._ramp_frames:
+            return 1.0
+        return self._start_gain + (1.0 - self._start_gain) * frame / self._ramp_frames
+
+    def period(self, frame: int) -> bytes:
+        """PCM for one beep plus the following gap, starting at stream position ``frame``."""
+        step = round(self.gain_at(frame) * _GAIN_STEPS)
+        beep = self._scaled.get(step)
+        if beep is None:
+            beep = scale_pcm16(self.tone.frames, step / _GAIN_STEPS)
+            self._scaled[step] = beep
+        return beep + self._gap
+
+    async def run(self, stop: asyncio.Event, resumed: asyncio.Event) -> None:
+        """Play until ``stop`` is set or the duration is reached; pause while ``resumed`` is clear."""
+        loop = asyncio.get_running_loop()
+        tone = self.tone
+        position = 0
+        sink: ToneSink | None = None
+        clock_start = clock_frame = 0.0
+        try:
+            while position < self._total_frames and not stop.is_set():
+                if not resumed.is_set():
+                    if sink is not None:
+                        await sink.stop()
+                        sink = None
+                    await _wait_any(stop, resumed)
+                    continue
+                if sink is None:
+                    sink = self._sink_factory()
+                    await sink.prewarm(tone.rate, tone.width, tone.channels)
+                    await sink.start(tone.rate, tone.width, tone.channels)
+                    clock_start, clock_frame = loop.time(), position
+                block = self.period(position)
+                remaining = (self._total_frames - position) * tone.frame_bytes
+                for offset in range(0, min(len(block), remaining), self._chunk_bytes):
+                    # Stay just ahead of the player so stop and pause take effect promptly.
+                    ahead = (position - clock_frame) / tone.rate - (loop.time() - clock_start)
+                    if ahead > self._lead:
+                        with contextlib.suppress(TimeoutError):
+                            await asyncio.wait_for(stop.wait(), ahead - self._lead)
+                    if stop.is_set() or not resumed.is_set():
+                        break
+                    chunk = block[offset : offset + min(self._chunk_bytes, remaining - offset)]
+                    await sink.write(chunk)
+                    position += len(chunk) // tone.frame_bytes
+        except RuntimeError as exc:
+            self._logger.warning("[playback] Tone playback stopped: %s", exc)
+        finally:
+            if sink is not None:
+                await sink.stop()
+
+
+async def _wait_any(*events: asyncio.Event) -> None:
+    waiters = [asyncio.create_task(event.wait()) for event in events]
+    try:
+        await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for waiter in waiters:
+            waiter.cancel()
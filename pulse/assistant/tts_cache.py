@@ -0,0 +1,200 @@
+"""Disk-backed cache of synthesized TTS audio.
+
+Short, fixed responses ("Alarm cancelled.", "Sorry, I didn't catch that.") are spoken
+over and over. Caching their PCM keyed by (text, voice, endpoint) lets the orchestrator
+replay them straight to the playback sink without a Wyoming round-trip.
+
+Entries are stored as one file per phrase with a small header describing the PCM format.
+The cache is bounded by total size and evicts least-recently-used entries; file mtimes
+carry the LRU order across restarts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import struct
+import threading
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from pathlib import Path
+
+from .config import WyomingEndpoint
+from .wyoming import SynthesizedAudio
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_TEXT_CHARS = 160
+
+_HEADER = struct.Struct("<4sIHH")
+_MAGIC = b"PTTS"
+_SUFFIX = ".pcm"
+
+
+def _normalize_text(text: str) -> str:
+    return " ".join(text.split())
+
+
+class TtsCache:
+    """Size-bounded LRU cache of synthesized speech stored on disk."""
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        max_bytes: int,
+        max_text_chars: int = DEFAULT_MAX_TEXT_CHARS,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self.directory = directory
+        self.max_bytes = max(0, max_bytes)
+        self.max_text_chars = max_text_chars
+        self.logger = logger or LOGGER
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._total_bytes = 0
+        self._load_index()
+
+    @staticmethod
+    def cache_key(text: str, endpoint: WyomingEndpoint, voice_name: str | None) -> str:
+        raw = "\n".join((endpoint.host, str(endpoint.port), voice_name or "", _normalize_text(text)))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._total_bytes
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def accepts(self, text: str) -> bool:
+        """Return True if ``text`` is short enough to be worth caching."""
+        normalized = _normalize_text(text)
+        return bool(normalized) and len(normalized) <= self.max_text_chars and self.max_bytes > 0
+
+    def contains(self, text: str, endpoint: WyomingEndpoint, voice_name: str | None) -> bool:
+        with self._lock:
+            return self.cache_key(text, endpoint, voice_name) in self._entries
+
+    async def get(self, text: str, endpoint: WyomingEndpoint, voice_name: str | None) -> SynthesizedAudio | None:
+        key = self.cache_key(text, endpoint, voice_name)
+        with self._lock:
+            if key not in self._entries:
+                return None
+        return await asyncio.to_thread(self._read_entry, key)
+
+    async def put(
+        self,
+        text: str,
+        endpoint: WyomingEndpoint,
+        voice_name: str | None,
+        audio: SynthesizedAudio,
+    ) -> None:
+        if not self.accepts(text) or not audio.audio:
+            return
+        key = self.cache_key(text, endpoint, voice_name)
+        await asyncio.to_thread(self._write_entry, key, audio)
+
+    async def warm(
+        self,
+        phrases: Iterable[str],
+        endpoint: WyomingEndpoint,
+        voice_name: str | None,
+        synthesize: Callable[[str], Awaitable[SynthesizedAudio | None]],
+    ) -> int:
+        """Synthesize any ``phrases`` that are not cached yet; return how many were added."""
+        added = 0
+        for phrase in phrases:
+            if not self.accepts(phrase) or self.contains(phrase, endpoint, voice_name):
+                continue
+            try:
+                audio = await synthesize(phrase)
+            except Exception as exc:
+                self.logger.debug("[tts-cache] Warm-up synthesis failed for %r: %s", phrase, exc)
+                continue
+            if audio is None:
+                continue
+            await self.put(phrase, endpoint, voice_name, audio)
+            added += 1
+        return added
+
+    def _path_for(self, key: str) -> Path:
+        return self.directory / f"{key}{_SUFFIX}"
+
+    def _load_index(self) -> None:
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            files = [(path.stat().st_mtime, path) for path in self.directory.glob(f"*{_SUFFIX}")]
+        except OSError as exc:
+            self.logger.warning("[tts-cache] Unable to use cache directory %s: %s", self.directory, exc)
+            return
+        for _, path in sorted(files):
+            try:
+                size = path.stat().st_size
+            except OSError:
+                continue
+            self._entries[path.stem] = size
+            self._total_bytes += size
+        self._evict_locked()
+
+    def _read_entry(self, key: str) -> SynthesizedAudio | None:
+        path = self._path_for(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            self._forget(key)
+            return None
+        if len(data) <= _HEADER.size:
+            self._forget(key)
+            return None
+        magic, rate, width, channels = _HEADER.unpack_from(data)
+        if magic != _MAGIC or not rate or not width or not channels:
+            self._forget(key)
+            return None
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+        return SynthesizedAudio(rate=rate, width=width, channels=channels, audio=data[_HEADER.size :])
+
+    def _write_entry(self, key: str, audio: SynthesizedAudio) -> None:
+        payload = _HEADER.pack(_MAGIC, audio.rate, audio.width, audio.channels) + audio.audio
+        if len(payload) > self.max_bytes:
+            return
+        path = self._path_for(key)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            self.logger.debug("[tts-cache] Failed to write cache entry %s: %s", path, exc)
+            return
+        with self._lock:
+            previous = self._entries.pop(key, 0)
+            self._entries[key] = len(payload)
+            self._total_bytes += len(payload) - previous
+            self._evict_locked()
+
+    def _forget(self, key: str) -> None:
+        with self._lock:
+            size = self._entries.pop(key, None)
+            if size is not None:
+                self._total_bytes -= size
+        try:
+            self._path_for(key).unlink(missing_ok=True)
+        except OSError:
+            pass  # best effort; entry is already dropped from the index
+
+    def _evict_locked(self) -> None:
+        while self._entries and self._total_bytes > self.max_bytes:
+            key, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            try:
+                self._path_for(key).unlink(missing_ok=True)
+            except OSError:
+                pass  # best effort; entry is already dropped from the index
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from collections.abc import AsyncIterator, Sequence
-from contextlib import AbstractAsyncContextManager
+import re
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable, Sequence
+from contextlib import AbstractAsyncContextManager, aclosing
+from dataclasses import dataclass
 
 from wyoming.asr import Transcribe, Transcript
 from wyoming.audio import AudioChunk, AudioStart, AudioStop
@@ -19,6 +23,198 @@ from .audio import AplaySink
 from .config import MicConfig, WyomingEndpoint
 
 LoggerLike = logging.Logger | None
+TimingMetrics = dict[str, int]
+
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+(?=[\"'(\[]?[A-Z0-9])")
+_ABBREVIATIONS = frozenset({"mr.", "mrs.", "ms.", "dr.", "st.", "vs.", "jr.", "sr.", "no.", "mt.", "ft."})
+MIN_SENTENCE_CHARS = 20
+
+
+@dataclass(frozen=True)
+class SynthesizedAudio:
+    """Raw PCM returned by a Wyoming TTS server, plus its format."""
+
+    rate: int
+    width: int
+    channels: int
+    audio: bytes
+
+
+class _StaleConnectionError(ConnectionError):
+    """A pooled connection was closed by the server before it could be reused."""
+
+
+@dataclass
+class _IdleClient:
+    client: AsyncTcpClient
+    idle_since: float
+
+
+def _client_alive(client: AsyncTcpClient) -> bool:
+    reader = getattr(client, "_reader", None)
+    writer = getattr(client, "_writer", None)
+    if reader is None or writer is None:
+        return False
+    return not writer.is_closing() and not reader.at_eof()
+
+
+async def _disconnect_quietly(client: AsyncTcpClient) -> None:
+    try:
+        await client.disconnect()
+    except Exception:  # nosec B110 - socket already unusable
+        pass
+
+
+def _add_timing(metrics: TimingMetrics | None, key: str, started: float) -> None:
+    _add_duration(metrics, key, time.monotonic() - started)
+
+
+def _add_duration(metrics: TimingMetrics | None, key: str, seconds: float) -> None:
+    if metrics is None:
+        return
+    metrics[key] = metrics.get(key, 0) + int(seconds * 1000)
+
+
+class WyomingClientPool:
+    """Keep Wyoming TCP connections open between requests.
+
+    Wyoming servers such as Piper and faster-whisper accept several sequential requests
+    on one socket, so reusing an idle connection skips the TCP connect (and any lazy
+    per-connection model load) on every call. Idle connections are health-checked before
+    reuse and dropped after ``idle_timeout`` seconds; a reused connection that the server
+    already closed is retried once on a fresh socket.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_idle: int = 2,
+        idle_timeout: float = 60.0,
+        logger: LoggerLike = None,
+    ) -> None:
+        self.max_idle = max(0, max_idle)
+        self.idle_timeout = idle_timeout
+        self._logger = logger or logging.getLogger(__name__)
+        self._idle: dict[WyomingEndpoint, list[_IdleClient]] = {}
+
+    def idle_count(self, endpoint: WyomingEndpoint) -> int:
+        return len(self._idle.get(endpoint, ()))
+
+    async def acquire(
+        self,
+        endpoint: WyomingEndpoint,
+        *,
+        timeout: float | None = None,
+        metrics: TimingMetrics | None = None,
+    ) -> tuple[AsyncTcpClient, bool]:
+        """Return ``(client, reused)``; connect time is added to ``metrics["connect_ms"]``."""
+        idle = self._idle.get(endpoint)
+        while idle:
+            entry = idle.pop()
+            if self._is_reusable(entry):
+                if metrics is not None:
+                    metrics.setdefault("connect_ms", 0)
+                return entry.client, True
+            await _disconnect_quietly(entry.client)
+        return await _connect(endpoint, timeout, metrics), False
+
+    async def release(self, endpoint: WyomingEndpoint, client: AsyncTcpClient, *, reusable: bool = True) -> None:
+        idle = self._idle.setdefault(endpoint, [])
+        if not reusable or not _client_alive(client) or len(idle) >= self.max_idle:
+            await _disconnect_quietly(client)
+            return
+        idle.append(_IdleClient(client, time.monotonic()))
+
+    async def prewarm(self, endpoint: WyomingEndpoint, *, timeout: float | None = None) -> bool:
+        """Open a connection ahead of use; return True if a new socket was connected."""
+        if self.max_idle == 0:
+            return False
+        idle = self._idle.setdefault(endpoint, [])
+        for entry in list(idle):
+            if self._is_reusable(entry):
+                return False
+            idle.remove(entry)
+            await _disconnect_quietly(entry.client)
+        try:
+            client = await _connect(endpoint, timeout, None)
+        except (OSError, TimeoutError) as exc:
+            self._logger.debug("[wyoming] Pre-connect to %s:%s failed: %s", endpoint.host, endpoint.port, exc)
+            return False
+        idle.append(_IdleClient(client, time.monotonic()))
+        return True
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, {}
+        for entries in idle.values():
+            for entry in entries:
+                await _disconnect_quietly(entry.client)
+
+    def _is_reusable(self, entry: _IdleClient) -> bool:
+        if time.monotonic() - entry.idle_since > self.idle_timeout:
+            return False
+        return _client_alive(entry.client)
+
+
+async def _connect(
+    endpoint: WyomingEndpoint,
+    timeout: float | None,
+    metrics: TimingMetrics | None,
+) -> AsyncTcpClient:
+    client = AsyncTcpClient(endpoint.host, endpoint.port)
+    started = time.monotonic()
+    await await_with_timeout(client.connect(), timeout)
+    _add_timing(metrics, "connect_ms", started)
+    return client
+
+
+async def _run_session[T](
+    endpoint: WyomingEndpoint,
+    operation: Callable[[AsyncTcpClient, bool], Awaitable[T]],
+    *,
+    pool: WyomingClientPool | None,
+    timeout: float | None,
+    metrics: TimingMetrics | None,
+) -> T:
+    """Run one request/response exchange, reusing a pooled connection when available.
+
+    ``operation`` receives the client and whether it was reused; it raises
+    ``_StaleConnectionError`` when a reused socket turns out to be dead so the exchange can
+    be retried once on a fresh connection.
+    """
+
+    if pool is None:
+        client = await _connect(endpoint, timeout, metrics)
+        started = time.monotonic()
+        try:
+            return await operation(client, False)
+        finally:
+            _add_timing(metrics, "inference_ms", started)
+            await client.disconnect()
+
+    while True:
+        client, reused = await pool.acquire(endpoint, timeout=timeout, metrics=metrics)
+        started = time.monotonic()
+        completed = False
+        try:
+            result = await operation(client, reused)
+            completed = True
+            return result
+        except _StaleConnectionError:
+            continue
+        finally:
+            _add_timing(metrics, "inference_ms", started)
+            await pool.release(endpoint, client, reusable=completed)
+
+
+async def _write_or_stale(client: AsyncTcpClient, event: Event, timeout: float | None, reused: bool) -> None:
+    try:
+        await await_with_timeout(client.write_event(event), timeout)
+    except TimeoutError:
+        raise
+    except OSError as exc:
+        if reused:
+            raise _StaleConnectionError(str(exc)) from exc
+        raise
 
 
 async def transcribe_audio(
@@ -30,22 +226,15 @@ async def transcribe_audio(
     model: str | None = None,
     timeout: float | None = None,
     logger: LoggerLike = None,
+    pool: WyomingClientPool | None = None,
+    metrics: TimingMetrics | None = None,
 ) -> str | None:
     """Send PCM audio to a Wyoming STT endpoint and return the transcript text."""
 
-    client = AsyncTcpClient(endpoint.host, endpoint.port)
-    await await_with_timeout(client.connect(), timeout)
     requested_model = model or endpoint.model
-    try:
-        await await_with_timeout(
-            client.write_event(
-                Transcribe(
-                    name=requested_model,
-                    language=language,
-                ).event()
-            ),
-            timeout,
-        )
+
+    async def _transcribe(client: AsyncTcpClient, reused: bool) -> str | None:
+        await _write_or_stale(client, Transcribe(name=requested_model, language=language).event(), timeout, reused)
         await await_with_timeout(
             client.write_event(
                 AudioStart(
@@ -72,14 +261,16 @@ async def transcribe_audio(
         while True:
             event = await await_with_timeout(client.read_event(), timeout)
             if event is None:
+                if reused:
+                    raise _StaleConnectionError("STT connection closed before transcript returned")
                 if logger:
                     logger.debug("[stt] Wyoming STT connection closed before transcript returned")
                 return None
             if Transcript.is_type(event.type):
                 transcript = Transcript.from_event(event)
                 return transcript.text
-    finally:
-        await client.disconnect()
+
+    return await _run_session(endpoint, _transcribe, pool=pool, timeout=timeout, metrics=metrics)
 
 
 async def play_tts_stream(
@@ -91,27 +282,40 @@ async def play_tts_stream(
     audio_guard: AbstractAsyncContextManager[None] | None = None,
     timeout: float | None = None,
     logger: LoggerLike = None,
-) -> None:
-    """Synthesize speech via Wyoming TTS and stream it directly to the provided sink."""
+    capture: bool = False,
+    pool: WyomingClientPool | None = None,
+    metrics: TimingMetrics | None = None,
+) -> SynthesizedAudio | None:
+    """Synthesize speech via Wyoming TTS and stream it directly to the provided sink.
+
+    When ``capture`` is set, the streamed PCM is also collected and returned so callers
+    can replay it later without another synthesis round-trip.
+    """
+
+    captured = bytearray()
+    audio_format: tuple[int, int, int] | None = None
 
     async def _play() -> None:
+        nonlocal audio_format
         started = False
         try:
-            async for event in _tts_event_stream(
-                text,
-                endpoint=endpoint,
-                voice_name=voice_name,
-                timeout=timeout,
-            ):
-                if AudioStart.is_type(event.type):
-                    audio_start = AudioStart.from_event(event)
-                    await sink.start(audio_start.rate, audio_start.width, audio_start.channels)
-                    started = True
-                elif AudioChunk.is_type(event.type):
-                    chunk = AudioChunk.from_event(event)
-                    await sink.write(chunk.audio)
-                elif AudioStop.is_type(event.type):
-                    break
+            stream = _tts_event_stream(
+                text, endpoint=endpoint, voice_name=voice_name, timeout=timeout, pool=pool, metrics=metrics
+            )
+            async with aclosing(stream) as events:
+                async for event in events:
+                    if AudioStart.is_type(event.type):
+                        audio_start = AudioStart.from_event(event)
+                        await sink.start(audio_start.rate, audio_start.width, audio_start.channels)
+                        audio_format = (audio_start.rate, audio_start.width, audio_start.channels)
+                        started = True
+                    elif AudioChunk.is_type(event.type):
+                        chunk = AudioChunk.from_event(event)
+                        await sink.write(chunk.audio)
+                        if capture:
+                            captured.extend(chunk.audio)
+                    elif AudioStop.is_type(event.type):
+                        break
         finally:
             if started:
                 await sink.stop()
@@ -121,6 +325,162 @@ async def play_tts_stream(
     else:
         async with audio_guard:
             await _play()
+    if not capture or audio_format is None or not captured:
+        return None
+    rate, width, channels = audio_format
+    return SynthesizedAudio(rate=rate, width=width, channels=channels, audio=bytes(captured))
+
+
+def split_sentences(text: str, *, min_chars: int = MIN_SENTENCE_CHARS) -> list[str]:
+    """Split response text into sentences suitable for independent synthesis.
+
+    Fragments shorter than ``min_chars`` and pieces ending in a common abbreviation are
+    merged into the following sentence so Piper keeps natural prosody.
+    """
+
+    sentences: list[str] = []
+    for piece in _SENTENCE_BOUNDARY.split(text.strip()):
+        piece = piece.strip()
+        if not piece:
+            continue
+        if sentences and (len(sentences[-1]) < min_chars or sentences[-1].rsplit(" ", 1)[-1].lower() in _ABBREVIATIONS):
+            sentences[-1] = f"{sentences[-1]} {piece}"
+        else:
+            sentences.append(piece)
+    return sentences
+
+
+async def play_tts_pipelined(
+    text: str,
+    *,
+    endpoint: WyomingEndpoint,
+    sink: AplaySink,
+    voice_name: str | None = None,
+    audio_guard: AbstractAsyncContextManager[None] | None = None,
+    timeout: float | None = None,
+    logger: LoggerLike = None,
+    lookahead: int = 1,
+    pool: WyomingClientPool | None = None,
+    metrics: TimingMetrics | None = None,
+) -> None:
+    """Synthesize text sentence by sentence while earlier sentences play.
+
+    Each sentence gets its own Wyoming connection; up to ``lookahead`` sentences are
+    synthesized ahead of the one currently playing. All audio is written to a single
+    sink session so there is no player restart between sentences.
+    """
+
+    sentences = split_sentences(text)
+    if len(sentences) <= 1:
+        await play_tts_stream(
+            text,
+            endpoint=endpoint,
+            sink=sink,
+            voice_name=voice_name,
+            audio_guard=audio_guard,
+            timeout=timeout,
+            logger=logger,
+            pool=pool,
+            metrics=metrics,
+        )
+        return
+    if logger:
+        logger.debug("[tts] Pipelining synthesis of %d sentences", len(sentences))
+
+    async def _synthesize_into(sentence: str, queue: asyncio.Queue[object]) -> None:
+        try:
+            stream = _tts_event_stream(
+                sentence, endpoint=endpoint, voice_name=voice_name, timeout=timeout, pool=pool, metrics=metrics
+            )
+            async with aclosing(stream) as events:
+                async for event in events:
+                    if AudioStart.is_type(event.type):
+                        queue.put_nowait(AudioStart.from_event(event))
+                    elif AudioChunk.is_type(event.type):
+                        queue.put_nowait(AudioChunk.from_event(event))
+                    elif AudioStop.is_type(event.type):
+                        break
+        except Exception as exc:
+            queue.put_nowait(exc)
+        finally:
+            queue.put_nowait(None)
+
+    async def _play() -> None:
+        queues: list[asyncio.Queue[object]] = [asyncio.Queue() for _ in sentences]
+        tasks: list[asyncio.Task[None]] = []
+        audio_format: tuple[int, int, int] | None = None
+
+        def _launch(index: int) -> None:
+            if index < len(sentences) and index == len(tasks):
+                tasks.append(asyncio.create_task(_synthesize_into(sentences[index], queues[index])))
+
+        async def _ensure_format(fmt: tuple[int, int, int]) -> None:
+            nonlocal audio_format
+            if fmt == audio_format:
+                return
+            if audio_format is not None:
+                await sink.stop()
+            await sink.start(*fmt)
+            audio_format = fmt
+
+        try:
+            for index in range(min(len(sentences), lookahead + 1)):
+                _launch(index)
+            for index, queue in enumerate(queues):
+                while (item := await queue.get()) is not None:
+                    if isinstance(item, Exception):
+                        raise item
+                    if isinstance(item, AudioStart):
+                        await _ensure_format((item.rate, item.width, item.channels))
+                    elif isinstance(item, AudioChunk):
+                        if audio_format is None:
+                            await _ensure_format((item.rate, item.width, item.channels))
+                        await sink.write(item.audio)
+                _launch(index + lookahead + 1)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if audio_format is not None:
+                await sink.stop()
+
+    if audio_guard is None:
+        await _play()
+    else:
+        async with audio_guard:
+            await _play()
+
+
+async def synthesize_audio(
+    text: str,
+    *,
+    endpoint: WyomingEndpoint,
+    voice_name: str | None = None,
+    timeout: float | None = None,
+    pool: WyomingClientPool | None = None,
+) -> SynthesizedAudio | None:
+    """Synthesize speech via Wyoming TTS and return the PCM without playing it."""
+
+    audio_format: tuple[int, int, int] | None = None
+    captured = bytearray()
+    stream = _tts_event_stream(text, endpoint=endpoint, voice_name=voice_name, timeout=timeout, pool=pool)
+    async with aclosing(stream) as events:
+        async for event in events:
+            if AudioStart.is_type(event.type):
+                audio_start = AudioStart.from_event(event)
+                audio_format = (audio_start.rate, audio_start.width, audio_start.channels)
+            elif AudioChunk.is_type(event.type):
+                chunk = AudioChunk.from_event(event)
+                if audio_format is None:
+                    audio_format = (chunk.rate, chunk.width, chunk.channels)
+                captured.extend(chunk.audio)
+            elif AudioStop.is_type(event.type):
+                break
+    if audio_format is None or not captured:
+        return None
+    rate, width, channels = audio_format
+    return SynthesizedAudio(rate=rate, width=width, channels=channels, audio=bytes(captured))
 
 
 async def probe_synthesize(
@@ -128,18 +488,20 @@ async def probe_synthesize(
     endpoint: WyomingEndpoint,
     text: str,
     timeout: float | None = None,
+    pool: WyomingClientPool | None = None,
 ) -> tuple[bool, int]:
     """Synthesize speech and report whether audio started plus how many chunks arrived."""
 
     started = False
     chunks = 0
-    async for event in _tts_event_stream(text, endpoint=endpoint, timeout=timeout):
-        if AudioStart.is_type(event.type):
-            started = True
-        elif AudioChunk.is_type(event.type):
-            chunks += 1
-        elif AudioStop.is_type(event.type):
-            break
+    async with aclosing(_tts_event_stream(text, endpoint=endpoint, timeout=timeout, pool=pool)) as events:
+        async for event in events:
+            if AudioStart.is_type(event.type):
+                started = True
+            elif AudioChunk.is_type(event.type):
+                chunks += 1
+            elif AudioStop.is_type(event.type):
+                break
     return started, chunks
 
 
@@ -150,15 +512,15 @@ async def probe_wake_detection(
     models: Sequence[str],
     audio: bytes | None = None,
     timeout: float | None = None,
+    pool: WyomingClientPool | None = None,
 ) -> str | None:
     """Send a short audio sample to Wyoming OpenWakeWord and return detection info."""
 
-    client = AsyncTcpClient(endpoint.host, endpoint.port)
-    await await_with_timeout(client.connect(), timeout)
-    timestamp = 0
     sample = audio or silence_bytes(mic.chunk_ms, mic)
-    try:
-        await await_with_timeout(client.write_event(Detect(names=list(models)).event()), timeout)
+
+    async def _probe(client: AsyncTcpClient, reused: bool) -> str | None:
+        timestamp = 0
+        await _write_or_stale(client, Detect(names=list(models)).event(), timeout, reused)
         await await_with_timeout(
             client.write_event(
                 AudioStart(
@@ -187,14 +549,16 @@ async def probe_wake_detection(
         while True:
             event = await await_with_timeout(client.read_event(), timeout)
             if event is None:
+                if reused:
+                    raise _StaleConnectionError("wake connection closed before a result returned")
                 return None
             if Detection.is_type(event.type):
                 detection = Detection.from_event(event)
                 return detection.name or (models[0] if models else None)
             if NotDetected.is_type(event.type):
                 return None
-    finally:
-        await client.disconnect()
+
+    return await _run_session(endpoint, _probe, pool=pool, timeout=timeout, metrics=None)
 
 
 def silence_bytes(duration_ms: int, mic: MicConfig) -> bytes:
@@ -212,18 +576,52 @@ async def _tts_event_stream(
     endpoint: WyomingEndpoint,
     voice_name: str | None = None,
     timeout: float | None = None,
-) -> AsyncIterator[Event]:
-    client = AsyncTcpClient(endpoint.host, endpoint.port)
-    await await_with_timeout(client.connect(), timeout)
+    pool: WyomingClientPool | None = None,
+    metrics: TimingMetrics | None = None,
+) -> AsyncGenerator[Event]:
     voice = SynthesizeVoice(name=voice_name) if voice_name else None
-    await await_with_timeout(client.write_event(Synthesize(text=text, voice=voice).event()), timeout)
+    request = Synthesize(text=text, voice=voice).event()
+    if pool is None:
+        client = await _connect(endpoint, timeout, metrics)
+        reused = False
+    else:
+        client, reused = await pool.acquire(endpoint, timeout=timeout, metrics=metrics)
+    completed = False
+    # Inference is the time spent waiting on the server. The consumer's time between chunks
+    # (usually playback) is excluded, so the clock only runs while a read is pending.
+    inference = 0.0
+    started = time.monotonic()
     try:
-        while True:
+        try:
+            await _write_or_stale(client, request, timeout, reused)
             event = await await_with_timeout(client.read_event(), timeout)
-            if event is None:
-                break
-            yield event
+            if event is None and reused:
+                raise _StaleConnectionError("TTS connection closed before audio started")
+        except _StaleConnectionError:
+            # The pooled socket was dead before anything was yielded; retry on a fresh one.
+            assert pool is not None  # nosec B101 - reused connections only come from a pool
+            await pool.release(endpoint, client, reusable=False)
+            client = await _connect(endpoint, timeout, metrics)
+            started = time.monotonic()
+            await await_with_timeout(client.write_event(request), timeout)
+            event = await await_with_timeout(client.read_event(), timeout)
+        while event is not None:
+            inference += time.monotonic() - started
             if AudioStop.is_type(event.type):
+                # Mark complete before yielding: consumers usually stop iterating at AudioStop.
+                completed = True
+                _add_duration(metrics, "inference_ms", inference)
+                yield event
                 break
+            yield event
+            started = time.monotonic()
+            event = await await_with_timeout(client.read_event(), timeout)
+        else:
+            # The server closed the stream without an AudioStop.
+            inference += time.monotonic() - started
+            _add_duration(metrics, "inference_ms", inference)
     finally:
-        await client.disconnect()
+        if pool is None:
+            await client.disconnect()
+        else:
+            await pool.release(endpoint, client, reusable=completed)
@@ -394,6 +394,11 @@ def play_volume_feedback() -> None:
     _play_sample(sample)
 
 
+def alarm_sample() -> Path | None:
+    """Return the default alarm sample, rendering it on first use."""
+    return _ensure_alarm_sample()
+
+
 def play_alarm_sound() -> None:
     """Play the alarm sound (used for repeating alarm beeps)."""
     sample = _ensure_alarm_sample()
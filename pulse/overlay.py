@@ -33,7 +33,7 @@ import threading
 import time
 from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
 from functools import lru_cache
 from html import escape as html_escape
 from importlib.metadata import PackageNotFoundError
@@ -43,6 +43,7 @@ from typing import Any
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from pulse import __version__
+from pulse.assistant.recurrence import AlarmRule
 from pulse.assistant.schedule_service import parse_day_tokens
 from pulse.overlay_assets import OVERLAY_CSS, OVERLAY_JS
 from pulse.weather_alerts import BANNER_ALWAYS, TIER_RANK, banner_active
@@ -2966,48 +2967,18 @@ def _compute_next_n_alarm_fires(
 
     Returns:
         List of datetime objects representing next N potential fire times.
-        May return fewer than N if alarm is very sparse.
+        One-time alarms return a single fire time.
     """
     time_str = alarm.get("time")
     if not time_str:
         return []
 
     repeat_days = _normalize_repeat_day_indexes(alarm)
-    now = datetime.now().astimezone()
-
-    # Parse time
     try:
-        parts = time_str.split(":")
-        hour = int(parts[0])
-        minute = int(parts[1]) if len(parts) > 1 else 0
-    except (ValueError, AttributeError, IndexError):
+        rule = AlarmRule.parse(time_str, repeat_days)
+    except (ValueError, TypeError):
         return []
-
-    fire_times: list[datetime] = []
-    candidate = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-
-    # For one-time alarms
-    if not repeat_days:
-        if candidate <= now:
-            candidate += timedelta(days=1)
-        return [candidate]
-
-    # For repeating alarms - show all potential fire times based on repeat_days
-    day_set = set(d % 7 for d in repeat_days)
-    search_limit = 90  # Search up to 90 days
-
-    for offset in range(search_limit):
-        attempt = candidate + timedelta(days=offset)
-        if attempt <= now:
-            continue
-        if attempt.weekday() not in day_set:
-            continue
-
-        fire_times.append(attempt)
-        if len(fire_times) >= n:
-            break
-
-    return fire_times
+    return rule.next_fires(datetime.now().astimezone(), n)
 
 
 def _format_reminder_meta_text(reminder: dict[str, Any]) -> str:
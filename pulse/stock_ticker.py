@@ -4,6 +4,12 @@ Fetches quotes for a configured list of symbols (major indices plus any equities
 the user cares to watch) for display in the scrolling overlay ticker.
 
 Provider chain (per symbol, first source that answers wins for that symbol):
+- Optional: Finnhub's trade websocket (stream=True plus an API key) during the regular
+  US session, and post-market when after-hours prices are on. One subscription covers
+  every equity; regular-session trades are folded into the last-good quotes (post-market
+  ones into their after-hours price) and pushed through `on_update` whenever a displayed
+  value changes. Symbols that traded since their last poll skip polling; the rest (and
+  indices, which the free stream does not carry) continue down the chain.
 - Optional: Finnhub (https://finnhub.io) when PULSE_TICKER_API_KEY is set. This is a
   licensed API with an explicit free tier for personal use, so it is the preferred
   source when configured. Free tier covers US equities/ETFs but generally not indices,
@@ -12,7 +18,8 @@ Provider chain (per symbol, first source that answers wins for that symbol):
   marketState, and after-hours price). Yahoo gates this behind a cookie + crumb, which
   this module obtains transparently and refreshes on expiry.
 - Yahoo v8 chart, one request per symbol, needs no auth so it survives crumb-flow
-  breakage (price vs. previous close; no marketState/after-hours).
+  breakage (price vs. previous close; no marketState/after-hours). The requests run
+  concurrently and each symbol's result is reused for part of a poll interval.
 - Last resort: the most recent successfully-fetched values, so the ticker never goes
   blank when the providers hiccup. Because that cache can quietly serve an old price
   indefinitely, every quote carries the provider's own timestamp (`quote_time`) and
@@ -31,16 +38,27 @@ mirroring the httpx style used by pulse/assistant/info_sources.py.
 
 from __future__ import annotations
 
+import json
 import logging
 import threading
 import time
 from collections.abc import Callable, Sequence
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import datetime
+from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
 
 import httpx
 
+try:
+    from websockets.sync.client import connect as ws_connect
+except ImportError:  # pragma: no cover - websockets is a declared dependency
+    ws_connect = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from websockets.sync.client import ClientConnection
+
 LOGGER = logging.getLogger("pulse.stock_ticker")
 
 YAHOO_QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
@@ -48,6 +66,16 @@ YAHOO_CRUMB_URL = "https://query1.finance.yahoo.com/v1/test/getcrumb"
 YAHOO_COOKIE_SEED_URL = "https://fc.yahoo.com/"
 YAHOO_CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/"
 FINNHUB_QUOTE_URL = "https://finnhub.io/api/v1/quote"
+FINNHUB_STREAM_URL = "wss://ws.finnhub.io"
+# Streamed prices are measured against the previous close from the symbol's last polled
+# quote, so a streaming symbol is handed back to polling this often to refresh it.
+STREAM_REBASE_SECONDS = 600.0
+# The v8 chart fallback fetches this many symbols at once over the shared client.
+CHART_WORKERS = 6
+# A symbol priced by the chart fallback is not refetched for this fraction of the poll
+# interval, so a retry that is only missing a few symbols only asks for those, while the
+# next scheduled poll always gets fresh prices.
+CHART_CACHE_FRACTION = 0.5
 # Yahoo rejects the default httpx User-Agent, so present a browser-like one.
 _USER_AGENT = "Mozilla/5.0 (X11; Linux aarch64) PulseOS-ticker/1.0"
 
@@ -292,6 +320,112 @@ def parse_symbols(spec: str | None) -> list[str]:
     return symbols
 
 
+def _displayed(quote: TickerQuote) -> tuple[float, float, float, float | None]:
+    """The values the overlay shows for a quote, at its two-decimal precision."""
+    after_hours = round(quote.after_hours, 2) if quote.after_hours is not None else None
+    return round(quote.price, 2), round(quote.change, 2), round(quote.change_pct, 2), after_hours
+
+
+class FinnhubTradeStream:
+    """One Finnhub trade websocket for a fixed symbol list, run on a daemon thread.
+
+    Each message's trades are reduced to the latest ``(price, unix seconds)`` per symbol
+    and handed to ``on_trades``. The connection is re-established with backoff until
+    stop() is called. The token has to travel in the URL here, so every logged error is
+    passed through _redact().
+    """
+
+    def __init__(
+        self,
+        symbols: Sequence[str],
+        api_key: str,
+        on_trades: Callable[[dict[str, tuple[float, int]]], None],
+        *,
+        url: str = FINNHUB_STREAM_URL,
+        reconnect_delay: float = 5.0,
+        log: Callable[[str], None] | None = None,
+    ) -> None:
+        self.symbols = list(symbols)
+        self.api_key = api_key
+        self.url = url
+        self.reconnect_delay = reconnect_delay
+        self._on_trades = on_trades
+        self._log = log or LOGGER.info
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._ws: ClientConnection | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="pulse-ticker-stream", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        ws = self._ws
+        if ws is not None:
+            try:
+                ws.close()
+            except Exception:  # nosec B110 - best-effort shutdown
+                pass
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self) -> None:
+        delay = self.reconnect_delay
+        while not self._stop.is_set():
+            try:
+                with ws_connect(f"{self.url}?token={self.api_key}", open_timeout=10, close_timeout=2) as ws:
+                    self._ws = ws
+                    for symbol in self.symbols:
+                        ws.send(json.dumps({"type": "subscribe", "symbol": symbol}))
+                    self._log(f"ticker: finnhub stream subscribed to {len(self.symbols)} symbol(s)")
+                    delay = self.reconnect_delay
+                    for message in ws:
+                        self._handle(message)
+            except Exception as exc:  # websockets/OS errors all mean "reconnect later"
+                if self._stop.is_set():
+                    break
+                self._log(f"ticker: finnhub stream dropped ({_redact(str(exc), self.api_key)})")
+            finally:
+                self._ws = None
+            if self._stop.wait(delay):
+                break
+            delay = min(delay * 2, 300.0)
+
+    def _handle(self, message: str | bytes) -> None:
+        try:
+            data = json.loads(message)
+        except ValueError:
+            return
+        if not isinstance(data, dict):
+            return
+        if data.get("type") == "error":
+            self._log(f"ticker: finnhub stream error ({data.get('msg')})")
+            return
+        if data.get("type") != "trade":
+            return
+        latest: dict[str, tuple[float, int]] = {}
+        for trade in data.get("data") or []:
+            symbol = str(trade.get("s") or "").upper()
+            price = _coerce_float(trade.get("p"))
+            stamp = _coerce_int(trade.get("t"))
+            if not symbol or not price or price <= 0 or stamp is None:
+                continue
+            seconds = stamp // 1000  # Finnhub stamps trades in milliseconds
+            if symbol not in latest or seconds >= latest[symbol][1]:
+                latest[symbol] = (price, seconds)
+        if latest:
+            self._on_trades(latest)
+
+
 class StockTicker:
     """Fetches quotes via an optional Finnhub key, then Yahoo v7/v8, then last-good cache."""
 
@@ -303,6 +437,10 @@ class StockTicker:
         api_key: str | None = None,
         timeout: float = 10.0,
         log: Callable[[str], None] | None = None,
+        stream: bool = False,
+        stream_url: str = FINNHUB_STREAM_URL,
+        on_update: Callable[[list[TickerQuote]], object] | None = None,
+        poll_interval: float = 60.0,
     ) -> None:
         self.symbols = [s.strip().upper() for s in symbols if s and s.strip()]
         self.afterhours = afterhours
@@ -313,8 +451,18 @@ class StockTicker:
         self._cache: tuple[TickerQuote, ...] = ()
         self._client: httpx.Client | None = None
         self._crumb: str | None = None
+        self._chart_cache: dict[str, tuple[float, TickerQuote]] = {}  # symbol -> (monotonic, quote)
+        self._chart_ttl = poll_interval * CHART_CACHE_FRACTION
+        self.stream = stream and bool(self.api_key) and ws_connect is not None
+        self._stream_url = stream_url
+        self._on_update = on_update
+        self._trade_stream: FinnhubTradeStream | None = None
+        # symbol -> (previous close, monotonic time of the poll it came from)
+        self._baselines: dict[str, tuple[float, float]] = {}
+        self._streamed: set[str] = set()  # symbols with trades folded in since their last poll
 
     def close(self) -> None:
+        self._stop_stream()
         if self._client is not None:
             self._client.close()
             self._client = None
@@ -334,6 +482,8 @@ class StockTicker:
 
     def _provider_chain(self) -> list[Callable[[list[str]], list[TickerQuote] | None]]:
         chain: list[Callable[[list[str]], list[TickerQuote] | None]] = []
+        if self.stream:
+            chain.append(self._fetch_stream)
         if self.api_key:
             chain.append(self._fetch_finnhub)
         chain.append(self._fetch_yahoo_quote)
@@ -353,6 +503,7 @@ class StockTicker:
         if not self.symbols:
             return []
         collected: dict[str, TickerQuote] = {}
+        polled: list[TickerQuote] = []
         remaining = list(self.symbols)
         for provider in self._provider_chain():
             if not remaining:
@@ -364,8 +515,14 @@ class StockTicker:
                 found = []
             for quote in found:
                 collected[quote.symbol] = quote
+            if provider != self._fetch_stream:
+                polled.extend(found)
             remaining = [symbol for symbol in self.symbols if symbol not in collected]
         with self._lock:
+            polled_at = time.monotonic()
+            for quote in polled:
+                self._baselines[quote.symbol] = (quote.price - quote.change, polled_at)
+                self._streamed.discard(quote.symbol)
             if collected:
                 merged = {quote.symbol: quote for quote in self._cache}
                 merged.update(collected)
@@ -373,11 +530,95 @@ class StockTicker:
                 self._cache = tuple(merged[symbol] for symbol in self.symbols if symbol in merged)
             return list(self._cache)
 
+    # -- trade stream ----------------------------------------------------------
+
+    def _fetch_stream(self, symbols: list[str]) -> list[TickerQuote] | None:
+        """Streaming provider: keeps the websocket up while trades can be shown (the regular
+        session, plus post-market when after-hours prices are on) and returns the cached
+        quotes that trades have already refreshed, so polling can skip them."""
+        if not self._streams_in(_schedule_phase()):
+            self._stop_stream()
+            return None
+        self._start_stream()
+        now = time.monotonic()
+        with self._lock:
+            cached = {quote.symbol: quote for quote in self._cache}
+            quotes = [
+                cached[symbol]
+                for symbol in symbols
+                if symbol in self._streamed
+                and symbol in cached
+                and now - self._baselines.get(symbol, (0.0, float("-inf")))[1] < STREAM_REBASE_SECONDS
+            ]
+        return quotes or None
+
+    def _start_stream(self) -> None:
+        if self._trade_stream is None:
+            equities = [self._finnhub_symbol(symbol) for symbol in self.symbols if not symbol.startswith("^")]
+            if not equities or not self.api_key:
+                return
+            self._trade_stream = FinnhubTradeStream(
+                equities, self.api_key, self._apply_trades, url=self._stream_url, log=self._log
+            )
+        self._trade_stream.start()
+
+    def _stop_stream(self) -> None:
+        if self._trade_stream is not None and self._trade_stream.running:
+            self._trade_stream.stop()
+
+    def _streams_in(self, phase: str) -> bool:
+        return phase == "regular" or (phase == "post" and self.afterhours)
+
+    def _apply_trades(self, trades: dict[str, tuple[float, int]]) -> None:
+        """Fold streamed trades into the last-good cache; notify only on a visible change.
+
+        Only regular-session trades move the price and change. Post-market trades update
+        the after-hours price instead, and anything else is dropped, matching what the
+        polled providers report for the same session.
+        """
+        phase = _schedule_phase()
+        if not self._streams_in(phase):
+            return
+        changed = False
+        with self._lock:
+            merged = {quote.symbol: quote for quote in self._cache}
+            for symbol, (price, stamp) in trades.items():
+                quote = merged.get(symbol)
+                baseline = self._baselines.get(symbol)
+                if quote is None or baseline is None or not baseline[0]:
+                    continue  # no previous close yet; polling will provide one
+                if quote.quote_time is not None and stamp < quote.quote_time:
+                    continue
+                if phase == "post":
+                    updated = replace(quote, after_hours=price)
+                else:
+                    prev_close = baseline[0]
+                    change = price - prev_close
+                    updated = replace(
+                        quote,
+                        price=price,
+                        change=change,
+                        change_pct=change / prev_close * 100.0,
+                        is_up=change >= 0,
+                        quote_time=stamp,
+                    )
+                merged[symbol] = updated
+                self._streamed.add(symbol)
+                changed = changed or _displayed(updated) != _displayed(quote)
+            self._cache = tuple(merged[symbol] for symbol in self.symbols if symbol in merged)
+            snapshot = list(self._cache)
+        if changed and self._on_update is not None:
+            try:
+                self._on_update(snapshot)
+            except Exception as exc:  # nosec B110 - a consumer error must not kill the stream
+                self._log(f"ticker: stream update handler failed ({exc})")
+
     # -- http client -----------------------------------------------------------
 
     def _get_client(self) -> httpx.Client:
-        # A single reused client keeps the Yahoo cookie/crumb warm across polls.
-        # Only the ticker thread calls fetch(), so no cross-thread client sharing.
+        # A single reused client keeps the Yahoo cookie/crumb warm across polls. Only the
+        # ticker thread calls fetch(); the chart fallback's worker threads share this client
+        # (httpx clients are thread-safe), so they also share its connection pool.
         if self._client is None:
             self._client = httpx.Client(
                 timeout=self.timeout,
@@ -534,31 +775,53 @@ class StockTicker:
             return None
 
     def _fetch_yahoo_chart(self, symbols: list[str]) -> list[TickerQuote] | None:
-        """Fallback: v8 chart, one request per symbol, no auth required."""
-        client = self._get_client()
-        quotes: list[TickerQuote] = []
+        """Fallback: v8 chart, one request per symbol, no auth required.
+
+        Symbols charted within the last half poll interval come from the per-symbol cache; the rest
+        are fetched concurrently (up to CHART_WORKERS at a time), so a long watchlist costs
+        about one round trip instead of one per symbol.
+        """
+        now = time.monotonic()
+        found: dict[str, TickerQuote] = {}
+        pending: list[str] = []
         for canonical in symbols:
-            meta = self._chart_meta(client, self._yahoo_symbol(canonical))
-            if not meta:
-                continue
-            price = _coerce_float(meta.get("regularMarketPrice"))
-            prev_close = _coerce_float(meta.get("chartPreviousClose"))
-            if price is None or not prev_close:
-                continue
-            change = price - prev_close
-            quotes.append(
-                TickerQuote(
-                    symbol=canonical,
-                    label=self._label(canonical, meta.get("shortName")),
-                    price=price,
-                    change=change,
-                    change_pct=change / prev_close * 100.0,
-                    is_up=change >= 0,
-                    quote_time=_coerce_int(meta.get("regularMarketTime")),
-                )
-            )
+            cached = self._chart_cache.get(canonical)
+            if cached and now - cached[0] < self._chart_ttl:
+                found[canonical] = cached[1]
+            else:
+                pending.append(canonical)
+        if pending:
+            client = self._get_client()
+            workers = min(CHART_WORKERS, len(pending))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ticker-chart") as pool:
+                results = list(pool.map(lambda canonical: self._chart_quote(client, canonical), pending))
+            fetched_at = time.monotonic()
+            for quote in results:
+                if quote is not None:
+                    found[quote.symbol] = quote
+                    self._chart_cache[quote.symbol] = (fetched_at, quote)
+        quotes = [found[canonical] for canonical in symbols if canonical in found]
         return quotes or None
 
+    def _chart_quote(self, client: httpx.Client, canonical: str) -> TickerQuote | None:
+        meta = self._chart_meta(client, self._yahoo_symbol(canonical))
+        if not meta:
+            return None
+        price = _coerce_float(meta.get("regularMarketPrice"))
+        prev_close = _coerce_float(meta.get("chartPreviousClose"))
+        if price is None or not prev_close:
+            return None
+        change = price - prev_close
+        return TickerQuote(
+            symbol=canonical,
+            label=self._label(canonical, meta.get("shortName")),
+            price=price,
+            change=change,
+            change_pct=change / prev_close * 100.0,
+            is_up=change >= 0,
+            quote_time=_coerce_int(meta.get("regularMarketTime")),
+        )
+
     def _chart_meta(self, client: httpx.Client, yahoo_symbol: str) -> dict | None:
         try:
             response = client.get(
@@ -17,11 +17,15 @@ Filtering runs on two axes because NWS's own two axes disagree often enough to n
   Winter Storm Warning when both are nominally "Moderate".
 
 Runs synchronously in a background daemon thread (see bin/kiosk-mqtt-listener.py),
-mirroring the httpx style used by pulse/stock_ticker.py.
+mirroring the httpx style used by pulse/stock_ticker.py. Polls are conditional: the
+validators from the last good response are sent back, and a 304 (or a byte-identical
+body from a cache that ignores them) reuses the previous result instead of re-parsing.
+The active set changes a few times a day, so most polls move almost no data.
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import threading
 import time
@@ -244,6 +248,10 @@ class WeatherAlertClient:
         # across polls and the pill can say "new" without re-deriving it from NWS fields.
         self._first_seen: dict[str, float] = {}
         self._cache: tuple[WeatherAlert, ...] = ()
+        # Validators and body digest of the last response that was parsed into _cache.
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+        self._body_digest: str | None = None
 
     def close(self) -> None:
         if self._client is not None:
@@ -270,7 +278,9 @@ class WeatherAlertClient:
         On a fetch error the previous result is reused, but only for alerts whose expiry
         has not passed. That is the conservative choice in both directions: a network blip
         doesn't flap the pill off and back on, and a kiosk that loses its uplink mid-storm
-        cannot keep insisting on a warning that has since lapsed.
+        cannot keep insisting on a warning that has since lapsed. An unchanged feed still
+        ages out an alert whose expiry passes between NWS updates, but keeps the ones that
+        carry no expiry, since NWS is still listing them as active.
         """
         try:
             payload = self._request()
@@ -278,11 +288,12 @@ class WeatherAlertClient:
             self._log(f"weather-alerts: fetch failed: {exc}")
             return self._stale_fallback()
         if payload is None:
-            return self._stale_fallback()
+            return self._stale_fallback(keep_open_ended=True)
 
         features = payload.get("features")
         if not isinstance(features, list):
             self._log("weather-alerts: unexpected payload (no features list)")
+            self._forget_validators()
             return self._stale_fallback()
 
         now = time.time()
@@ -310,14 +321,28 @@ class WeatherAlertClient:
         self._cache = tuple(trimmed)
         return trimmed
 
-    def _stale_fallback(self) -> list[WeatherAlert]:
+    def _stale_fallback(self, *, keep_open_ended: bool = False) -> list[WeatherAlert]:
         now = time.time()
-        kept = [alert for alert in self._cache if (_expiry_epoch(alert) or 0.0) > now]
+        open_ended = now + 1.0 if keep_open_ended else 0.0
+        kept = [alert for alert in self._cache if (_expiry_epoch(alert) or open_ended) > now]
+        if len(kept) < len(self._cache):
+            # The cache no longer matches the body the validators vouch for; the next
+            # "unchanged" answer would otherwise keep the dropped alerts missing.
+            self._forget_validators()
         self._cache = tuple(kept)
         return kept
 
+    def _forget_validators(self) -> None:
+        self._etag = self._last_modified = self._body_digest = None
+
     def _request(self) -> dict[str, Any] | None:
+        """GET the active feed; ``None`` when it is unchanged since the last parse."""
         client = self._get_client()
+        headers: dict[str, str] = {}
+        if self._etag:
+            headers["If-None-Match"] = self._etag
+        if self._last_modified:
+            headers["If-Modified-Since"] = self._last_modified
         response = client.get(
             ALERTS_URL,
             params={
@@ -328,10 +353,21 @@ class WeatherAlertClient:
                 "status": "actual",
                 "message_type": "alert,update",
             },
+            headers=headers,
         )
+        if response.status_code == 304:
+            return None
         response.raise_for_status()
+        digest = hashlib.sha256(response.content).hexdigest()
+        if digest == self._body_digest:
+            return None
         data = response.json()
-        return data if isinstance(data, dict) else None
+        if not isinstance(data, dict):
+            return {}  # fetch() reports it as an unexpected payload
+        self._etag = response.headers.get("etag")
+        self._last_modified = response.headers.get("last-modified")
+        self._body_digest = digest
+        return data
 
     def _build_alert(self, feature: Any, *, now: float) -> WeatherAlert | None:
         if not isinstance(feature, dict):
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import tempfile
 from contextlib import contextmanager
@@ -36,6 +37,7 @@ from pulse.assistant.actions import (
     _split_action_token,
     load_action_definitions,
 )
+from pulse.assistant.home_assistant import HomeAssistantStateMirror
 
 
 @contextmanager
@@ -141,6 +143,17 @@ def test_load_action_definitions_from_inline_json():
     assert result[0].payload == '{"k": "v"}'
 
 
+def test_load_action_definitions_reads_after():
+    inline = json.dumps(
+        [
+            {"slug": "a", "topic": "t", "payload": "x", "after": "ha.turn_on"},
+            {"slug": "b", "topic": "t", "payload": "x", "after": ["a", " "]},
+        ]
+    )
+    result = load_action_definitions(None, inline)
+    assert [definition.after for definition in result] == [("ha.turn_on",), ("a",)]
+
+
 def test_load_action_definitions_skips_missing_fields():
     inline = json.dumps([{"slug": "no_topic", "payload": "x"}, {"slug": "", "topic": "t", "payload": "x"}])
     result = load_action_definitions(None, inline)
@@ -237,6 +250,146 @@ async def test_action_engine_execute_empty_token_skipped():
     assert result == []
 
 
+class _RecordingHomeAssistant:
+    """Records service-call start/end order; ``hold`` keeps a call open until released."""
+
+    def __init__(self, fail: set[str] | None = None, states: list[dict] | None = None) -> None:
+        self.log: list[str] = []
+        self.hold: dict[str, asyncio.Event] = {}
+        self.fail = fail or set()
+        self.states = states or []
+
+    async def list_entities(self, domain: str | None = None) -> list[dict]:
+        return [state for state in self.states if domain is None or state["entity_id"].startswith(f"{domain}.")]
+
+    async def call_service(self, domain: str, service: str, data: dict) -> None:
+        entity_id = data["entity_id"]
+        self.log.append(f"start {service} {entity_id}")
+        if entity_id in self.hold:
+            await self.hold[entity_id].wait()
+        if entity_id in self.fail:
+            raise HomeAssistantError(f"{entity_id} unavailable")
+        self.log.append(f"end {service} {entity_id}")
+
+    async def set_light_state(self, entity_ids: list[str], *, on: bool, **kwargs) -> None:
+        self.log.append(f"light {'on' if on else 'off'} {entity_ids[0]}")
+
+
+@pytest.mark.anyio
+async def test_action_engine_runs_independent_actions_concurrently():
+    ha = _RecordingHomeAssistant()
+    ha.hold["switch.a"] = asyncio.Event()
+    media = AsyncMock()
+    media.pause_all = AsyncMock(side_effect=lambda: ha.hold["switch.a"].set())
+    engine = ActionEngine([])
+
+    result = await asyncio.wait_for(
+        engine.execute(["ha.turn_on: entity_id=switch.a", "media.pause"], None, ha, media_controller=media), 2
+    )
+
+    # media.pause could only release switch.a while that call was still in flight.
+    assert result == ["ha.turn_on", "media.pause"]
+    assert ha.log == ["start turn_on switch.a", "end turn_on switch.a"]
+
+
+@pytest.mark.anyio
+async def test_action_engine_keeps_order_on_same_target():
+    ha = _RecordingHomeAssistant()
+    ha.hold["switch.a"] = asyncio.Event()
+    asyncio.get_running_loop().call_later(0.05, ha.hold["switch.a"].set)
+    engine = ActionEngine([])
+
+    result = await engine.execute(
+        ["ha.turn_on: entity_id=switch.a", "ha.turn_off: entity_id=switch.b", "ha.light_off: switch.a"],
+        None,
+        ha,
+    )
+
+    assert result == ["ha.turn_on", "ha.turn_off", "ha.light_off"]
+    assert ha.log == [
+        "start turn_on switch.a",
+        "start turn_off switch.b",
+        "end turn_off switch.b",
+        "end turn_on switch.a",
+        "light off switch.a",
+    ]
+
+
+@pytest.mark.anyio
+async def test_action_engine_gives_each_listed_entity_its_own_lane():
+    ha = _RecordingHomeAssistant()
+    ha.hold["switch.a"] = asyncio.Event()
+    asyncio.get_running_loop().call_later(0.05, ha.hold["switch.a"].set)
+    engine = ActionEngine([])
+
+    result = await engine.execute(
+        ["ha.turn_on: entity_id=switch.a, switch.b", "ha.turn_off: entity_id=switch.b"], None, ha
+    )
+
+    assert result == ["ha.turn_on", "ha.turn_off"]
+    assert ha.log == [
+        "start turn_on switch.a",
+        "end turn_on switch.a",
+        "start turn_off switch.b",
+        "end turn_off switch.b",
+    ]
+
+
+@pytest.mark.anyio
+async def test_action_engine_serialises_name_resolved_ha_actions():
+    ha = _RecordingHomeAssistant(states=[{"entity_id": "switch.a", "attributes": {"friendly_name": "Porch"}}])
+    ha.hold["switch.a"] = asyncio.Event()
+    asyncio.get_running_loop().call_later(0.05, ha.hold["switch.a"].set)
+    engine = ActionEngine([])
+
+    result = await engine.execute(
+        ["ha.turn_on: entity_id=switch.a", "ha.turn_off: name=porch", "ha.light_off: light.c"], None, ha
+    )
+
+    # The name resolves to switch.a, so it waits for the first action; light.c waits for it.
+    assert result == ["ha.turn_on", "ha.turn_off", "ha.light_off"]
+    assert ha.log == [
+        "start turn_on switch.a",
+        "end turn_on switch.a",
+        "start turn_off switch.a",
+        "end turn_off switch.a",
+        "light off light.c",
+    ]
+
+
+@pytest.mark.anyio
+async def test_action_engine_honours_declared_dependency():
+    ha = _RecordingHomeAssistant()
+    ha.hold["switch.a"] = asyncio.Event()
+    asyncio.get_running_loop().call_later(0.05, ha.hold["switch.a"].set)
+    mqtt = Mock()
+    mqtt.publish.side_effect = lambda *args, **kwargs: ha.log.append("publish")
+    engine = ActionEngine(
+        [
+            ActionDefinition(
+                slug="scene.after", description="d", type="mqtt", topic="t", payload="p", after=("ha.turn_on",)
+            ),
+            ActionDefinition(slug="scene.free", description="d", type="mqtt", topic="u", payload="p"),
+        ]
+    )
+
+    result = await engine.execute(["ha.turn_on: entity_id=switch.a", "scene.after", "scene.free"], mqtt, ha)
+
+    assert result == ["ha.turn_on", "scene.after", "scene.free"]
+    assert ha.log == ["start turn_on switch.a", "publish", "end turn_on switch.a", "publish"]
+
+
+@pytest.mark.anyio
+async def test_action_engine_reports_partial_failures(caplog):
+    ha = _RecordingHomeAssistant(fail={"switch.broken"})
+    engine = ActionEngine([])
+
+    result = await engine.execute(["ha.turn_on: entity_id=switch.broken", "ha.turn_off: entity_id=switch.ok"], None, ha)
+
+    assert result == ["ha.turn_off"]
+    assert "Action ha.turn_on failed: switch.broken unavailable" in caplog.text
+
+
 # ===== _split_action_token =====
 
 
@@ -555,6 +708,24 @@ async def test_resolve_entities_fallback_substring_match():
     assert result == ["light.xyzzy_thing"]
 
 
+@pytest.mark.anyio
+async def test_resolve_entities_uses_ready_state_mirror():
+    mirror = HomeAssistantStateMirror(None)
+    for state in (
+        {"entity_id": "light.kitchen", "attributes": {"friendly_name": "Kitchen Light"}},
+        {"entity_id": "fan.kitchen", "attributes": {"friendly_name": "Kitchen Fan"}},
+    ):
+        mirror._store(state["entity_id"], state)
+    mirror._ready = True
+    ha = AsyncMock()
+    ha.state_mirror = mirror
+
+    assert await _resolve_entities({"name": "kitchen"}, ha, "fan") == ["fan.kitchen"]
+    assert await _resolve_entities({"all": "true"}, ha, "light") == ["light.kitchen"]
+    ha.list_entities.assert_not_called()
+    assert actions._ENTITY_INDEXES.for_mirror(mirror) is actions._ENTITY_INDEXES.for_mirror(mirror)
+
+
 # ===== _maybe_execute_home_assistant_action =====
 
 
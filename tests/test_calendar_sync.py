@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import hashlib
+import json
 import unittest
+from concurrent.futures import ProcessPoolExecutor
 from datetime import UTC, date, datetime, timedelta
+from typing import cast
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 from icalendar import Calendar  # type: ignore[import-untyped]
+from pulse.assistant import calendar_sync as calendar_sync_module
 from pulse.assistant.calendar_sync import (
     CalendarReminder,
     CalendarSyncService,
@@ -15,8 +21,10 @@ from pulse.assistant.calendar_sync import (
     _guess_google_calendar_email,
     _normalize_attendee_identifier,
     _owner_tokens_for_feed,
+    _share_feed_id,
 )
 from pulse.assistant.config import CalendarConfig
+from pulse.assistant.mqtt import AssistantMqtt
 
 
 async def _noop_trigger(_reminder) -> None:
@@ -204,7 +212,7 @@ END:VCALENDAR
             await asyncio.sleep(0)
 
         asyncio.run(_run_schedule())
-        windowed = list(self.service._windowed_events.values())
+        windowed = self.service._merged_window()
         self.assertEqual(len(windowed), 1)
         self.assertEqual(windowed[0].uid, "event-accepted")
 
@@ -283,7 +291,7 @@ END:VCALENDAR
             await asyncio.sleep(0)
 
         asyncio.run(_run_schedule())
-        windowed = list(self.service._windowed_events.values())
+        windowed = self.service._merged_window()
         self.assertEqual(len(windowed), 1)
         self.assertEqual(windowed[0].uid, reminder.uid)
 
@@ -805,16 +813,13 @@ class TestCancelOldRemindersForUid(unittest.TestCase):
             source_url="https://example.com/cal.ics",
         )
         old_key = svc._reminder_key(old_reminder)
-        mock_task = MagicMock()
-        svc._scheduled[old_key] = mock_task
-        svc._scheduled_reminders[old_key] = old_reminder
-        svc._key_to_feed[old_key] = state.url
-        state.active_keys.add(old_key)
+        svc._deadlines = MagicMock()
+        svc._track_reminder(state, old_key, old_reminder)
 
         svc._cancel_old_reminders_for_uid("e1", "https://example.com/cal.ics", {new_trigger}, state)
-        assert old_key not in svc._scheduled
         assert old_key not in svc._scheduled_reminders
-        mock_task.cancel.assert_called_once()
+        assert state.uid_keys == {}
+        svc._deadlines.cancel.assert_called_once_with(("calendar", old_key))
 
 
 # ---------------------------------------------------------------------------
@@ -914,6 +919,33 @@ def _make_config(**overrides) -> CalendarConfig:  # type: ignore[no-untyped-def]
     return CalendarConfig(**defaults)  # type: ignore[arg-type]
 
 
+def _response(status_code: int = 200, content: bytes = b"", headers: dict | None = None) -> MagicMock:
+    """A streamed httpx response stand-in; the body is delivered in small chunks."""
+    response = MagicMock(status_code=status_code, content=content, headers=headers or {})
+
+    async def aiter_bytes():  # type: ignore[no-untyped-def]
+        body = response.content
+        for offset in range(0, len(body), 64):
+            yield body[offset : offset + 64]
+
+    response.aiter_bytes = aiter_bytes
+    return response
+
+
+def _streams(*results) -> MagicMock:  # type: ignore[no-untyped-def]
+    """Stand-in for ``AsyncClient.stream``: yields ``results`` (responses or exceptions) in order, then the last."""
+    pending = list(results)
+
+    @contextlib.asynccontextmanager
+    async def stream(method, url, **kwargs):  # type: ignore[no-untyped-def]
+        result = pending.pop(0) if len(pending) > 1 else pending[0]
+        if isinstance(result, BaseException):
+            raise result
+        yield result
+
+    return MagicMock(side_effect=stream)
+
+
 @pytest.mark.anyio
 async def test_start_no_feeds_does_nothing() -> None:
     config = _make_config(feeds=())
@@ -947,13 +979,15 @@ async def test_stop_clears_state() -> None:
         # Add some fake scheduled tasks
         fake_task = MagicMock()
         fake_task.cancel = MagicMock()
-        svc._scheduled["key1"] = fake_task
+        svc._deadlines.schedule(("calendar", "key1"), datetime.now(UTC) + timedelta(hours=1), AsyncMock())
+        svc._scheduled_reminders["key1"] = MagicMock()
         svc._retry_tasks["url1"] = fake_task
         svc._failed_feeds.add("url1")
         await svc.stop()
         assert svc._runner is None
         assert svc._client is None
-        assert len(svc._scheduled) == 0
+        assert len(svc._deadlines) == 0
+        assert len(svc._scheduled_reminders) == 0
         assert len(svc._retry_tasks) == 0
         assert len(svc._failed_feeds) == 0
 
@@ -970,10 +1004,10 @@ async def test_sync_feed_304_not_modified() -> None:
     state = svc._feed_states[config.feeds[0]]
     state.etag = '"abc"'
 
-    mock_response = MagicMock()
+    mock_response = _response()
     mock_response.status_code = 304
     mock_client = AsyncMock()
-    mock_client.get = AsyncMock(return_value=mock_response)
+    mock_client.stream = _streams(mock_response)
     svc._client = mock_client
 
     now = datetime.now(UTC).astimezone()
@@ -990,7 +1024,7 @@ async def test_sync_feed_http_error_schedules_retry() -> None:
     svc._stop_event = asyncio.Event()
 
     mock_client = AsyncMock()
-    mock_client.get = AsyncMock(side_effect=httpx.HTTPError("Connection failed"))
+    mock_client.stream = _streams(httpx.HTTPError("Connection failed"))
     svc._client = mock_client
 
     now = datetime.now(UTC).astimezone()
@@ -1009,7 +1043,7 @@ async def test_sync_feed_read_timeout_schedules_retry() -> None:
     svc._stop_event = asyncio.Event()
 
     mock_client = AsyncMock()
-    mock_client.get = AsyncMock(side_effect=httpx.ReadTimeout("Timed out"))
+    mock_client.stream = _streams(httpx.ReadTimeout("Timed out"))
     svc._client = mock_client
 
     now = datetime.now(UTC).astimezone()
@@ -1026,10 +1060,10 @@ async def test_sync_feed_400_schedules_retry() -> None:
     state = svc._feed_states[config.feeds[0]]
     svc._stop_event = asyncio.Event()
 
-    mock_response = MagicMock()
+    mock_response = _response()
     mock_response.status_code = 500
     mock_client = AsyncMock()
-    mock_client.get = AsyncMock(return_value=mock_response)
+    mock_client.stream = _streams(mock_response)
     svc._client = mock_client
 
     now = datetime.now(UTC).astimezone()
@@ -1046,12 +1080,12 @@ async def test_sync_feed_parse_failure_schedules_retry() -> None:
     state = svc._feed_states[config.feeds[0]]
     svc._stop_event = asyncio.Event()
 
-    mock_response = MagicMock()
+    mock_response = _response()
     mock_response.status_code = 200
     mock_response.content = b"NOT VALID ICS DATA"
     mock_response.headers = {}
     mock_client = AsyncMock()
-    mock_client.get = AsyncMock(return_value=mock_response)
+    mock_client.stream = _streams(mock_response)
     svc._client = mock_client
 
     now = datetime.now(UTC).astimezone()
@@ -1081,12 +1115,12 @@ END:VEVENT
 END:VCALENDAR
 """.encode()
 
-    mock_response = MagicMock()
+    mock_response = _response()
     mock_response.status_code = 200
     mock_response.content = ics_body
     mock_response.headers = {"etag": '"new-etag"', "last-modified": "Thu, 01 Jan 2025 00:00:00 GMT"}
     mock_client = AsyncMock()
-    mock_client.get = AsyncMock(return_value=mock_response)
+    mock_client.stream = _streams(mock_response)
     svc._client = mock_client
 
     now = datetime.now(UTC).astimezone()
@@ -1095,8 +1129,7 @@ END:VCALENDAR
     assert state.last_modified == "Thu, 01 Jan 2025 00:00:00 GMT"
     assert state.calendar_name == "Work Calendar"
     # Clean up
-    for task in svc._scheduled.values():
-        task.cancel()
+    await svc._deadlines.close()
 
 
 @pytest.mark.anyio
@@ -1133,7 +1166,7 @@ async def test_emit_event_snapshot_calls_callback() -> None:
         calendar_name=None,
         source_url="https://example.com/cal.ics",
     )
-    svc._windowed_events["key1"] = reminder
+    svc._feed_states[config.feeds[0]].window[(reminder.uid, reminder.start)] = reminder
     await svc._emit_event_snapshot()
     snapshot_cb.assert_awaited_once()
     args = snapshot_cb.call_args[0][0]
@@ -1145,7 +1178,6 @@ async def test_emit_event_snapshot_calls_callback() -> None:
 async def test_emit_event_snapshot_no_callback() -> None:
     config = _make_config()
     svc = CalendarSyncService(config=config, trigger_callback=_noop_trigger, snapshot_callback=None)
-    svc._windowed_events.clear()
     # Should not raise
     await svc._emit_event_snapshot()
     assert svc._latest_events == []
@@ -1169,18 +1201,18 @@ async def test_emit_event_snapshot_callback_exception_logged() -> None:
         calendar_name=None,
         source_url="https://example.com/cal.ics",
     )
-    svc._windowed_events["k"] = reminder
+    svc._feed_states[config.feeds[0]].window[(reminder.uid, reminder.start)] = reminder
     # Should not raise (exception is logged)
     await svc._emit_event_snapshot()
 
 
 # ---------------------------------------------------------------------------
-# _await_and_fire
+# _fire_reminder
 # ---------------------------------------------------------------------------
 
 
 @pytest.mark.anyio
-async def test_await_and_fire_immediate_trigger() -> None:
+async def test_fire_reminder_immediate_trigger() -> None:
     trigger_cb = AsyncMock()
     config = _make_config()
     svc = CalendarSyncService(config=config, trigger_callback=trigger_cb)
@@ -1200,19 +1232,18 @@ async def test_await_and_fire_immediate_trigger() -> None:
         source_url=config.feeds[0],
     )
     key = svc._reminder_key(reminder)
-    svc._scheduled[key] = MagicMock()
     svc._scheduled_reminders[key] = reminder
     svc._key_to_feed[key] = config.feeds[0]
     state.active_keys.add(key)
 
-    await svc._await_and_fire(key, reminder)
+    await svc._fire_reminder(key, reminder)
     trigger_cb.assert_awaited_once_with(reminder)
     assert key in svc._triggered
-    assert key not in svc._scheduled
+    assert key not in svc._scheduled_reminders
 
 
 @pytest.mark.anyio
-async def test_await_and_fire_declined_not_triggered() -> None:
+async def test_fire_reminder_declined_not_triggered() -> None:
     trigger_cb = AsyncMock()
     config = _make_config()
     svc = CalendarSyncService(config=config, trigger_callback=trigger_cb)
@@ -1233,18 +1264,17 @@ async def test_await_and_fire_declined_not_triggered() -> None:
         declined=True,
     )
     key = svc._reminder_key(reminder)
-    svc._scheduled[key] = MagicMock()
     svc._scheduled_reminders[key] = reminder
     svc._key_to_feed[key] = config.feeds[0]
     state.active_keys.add(key)
 
-    await svc._await_and_fire(key, reminder)
+    await svc._fire_reminder(key, reminder)
     trigger_cb.assert_not_awaited()
     assert key in svc._triggered
 
 
 @pytest.mark.anyio
-async def test_await_and_fire_stop_event_cancels() -> None:
+async def test_fire_reminder_stop_event_cancels() -> None:
     trigger_cb = AsyncMock()
     config = _make_config()
     svc = CalendarSyncService(config=config, trigger_callback=trigger_cb)
@@ -1264,14 +1294,14 @@ async def test_await_and_fire_stop_event_cancels() -> None:
     )
     key = svc._reminder_key(reminder)
 
-    # Set the stop event so the wait returns immediately
+    # A reminder that comes due while the service is stopping is skipped
     svc._stop_event.set()
-    await svc._await_and_fire(key, reminder)
+    await svc._fire_reminder(key, reminder)
     trigger_cb.assert_not_awaited()
 
 
 @pytest.mark.anyio
-async def test_await_and_fire_callback_exception_logged() -> None:
+async def test_fire_reminder_callback_exception_logged() -> None:
     trigger_cb = AsyncMock(side_effect=RuntimeError("callback exploded"))
     config = _make_config()
     svc = CalendarSyncService(config=config, trigger_callback=trigger_cb)
@@ -1291,13 +1321,12 @@ async def test_await_and_fire_callback_exception_logged() -> None:
         source_url=config.feeds[0],
     )
     key = svc._reminder_key(reminder)
-    svc._scheduled[key] = MagicMock()
     svc._scheduled_reminders[key] = reminder
     svc._key_to_feed[key] = config.feeds[0]
     state.active_keys.add(key)
 
     # Should not raise
-    await svc._await_and_fire(key, reminder)
+    await svc._fire_reminder(key, reminder)
     assert key in svc._triggered
 
 
@@ -1385,7 +1414,8 @@ async def test_schedule_reminders_skips_past_events() -> None:
         source_url=config.feeds[0],
     )
     await svc._schedule_reminders(state, [past_reminder], now)
-    assert len(svc._scheduled) == 0
+    assert len(svc._scheduled_reminders) == 0
+    assert len(svc._deadlines) == 0
 
 
 @pytest.mark.anyio
@@ -1397,16 +1427,16 @@ async def test_schedule_reminders_stale_keys_cancelled() -> None:
 
     # Simulate an old reminder that's no longer in the feed
     stale_key = "stale-key"
-    mock_task = MagicMock()
-    svc._scheduled[stale_key] = mock_task
+    svc._deadlines.schedule(("calendar", stale_key), now + timedelta(hours=1), AsyncMock())
     svc._scheduled_reminders[stale_key] = MagicMock()
     svc._key_to_feed[stale_key] = config.feeds[0]
     state.active_keys.add(stale_key)
 
     # Schedule with empty reminders -> stale key should be cancelled
     await svc._schedule_reminders(state, [], now)
-    mock_task.cancel.assert_called_once()
-    assert stale_key not in svc._scheduled
+    assert ("calendar", stale_key) not in svc._deadlines
+    assert stale_key not in svc._scheduled_reminders
+    await svc._deadlines.close()
 
 
 # ---------------------------------------------------------------------------
@@ -1536,26 +1566,34 @@ END:VCALENDAR
 
 
 class TestKeyMethods(unittest.TestCase):
-    def test_window_key_format(self) -> None:
+    def test_window_keeps_earliest_trigger_per_occurrence(self) -> None:
         config = _make_config()
         svc = CalendarSyncService(config=config, trigger_callback=_noop_trigger)
+        svc._deadlines = MagicMock()
+        state = svc._feed_states[config.feeds[0]]
         now = datetime(2025, 6, 1, 10, 0, tzinfo=UTC)
-        r = CalendarReminder(
-            uid="k1",
-            summary="T",
-            description=None,
-            location=None,
-            start=now,
-            end=None,
-            all_day=False,
-            trigger_time=now - timedelta(minutes=5),
-            calendar_name=None,
-            source_url="http://x",
-        )
-        wk = svc._window_key(r)
-        assert "k1" in wk
-        assert "http://x" in wk
-        assert now.isoformat() in wk
+        start = now + timedelta(hours=1)
+        reminders = [
+            CalendarReminder(
+                uid="k1",
+                summary="T",
+                description=None,
+                location=None,
+                start=start,
+                end=None,
+                all_day=False,
+                trigger_time=start - timedelta(minutes=minutes),
+                calendar_name=None,
+                source_url=state.url,
+            )
+            for minutes in (5, 15)
+        ]
+
+        asyncio.run(svc._schedule_reminders(state, reminders, now))
+
+        assert list(state.window) == [("k1", start)]
+        assert state.window[("k1", start)].trigger_time == start - timedelta(minutes=15)
+        assert len(state.uid_keys["k1"]) == 2
 
     def test_reminder_key_uses_trigger_time(self) -> None:
         config = _make_config()
@@ -1576,3 +1614,557 @@ class TestKeyMethods(unittest.TestCase):
         )
         rk = svc._reminder_key(r)
         assert trigger.isoformat() in rk
+
+
+# ---------------------------------------------------------------------------
+# Concurrent, per-feed refresh
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.anyio
+async def test_sync_once_fetches_feeds_concurrently() -> None:
+    config = _make_config(feeds=("https://a.example.com/cal.ics", "https://b.example.com/cal.ics"))
+    svc = CalendarSyncService(config=config, trigger_callback=_noop_trigger)
+    svc._client = AsyncMock()
+    in_flight = 0
+    peak = 0
+
+    async def fake_sync(state, now):  # type: ignore[no-untyped-def]
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return True
+
+    with patch.object(svc, "_sync_feed", side_effect=fake_sync):
+        await svc._sync_once()
+
+    assert peak == 2
+    assert all(state.interval == 300 for state in svc._feed_states.values())
+
+
+@pytest.mark.anyio
+async def test_slow_feed_does_not_block_others() -> None:
+    config = _make_config(feeds=("https://slow.example.com/cal.ics", "https://fast.example.com/cal.ics"))
+    svc = CalendarSyncService(config=config, trigger_callback=_noop_trigger)
+    svc._client = AsyncMock()
+    synced: list[str] = []
+
+    async def fake_sync(state, now):  # type: ignore[no-untyped-def]
+        if "slow" in state.url:
+            await asyncio.sleep(10)
+        synced.append(state.url)
+        return True
+
+    with (
+        patch("pulse.assistant.calendar_sync.FEED_TIMEOUT_SECONDS", 0.05),
+        patch.object(svc, "_sync_feed", side_effect=fake_sync),
+    ):
+        await svc._sync_once()
+
+    assert synced == ["https://fast.example.com/cal.ics"]
+    assert svc._last_sync_completed is not None
+
+
+@pytest.mark.anyio
+async def test_plan_refresh_backs_off_while_unchanged() -> None:
+    config = _make_config(refresh_minutes=5, max_refresh_minutes=30)
+    svc = CalendarSyncService(config=config, trigger_callback=_noop_trigger)
+    state = svc._feed_states[config.feeds[0]]
+    loop = asyncio.get_running_loop()
+
+    intervals = []
+    for changed in (True, False, False, False, None, True):
+        svc._plan_refresh(state, changed)
+        intervals.append(state.interval)
+
+    assert intervals == [300, 600, 1200, 1800, 1800, 300]
+    delay = state.next_due - loop.time()
+    assert 300 * 0.85 <= delay <= 300 * 1.1
+
+
+@pytest.mark.anyio
+async def test_sync_feed_304_leaves_window_untouched() -> None:
+    config = _make_config()
+    svc = CalendarSyncService(config=config, trigger_callback=_noop_trigger)
+    state = svc._feed_states[config.feeds[0]]
+    event_start = (datetime.now(UTC) + timedelta(hours=2)).strftime("%Y%m%dT%H%M%SZ")
+    body = (
+        f"BEGIN:VCALENDAR\nVERSION:2.0\nBEGIN:VEVENT\nUID:cached\nDTSTART:{event_start}\n"
+        "SUMMARY:Cached\nEND:VEVENT\nEND:VCALENDAR\n"
+    ).encode()
+    ok = _response(200, content=body, headers={"etag": '"v1"'})
+    not_modified = _response(304)
+    svc._client = AsyncMock()
+    svc._client.stream = _streams(ok, not_modified)
+    now = datetime.now(UTC).astimezone()
+
+    assert await svc._sync_feed(state, now) is True
+    await svc._emit_event_snapshot()
+    assert await svc._sync_feed(state, now) is False
+
+    assert [reminder.uid for reminder in svc._merged_window()] == ["cached"]
+    assert not svc._window_changed
+    await svc._deadlines.close()
+
+
+# ---------------------------------------------------------------------------
+# Off-loop parsing and expansion cache
+# ---------------------------------------------------------------------------
+
+
+def _single_event_body(uid: str = "cached") -> bytes:
+    event_start = (datetime.now(UTC) + timedelta(hours=2)).strftime("%Y%m%dT%H%M%SZ")
+    return (
+        f"BEGIN:VCALENDAR\nVERSION:2.0\nX-WR-CALNAME:Team\nBEGIN:VEVENT\nUID:{uid}\nDTSTART:{event_start}\n"
+        "SUMMARY:Standup\nEND:VEVENT\nEND:VCALENDAR\n"
+    ).encode()
+
+
+@pytest.mark.anyio
+async def test_unchanged_feed_reuses_expansion() -> None:
+    from pulse.assistant import calendar_sync
+
+    config = _make_config()
+    svc = CalendarSyncService(config=config, trigger_callback=_noop_trigger)
+    state = svc._feed_states[config.feeds[0]]
+    body = _single_event_body()
+    svc._client = AsyncMock()
+    svc._client.stream = _streams(
+        _response(200, content=body, headers={}),
+        _response(200, content=body, headers={}),
+        _response(304),
+    )
+    now = datetime.now(UTC).astimezone()
+
+    with patch.object(calendar_sync, "_expand_feed", wraps=calendar_sync._expand_feed) as expand:
+        assert await svc._sync_feed(state, now) is True
+        assert await svc._sync_feed(state, now) is False
+        assert await svc._sync_feed(state, now) is False
+
+    assert expand.call_count == 1
+    assert state.calendar_name == "Team"
+    assert [reminder.uid for reminder in svc._merged_window()] == ["cached"]
+    await svc._deadlines.close()
+
+
+@pytest.mark.anyio
+async def test_expansion_refreshed_once_lookahead_passes_it() -> None:
+    from pulse.assistant import calendar_sync
+
+    config = _make_config()
+    svc = CalendarSyncService(config=config, trigger_callback=_noop_trigger)
+    state = svc._feed_states[config.feeds[0]]
+    svc._client = AsyncMock()
+    svc._client.stream = _streams(_response(200, content=_single_event_body(), headers={}), _response(304))
+    now = datetime.now(UTC).astimezone()
+
+    with patch.object(calendar_sync, "_expand_feed", wraps=calendar_sync._expand_feed) as expand:
+        await svc._sync_feed(state, now)
+        await svc._sync_feed(state, now + calendar_sync.EXPANSION_MARGIN + timedelta(minutes=1))
+
+    assert expand.call_count == 2
+    await svc._deadlines.close()
+
+
+@pytest.mark.anyio
+async def test_expansion_runs_in_worker_process() -> None:
+    config = _make_config()
+    svc = CalendarSyncService(config=config, trigger_callback=_noop_trigger)
+    state = svc._feed_states[config.feeds[0]]
+    with patch.object(svc, "_run_loop", new_callable=AsyncMock):
+        await svc.start()
+        assert isinstance(svc._parse_executor, ProcessPoolExecutor)
+        assert svc._client is not None
+        await svc._client.aclose()
+        svc._client = AsyncMock()
+        svc._client.stream = _streams(_response(200, content=_single_event_body(), headers={}))
+        try:
+            await svc._sync_feed(state, datetime.now(UTC).astimezone())
+            assert state.expanded is not None
+            assert [reminder.uid for reminder in state.expanded.reminders] == ["cached"]
+        finally:
+            await svc.stop()
+    assert svc._parse_executor is None
+
+
+# ---------------------------------------------------------------------------
+# Incremental window
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.anyio
+async def test_snapshot_only_emitted_when_window_changes() -> None:
+    snapshot_cb = AsyncMock()
+    config = _make_config()
+    svc = CalendarSyncService(config=config, trigger_callback=_noop_trigger, snapshot_callback=snapshot_cb)
+    first = _single_event_body("first")
+    moved = first.replace(b"SUMMARY:Standup", b"SUMMARY:Standup (moved)")
+    svc._client = AsyncMock()
+    svc._client.stream = _streams(
+        _response(200, content=first, headers={"etag": '"1"'}),
+        _response(304),
+        _response(200, content=moved, headers={"etag": '"2"'}),
+    )
+
+    await svc._sync_once()
+    await svc._sync_once()
+    assert snapshot_cb.await_count == 1
+    await svc._sync_once()
+
+    assert snapshot_cb.await_count == 2
+    assert [reminder.summary for reminder in snapshot_cb.call_args[0][0]] == ["Standup (moved)"]
+    await svc._deadlines.close()
+
+
+@pytest.mark.anyio
+async def test_rescheduled_event_replaces_its_trigger() -> None:
+    config = _make_config()
+    svc = CalendarSyncService(config=config, trigger_callback=_noop_trigger)
+    svc._deadlines = MagicMock()
+    state = svc._feed_states[config.feeds[0]]
+    now = datetime.now(UTC)
+
+    def reminder(start: datetime) -> CalendarReminder:
+        return CalendarReminder(
+            uid="move-me",
+            summary="Move",
+            description=None,
+            location=None,
+            start=start,
+            end=None,
+            all_day=False,
+            trigger_time=start - timedelta(minutes=5),
+            calendar_name=None,
+            source_url=state.url,
+        )
+
+    original, moved = reminder(now + timedelta(hours=1)), reminder(now + timedelta(hours=3))
+    await svc._schedule_reminders(state, [original], now)
+    await svc._schedule_reminders(state, [moved], now)
+
+    assert state.uid_keys == {"move-me": {svc._reminder_key(moved)}}
+    assert set(svc._scheduled_reminders) == {svc._reminder_key(moved)}
+    assert list(state.window) == [("move-me", moved.start)]
+    svc._deadlines.cancel.assert_called_once_with(("calendar", svc._reminder_key(original)))
+
+
+# ---------------------------------------------------------------------------
+# Disk cache
+# ---------------------------------------------------------------------------
+
+
+def test_reminder_dict_round_trip() -> None:
+    start = datetime(2025, 1, 1, 9, 0, tzinfo=UTC)
+    reminder = CalendarReminder(
+        uid="event-1",
+        summary="Standup",
+        description=None,
+        location="Room 4",
+        start=start,
+        end=None,
+        all_day=False,
+        trigger_time=start - timedelta(minutes=10),
+        calendar_name="Work",
+        source_url="https://example.com/work.ics",
+        sequence=2,
+        declined_by=("a@example.com",),
+    )
+
+    payload = json.loads(json.dumps(calendar_sync_module._reminder_to_dict(reminder)))
+
+    assert calendar_sync_module._reminder_from_dict(payload) == reminder
+
+
+@pytest.mark.anyio
+async def test_cache_restores_window_before_network(tmp_path) -> None:
+    config = _make_config(cache_file=tmp_path / "calendar.json")
+    writer = CalendarSyncService(config=config, trigger_callback=_noop_trigger)
+    writer._client = AsyncMock()
+    writer._client.stream = _streams(
+        _response(200, content=_single_event_body(), headers={"etag": '"v1"', "last-modified": "Mon"})
+    )
+    await writer._sync_once()
+    await writer._deadlines.close()
+    assert config.cache_file is not None and config.cache_file.exists()
+
+    snapshot_cb = AsyncMock()
+    svc = CalendarSyncService(config=config, trigger_callback=_noop_trigger, snapshot_callback=snapshot_cb)
+    with patch.object(svc, "_run_loop", new_callable=AsyncMock):
+        await svc.start()
+        try:
+            snapshot_cb.assert_awaited_once()
+            assert [reminder.uid for reminder in snapshot_cb.call_args[0][0]] == ["cached"]
+            state = svc._feed_states[config.feeds[0]]
+            assert (state.etag, state.last_modified, state.calendar_name) == ('"v1"', "Mon", "Team")
+            assert len(svc._deadlines) == 1
+
+            # Revalidation sends the restored validators and a 304 keeps everything in place.
+            assert svc._client is not None
+            await svc._client.aclose()
+            svc._client = AsyncMock()
+            svc._client.stream = _streams(_response(304))
+            assert await svc._sync_feed(state, datetime.now(UTC).astimezone()) is False
+            assert svc._client.stream.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+            assert [reminder.uid for reminder in svc._merged_window()] == ["cached"]
+        finally:
+            await svc.stop()
+
+
+@pytest.mark.anyio
+async def test_expired_cache_entry_fetches_unconditionally(tmp_path) -> None:
+    config = _make_config(cache_file=tmp_path / "calendar.json")
+    svc = CalendarSyncService(config=config, trigger_callback=_noop_trigger)
+    state = svc._feed_states[config.feeds[0]]
+    now = datetime.now(UTC).astimezone()
+    state.etag = '"v1"'
+    state.content_hash = "abc"
+    state.expanded = calendar_sync_module._ExpandedFeed("abc", None, now, [])
+    svc._client = AsyncMock()
+    svc._client.stream = _streams(_response(200, content=_single_event_body(), headers={}))
+
+    await svc._sync_feed(state, now)
+
+    assert svc._client.stream.call_args.kwargs["headers"] == {}
+    assert state.body is not None
+    await svc._deadlines.close()
+
+
+@pytest.mark.anyio
+async def test_corrupt_cache_is_ignored(tmp_path) -> None:
+    cache_file = tmp_path / "calendar.json"
+    cache_file.write_text("{not json")
+    snapshot_cb = AsyncMock()
+    svc = CalendarSyncService(
+        config=_make_config(cache_file=cache_file), trigger_callback=_noop_trigger, snapshot_callback=snapshot_cb
+    )
+
+    await svc._restore_from_cache()
+
+    snapshot_cb.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_streamed_body_drops_past_events_but_hashes_raw_body() -> None:
+    config = _make_config()
+    svc = CalendarSyncService(config=config, trigger_callback=_noop_trigger)
+    state = svc._feed_states[config.feeds[0]]
+    past = "BEGIN:VEVENT\nUID:old\nDTSTART:20100101T100000Z\nDTEND:20100101T110000Z\nEND:VEVENT\n"
+    raw = _single_event_body().replace(b"BEGIN:VEVENT", past.encode() + b"BEGIN:VEVENT", 1)
+    svc._client = AsyncMock()
+    svc._client.stream = _streams(_response(200, content=raw, headers={}))
+
+    assert await svc._sync_feed(state, datetime.now(UTC).astimezone()) is True
+
+    assert state.body is not None and b"UID:old" not in state.body
+    assert state.content_hash == hashlib.sha256(raw).hexdigest()
+    assert [reminder.uid for reminder in svc._merged_window()] == ["cached"]
+    await svc._deadlines.close()
+
+
+# ---------------------------------------------------------------------------
+# Fleet sharing over MQTT
+# ---------------------------------------------------------------------------
+
+
+class _FakeMqtt:
+    def __init__(self) -> None:
+        self.published: list[tuple[str, str, bool]] = []
+        self.subscriptions: dict[str, object] = {}
+
+    def publish(self, topic: str, payload: str, retain: bool = False, qos: int = 0) -> None:
+        self.published.append((topic, payload, retain))
+
+    def subscribe(self, topic: str, on_message) -> None:  # type: ignore[no-untyped-def]
+        self.subscriptions[topic] = on_message
+
+
+def _shared_body() -> bytes:
+    event_start = (datetime.now(UTC) + timedelta(hours=3)).strftime("%Y%m%dT%H%M%SZ")
+    return (
+        "BEGIN:VCALENDAR\nVERSION:2.0\nX-WR-CALNAME:Family\nBEGIN:VEVENT\nUID:recital\n"
+        f"DTSTART:{event_start}\nSUMMARY:Recital\nATTENDEE;PARTSTAT=DECLINED:mailto:Kid@Example.com\n"
+        "ATTENDEE;PARTSTAT=ACCEPTED:mailto:parent@example.com\nEND:VEVENT\nEND:VCALENDAR\n"
+    ).encode()
+
+
+async def _leader_payload(hostname: str = "kitchen", **overrides) -> dict:  # type: ignore[no-untyped-def]
+    mqtt = _FakeMqtt()
+    config = _make_config(share_mode="leader", hide_declined_events=True, attendee_emails=("kid@example.com",))
+    leader = CalendarSyncService(
+        config=config, trigger_callback=_noop_trigger, mqtt=cast(AssistantMqtt, mqtt), hostname=hostname
+    )
+    leader._client = AsyncMock()
+    leader._client.stream = _streams(_response(200, content=_shared_body(), headers={}))
+    await leader._sync_once()
+    await leader._deadlines.close()
+    payload = json.loads(mqtt.published[-1][1])
+    payload.update(overrides)
+    return payload
+
+
+@pytest.mark.anyio
+async def test_leader_publishes_retained_payload_and_heartbeats() -> None:
+    mqtt = _FakeMqtt()
+    config = _make_config(share_mode="leader", hide_declined_events=True, attendee_emails=("kid@example.com",))
+    leader = CalendarSyncService(
+        config=config, trigger_callback=_noop_trigger, mqtt=cast(AssistantMqtt, mqtt), hostname="kitchen"
+    )
+    leader._client = AsyncMock()
+    leader._client.stream = _streams(_response(200, content=_shared_body(), headers={}), _response(304))
+
+    await leader._sync_once()
+    await leader._sync_once()
+
+    assert len(mqtt.published) == 1
+    topic, raw, retain = mqtt.published[0]
+    assert (topic, retain) == ("pulse/shared/calendar", True)
+    assert config.feeds[0] not in raw
+    payload = json.loads(raw)
+    (reminder,) = payload["feeds"][_share_feed_id(config.feeds[0])]["reminders"]
+    # The leader hides its own declined event locally but shares it undecided for other devices.
+    assert leader._merged_window() == []
+    assert reminder["declined"] is False
+    assert reminder["declined_by"] == ["kid@example.com"]
+
+    leader._share_published_at = -1e9
+    await leader._sync_once()
+    assert json.loads(mqtt.published[-1][1])["revision"] == payload["revision"]
+    await leader._deadlines.close()
+
+
+@pytest.mark.anyio
+async def test_follower_schedules_from_payload_with_local_declines() -> None:
+    payload = await _leader_payload()
+    snapshot_cb = AsyncMock()
+    follower = CalendarSyncService(
+        config=_make_config(feeds=(), share_mode="follower"),
+        trigger_callback=_noop_trigger,
+        snapshot_callback=snapshot_cb,
+        hostname="bedroom",
+    )
+    kid = CalendarSyncService(
+        config=_make_config(feeds=(), share_mode="follower", attendee_emails=("kid@example.com",)),
+        trigger_callback=_noop_trigger,
+        hostname="kids-room",
+    )
+
+    await follower._apply_shared(payload)
+    await follower._apply_shared(dict(payload))  # heartbeat: same revision is not re-applied
+    await kid._apply_shared(payload)
+
+    assert [reminder.uid for reminder in follower._merged_window()] == ["recital"]
+    assert follower._feed_states[_share_feed_id(_make_config().feeds[0])].label == "Family"
+    snapshot_cb.assert_awaited_once()
+    assert kid._merged_window() == []
+    assert all(reminder.declined for reminder in kid._scheduled_reminders.values())
+    await follower._deadlines.close()
+    await kid._deadlines.close()
+
+
+@pytest.mark.anyio
+async def test_shared_payload_carries_owner_tokens_instead_of_the_feed_url() -> None:
+    url = "https://calendar.google.com/calendar/ical/kid%40example.com/private-s3cret/basic.ics"
+    mqtt = _FakeMqtt()
+    leader = CalendarSyncService(
+        config=_make_config(feeds=(url,), share_mode="leader"),
+        trigger_callback=_noop_trigger,
+        mqtt=cast(AssistantMqtt, mqtt),
+        hostname="kitchen",
+    )
+    leader._client = AsyncMock()
+    leader._client.stream = _streams(_response(200, content=_shared_body(), headers={}))
+    await leader._sync_once()
+    raw = mqtt.published[-1][1]
+    follower = CalendarSyncService(
+        config=_make_config(feeds=(), share_mode="follower"), trigger_callback=_noop_trigger, hostname="bedroom"
+    )
+    polls_too = CalendarSyncService(
+        config=_make_config(feeds=(url,), share_mode="follower"), trigger_callback=_noop_trigger, hostname="den"
+    )
+
+    await follower._apply_shared(json.loads(raw))
+    await polls_too._apply_shared(json.loads(raw))
+
+    assert "s3cret" not in raw
+    # The owner is known from the leader's URL, so the kid's decline applies on every device.
+    assert [reminder.declined for reminder in follower._scheduled_reminders.values()] == [True]
+    assert list(polls_too._feed_states) == [url]
+    assert all(reminder.source_url == url for reminder in polls_too._scheduled_reminders.values())
+    for svc in (leader, follower, polls_too):
+        await svc._deadlines.close()
+
+
+@pytest.mark.anyio
+async def test_follower_drops_feeds_the_leader_no_longer_shares() -> None:
+    payload = await _leader_payload()
+    follower = CalendarSyncService(
+        config=_make_config(feeds=(), share_mode="follower"), trigger_callback=_noop_trigger, hostname="bedroom"
+    )
+    await follower._apply_shared(payload)
+
+    await follower._apply_shared({**payload, "revision": payload["revision"] + 1, "feeds": {}})
+
+    assert follower._feed_states == {}
+    assert follower._scheduled_reminders == {}
+    await follower._deadlines.close()
+
+
+@pytest.mark.anyio
+async def test_auto_device_claims_leadership_without_a_current_leader() -> None:
+    svc = CalendarSyncService(
+        config=_make_config(share_mode="auto"),
+        trigger_callback=_noop_trigger,
+        mqtt=cast(AssistantMqtt, _FakeMqtt()),
+        hostname="bedroom",
+    )
+    stale = await _leader_payload(published_at=(datetime.now(UTC) - timedelta(days=1)).isoformat())
+    await svc._apply_shared(stale)
+    assert svc._share_role == "follower"
+
+    await svc._review_share_role()
+
+    assert svc._share_role == "leader"
+    await svc._deadlines.close()
+
+
+@pytest.mark.anyio
+async def test_auto_leader_defers_to_lower_hostname() -> None:
+    svc = CalendarSyncService(
+        config=_make_config(share_mode="auto"),
+        trigger_callback=_noop_trigger,
+        mqtt=cast(AssistantMqtt, _FakeMqtt()),
+        hostname="hallway",
+    )
+    svc._share_role = "leader"
+
+    await svc._apply_shared(await _leader_payload(hostname="office"))
+    assert svc._share_role == "leader"
+
+    await svc._apply_shared(await _leader_payload(hostname="attic"))
+    assert svc._share_role == "follower"
+    assert [reminder.uid for reminder in svc._merged_window()] == ["recital"]
+    await svc._review_share_role()
+    assert svc._share_role == "follower"
+    await svc._deadlines.close()
+
+
+@pytest.mark.anyio
+async def test_shared_message_is_handed_to_event_loop() -> None:
+    payload = await _leader_payload()
+    mqtt = _FakeMqtt()
+    config = _make_config(feeds=(), share_mode="follower", cache_file=None)
+    svc = CalendarSyncService(
+        config=config, trigger_callback=_noop_trigger, mqtt=cast(AssistantMqtt, mqtt), hostname="bedroom"
+    )
+    await svc.start()
+    handler = mqtt.subscriptions["pulse/shared/calendar"]
+    await asyncio.to_thread(handler, json.dumps(payload))  # type: ignore[arg-type]
+    for _ in range(50):
+        if svc._merged_window():
+            break
+        await asyncio.sleep(0.01)
+
+    assert [reminder.uid for reminder in svc._merged_window()] == ["recital"]
+    await svc.stop()
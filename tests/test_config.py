@@ -9,6 +9,7 @@ from unittest.mock import Mock, patch
 import pytest
 from pulse.assistant.config import (
     DEFAULT_HA_WAKE_MODEL,
+    DEFAULT_TTS_CACHE_PHRASES,
     DEFAULT_WAKE_MODEL,
     AssistantConfig,
     MicConfig,
@@ -392,6 +393,15 @@ class TestFromEnvMqtt:
         assert not cfg.mqtt.topic_base.endswith("/")
 
 
+class TestFromEnvHomeAssistant:
+    def test_state_mirror_defaults_on(self) -> None:
+        assert _from_env().home_assistant.state_mirror is True
+
+    def test_state_mirror_can_be_disabled(self) -> None:
+        cfg = _from_env({"HOME_ASSISTANT_STATE_MIRROR": "false"})
+        assert cfg.home_assistant.state_mirror is False
+
+
 class TestFromEnvActionFile:
     def test_action_file_exists(self, tmp_path: Path) -> None:
         action_file = tmp_path / "actions.yaml"
@@ -463,6 +473,54 @@ class TestFromEnvCalendar:
         cfg = _from_env({"PULSE_CALENDAR_DEFAULT_NOTIFICATIONS": ""})
         assert cfg.calendar.default_notifications == ()
 
+    def test_calendar_max_refresh_never_below_refresh(self) -> None:
+        cfg = _from_env({"PULSE_CALENDAR_REFRESH_MINUTES": "45", "PULSE_CALENDAR_MAX_CONCURRENT_FEEDS": "0"})
+        assert cfg.calendar.max_refresh_minutes == 45
+        assert cfg.calendar.max_concurrent_feeds == 1
+
+    def test_calendar_cache_file(self, tmp_path) -> None:
+        assert _from_env().calendar.cache_file is not None
+        assert _from_env({"PULSE_CALENDAR_CACHE_FILE": str(tmp_path / "c.json")}).calendar.cache_file == (
+            tmp_path / "c.json"
+        )
+        assert _from_env({"PULSE_CALENDAR_CACHE": "false"}).calendar.cache_file is None
+
+    def test_calendar_share_mode(self) -> None:
+        assert _from_env().calendar.share_mode == "off"
+        follower = _from_env({"PULSE_CALENDAR_SHARE_MODE": "Follower", "PULSE_CALENDAR_SHARE_TOPIC": "home/cal/"})
+        assert follower.calendar.share_mode == "follower"
+        assert follower.calendar.share_topic == "home/cal"
+        # Followers need no feed URLs of their own.
+        assert follower.calendar.enabled
+        assert _from_env({"PULSE_CALENDAR_SHARE_MODE": "boss"}).calendar.share_mode == "off"
+
+
+class TestFromEnvInfo:
+    def test_prefetch_defaults_off(self) -> None:
+        info = _from_env().info
+        assert info.prefetch is False
+        assert info.prefetch_news is False
+        assert info.prefetch_quiet_hours is None
+
+    def test_prefetch_news_opt_in(self) -> None:
+        info = _from_env({"PULSE_INFO_PREFETCH": "true", "PULSE_INFO_PREFETCH_NEWS": "true"}).info
+        assert (info.prefetch, info.prefetch_news) == (True, True)
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ("23:00-06:00", ((23, 0), (6, 0))),
+            ("11pm - 6:30am", ((23, 0), (6, 30))),
+            ("06:00", None),
+            ("late-early", None),
+            ("08:00-08:00", None),
+        ],
+    )
+    def test_prefetch_quiet_hours(self, raw, expected) -> None:
+        info = _from_env({"PULSE_INFO_PREFETCH": "true", "PULSE_INFO_PREFETCH_QUIET_HOURS": raw}).info
+        assert info.prefetch is True
+        assert info.prefetch_quiet_hours == expected
+
 
 class TestFromEnvWorkPause:
     def test_skip_dates_valid(self) -> None:
@@ -486,6 +544,49 @@ class TestFromEnvWorkPause:
         assert set(cfg.work_pause.skip_weekdays) == {0, 4, 6}
 
 
+class TestFromEnvTtsCache:
+    def test_defaults(self) -> None:
+        cfg = _from_env()
+        assert cfg.tts_cache.enabled is True
+        assert cfg.tts_cache.max_bytes == 32 * 1024 * 1024
+        assert cfg.tts_cache.warm_phrases == DEFAULT_TTS_CACHE_PHRASES
+
+    def test_disabled(self) -> None:
+        cfg = _from_env({"PULSE_ASSISTANT_TTS_CACHE": "false"})
+        assert cfg.tts_cache.enabled is False
+
+    def test_custom_dir_and_budget(self, tmp_path: Path) -> None:
+        cfg = _from_env({"PULSE_ASSISTANT_TTS_CACHE_DIR": str(tmp_path), "PULSE_ASSISTANT_TTS_CACHE_MAX_MB": "4"})
+        assert cfg.tts_cache.directory == tmp_path
+        assert cfg.tts_cache.max_bytes == 4 * 1024 * 1024
+
+    def test_sentence_pipeline_default_and_override(self) -> None:
+        assert _from_env().tts_pipeline is True
+        assert _from_env({"PULSE_ASSISTANT_TTS_PIPELINE": "false"}).tts_pipeline is False
+
+    def test_wyoming_keepalive_defaults(self) -> None:
+        cfg = _from_env()
+        assert cfg.wyoming_keepalive is True
+        assert cfg.wyoming_idle_timeout == 60.0
+
+    def test_wyoming_keepalive_overrides(self) -> None:
+        cfg = _from_env({"PULSE_ASSISTANT_WYOMING_KEEPALIVE": "false", "PULSE_ASSISTANT_WYOMING_IDLE_SECONDS": "15"})
+        assert cfg.wyoming_keepalive is False
+        assert cfg.wyoming_idle_timeout == 15.0
+
+    def test_prewarm_default_and_override(self) -> None:
+        assert _from_env().prewarm is True
+        assert _from_env({"PULSE_ASSISTANT_PREWARM": "no"}).prewarm is False
+
+    def test_speculative_llm_default_and_override(self) -> None:
+        assert _from_env().speculative_llm is True
+        assert _from_env({"PULSE_ASSISTANT_SPECULATIVE_LLM": "false"}).speculative_llm is False
+
+    def test_phrases_split_on_pipe(self) -> None:
+        cfg = _from_env({"PULSE_ASSISTANT_TTS_CACHE_PHRASES": "Okay, no problem.| Done. |Okay, no problem."})
+        assert cfg.tts_cache.warm_phrases == ("Okay, no problem.", "Done.")
+
+
 class TestFromEnvMediaPlayer:
     def test_media_player_entity_deduplication(self) -> None:
         cfg = _from_env(
@@ -0,0 +1,146 @@
+"""Tests for the shared heap-backed deadline scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from pulse.assistant.deadline_scheduler import DeadlineScheduler
+
+pytestmark = pytest.mark.anyio
+
+BASE = datetime(2026, 1, 5, 7, 0, tzinfo=UTC)
+
+
+class FakeClock:
+    def __init__(self, now: datetime = BASE) -> None:
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+async def scheduler(clock):
+    sched: DeadlineScheduler[str] = DeadlineScheduler(clock=clock, max_sleep=0.01)
+    yield sched
+    await sched.close()
+
+
+class TestScheduling:
+    async def test_past_deadline_fires_immediately(self, scheduler):
+        callback = AsyncMock()
+        scheduler.schedule("a", BASE - timedelta(seconds=5), callback)
+
+        await _settle()
+
+        callback.assert_awaited_once()
+        assert "a" not in scheduler
+
+    async def test_future_deadline_waits_for_wall_clock(self, scheduler, clock):
+        callback = AsyncMock()
+        scheduler.schedule("a", BASE + timedelta(hours=8), callback)
+
+        await asyncio.sleep(0.05)
+        callback.assert_not_awaited()
+
+        # Simulate a suspend/resume jump: the wall clock moves while the loop sleeps.
+        clock.now = BASE + timedelta(hours=8, seconds=1)
+        await asyncio.sleep(0.05)
+
+        callback.assert_awaited_once()
+
+    async def test_fires_in_deadline_order(self, scheduler, clock):
+        fired: list[str] = []
+
+        def record(name: str):
+            async def _callback() -> None:
+                fired.append(name)
+
+            return _callback
+
+        scheduler.schedule("late", BASE + timedelta(minutes=2), record("late"))
+        scheduler.schedule("early", BASE + timedelta(minutes=1), record("early"))
+        clock.now = BASE + timedelta(minutes=5)
+        await asyncio.sleep(0.05)
+
+        assert fired == ["early", "late"]
+
+    async def test_rescheduling_key_replaces_deadline(self, scheduler, clock):
+        first = AsyncMock()
+        second = AsyncMock()
+        scheduler.schedule("a", BASE + timedelta(minutes=1), first)
+        scheduler.schedule("a", BASE + timedelta(minutes=10), second)
+
+        assert len(scheduler) == 1
+        assert scheduler.deadline("a") == BASE + timedelta(minutes=10)
+        clock.now = BASE + timedelta(minutes=5)
+        await asyncio.sleep(0.05)
+        first.assert_not_awaited()
+        second.assert_not_awaited()
+
+    async def test_cancel_prevents_callback(self, scheduler):
+        callback = AsyncMock()
+        scheduler.schedule("a", BASE + timedelta(seconds=1), callback)
+
+        assert scheduler.cancel("a") is True
+        assert scheduler.cancel("a") is False
+        await asyncio.sleep(0.05)
+
+        callback.assert_not_awaited()
+
+    async def test_failing_callback_does_not_stop_waiter(self, scheduler, clock):
+        ok = AsyncMock()
+        scheduler.schedule("bad", BASE, AsyncMock(side_effect=RuntimeError("boom")))
+        scheduler.schedule("good", BASE + timedelta(microseconds=1), ok)
+        clock.now = BASE + timedelta(seconds=1)
+
+        await asyncio.sleep(0.05)
+
+        ok.assert_awaited_once()
+
+
+class TestBulk:
+    async def test_schedule_many_rebuilds_heap(self, scheduler):
+        scheduler.schedule("a", BASE + timedelta(hours=1), AsyncMock())
+        scheduler.schedule_many(
+            [
+                ("a", BASE + timedelta(hours=2), AsyncMock()),
+                ("b", BASE + timedelta(hours=3), AsyncMock()),
+            ]
+        )
+
+        assert len(scheduler) == 2
+        assert len(scheduler._heap) == 2
+        assert scheduler.deadline("a") == BASE + timedelta(hours=2)
+
+    async def test_cancelled_entries_are_compacted(self, scheduler):
+        for idx in range(100):
+            scheduler.schedule(f"k{idx}", BASE + timedelta(hours=1, seconds=idx), AsyncMock())
+        for idx in range(90):
+            scheduler.cancel(f"k{idx}")
+
+        assert len(scheduler) == 10
+        assert len(scheduler._heap) < 100
+
+    async def test_close_drops_pending_and_restarts_on_demand(self, scheduler):
+        scheduler.schedule("a", BASE + timedelta(hours=1), AsyncMock())
+        await scheduler.close()
+        assert len(scheduler) == 0
+
+        callback = AsyncMock()
+        scheduler.schedule("b", BASE, callback)
+        await _settle()
+        callback.assert_awaited_once()
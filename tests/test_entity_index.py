@@ -0,0 +1,114 @@
+"""Tests for the entity-name resolution index."""
+
+from __future__ import annotations
+
+from pulse.assistant.entity_index import EntityIndex, EntityIndexCache, tokenize
+from pulse.assistant.home_assistant import HomeAssistantStateMirror
+
+
+def _state(entity_id: str, friendly: str | None = None, area: str | None = None, **attrs) -> dict:
+    attributes = dict(attrs)
+    if friendly:
+        attributes["friendly_name"] = friendly
+    if area:
+        attributes["area_id"] = area
+    return {"entity_id": entity_id, "state": "off", "attributes": attributes}
+
+
+STATES = [
+    _state("light.kitchen_main", "Kitchen Main Light", "kitchen"),
+    _state("light.kitchen", "Kitchen", "kitchen"),
+    _state("light.bedroom_lamp", "Lamp", "bedroom"),
+    _state("fan.kitchen", "Kitchen Fan", "kitchen"),
+    _state("switch.porch", "Porch", "outside", aliases=["Front Door Light"]),
+    _state("light.living_room", "Light", "living_room"),
+]
+
+
+def test_tokenize_drops_plural_s():
+    assert tokenize("Kitchen LIGHTS, glass-door") == ["kitchen", "light", "glass", "door"]
+
+
+class TestEntityIndex:
+    def test_entity_ids_by_domain_keep_listing_order(self):
+        index = EntityIndex(STATES)
+
+        assert index.entity_ids("light") == [
+            "light.kitchen_main",
+            "light.kitchen",
+            "light.bedroom_lamp",
+            "light.living_room",
+        ]
+        assert len(index.entity_ids()) == len(index) == 6
+        assert index.entity_ids("climate") == []
+
+    def test_resolution_is_scoped_to_domain(self):
+        index = EntityIndex(STATES)
+
+        assert index.resolve("fan", name="kitchen") == ["fan.kitchen"]
+        assert index.resolve("switch", name="kitchen") == []
+
+    def test_shorter_friendly_name_wins_ties(self):
+        index = EntityIndex(STATES)
+
+        assert index.resolve("light", name="kitchen") == ["light.kitchen"]
+        assert index.resolve("light", name="kitchen lights") == ["light.kitchen_main"]
+
+    def test_name_beats_area_beats_entity_id(self):
+        index = EntityIndex(
+            [
+                _state("light.desk_strip", "Strip", "office"),
+                _state("light.ceiling", "Ceiling", "desk"),
+                _state("light.shelf", "Desk Shelf", "office"),
+            ]
+        )
+
+        assert index.resolve("light", name="desk") == ["light.shelf"]
+        assert index.resolve("light", room="desk") == ["light.shelf"]
+
+    def test_room_hint_matches_area_tokens(self):
+        index = EntityIndex(STATES)
+
+        assert index.resolve("light", room="living room") == ["light.living_room"]
+
+    def test_aliases_are_indexed(self):
+        index = EntityIndex(STATES)
+
+        assert index.resolve(None, name="front door") == ["switch.porch"]
+
+    def test_prefix_fallback(self):
+        index = EntityIndex(STATES)
+
+        assert index.resolve("light", room="bed") == ["light.bedroom_lamp"]
+        assert index.resolve("light", name="be") == []
+        assert index.resolve("light", name="garage") == []
+
+
+class TestEntityIndexCache:
+    def test_reuses_index_for_unchanged_listing(self):
+        cache = EntityIndexCache()
+
+        first = cache.for_states(list(STATES))
+        assert cache.for_states(list(STATES)) is first
+        renamed = [*STATES[:-1], _state("light.living_room", "Sofa Light", "living_room")]
+        assert cache.for_states(renamed) is not first
+
+    def test_mirror_index_follows_catalog_revision(self):
+        cache = EntityIndexCache()
+        mirror = HomeAssistantStateMirror(None)
+        for state in STATES:
+            mirror._store(state["entity_id"], state)
+
+        first = cache.for_mirror(mirror)
+        assert cache.for_mirror(mirror) is first
+        mirror.catalog_revision += 1
+        assert cache.for_mirror(mirror) is not first
+
+    def test_evicts_least_recently_used(self):
+        cache = EntityIndexCache(max_entries=2)
+        a = cache.for_states([STATES[0]])
+        cache.for_states([STATES[1]])
+        cache.for_states([STATES[0]])
+        cache.for_states([STATES[2]])
+
+        assert cache.for_states([STATES[0]]) is a
@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
+import pulse.assistant.home_assistant as home_assistant_module
 import pytest
 from pulse.assistant.config import HomeAssistantConfig
 from pulse.assistant.home_assistant import (
     HomeAssistantAuthError,
     HomeAssistantClient,
     HomeAssistantError,
+    HomeAssistantStateMirror,
     _brightness_pct_to_value,
     kelvin_to_mired,
     verify_home_assistant_access,
@@ -1562,3 +1566,222 @@ class TestAssistAudio:
         send_calls = mock_ws.send.call_args_list
         run_sent = json.loads(send_calls[1][0][0])
         assert run_sent["language"] == "en"
+
+
+class TestPrewarm:
+    """Test connection pre-warming and pipeline ID caching."""
+
+    async def test_prewarm_refreshes_http_connection(self, ha_config):
+        with patch.object(HomeAssistantClient, "_request", new_callable=AsyncMock) as mock_request:
+            client = HomeAssistantClient(ha_config)
+            await client.prewarm()
+        mock_request.assert_awaited_once_with("GET", "/api/")
+
+    async def test_prewarm_skips_pipeline_lookup_when_not_requested(self):
+        config = HomeAssistantConfig(
+            base_url="http://homeassistant.local:8123",
+            token="test_token_123",
+            verify_ssl=True,
+            assist_pipeline="Kitchen",
+            wake_endpoint=None,
+            stt_endpoint=None,
+            tts_endpoint=None,
+            timer_entity=None,
+            reminder_service=None,
+            presence_entity=None,
+        )
+        with (
+            patch.object(HomeAssistantClient, "_request", new_callable=AsyncMock),
+            patch.object(HomeAssistantClient, "_resolve_pipeline_id", new_callable=AsyncMock) as resolve,
+        ):
+            client = HomeAssistantClient(config)
+            await client.prewarm()
+        resolve.assert_not_awaited()
+
+    async def test_resolved_pipeline_id_is_cached(self, ha_config):
+        client = HomeAssistantClient(ha_config)
+        ws = AsyncMock()
+        ws.recv = AsyncMock(
+            return_value=json.dumps(
+                {"type": "result", "success": True, "result": {"pipelines": [{"name": "Kitchen", "id": "abc"}]}}
+            )
+        )
+
+        assert await client._resolve_pipeline_id(ws, "Kitchen") == "abc"
+        assert await client._resolve_pipeline_id(ws, "Kitchen") == "abc"
+        ws.send.assert_awaited_once()
+
+
+def _state(entity_id: str, state: str, updated: str = "2025-01-01T00:00:00+00:00") -> dict:
+    return {"entity_id": entity_id, "state": state, "attributes": {}, "last_updated": updated}
+
+
+class _FakeHomeAssistant:
+    """Minimal HA websocket API: auth, subscribe_events, get_states and pushed state_changed events."""
+
+    def __init__(self, states: list[dict]) -> None:
+        self.states = {state["entity_id"]: state for state in states}
+        self.connections: list = []
+        self.get_states_calls = 0
+
+    async def handler(self, ws) -> None:
+        await ws.send(json.dumps({"type": "auth_required"}))
+        auth = json.loads(await ws.recv())
+        if auth.get("access_token") != "test_token_123":
+            await ws.send(json.dumps({"type": "auth_invalid"}))
+            return
+        await ws.send(json.dumps({"type": "auth_ok"}))
+        self.connections.append(ws)
+        try:
+            async for raw in ws:
+                message = json.loads(raw)
+                result = None
+                if message["type"] == "get_states":
+                    self.get_states_calls += 1
+                    result = list(self.states.values())
+                await ws.send(json.dumps({"id": message["id"], "type": "result", "success": True, "result": result}))
+        finally:
+            self.connections.remove(ws)
+
+    async def push(self, entity_id: str, new_state: dict | None) -> None:
+        if new_state is None:
+            self.states.pop(entity_id, None)
+        else:
+            self.states[entity_id] = new_state
+        event = {
+            "type": "event",
+            "event": {"event_type": "state_changed", "data": {"entity_id": entity_id, "new_state": new_state}},
+        }
+        for ws in list(self.connections):
+            await ws.send(json.dumps(event))
+
+    async def drop_connections(self) -> None:
+        for ws in list(self.connections):
+            await ws.close()
+
+
+@asynccontextmanager
+async def _mirrored_client(fake: _FakeHomeAssistant):
+    from websockets.asyncio.server import serve
+
+    async with serve(fake.handler, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        config = HomeAssistantConfig(
+            base_url=f"http://127.0.0.1:{port}",
+            token="test_token_123",
+            verify_ssl=True,
+            assist_pipeline=None,
+            wake_endpoint=None,
+            stt_endpoint=None,
+            tts_endpoint=None,
+            timer_entity=None,
+            reminder_service=None,
+            presence_entity=None,
+        )
+        client = HomeAssistantClient(config)
+        try:
+            await client.start_state_mirror()
+            assert client.state_mirror is not None
+            assert await client.state_mirror.wait_synced(5)
+            yield client
+        finally:
+            await client.close()
+
+
+async def _until(predicate, timeout: float = 5.0) -> None:
+    async with asyncio.timeout(timeout):
+        while not predicate():
+            await asyncio.sleep(0.01)
+
+
+class TestHomeAssistantStateMirror:
+    async def test_reads_are_served_from_the_mirror(self):
+        fake = _FakeHomeAssistant([_state("light.kitchen", "on"), _state("switch.fan", "off")])
+
+        async with _mirrored_client(fake) as client:
+            with patch.object(HomeAssistantClient, "_request", new_callable=AsyncMock) as request:
+                assert await client.list_entities("light") == [_state("light.kitchen", "on")]
+                assert len(await client.list_entities()) == 2
+                assert (await client.get_state("switch.fan"))["state"] == "off"
+            request.assert_not_awaited()
+
+    async def test_state_changed_events_update_and_remove_entities(self):
+        fake = _FakeHomeAssistant([_state("light.kitchen", "off")])
+
+        async with _mirrored_client(fake) as client:
+            mirror = client.state_mirror
+            revision = mirror.revision
+            await fake.push("light.kitchen", _state("light.kitchen", "on", "2025-01-01T00:00:05+00:00"))
+            await fake.push("light.porch", _state("light.porch", "on"))
+            await _until(lambda: mirror.revision == revision + 2)
+            # An older event than the stored state is ignored.
+            await fake.push("light.kitchen", _state("light.kitchen", "off", "2025-01-01T00:00:01+00:00"))
+            await fake.push("light.porch", None)
+            await _until(lambda: mirror.get("light.porch") is None)
+
+            assert mirror.get("light.kitchen")["state"] == "on"
+            assert [state["entity_id"] for state in await client.list_entities("light")] == ["light.kitchen"]
+
+    async def test_catalog_revision_tracks_only_naming_changes(self):
+        fake = _FakeHomeAssistant([_state("sensor.power", "1")])
+
+        async with _mirrored_client(fake) as client:
+            mirror = client.state_mirror
+            catalog = mirror.catalog_revision
+            await fake.push("sensor.power", _state("sensor.power", "2", "2025-01-01T00:00:05+00:00"))
+            renamed = _state("sensor.power", "3", "2025-01-01T00:00:06+00:00")
+            renamed["attributes"] = {"friendly_name": "Mains Power"}
+            await fake.push("sensor.power", renamed)
+            await _until(lambda: mirror.get("sensor.power")["state"] == "3")
+
+            assert mirror.catalog_revision == catalog + 1
+
+    async def test_resyncs_after_reconnect_and_falls_back_to_rest_meanwhile(self, monkeypatch):
+        monkeypatch.setattr(home_assistant_module, "MIRROR_RECONNECT_SECONDS", 0.2)
+        fake = _FakeHomeAssistant([_state("light.kitchen", "off")])
+
+        async with _mirrored_client(fake) as client:
+            mirror = client.state_mirror
+            fake.states["light.kitchen"] = _state("light.kitchen", "on", "2025-01-01T00:00:09+00:00")
+            await fake.drop_connections()
+            await _until(lambda: not mirror.ready)
+
+            with patch.object(HomeAssistantClient, "_request", new_callable=AsyncMock) as request:
+                request.return_value = _state("light.kitchen", "rest")
+                assert (await client.get_state("light.kitchen"))["state"] == "rest"
+
+            assert await mirror.wait_synced(5)
+            assert fake.get_states_calls == 2
+            assert mirror.get("light.kitchen")["state"] == "on"
+
+    async def test_snapshot_larger_than_the_default_frame_limit(self):
+        states = [_state(f"sensor.power_{idx}", "1") for idx in range(6000)]
+        for state in states:
+            state["attributes"] = {"friendly_name": "Power " + "x" * 200}
+        fake = _FakeHomeAssistant(states)
+        assert len(json.dumps(states)) > 2**20  # websockets closes with 1009 above this by default
+
+        async with _mirrored_client(fake) as client:
+            assert len(await client.list_entities("sensor")) == 6000
+            assert fake.get_states_calls == 1
+
+    async def test_unknown_entity_falls_back_to_rest(self):
+        fake = _FakeHomeAssistant([])
+
+        async with _mirrored_client(fake) as client:
+            with patch.object(HomeAssistantClient, "_request", new_callable=AsyncMock) as request:
+                request.return_value = _state("sensor.new", "1")
+                assert (await client.get_state("sensor.new"))["state"] == "1"
+            request.assert_awaited_once_with("GET", "/api/states/sensor.new")
+
+    async def test_stop_marks_mirror_not_ready(self):
+        @asynccontextmanager
+        async def never_connects():
+            raise OSError("unreachable")
+            yield
+
+        mirror = HomeAssistantStateMirror(never_connects, reconnect_delay=0.01)
+        await mirror.start()
+        assert not await mirror.wait_synced(0.05)
+        await mirror.stop()
+        assert not mirror.ready
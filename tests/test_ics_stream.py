@@ -0,0 +1,114 @@
+"""Tests for the streaming ICS window filter."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from icalendar import Calendar  # type: ignore[import-untyped]
+from pulse.assistant.ics_stream import IcsWindowFilter
+
+CUTOFF = datetime(2025, 6, 1)
+
+
+def _event(uid: str, *props: str) -> str:
+    return "\r\n".join(["BEGIN:VEVENT", f"UID:{uid}", *props, "END:VEVENT"]) + "\r\n"
+
+
+def _calendar(*events: str) -> bytes:
+    header = (
+        "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nBEGIN:VTIMEZONE\r\nTZID:Europe/Berlin\r\n"
+        "BEGIN:STANDARD\r\nDTSTART:19701025T030000\r\nTZOFFSETFROM:+0200\r\nTZOFFSETTO:+0100\r\n"
+        "END:STANDARD\r\nEND:VTIMEZONE\r\n"
+    )
+    return (header + "".join(events) + "END:VCALENDAR\r\n").encode()
+
+
+def _kept_uids(body: bytes, chunk: int | None = None) -> list[str]:
+    ics_filter = IcsWindowFilter(CUTOFF)
+    size = chunk or len(body)
+    out = b"".join(ics_filter.feed(body[offset : offset + size]) for offset in range(0, len(body), size))
+    out += ics_filter.close()
+    calendar = Calendar.from_ical(out)
+    assert calendar.walk("VTIMEZONE"), "non-event components must pass through"
+    return [str(component["UID"]) for component in calendar.walk("VEVENT")]
+
+
+def test_drops_only_events_that_ended_before_cutoff():
+    body = _calendar(
+        _event("past", "DTSTART:20240101T100000Z", "DTEND:20240101T110000Z"),
+        _event("ends-after", "DTSTART:20250531T100000Z", "DTEND:20250602T100000Z"),
+        _event("future", "DTSTART;TZID=Europe/Berlin:20250610T090000", "DTEND;TZID=Europe/Berlin:20250610T100000"),
+        _event("all-day-past", "DTSTART;VALUE=DATE:20240301", "DTEND;VALUE=DATE:20240302"),
+        _event("duration", "DTSTART:20250520T000000Z", "DURATION:P20D"),
+    )
+
+    assert _kept_uids(body) == ["ends-after", "future", "duration"]
+
+
+def test_recurrence_bounds():
+    body = _calendar(
+        _event("open-ended", "DTSTART:20200101T090000Z", "RRULE:FREQ=WEEKLY"),
+        _event("count", "DTSTART:20200101T090000Z", "RRULE:FREQ=DAILY;COUNT=3"),
+        _event("until-past", "DTSTART:20200101T090000Z", "RRULE:FREQ=WEEKLY;UNTIL=20230101T000000Z"),
+        _event("until-future", "DTSTART:20200101T090000Z", "RRULE:FREQ=WEEKLY;UNTIL=20260101T000000Z"),
+        _event("rdate", "DTSTART:20200101T090000Z", "RDATE:20300101T090000Z"),
+    )
+
+    assert _kept_uids(body) == ["open-ended", "count", "until-future", "rdate"]
+
+
+def test_overrides_are_kept_even_when_moved_before_cutoff():
+    body = _calendar(
+        _event("weekly", "DTSTART:20250101T090000Z", "DTEND:20250101T100000Z", "RRULE:FREQ=WEEKLY"),
+        _event(
+            "weekly",
+            "RECURRENCE-ID:20250604T090000Z",
+            "DTSTART:20250527T090000Z",
+            "DTEND:20250527T100000Z",
+        ),
+    )
+
+    assert _kept_uids(body) == ["weekly", "weekly"]
+
+
+def test_nested_alarm_and_folded_lines():
+    body = _calendar(
+        _event(
+            "folded",
+            'DTSTART;X-NOTE="a:b":2024010',
+            " 1T100000Z",
+            "BEGIN:VALARM",
+            "ACTION:DISPLAY",
+            "TRIGGER:-PT15M",
+            "DTSTART:20300101T000000Z",
+            "END:VALARM",
+        ),
+        _event("keep", "DTSTART:20300101T100000Z", "BEGIN:VALARM", "TRIGGER:-PT5M", "END:VALARM"),
+    )
+
+    assert _kept_uids(body) == ["keep"]
+
+
+def test_chunk_boundaries_do_not_matter():
+    events = [_event(f"e{idx}", f"DTSTART:2025{idx % 12 + 1:02d}01T100000Z") for idx in range(40)]
+    body = _calendar(*events).replace(b"\r\n", b"\n")
+
+    assert _kept_uids(body, chunk=1) == _kept_uids(body, chunk=7) == _kept_uids(body)
+
+
+def test_unparsable_start_is_kept_and_counts_are_reported():
+    ics_filter = IcsWindowFilter(CUTOFF)
+    body = _calendar(_event("no-start", "SUMMARY:?"), _event("past", "DTSTART:20000101T000000Z"))
+
+    ics_filter.feed(body)
+    ics_filter.close()
+
+    assert (ics_filter.kept, ics_filter.dropped) == (1, 1)
+
+
+def test_truncated_event_passes_through():
+    ics_filter = IcsWindowFilter(CUTOFF)
+
+    out = ics_filter.feed(b"BEGIN:VCALENDAR\nBEGIN:VEVENT\nDTSTART:20000101T000000Z") + ics_filter.close()
+
+    assert out.endswith(b"DTSTART:20000101T000000Z\n")
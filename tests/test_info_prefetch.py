@@ -0,0 +1,145 @@
+"""Tests for the info prefetch scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from pulse.assistant.config import InfoConfig, NewsConfig, SportsConfig, WeatherConfig
+from pulse.assistant.info_prefetch import InfoPrefetcher, in_quiet_hours
+
+pytestmark = pytest.mark.anyio
+
+NIGHT = ((23, 0), (6, 0))
+
+
+def _config(
+    *, location: str | None = "40.7,-74.0", news_key: str | None = "key", news=True, teams=("eagles",), quiet=None
+):
+    return InfoConfig(
+        news=NewsConfig(
+            api_key=news_key,
+            base_url="https://news.invalid",
+            country="us",
+            category="general",
+            language="en",
+            max_articles=5,
+        ),
+        weather=WeatherConfig(
+            location=location, units="auto", language="en", forecast_days=3, base_url="https://wx.invalid"
+        ),
+        sports=SportsConfig(
+            default_country="us",
+            headline_country="us",
+            favorite_teams=teams,
+            default_leagues=("nfl",),
+            base_url="https://espn.invalid",
+        ),
+        what3words_api_key=None,
+        prefetch=True,
+        prefetch_news=news,
+        prefetch_quiet_hours=quiet,
+    )
+
+
+def _sources():
+    return SimpleNamespace(
+        weather=SimpleNamespace(forecast=AsyncMock(return_value=None)),
+        news=SimpleNamespace(latest=AsyncMock(return_value=[])),
+        sports=SimpleNamespace(team_snapshot=AsyncMock(return_value=None)),
+    )
+
+
+@pytest.mark.parametrize(
+    ("now", "window", "expected"),
+    [
+        (datetime(2025, 1, 1, 23, 30), NIGHT, True),
+        (datetime(2025, 1, 1, 5, 59), NIGHT, True),
+        (datetime(2025, 1, 1, 6, 0), NIGHT, False),
+        (datetime(2025, 1, 1, 12, 0), NIGHT, False),
+        (datetime(2025, 1, 1, 13, 0), ((12, 0), (14, 0)), True),
+        (datetime(2025, 1, 1, 14, 0), ((12, 0), (14, 0)), False),
+        (datetime(2025, 1, 1, 3, 0), None, False),
+    ],
+)
+def test_in_quiet_hours(now, window, expected):
+    assert in_quiet_hours(now, window) is expected
+
+
+async def test_warm_reads_every_target():
+    sources = _sources()
+    prefetcher = InfoPrefetcher(sources, _config(teams=("eagles", "phillies")))  # type: ignore[arg-type]
+
+    await prefetcher.warm()
+
+    sources.weather.forecast.assert_awaited_once()
+    sources.news.latest.assert_awaited_once_with()
+    assert [call.args for call in sources.sports.team_snapshot.await_args_list] == [("eagles",), ("phillies",)]
+
+
+async def test_news_is_only_prefetched_when_enabled():
+    sources = _sources()
+
+    await InfoPrefetcher(sources, _config(news=False)).warm()  # type: ignore[arg-type]
+
+    sources.weather.forecast.assert_awaited_once()
+    sources.news.latest.assert_not_awaited()
+
+
+async def test_unconfigured_targets_are_skipped_and_nothing_starts():
+    sources = _sources()
+    prefetcher = InfoPrefetcher(sources, _config(location=None, news_key=None, teams=()))  # type: ignore[arg-type]
+
+    await prefetcher.start()
+
+    assert not prefetcher.has_targets
+    assert prefetcher._runner is None
+
+
+async def test_failures_are_logged_not_raised(caplog):
+    sources = _sources()
+    sources.weather.forecast.side_effect = RuntimeError("geocoder exploded")
+
+    await InfoPrefetcher(sources, _config()).warm()  # type: ignore[arg-type]
+
+    assert "Prefetch of weather failed: geocoder exploded" in caplog.text
+    sources.news.latest.assert_awaited_once()
+
+
+async def test_quiet_hours_pause_the_loop():
+    sources = _sources()
+    now = [datetime(2025, 1, 1, 2, 0)]
+    prefetcher = InfoPrefetcher(
+        sources,  # type: ignore[arg-type]
+        _config(quiet=NIGHT),
+        tick_seconds=0.001,
+        clock=lambda: now[0],
+    )
+    await prefetcher.start()
+    await asyncio.sleep(0.01)
+    assert sources.weather.forecast.await_count == 0
+
+    now[0] = datetime(2025, 1, 1, 7, 0)
+    await asyncio.sleep(0.01)
+    await prefetcher.stop()
+
+    assert sources.weather.forecast.await_count >= 1
+    assert prefetcher._runner is None
+
+
+async def test_prefetch_resumes_shortly_before_quiet_hours_end():
+    sources = _sources()
+    prefetcher = InfoPrefetcher(
+        sources,  # type: ignore[arg-type]
+        _config(quiet=NIGHT),
+        tick_seconds=0.001,
+        clock=lambda: datetime(2025, 1, 1, 5, 57),
+    )
+    await prefetcher.start()
+    await asyncio.sleep(0.01)
+    await prefetcher.stop()
+
+    assert sources.weather.forecast.await_count >= 1
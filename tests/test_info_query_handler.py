@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, Mock
 
 import pytest
 from pulse.assistant.info_query_handler import InfoQueryHandler
+from pulse.assistant.intent_router import IntentConfidence
 
 
 @dataclass
@@ -120,6 +121,22 @@ class TestMaybeHandle:
         mock_media_controller.trigger_media_resume_after_response.assert_called_once()
 
 
+class TestClassify:
+    def test_delegates_to_info_service(self, handler, mock_info_service):
+        mock_info_service.classify = Mock(return_value=IntentConfidence.LIKELY)
+        assert handler.classify("weather") is IntentConfidence.LIKELY
+        mock_info_service.classify.assert_called_once_with("weather")
+
+    def test_without_info_service_is_skipped(self, mock_publisher, mock_media_controller):
+        h = InfoQueryHandler(
+            info_service=None,
+            publisher=mock_publisher,
+            media_controller=mock_media_controller,
+            response_topic="pulse/test/response",
+        )
+        assert h.classify("weather") is IntentConfidence.NONE
+
+
 class TestOverlay:
     """Tests for info overlay publishing."""
 
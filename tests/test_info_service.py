@@ -30,6 +30,7 @@ from pulse.assistant.info_sources import (
     WeatherDay,
     WeatherForecast,
 )
+from pulse.assistant.intent_router import IntentConfidence
 
 pytestmark = pytest.mark.anyio
 
@@ -854,3 +855,32 @@ class TestFormatTeamSnapshot:
         assert result is not None
         spoken, _ = result
         assert "couldn't find" in spoken.lower()
+
+
+class TestClassify:
+    @pytest.mark.parametrize(
+        "transcript",
+        ["What's the weather?", "Top headlines", "How are the sports scores?", "NFL standings"],
+    )
+    def test_keyword_queries_are_likely(self, transcript):
+        assert _make_service().classify(transcript) is IntentConfidence.LIKELY
+
+    def test_team_query_needs_a_lookup_until_rosters_are_indexed(self):
+        sports = AsyncMock()
+        sports.cached_team_match = Mock(return_value=None)
+        svc = _make_service(sources=_make_sources(sports=sports))
+
+        assert svc.classify("how did the tigers do") is IntentConfidence.POSSIBLE
+        assert "tigers" in sports.cached_team_match.call_args.args[0]
+
+    def test_indexed_rosters_decide_team_queries(self):
+        sports = AsyncMock()
+        svc = _make_service(sources=_make_sources(sports=sports))
+
+        sports.cached_team_match = Mock(return_value=True)
+        assert svc.classify("how did the tigers do") is IntentConfidence.LIKELY
+        sports.cached_team_match = Mock(return_value=False)
+        assert svc.classify("turn on the kitchen lights") is IntentConfidence.NONE
+
+    def test_empty_transcript_is_skipped(self):
+        assert _make_service().classify("  ") is IntentConfidence.NONE
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pulse.assistant.info_sources as info_sources_module
 import pytest
 from pulse.assistant.config import InfoConfig, NewsConfig, SportsConfig, WeatherConfig
 from pulse.assistant.info_sources import (
@@ -121,6 +126,108 @@ class TestTTLCache:
             cache.get("key")
             assert "key" not in cache._values
 
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = TTLCache(ttl_seconds=60, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert list(cache._values) == ["a", "c"]
+
+
+class _Upstream:
+    """Counting fetch callable whose next answers can be scripted."""
+
+    def __init__(self, *answers) -> None:  # type: ignore[no-untyped-def]
+        self.answers = list(answers)
+        self.calls = 0
+        self.release: asyncio.Event | None = None
+
+    async def __call__(self):  # type: ignore[no-untyped-def]
+        self.calls += 1
+        if self.release is not None:
+            await self.release.wait()
+        return self.answers.pop(0)
+
+
+class TestTTLCacheFetch:
+    async def test_stale_value_is_served_while_refreshing(self):
+        cache = TTLCache(ttl_seconds=10, stale_seconds=100)
+        upstream = _Upstream("old", "new")
+        with patch("pulse.assistant.info_sources.time") as mock_time:
+            mock_time.monotonic.return_value = 100.0
+            assert await cache.get_or_fetch("k", upstream) == "old"
+            mock_time.monotonic.return_value = 150.0
+
+            assert await cache.get_or_fetch("k", upstream) == "old"
+            assert await cache.get_or_fetch("k", upstream) == "old"  # refresh already in flight
+            await asyncio.sleep(0)
+
+            assert upstream.calls == 2
+            assert await cache.get_or_fetch("k", upstream) == "new"
+
+    async def test_fresh_value_is_refreshed_ahead_of_expiry(self):
+        cache = TTLCache(ttl_seconds=100, refresh_ahead_seconds=20)
+        upstream = _Upstream("old", "new")
+        with patch("pulse.assistant.info_sources.time") as mock_time:
+            mock_time.monotonic.return_value = 100.0
+            await cache.get_or_fetch("k", upstream)
+            mock_time.monotonic.return_value = 170.0
+            assert await cache.get_or_fetch("k", upstream) == "old"
+            assert upstream.calls == 1
+
+            mock_time.monotonic.return_value = 185.0
+            assert await cache.get_or_fetch("k", upstream) == "old"
+            await asyncio.sleep(0)
+            assert cache.get("k") == "new"
+
+    async def test_value_past_the_stale_window_is_fetched_inline(self):
+        cache = TTLCache(ttl_seconds=10, stale_seconds=5)
+        upstream = _Upstream("old", "new")
+        with patch("pulse.assistant.info_sources.time") as mock_time:
+            mock_time.monotonic.return_value = 100.0
+            await cache.get_or_fetch("k", upstream)
+            mock_time.monotonic.return_value = 120.0
+            assert await cache.get_or_fetch("k", upstream) == "new"
+
+    async def test_failed_lookup_is_negatively_cached(self):
+        cache = TTLCache(ttl_seconds=60, negative_ttl_seconds=30)
+        upstream = _Upstream(None, "found")
+        with patch("pulse.assistant.info_sources.time") as mock_time:
+            mock_time.monotonic.return_value = 100.0
+            assert await cache.get_or_fetch("k", upstream) is None
+            assert await cache.get_or_fetch("k", upstream) is None
+            assert upstream.calls == 1
+            mock_time.monotonic.return_value = 131.0
+            assert await cache.get_or_fetch("k", upstream) == "found"
+
+    async def test_failed_refresh_keeps_the_stale_value(self):
+        cache = TTLCache(ttl_seconds=10, stale_seconds=100, negative_ttl_seconds=30)
+        upstream = _Upstream("old", None, "new")
+        with patch("pulse.assistant.info_sources.time") as mock_time:
+            mock_time.monotonic.return_value = 100.0
+            await cache.get_or_fetch("k", upstream)
+            mock_time.monotonic.return_value = 120.0
+            assert await cache.get_or_fetch("k", upstream) == "old"
+            await asyncio.sleep(0)
+
+            mock_time.monotonic.return_value = 140.0  # inside the retry interval: no new fetch
+            assert await cache.get_or_fetch("k", upstream) == "old"
+            assert upstream.calls == 2
+
+    async def test_concurrent_misses_share_one_fetch(self):
+        cache = TTLCache(ttl_seconds=60)
+        upstream = _Upstream("value")
+        upstream.release = asyncio.Event()
+
+        first = asyncio.ensure_future(cache.get_or_fetch("k", upstream))
+        second = asyncio.ensure_future(cache.get_or_fetch("k", upstream))
+        await asyncio.sleep(0)
+        upstream.release.set()
+
+        assert await asyncio.gather(first, second) == ["value", "value"]
+        assert upstream.calls == 1
+
 
 # ---------------------------------------------------------------------------
 # _get_json
@@ -710,6 +817,87 @@ class TestSportsClientTeamSnapshot:
         assert result is None
 
 
+def _roster(*names: tuple[str, str]) -> dict:
+    teams = [{"team": {"displayName": display, "shortDisplayName": short}} for display, short in names]
+    return {"sports": [{"leagues": [{"teams": teams}]}]}
+
+
+ROSTERS = {
+    "nfl": _roster(("Philadelphia Eagles", "Eagles"), ("Los Angeles Rams", "Rams")),
+    "nba": _roster(("Philadelphia 76ers", "76ers"), ("Sacramento Kings", "Kings")),
+    "nhl": _roster(("Los Angeles Kings", "Kings"), ("Philadelphia Flyers", "Flyers")),
+}
+
+
+class TestSportsClientTeamIndex:
+    def _client(self, monkeypatch, delay: float = 0.0):  # type: ignore[no-untyped-def]
+        client = SportsClient(_sports_config(default_leagues=("nfl", "nba", "nhl")))
+        self.active = self.peak = 0
+        self.requests: list[str] = []
+
+        async def fake_get_json(url, **_kwargs):  # type: ignore[no-untyped-def]
+            self.requests.append(url)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(delay)
+            self.active -= 1
+            return ROSTERS[url.split("/")[-2]]
+
+        monkeypatch.setattr("pulse.assistant.info_sources._get_json", fake_get_json)
+        return client
+
+    async def test_rosters_are_fetched_concurrently(self, monkeypatch):
+        client = self._client(monkeypatch, delay=0.01)
+
+        assert await client.team_snapshot("unknown team") is None
+
+        assert len(self.requests) == 3
+        assert self.peak == 3
+
+    async def test_index_is_built_once_per_roster(self, monkeypatch):
+        client = self._client(monkeypatch)
+        calls = []
+        real_tokens = info_sources_module._team_name_tokens
+        monkeypatch.setattr(
+            "pulse.assistant.info_sources._team_name_tokens", lambda team: calls.append(team) or real_tokens(team)
+        )
+
+        assert (await client.team_snapshot("eagles")).name == "Philadelphia Eagles"  # type: ignore[union-attr]
+        assert (await client.team_snapshot("flyers")).name == "Philadelphia Flyers"  # type: ignore[union-attr]
+
+        assert len(calls) == 6  # each team tokenized once
+        assert len(self.requests) == 3
+
+    async def test_earlier_league_wins_and_explicit_leagues_are_honoured(self, monkeypatch):
+        client = self._client(monkeypatch)
+
+        assert (await client.team_snapshot("Kings")).league == "nba"  # type: ignore[union-attr]
+        snapshot = await client.team_snapshot("kings", leagues=["NHL"])
+        assert snapshot is not None
+        assert (snapshot.name, snapshot.league) == ("Los Angeles Kings", "nhl")
+
+    async def test_fuzzy_match_only_without_an_exact_hit(self, monkeypatch):
+        client = self._client(monkeypatch)
+
+        snapshot = await client.team_snapshot("philadelphia eagle")
+        assert snapshot is not None
+        assert snapshot.name == "Philadelphia Eagles"
+        assert await client.team_snapshot("ram") is None  # too short to guess at
+        assert await client.team_snapshot("weather today") is None
+
+    async def test_cached_team_match_only_uses_indexed_rosters(self, monkeypatch):
+        client = self._client(monkeypatch)
+
+        assert client.cached_team_match(["eagles"]) is None
+        assert self.requests == []
+
+        await client.team_snapshot("unknown team")
+        assert client.cached_team_match(["kitchen lights", "eagles"]) is True
+        assert client.cached_team_match(["philadelphia eagle"]) is True
+        assert client.cached_team_match(["kitchen lights", "kitchen", "lights"]) is False
+        assert len(self.requests) == 3
+
+
 class TestSportsClientLeagueTeams:
     async def test_cached(self):
         client = SportsClient(_sports_config())
@@ -1071,3 +1259,73 @@ class TestInfoSources:
         config = _info_config(what3words_api_key="w3w-key")
         sources = InfoSources(config)
         assert sources.weather.what3words_api_key == "w3w-key"
+
+
+class _CountingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so reused connections are visible
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.connections += 1  # type: ignore[attr-defined]
+
+    def do_GET(self) -> None:  # noqa: N802 - BaseHTTPRequestHandler naming
+        self.server.paths.append(self.path.split("?", 1)[0])  # type: ignore[attr-defined]
+        body = json.dumps({"articles": [{"title": "Local"}], "daily": {}, "current_weather": {}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:  # noqa: A002 - silence request logging
+        return None
+
+
+@pytest.fixture
+def counting_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CountingHandler)
+    server.connections = 0  # type: ignore[attr-defined]
+    server.paths = []  # type: ignore[attr-defined]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestSharedHttpClient:
+    async def test_clients_share_one_keep_alive_connection(self, counting_server):
+        base = f"http://127.0.0.1:{counting_server.server_address[1]}"
+        config = _info_config(
+            news=_news_config(base_url=f"{base}/news"),
+            weather=_weather_config(base_url=f"{base}/forecast"),
+            sports=_sports_config(base_url=f"{base}/espn"),
+        )
+        sources = InfoSources(config)
+
+        assert [headline.title for headline in await sources.news.latest()] == ["Local"]
+        assert await sources.weather.forecast() is not None
+        await sources.sports.general_headlines()
+        await sources.news.latest("sports")
+
+        assert counting_server.paths == [
+            "/news/top-headlines",
+            "/forecast",
+            "/espn/site/v2/sports/news",
+            "/news/top-headlines",
+        ]
+        assert counting_server.connections == 1
+        await sources.close()
+        await sources.close()
+        assert sources.http._client is None
+
+    async def test_client_is_recreated_after_close(self, counting_server):
+        base = f"http://127.0.0.1:{counting_server.server_address[1]}"
+        sources = InfoSources(_info_config(news=_news_config(base_url=base)))
+        await sources.news.latest()
+        await sources.close()
+
+        await sources.news.latest("business")
+
+        assert counting_server.connections == 2
+        await sources.close()
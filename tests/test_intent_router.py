@@ -0,0 +1,119 @@
+"""Tests for the pre-LLM intent router."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from pulse.assistant.intent_router import IntentConfidence, IntentRoute, classify_routes, route_transcript
+
+pytestmark = pytest.mark.anyio
+
+
+def _route(name: str, confidence: IntentConfidence, handled: bool = False) -> IntentRoute:
+    return IntentRoute(name, lambda _text: confidence, AsyncMock(return_value=handled))
+
+
+class TestClassifyRoutes:
+    def test_drops_certain_misses_and_keeps_priority(self):
+        routes = [
+            _route("stop", IntentConfidence.NONE),
+            _route("music", IntentConfidence.POSSIBLE),
+            _route("info", IntentConfidence.LIKELY),
+        ]
+        classified = classify_routes(routes, "what's the weather")
+        assert [(route.name, confidence) for route, confidence in classified] == [
+            ("music", IntentConfidence.POSSIBLE),
+            ("info", IntentConfidence.LIKELY),
+        ]
+
+
+class TestRouteTranscript:
+    async def test_skipped_routes_are_not_run(self):
+        skipped = _route("music", IntentConfidence.NONE, handled=True)
+        handler = _route("info", IntentConfidence.LIKELY, handled=True)
+
+        result = await route_transcript("weather", [skipped, handler])
+
+        assert result.handled_by == "info"
+        skipped.handle.assert_not_awaited()
+
+    async def test_higher_priority_possible_runs_before_likely(self):
+        first = _route("schedule", IntentConfidence.POSSIBLE, handled=True)
+        second = _route("info", IntentConfidence.LIKELY, handled=True)
+
+        result = await route_transcript("stop", [first, second])
+
+        assert result.handled_by == "schedule"
+        second.handle.assert_not_awaited()
+
+    async def test_no_speculation_when_a_route_is_likely(self):
+        speculate = AsyncMock(return_value="llm")
+        routes = [_route("info", IntentConfidence.LIKELY, handled=False)]
+
+        result = await route_transcript("weather", routes, speculate=speculate)
+
+        assert result.handled_by is None
+        assert result.fallback is None
+        speculate.assert_not_called()
+
+    async def test_speculative_fallback_returned_when_all_decline(self):
+        routes = [_route("info", IntentConfidence.POSSIBLE, handled=False)]
+
+        async def _speculate() -> str:
+            return "llm"
+
+        result = await route_transcript("tell me a joke", routes, speculate=_speculate)
+
+        assert result.handled_by is None
+        assert result.fallback is not None
+        assert await result.fallback == "llm"
+
+    async def test_speculation_overlaps_handler_and_is_cancelled_on_match(self):
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def _speculate() -> str:
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return "llm"
+
+        async def _handle(_text: str) -> bool:
+            await started.wait()  # the LLM request is already in flight while the handler works
+            return True
+
+        routes = [IntentRoute("info", lambda _text: IntentConfidence.POSSIBLE, _handle)]
+
+        result = await route_transcript("how are the tigers doing", routes, speculate=_speculate)
+        await asyncio.sleep(0)
+
+        assert result.handled_by == "info"
+        assert result.fallback is None
+        assert cancelled.is_set()
+
+    async def test_handler_error_cancels_speculation(self):
+        speculation: list[asyncio.Task] = []
+
+        async def _speculate() -> str:
+            task = asyncio.current_task()
+            assert task is not None
+            speculation.append(task)
+            await asyncio.sleep(10)
+            return "llm"
+
+        async def _boom(_text: str) -> bool:
+            await asyncio.sleep(0)
+            raise RuntimeError("handler failed")
+
+        routes = [IntentRoute("info", lambda _text: IntentConfidence.POSSIBLE, _boom)]
+
+        with pytest.raises(RuntimeError):
+            await route_transcript("anything", routes, speculate=_speculate)
+        await asyncio.sleep(0)
+
+        assert speculation and speculation[0].cancelled()
@@ -5,8 +5,10 @@ from __future__ import annotations
 import json
 import urllib.error
 from io import BytesIO
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
+import anyio
+import httpx
 import pytest
 from pulse.assistant.config import LLMConfig
 from pulse.assistant.llm import (
@@ -298,7 +300,7 @@ class TestOpenAIProvider:
             }
         )
 
-        with patch.object(provider, "_call_api", return_value=response_json):
+        with patch.object(provider, "_call_api_async", return_value=response_json):
             result = await provider.generate(
                 "Turn on the lights",
                 [{"slug": "turn_on_lights", "description": "Turn on the lights"}],
@@ -311,7 +313,7 @@ class TestOpenAIProvider:
         """Test that exceptions are handled gracefully."""
         provider = OpenAIProvider(llm_config)
 
-        with patch.object(provider, "_call_api", side_effect=Exception("API error")):
+        with patch.object(provider, "_call_api_async", side_effect=Exception("API error")):
             result = await provider.generate(
                 "Turn on the lights",
                 [{"slug": "turn_on_lights", "description": "Turn on the lights"}],
@@ -657,7 +659,7 @@ class TestOpenAICompatibleGenerate:
         config = make_llm_config(openai_api_key="key")
         provider = OpenAIProvider(config)
         resp = json.dumps({"response": "hi", "actions": ["a1"]})
-        with patch.object(provider, "_call_api", return_value=resp):
+        with patch.object(provider, "_call_api_async", return_value=resp):
             result = await provider.generate("hello", [])
         assert result.response == "hi"
         assert result.actions == ["a1"]
@@ -665,7 +667,7 @@ class TestOpenAICompatibleGenerate:
     async def test_generate_exception_capacity(self):
         config = make_llm_config(openai_api_key="key")
         provider = OpenAIProvider(config)
-        with patch.object(provider, "_call_api", side_effect=RuntimeError("OpenAI HTTP error: 429")):
+        with patch.object(provider, "_call_api_async", side_effect=RuntimeError("OpenAI HTTP error: 429")):
             result = await provider.generate("hello", [])
         assert "at capacity" in result.response
         assert result.actions == []
@@ -673,7 +675,7 @@ class TestOpenAICompatibleGenerate:
     async def test_generate_exception_generic(self):
         config = make_llm_config(openai_api_key="key")
         provider = OpenAIProvider(config)
-        with patch.object(provider, "_call_api", side_effect=RuntimeError("connection reset")):
+        with patch.object(provider, "_call_api_async", side_effect=RuntimeError("connection reset")):
             result = await provider.generate("hello", [])
         assert "Sorry" in result.response
 
@@ -803,14 +805,14 @@ class TestAnthropicProvider:
     async def test_generate_success(self):
         provider = self._make_provider()
         resp = json.dumps({"response": "done", "actions": ["a"]})
-        with patch.object(provider, "_call_api", return_value=resp):
+        with patch.object(provider, "_call_api_async", return_value=resp):
             result = await provider.generate("do it", [])
         assert result.response == "done"
         assert result.actions == ["a"]
 
     async def test_generate_exception(self):
         provider = self._make_provider()
-        with patch.object(provider, "_call_api", side_effect=RuntimeError("Anthropic HTTP 529: overloaded")):
+        with patch.object(provider, "_call_api_async", side_effect=RuntimeError("Anthropic HTTP 529: overloaded")):
             result = await provider.generate("do it", [])
         assert "at capacity" in result.response
 
@@ -958,13 +960,13 @@ class TestGeminiProvider:
     async def test_generate_success(self):
         provider = self._make_provider()
         resp = json.dumps({"response": "hi", "actions": []})
-        with patch.object(provider, "_call_api", return_value=resp):
+        with patch.object(provider, "_call_api_async", return_value=resp):
             result = await provider.generate("hey", [])
         assert result.response == "hi"
 
     async def test_generate_exception(self):
         provider = self._make_provider()
-        with patch.object(provider, "_call_api", side_effect=RuntimeError("Gemini HTTP error: 503")):
+        with patch.object(provider, "_call_api_async", side_effect=RuntimeError("Gemini HTTP error: 503")):
             result = await provider.generate("hey", [])
         assert "at capacity" in result.response
 
@@ -1086,3 +1088,82 @@ class TestGetSupportedProviders:
         b = get_supported_providers()
         a["new"] = "value"
         assert "new" not in b
+
+
+class TestPrewarm:
+    """Prewarm resolves the provider's API host ahead of the request."""
+
+    async def _resolved_host(self, provider) -> tuple:
+        loop = Mock()
+        loop.getaddrinfo = AsyncMock(return_value=[])
+        with patch("pulse.assistant.llm.asyncio.get_running_loop", return_value=loop):
+            await provider.prewarm()
+        return loop.getaddrinfo.await_args.args
+
+    async def test_openai_compatible_resolves_base_url_host(self):
+        args = await self._resolved_host(OpenAIProvider(make_llm_config()))
+        assert args == ("api.openai.com", 443)
+
+    async def test_anthropic_resolves_base_url_host(self):
+        config = make_llm_config(anthropic_base_url="http://llm.local:8080/v1")
+        args = await self._resolved_host(AnthropicProvider(config))
+        assert args == ("llm.local", 8080)
+
+    async def test_gemini_resolves_base_url_host(self):
+        config = make_llm_config(gemini_base_url="https://generativelanguage.googleapis.com/v1beta")
+        args = await self._resolved_host(GeminiProvider(config))
+        assert args == ("generativelanguage.googleapis.com", 443)
+
+
+class TestCallApiAsync:
+    """generate() talks to the provider on the event loop so it can be cancelled."""
+
+    @staticmethod
+    def _route(monkeypatch, handler) -> None:
+        real_client = httpx.AsyncClient
+        monkeypatch.setattr(
+            "pulse.assistant.llm.httpx.AsyncClient",
+            lambda *a, **k: real_client(transport=httpx.MockTransport(handler), **k),
+        )
+
+    async def test_generate_posts_payload_and_parses_reply(self, monkeypatch):
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            content = json.dumps({"response": "hi", "actions": []})
+            return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+
+        self._route(monkeypatch, handler)
+        result = await OpenAIProvider(make_llm_config(openai_api_key="key")).generate("hello", [])
+        assert result.response == "hi"
+        assert str(seen[0].url) == "https://api.openai.com/v1/chat/completions"
+        assert seen[0].headers["Authorization"] == "Bearer key"
+        assert json.loads(seen[0].content)["messages"][1]["content"] == "hello"
+
+    async def test_http_error_keeps_provider_message(self, monkeypatch):
+        self._route(monkeypatch, lambda request: httpx.Response(529, text="overloaded"))
+        provider = AnthropicProvider(make_llm_config(anthropic_api_key="key", anthropic_model="claude"))
+        with pytest.raises(RuntimeError, match="Anthropic HTTP 529: overloaded"):
+            await provider._call_api_async({"messages": []})
+
+    async def test_cancelling_generate_aborts_the_request(self, monkeypatch):
+        started = anyio.Event()
+        aborted = anyio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            started.set()
+            try:
+                await anyio.sleep_forever()
+            except anyio.get_cancelled_exc_class():
+                aborted.set()
+                raise
+            raise AssertionError("unreachable")
+
+        self._route(monkeypatch, handler)
+        provider = OpenAIProvider(make_llm_config(openai_api_key="key"))
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(provider.generate, "hello", [])
+            await started.wait()
+            tg.cancel_scope.cancel()
+        assert aborted.is_set()
@@ -6,6 +6,7 @@ import json
 from unittest.mock import AsyncMock, Mock
 
 import pytest
+from pulse.assistant.intent_router import IntentConfidence
 from pulse.assistant.music_handler import MusicCommandHandler, _build_player_name_map
 
 
@@ -418,3 +419,24 @@ class TestBuildPlayerNameMap:
 
     def test_empty_tuple(self):
         assert _build_player_name_map(()) == {}
+
+
+class TestClassify:
+    @pytest.mark.parametrize(
+        "transcript",
+        ["Pause the music", "skip this song", "what song is this", "play Abbey Road"],
+    )
+    def test_music_commands_are_likely(self, handler, transcript):
+        assert handler.classify(transcript) is IntentConfidence.LIKELY
+
+    @pytest.mark.parametrize("transcript", ["what time is it", "play", ""])
+    def test_other_transcripts_are_skipped(self, handler, transcript):
+        assert handler.classify(transcript) is IntentConfidence.NONE
+
+    def test_without_media_player_is_skipped(self, mock_home_assistant, mock_media_controller):
+        h = MusicCommandHandler(
+            home_assistant=mock_home_assistant,
+            media_controller=mock_media_controller,
+            media_player_entity=None,
+        )
+        assert h.classify("pause the music") is IntentConfidence.NONE
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import time
-from unittest.mock import Mock
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from pulse.assistant.config import WyomingEndpoint
+from pulse.assistant.intent_router import IntentConfidence
+from pulse.assistant.llm import LLMResult
 from pulse.assistant.pipeline_orchestrator import AssistRunTracker, PipelineOrchestrator
+from pulse.assistant.tts_cache import TtsCache
+from pulse.assistant.wyoming import SynthesizedAudio
 
 # ============================================================================
 # AssistRunTracker Tests
@@ -65,6 +72,13 @@ class TestAssistRunTracker:
         result = tracker.finalize("success")
         assert set(result["stages"].keys()) == {"listening", "thinking", "speaking"}
 
+    def test_record_timings_accumulates(self):
+        tracker = AssistRunTracker(pipeline="pulse", wake_word="hey_pulse")
+        tracker.record_timings("tts", {"connect_ms": 5, "inference_ms": 100})
+        tracker.record_timings("tts", {"connect_ms": 0, "inference_ms": 50})
+        result = tracker.finalize("success")
+        assert result["timings"] == {"tts_connect_ms": 5, "tts_inference_ms": 150}
+
 
 # ============================================================================
 # HA Response Extraction Tests (static methods)
@@ -219,6 +233,8 @@ def mock_orchestrator_deps():
     config.stt_endpoint = None
     config.language = "en"
     config.mic = Mock()
+    config.prewarm = False
+    config.speculative_llm = True
     config.response_topic = "test-device/assistant/response"
     config.transcript_topic = "test-device/assistant/transcript"
     config.action_topic = "test-device/assistant/action"
@@ -646,3 +662,296 @@ class TestConstructor:
         assert orch._assist_pipeline is None
         assert orch._get_llm is None
         assert orch._get_preferences is None
+
+
+# ============================================================================
+# TTS Cache Tests
+# ============================================================================
+
+
+@asynccontextmanager
+async def _null_guard():
+    yield
+
+
+@pytest.fixture
+def cached_orchestrator(mock_orchestrator_deps, mock_logger, tmp_path):
+    endpoint = WyomingEndpoint(host="piper.local", port=10200)
+    mock_orchestrator_deps["config"].tts_endpoint = endpoint
+    mock_orchestrator_deps["config"].tts_cache.warm_phrases = ("Okay, no problem.",)
+    mock_orchestrator_deps["wake_detector"].local_audio_block = _null_guard
+    player = Mock()
+    player.start = AsyncMock()
+    player.write = AsyncMock()
+    player.stop = AsyncMock()
+    mock_orchestrator_deps["player"] = player
+    cache = TtsCache(tmp_path, max_bytes=4096)
+    orch = PipelineOrchestrator(**mock_orchestrator_deps, tts_cache=cache, logger=mock_logger)
+    return orch, cache, endpoint
+
+
+class TestTtsCache:
+    @pytest.mark.anyio
+    async def test_cache_hit_skips_synthesis(self, cached_orchestrator):
+        orch, cache, endpoint = cached_orchestrator
+        audio = SynthesizedAudio(rate=22050, width=2, channels=1, audio=b"\x01" * 32)
+        await cache.put("Alarm cancelled.", endpoint, None, audio)
+
+        with patch("pulse.assistant.pipeline_orchestrator.play_tts_stream", new=AsyncMock()) as tts:
+            await orch.speak("Alarm cancelled.")
+
+        tts.assert_not_awaited()
+        orch.player.start.assert_awaited_once_with(22050, 2, 1)
+        orch.player.write.assert_awaited_once_with(audio.audio)
+        orch.player.stop.assert_awaited_once()
+
+    @pytest.mark.anyio
+    async def test_cache_miss_stores_captured_audio(self, cached_orchestrator):
+        orch, cache, endpoint = cached_orchestrator
+        audio = SynthesizedAudio(rate=22050, width=2, channels=1, audio=b"\x02" * 32)
+
+        with patch("pulse.assistant.pipeline_orchestrator.play_tts_stream", new=AsyncMock(return_value=audio)) as tts:
+            await orch.speak("Timer cancelled.")
+
+        assert tts.await_args.kwargs["capture"] is True
+        assert await cache.get("Timer cancelled.", endpoint, None) == audio
+
+    @pytest.mark.anyio
+    async def test_long_text_uses_sentence_pipeline(self, cached_orchestrator):
+        orch, cache, _ = cached_orchestrator
+        orch.config.tts_pipeline = True
+        long_text = "This is a long explanation. " * 20
+
+        with (
+            patch("pulse.assistant.pipeline_orchestrator.play_tts_stream", new=AsyncMock()) as tts,
+            patch("pulse.assistant.pipeline_orchestrator.play_tts_pipelined", new=AsyncMock()) as pipelined,
+        ):
+            await orch.speak(long_text)
+
+        pipelined.assert_awaited_once()
+        tts.assert_not_awaited()
+        assert len(cache) == 0
+
+    @pytest.mark.anyio
+    async def test_long_text_streams_when_pipeline_disabled(self, cached_orchestrator):
+        orch, cache, _ = cached_orchestrator
+        orch.config.tts_pipeline = False
+        long_text = "This is a long explanation. " * 20
+
+        with patch("pulse.assistant.pipeline_orchestrator.play_tts_stream", new=AsyncMock(return_value=None)) as tts:
+            await orch.speak(long_text)
+
+        assert tts.await_args.kwargs["capture"] is False
+        assert len(cache) == 0
+
+    @pytest.mark.anyio
+    async def test_warm_tts_cache_synthesizes_phrases(self, cached_orchestrator):
+        orch, cache, endpoint = cached_orchestrator
+        audio = SynthesizedAudio(rate=22050, width=2, channels=1, audio=b"\x03" * 32)
+
+        with patch("pulse.assistant.pipeline_orchestrator.synthesize_audio", new=AsyncMock(return_value=audio)):
+            await orch.warm_tts_cache()
+
+        assert cache.contains("Okay, no problem.", endpoint, None)
+
+    @pytest.mark.anyio
+    async def test_warm_without_cache_is_noop(self, orchestrator):
+        with patch("pulse.assistant.pipeline_orchestrator.synthesize_audio", new=AsyncMock()) as synth:
+            await orchestrator.warm_tts_cache()
+        synth.assert_not_awaited()
+
+
+# ============================================================================
+# Wyoming keepalive Tests
+# ============================================================================
+
+
+class TestWyomingKeepalive:
+    @pytest.mark.anyio
+    async def test_transcribe_passes_pool_and_records_timings(self, mock_orchestrator_deps, mock_logger):
+        pool = Mock()
+        mock_orchestrator_deps["config"].stt_endpoint = WyomingEndpoint(host="whisper.local", port=10300)
+        orch = PipelineOrchestrator(**mock_orchestrator_deps, wyoming_pool=pool, logger=mock_logger)
+        orch._current_tracker = AssistRunTracker("pulse", "hey_pulse")
+
+        async def _fake_transcribe(audio, **kwargs):
+            kwargs["metrics"].update({"connect_ms": 0, "inference_ms": 420})
+            return "turn on the lights"
+
+        with patch("pulse.assistant.pipeline_orchestrator.transcribe_audio", new=_fake_transcribe):
+            transcript = await orch._transcribe(b"\x00" * 10)
+
+        assert transcript == "turn on the lights"
+        assert orch._current_tracker.timings == {"stt_connect_ms": 0, "stt_inference_ms": 420}
+
+
+# ============================================================================
+# Pre-warm Tests
+# ============================================================================
+
+
+@pytest.fixture
+def prewarm_orchestrator(mock_orchestrator_deps, mock_logger):
+    stt = WyomingEndpoint(host="whisper.local", port=10300)
+    tts = WyomingEndpoint(host="piper.local", port=10200)
+    mock_orchestrator_deps["config"].prewarm = True
+    mock_orchestrator_deps["config"].stt_endpoint = stt
+    mock_orchestrator_deps["config"].tts_endpoint = tts
+    mock_orchestrator_deps["player"].prewarm = AsyncMock()
+    ha_client = Mock()
+    ha_client.prewarm = AsyncMock()
+    mock_orchestrator_deps["home_assistant"] = ha_client
+    pool = Mock()
+    pool.prewarm = AsyncMock(return_value=True)
+    orch = PipelineOrchestrator(**mock_orchestrator_deps, wyoming_pool=pool, logger=mock_logger)
+    llm = Mock()
+    llm.prewarm = AsyncMock()
+    orch.set_llm_provider_getter(lambda: llm)
+    return orch, pool, llm, stt, tts
+
+
+class TestPrewarm:
+    @pytest.mark.anyio
+    async def test_pulse_pipeline_warms_everything(self, prewarm_orchestrator):
+        orch, pool, llm, stt, tts = prewarm_orchestrator
+
+        orch._start_prewarm("pulse")
+        await asyncio.gather(*orch._prewarm_tasks)
+
+        assert {call.args[0] for call in pool.prewarm.await_args_list} == {stt, tts}
+        llm.prewarm.assert_awaited_once()
+        orch.home_assistant.prewarm.assert_awaited_once_with(resolve_pipeline=False)
+        orch.player.prewarm.assert_awaited_once()
+
+    @pytest.mark.anyio
+    async def test_home_assistant_pipeline_resolves_pipeline_id(self, prewarm_orchestrator):
+        orch, pool, llm, _, _ = prewarm_orchestrator
+
+        orch._start_prewarm("home_assistant")
+        await asyncio.gather(*orch._prewarm_tasks)
+
+        orch.home_assistant.prewarm.assert_awaited_once_with(resolve_pipeline=True)
+        pool.prewarm.assert_not_awaited()
+        llm.prewarm.assert_not_awaited()
+
+    @pytest.mark.anyio
+    async def test_failed_step_does_not_raise(self, prewarm_orchestrator):
+        orch, _, llm, _, _ = prewarm_orchestrator
+        llm.prewarm.side_effect = OSError("dns down")
+
+        orch._start_prewarm("pulse")
+        await asyncio.gather(*orch._prewarm_tasks)
+
+        orch.player.prewarm.assert_awaited_once()
+
+    @pytest.mark.anyio
+    async def test_cancel_abandons_pending_steps(self, prewarm_orchestrator):
+        orch, _, llm, _, _ = prewarm_orchestrator
+        started = asyncio.Event()
+
+        async def _slow() -> None:
+            started.set()
+            await asyncio.sleep(10)
+
+        llm.prewarm.side_effect = _slow
+        orch._start_prewarm("pulse")
+        await started.wait()
+        tasks = list(orch._prewarm_tasks)
+
+        orch._cancel_prewarm()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(task.done() for task in tasks)
+        assert not orch._prewarm_tasks
+
+    def test_disabled_by_config(self, orchestrator):
+        orchestrator._start_prewarm("pulse")
+        assert not orchestrator._prewarm_tasks
+
+
+# ============================================================================
+# Intent Routing Tests
+# ============================================================================
+
+
+@pytest.fixture
+def routed_orchestrator(orchestrator):
+    orch = orchestrator
+    orch.conversation_manager.is_conversation_stop = Mock(return_value=False)
+    orch.music_handler.classify = Mock(return_value=IntentConfidence.NONE)
+    orch.music_handler.maybe_handle = AsyncMock(return_value=False)
+    orch.schedule_shortcuts.classify_schedule_shortcut = Mock(return_value=IntentConfidence.POSSIBLE)
+    orch.schedule_shortcuts.maybe_handle_schedule_shortcut = AsyncMock(return_value=False)
+    orch.info_query_handler.classify = Mock(return_value=IntentConfidence.POSSIBLE)
+    orch.info_query_handler.maybe_handle = AsyncMock(return_value=False)
+    orch.actions.describe_for_prompt = Mock(return_value=[])
+    orch._execute_llm_turn = AsyncMock(return_value=LLMResult(response="Sure.", actions=[]))
+    llm = Mock()
+    llm.generate = AsyncMock(return_value=LLMResult(response="Sure.", actions=[]))
+    orch.set_llm_provider_getter(lambda: llm)
+    return orch, llm
+
+
+class TestDispatchTranscript:
+    @pytest.mark.anyio
+    async def test_shortcut_wins_and_llm_is_not_used(self, routed_orchestrator):
+        orch, _ = routed_orchestrator
+        orch.info_query_handler.maybe_handle = AsyncMock(return_value=True)
+        tracker = AssistRunTracker("pulse", "hey_pulse")
+
+        handled_by, llm_result = await orch._dispatch_transcript("how are the tigers", "hey_pulse", tracker)
+
+        assert (handled_by, llm_result) == ("info", None)
+        orch._execute_llm_turn.assert_not_awaited()
+        orch.music_handler.maybe_handle.assert_not_awaited()
+        orch.info_query_handler.maybe_handle.assert_awaited_once_with(
+            "how are the tigers", wake_word="hey_pulse", follow_up=False
+        )
+
+    @pytest.mark.anyio
+    async def test_fallback_passes_speculative_request_to_llm_turn(self, routed_orchestrator):
+        orch, llm = routed_orchestrator
+        tracker = AssistRunTracker("pulse", "hey_pulse")
+
+        handled_by, llm_result = await orch._dispatch_transcript("tell me a joke", "hey_pulse", tracker)
+
+        assert handled_by is None
+        assert llm_result.response == "Sure."
+        pending = orch._execute_llm_turn.await_args.kwargs["pending"]
+        assert pending is not None
+        assert (await pending).response == "Sure."
+        llm.generate.assert_awaited_once()
+
+    @pytest.mark.anyio
+    async def test_confident_shortcut_skips_speculation(self, routed_orchestrator):
+        orch, llm = routed_orchestrator
+        orch.schedule_shortcuts.classify_schedule_shortcut = Mock(return_value=IntentConfidence.LIKELY)
+        tracker = AssistRunTracker("pulse", "hey_pulse")
+
+        await orch._dispatch_transcript("set a timer for pasta", "hey_pulse", tracker)
+
+        assert orch._execute_llm_turn.await_args.kwargs["pending"] is None
+        llm.generate.assert_not_awaited()
+
+    @pytest.mark.anyio
+    async def test_speculation_disabled_by_config(self, routed_orchestrator):
+        orch, llm = routed_orchestrator
+        orch.config.speculative_llm = False
+        tracker = AssistRunTracker("pulse", "hey_pulse")
+
+        await orch._dispatch_transcript("tell me a joke", "hey_pulse", tracker)
+
+        assert orch._execute_llm_turn.await_args.kwargs["pending"] is None
+        llm.generate.assert_not_awaited()
+
+    @pytest.mark.anyio
+    async def test_stop_phrase_reports_stop_route(self, routed_orchestrator):
+        orch, _ = routed_orchestrator
+        orch.conversation_manager.is_conversation_stop = Mock(return_value=True)
+        orch._maybe_handle_stop_phrase = AsyncMock(return_value=True)
+        tracker = AssistRunTracker("pulse", "hey_pulse")
+
+        handled_by, _ = await orch._dispatch_transcript("never mind", "hey_pulse", tracker, follow_up=True)
+
+        assert handled_by == "stop"
+        orch.schedule_shortcuts.maybe_handle_schedule_shortcut.assert_not_awaited()
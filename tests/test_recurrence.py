@@ -0,0 +1,96 @@
+"""Tests for the alarm recurrence engine."""
+
+from __future__ import annotations
+
+import random
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+from pulse.assistant.recurrence import ALL_WEEKDAYS, AlarmRule, iso_ordinals, weekday_mask
+
+MONDAY = datetime(2025, 1, 6, 7, 30, tzinfo=UTC)
+
+
+def _ordinal(value: str) -> int:
+    return date.fromisoformat(value).toordinal()
+
+
+def _brute_force(rule: AlarmRule, after: datetime, n: int, skip: set[int], skip_weekdays: int) -> list[datetime]:
+    if skip_weekdays == ALL_WEEKDAYS:
+        skip_weekdays = 0
+    base = after.replace(hour=rule.hour, minute=rule.minute, second=0, microsecond=0)
+    fires: list[datetime] = []
+    for offset in range(0, 3000):
+        attempt = base + timedelta(days=offset)
+        if attempt <= after or not rule.weekdays >> attempt.weekday() & 1:
+            continue
+        if skip_weekdays >> attempt.weekday() & 1 or attempt.toordinal() in skip:
+            continue
+        fires.append(attempt)
+        if len(fires) == n:
+            break
+    return fires
+
+
+class TestHelpers:
+    def test_weekday_mask_wraps(self):
+        assert weekday_mask([0, 7, 13]) == 0b1000001
+        assert weekday_mask(None) == 0
+
+    def test_iso_ordinals_skips_invalid(self):
+        assert iso_ordinals(["2025-01-06", "garbage", "2025-13-01"]) == {_ordinal("2025-01-06")}
+
+    def test_parse_rejects_bad_time(self):
+        with pytest.raises(ValueError):
+            AlarmRule.parse("not a time", [0])
+
+
+class TestNextFires:
+    def test_one_time_later_today(self):
+        assert AlarmRule(8, 0).next_fires(MONDAY) == [MONDAY.replace(hour=8, minute=0)]
+
+    def test_one_time_past_moves_to_tomorrow_and_ignores_skips(self):
+        fires = AlarmRule(7, 0).next_fires(MONDAY, 3, skip=[{_ordinal("2025-01-07")}])
+        assert fires == [datetime(2025, 1, 7, 7, 0, tzinfo=UTC)]
+
+    def test_weekly_returns_n_in_order(self):
+        fires = AlarmRule(7, 0, weekday_mask([0, 2])).next_fires(MONDAY, 4)
+        assert [fire.date().isoformat() for fire in fires] == ["2025-01-08", "2025-01-13", "2025-01-15", "2025-01-20"]
+
+    def test_skips_dates_and_weekdays(self):
+        rule = AlarmRule(8, 0, weekday_mask(range(7)))
+        fires = rule.next_fires(
+            MONDAY, 3, skip=[{_ordinal("2025-01-06")}, {_ordinal("2025-01-08")}], skip_weekdays=weekday_mask([1])
+        )
+        assert [fire.date().isoformat() for fire in fires] == ["2025-01-09", "2025-01-10", "2025-01-11"]
+
+    def test_all_weekday_skip_is_ignored(self):
+        fires = AlarmRule(8, 0, weekday_mask([0])).next_fires(MONDAY, skip_weekdays=ALL_WEEKDAYS)
+        assert fires == [MONDAY.replace(hour=8, minute=0)]
+
+    def test_unreachable_rule_returns_empty(self):
+        rule = AlarmRule(8, 0, weekday_mask([5, 6]))
+        assert rule.next_fires(MONDAY, skip_weekdays=weekday_mask([5, 6])) == []
+
+    def test_year_of_skips_is_crossed(self):
+        skip = {(MONDAY.date() + timedelta(days=offset)).toordinal() for offset in range(365)}
+        fires = AlarmRule(8, 0, weekday_mask([0])).next_fires(MONDAY, skip=[skip])
+        assert fires[0].date() >= MONDAY.date() + timedelta(days=365)
+        assert fires[0].weekday() == 0
+
+    def test_enable_dates_only_fire_on_repeat_days(self):
+        enable = {_ordinal("2025-01-07"), _ordinal("2025-01-13"), _ordinal("2024-12-30")}
+        fires = AlarmRule(8, 0, weekday_mask([0])).next_fires(MONDAY, 5, enable=enable)
+        assert fires == [datetime(2025, 1, 13, 8, 0, tzinfo=UTC)]
+
+    def test_matches_day_by_day_walk(self):
+        rng = random.Random(1234)
+        for _ in range(300):
+            rule = AlarmRule(rng.randrange(24), rng.randrange(60), rng.randrange(1, 128))
+            after = MONDAY + timedelta(minutes=rng.randrange(60 * 24 * 14))
+            skip = {after.toordinal() + rng.randrange(200) for _ in range(rng.randrange(120))}
+            skip_weekdays = rng.choice([0, 0, rng.randrange(128), ALL_WEEKDAYS])
+            n = rng.randint(1, 12)
+            assert rule.next_fires(after, n, skip=[skip], skip_weekdays=skip_weekdays) == _brute_force(
+                rule, after, n, skip, skip_weekdays
+            )
@@ -1,4 +1,5 @@
 import asyncio
+import json
 import tempfile
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
@@ -54,10 +55,10 @@ class ScheduleServicePauseTests(IsolatedAsyncioTestCase):
 
     async def test_pause_alarm_marks_event_and_unschedules(self) -> None:
         event = await self.service.create_alarm(time_of_day="08:00", label="Alarm", days=[0, 1, 2, 3, 4])
-        self.assertIn(event.event_id, self.service._tasks)
+        self.assertIn(("fire", event.event_id), self.service._deadlines)
         await self.service.pause_alarm(event.event_id)
         self.assertTrue(self.service._events[event.event_id].paused)
-        self.assertNotIn(event.event_id, self.service._tasks)
+        self.assertNotIn(("fire", event.event_id), self.service._deadlines)
         events = self.service.list_events("alarm")
         self.assertEqual(events[0]["status"], "paused")
 
@@ -65,7 +66,7 @@ class ScheduleServicePauseTests(IsolatedAsyncioTestCase):
         event = await self.service.create_alarm(time_of_day="09:00", label="Alarm", days=[0, 1, 2, 3, 4])
         await self.service.pause_alarm(event.event_id)
         await self.service.resume_alarm(event.event_id)
-        self.assertIn(event.event_id, self.service._tasks)
+        self.assertIn(("fire", event.event_id), self.service._deadlines)
         events = self.service.list_events("alarm")
         self.assertEqual(events[0]["status"], "scheduled")
 
@@ -455,7 +456,7 @@ async def test_create_timer(schedule_service):
     assert event.label == "Eggs"
     assert event.duration_seconds == 60.0
     assert event.event_id in svc._events
-    assert event.event_id in svc._tasks
+    assert ("fire", event.event_id) in svc._deadlines
 
 
 @pytest.mark.anyio
@@ -576,34 +577,34 @@ async def test_snooze_nonexistent_alarm(schedule_service):
 
 @pytest.mark.anyio
 async def test_create_alarm_schedules_pre_alarm_task(schedule_service):
-    """Creating an alarm should also schedule a pre-alarm warning task."""
+    """Creating an alarm should also schedule a pre-alarm warning deadline."""
     svc = schedule_service
     event = await svc.create_alarm(time_of_day="08:00", days=[0, 1, 2, 3, 4])
-    assert event.event_id in svc._tasks
-    assert event.event_id in svc._pre_alarm_tasks
+    assert ("fire", event.event_id) in svc._deadlines
+    assert ("pre_alarm", event.event_id) in svc._deadlines
 
 
 @pytest.mark.anyio
 async def test_pause_alarm_cancels_pre_alarm_task(schedule_service):
-    """Pausing an alarm should cancel its pre-alarm warning task."""
+    """Pausing an alarm should cancel its pre-alarm warning deadline."""
     svc = schedule_service
     event = await svc.create_alarm(time_of_day="08:00", days=[0, 1, 2, 3, 4])
-    assert event.event_id in svc._pre_alarm_tasks
+    assert ("pre_alarm", event.event_id) in svc._deadlines
     await svc.pause_alarm(event.event_id)
-    assert event.event_id not in svc._pre_alarm_tasks
+    assert ("pre_alarm", event.event_id) not in svc._deadlines
     await svc.resume_alarm(event.event_id)
-    assert event.event_id in svc._pre_alarm_tasks
+    assert ("pre_alarm", event.event_id) in svc._deadlines
 
 
 @pytest.mark.anyio
 async def test_delete_alarm_cancels_pre_alarm_task(schedule_service):
-    """Deleting an alarm should cancel its pre-alarm warning task."""
+    """Deleting an alarm should cancel its pre-alarm warning deadline."""
     svc = schedule_service
     event = await svc.create_alarm(time_of_day="08:00", days=[0, 1, 2, 3, 4])
-    assert event.event_id in svc._pre_alarm_tasks
+    assert ("pre_alarm", event.event_id) in svc._deadlines
     await svc.delete_event(event.event_id)
-    assert event.event_id not in svc._pre_alarm_tasks
-    assert event.event_id not in svc._tasks
+    assert ("pre_alarm", event.event_id) not in svc._deadlines
+    assert ("fire", event.event_id) not in svc._deadlines
 
 
 @pytest.mark.anyio
@@ -631,8 +632,8 @@ async def test_dismiss_alarm_occurrence_single_shot_deletes(schedule_service):
     result = await svc.dismiss_alarm_occurrence(event.event_id)
     assert result is True
     assert event.event_id not in svc._events
-    assert event.event_id not in svc._tasks
-    assert event.event_id not in svc._pre_alarm_tasks
+    assert ("fire", event.event_id) not in svc._deadlines
+    assert ("pre_alarm", event.event_id) not in svc._deadlines
 
 
 @pytest.mark.anyio
@@ -1395,6 +1396,73 @@ async def test_load_events_skips_expired_timers(tmp_path):
     await svc.stop()
 
 
+@pytest.mark.anyio
+async def test_mutations_append_to_log_without_rewriting_snapshot(tmp_path):
+    storage_path = tmp_path / "schedules.json"
+    svc = ScheduleService(storage_path=storage_path, hostname="pulse-test")
+    await svc.start()
+    alarm = await svc.create_alarm(time_of_day="06:00", label="Log", days=[0, 1, 2, 3, 4])
+    timer = await svc.create_timer(duration_seconds=600, label="Oven")
+    await svc._store.flush()
+    assert not storage_path.exists()
+    log_lines = svc._store.log_path.read_text().splitlines()
+
+    await svc.extend_timer(timer.event_id, 60)
+    await svc._store.flush()
+
+    new_lines = svc._store.log_path.read_text().splitlines()[len(log_lines) :]
+    assert len(new_lines) == 1
+    assert json.loads(new_lines[0])["event"]["event_id"] == timer.event_id
+
+    # Simulate a crash: no clean stop, so nothing is compacted.
+    svc2 = ScheduleService(storage_path=storage_path, hostname="pulse-test")
+    await svc2.start()
+    assert set(svc2._events) == {alarm.event_id, timer.event_id}
+    assert svc2._events[timer.event_id].target_dt() == svc._events[timer.event_id].target_dt()
+    # Startup folds the replayed log into a fresh snapshot.
+    await svc2._store.flush()
+    assert not svc2._store.log_path.exists()
+    assert len(json.loads(storage_path.read_text())["events"]) == 2
+    await svc2.stop()
+    await svc._deadlines.close()
+
+
+@pytest.mark.anyio
+async def test_corrupt_first_log_record_does_not_swallow_later_writes(tmp_path):
+    storage_path = tmp_path / "schedules.json"
+    svc = ScheduleService(storage_path=storage_path, hostname="pulse-test")
+    await svc.start()
+    alarm = await svc.create_alarm(time_of_day="06:00", days=[0])
+    await svc.stop()
+    svc._store.log_path.write_text('{"op":"put","event":{"event_\n')
+
+    svc2 = ScheduleService(storage_path=storage_path, hostname="pulse-test")
+    await svc2.start()
+    timer = await svc2.create_timer(duration_seconds=600, label="Oven")
+    await svc2._store.flush()
+
+    svc3 = ScheduleService(storage_path=storage_path, hostname="pulse-test")
+    await svc3.start()
+    assert set(svc3._events) == {alarm.event_id, timer.event_id}
+    await svc3.stop()
+    await svc2._deadlines.close()
+
+
+@pytest.mark.anyio
+async def test_log_compacts_after_threshold(tmp_path):
+    storage_path = tmp_path / "schedules.json"
+    svc = ScheduleService(storage_path=storage_path, hostname="pulse-test")
+    svc._store._compact_after = 3
+    await svc.start()
+    for minute in range(4):
+        await svc.create_alarm(time_of_day=f"06:0{minute}", days=[0])
+    await svc._store.flush()
+
+    assert len(json.loads(storage_path.read_text())["events"]) == 3
+    assert svc._store.log_records == 1
+    await svc.stop()
+
+
 @pytest.mark.anyio
 async def test_load_events_corrupt_file(tmp_path):
     """Corrupt JSON file should not crash start()."""
@@ -1841,15 +1909,48 @@ async def test_create_reminder_with_interval_repeat(schedule_service):
 
 @pytest.mark.anyio
 async def test_schedule_event_skips_paused(schedule_service):
-    """A paused alarm should not get a task in _tasks."""
+    """A paused alarm should not get a fire deadline."""
     svc = schedule_service
     event = await svc.create_alarm(time_of_day="08:00", label="Pauseable", days=[0, 1, 2, 3, 4])
-    assert event.event_id in svc._tasks
+    assert ("fire", event.event_id) in svc._deadlines
     await svc.pause_alarm(event.event_id)
-    assert event.event_id not in svc._tasks
+    assert ("fire", event.event_id) not in svc._deadlines
     # Resume should re-add it
     await svc.resume_alarm(event.event_id)
-    assert event.event_id in svc._tasks
+    assert ("fire", event.event_id) in svc._deadlines
+
+
+@pytest.mark.anyio
+async def test_skip_date_change_rebuilds_alarm_deadlines(schedule_service):
+    """Rescheduling every alarm should refresh deadlines in one heap rebuild."""
+    svc = schedule_service
+    first = await svc.create_alarm(time_of_day="08:00", days=[0, 1, 2, 3, 4, 5, 6])
+    second = await svc.create_alarm(time_of_day="09:00", days=[0, 1, 2, 3, 4, 5, 6])
+    skip = first.next_fire_dt().date().isoformat()
+
+    await svc.set_manual_skip_dates({skip})
+
+    for event in (first, second):
+        fire_at = svc._events[event.event_id].next_fire_dt()
+        assert fire_at.date().isoformat() != skip
+        assert svc._deadlines.deadline(("fire", event.event_id)) == fire_at
+    assert len(svc._deadlines._heap) == len(svc._deadlines) == 4
+
+
+@pytest.mark.anyio
+async def test_due_timer_activates_from_deadline(schedule_service):
+    svc = schedule_service
+    event = await svc.create_timer(duration_seconds=60, label="Tea")
+    svc._events[event.event_id].set_next_fire(datetime.now().astimezone() - timedelta(seconds=1))
+    svc._reschedule_event(svc._events[event.event_id])
+
+    for _ in range(20):
+        if event.event_id in svc._active:
+            break
+        await asyncio.sleep(0.01)
+
+    assert event.event_id in svc._active
+    assert ("fire", event.event_id) not in svc._deadlines
 
 
 # ---------------------------------------------------------------------------
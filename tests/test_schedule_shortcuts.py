@@ -5,6 +5,7 @@ from __future__ import annotations
 from unittest.mock import AsyncMock, Mock
 
 import pytest
+from pulse.assistant.intent_router import IntentConfidence
 from pulse.assistant.schedule_shortcuts import ScheduleShortcutHandler
 
 
@@ -566,3 +567,41 @@ class TestMaybeHandleScheduleShortcut:
         result = await handler.maybe_handle_schedule_shortcut("cancel all timers")
         assert result is True
         mock_schedule_service.cancel_all_timers.assert_called_once()
+
+
+# =============================================================================
+# Intent classification
+# =============================================================================
+
+
+class TestClassifyScheduleShortcut:
+    @pytest.mark.parametrize(
+        "transcript",
+        [
+            "Set a timer for 5 minutes",
+            "Hey Pulse, cancel my alarm.",
+            "remind me to call mom",
+            "show my calendar",
+            "stop",
+            "add 5 minutes",
+        ],
+    )
+    def test_schedule_commands_are_likely(self, handler, transcript):
+        assert handler.classify_schedule_shortcut(transcript) is IntentConfidence.LIKELY
+
+    @pytest.mark.parametrize("transcript", ["what's the weather", "turn on the kitchen lights", "play some jazz"])
+    def test_other_commands_are_skipped(self, handler, transcript):
+        assert handler.classify_schedule_shortcut(transcript) is IntentConfidence.NONE
+
+    def test_empty_or_unconfigured_is_skipped(self, handler, mock_schedule_intents, mock_publisher, mock_config):
+        assert handler.classify_schedule_shortcut("   ") is IntentConfidence.NONE
+        bare = ScheduleShortcutHandler(
+            schedule_service=None,
+            schedule_intents=mock_schedule_intents,
+            publisher=mock_publisher,
+            config=mock_config,
+        )
+        assert bare.classify_schedule_shortcut("set a timer") is IntentConfidence.NONE
+
+    def test_normalize_command_strips_wake_prefix(self):
+        assert ScheduleShortcutHandler.normalize_command("Hey Jarvis, wake me at 7 a.m.") == "wake me at 7 am"
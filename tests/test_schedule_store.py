@@ -0,0 +1,125 @@
+"""Tests for the schedule snapshot + write-ahead log store."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from pulse.assistant.schedule_store import ScheduleStore
+
+pytestmark = pytest.mark.anyio
+
+
+def _event(event_id: str, label: str = "Alarm") -> dict:
+    return {"event_id": event_id, "event_type": "alarm", "label": label}
+
+
+class TestLoad:
+    def test_missing_files_return_none(self, tmp_path):
+        assert ScheduleStore(tmp_path / "schedules.json").load() is None
+
+    def test_snapshot_only(self, tmp_path):
+        path = tmp_path / "schedules.json"
+        path.write_text(json.dumps({"events": [_event("a")], "paused_dates": ["2026-01-01"]}))
+
+        data = ScheduleStore(path).load()
+
+        assert data == {"events": [_event("a")], "paused_dates": ["2026-01-01"]}
+
+    def test_corrupt_snapshot_raises(self, tmp_path):
+        path = tmp_path / "schedules.json"
+        path.write_text("not json {{{")
+
+        with pytest.raises(json.JSONDecodeError):
+            ScheduleStore(path).load()
+
+
+class TestLog:
+    async def test_mutations_replay_over_snapshot(self, tmp_path):
+        path = tmp_path / "schedules.json"
+        path.write_text(json.dumps({"events": [_event("a"), _event("b")], "paused_dates": []}))
+        store = ScheduleStore(path)
+        store.put_event(_event("a", label="Renamed"))
+        store.delete_event("b")
+        store.put_event(_event("c"))
+        store.put_settings({"paused_dates": ["2026-02-01"]})
+        await store.flush()
+
+        data = ScheduleStore(path).load()
+
+        assert data is not None
+        assert {item["event_id"]: item["label"] for item in data["events"]} == {"a": "Renamed", "c": "Alarm"}
+        assert data["paused_dates"] == ["2026-02-01"]
+        assert json.loads(path.read_text())["events"] == [_event("a"), _event("b")]
+
+    async def test_records_are_single_compact_lines(self, tmp_path):
+        store = ScheduleStore(tmp_path / "schedules.json")
+        store.put_event(_event("a"))
+        store.delete_event("a")
+        await store.flush()
+
+        lines = store.log_path.read_text().splitlines()
+
+        assert len(lines) == 2
+        assert lines[1] == '{"op":"delete","event_id":"a"}'
+
+    async def test_torn_final_record_is_ignored(self, tmp_path):
+        store = ScheduleStore(tmp_path / "schedules.json")
+        store.put_event(_event("a"))
+        await store.flush()
+        with store.log_path.open("a") as handle:
+            handle.write('{"op":"put","event":{"event_')
+
+        reloaded = ScheduleStore(tmp_path / "schedules.json")
+        data = reloaded.load()
+
+        assert data is not None
+        assert [item["event_id"] for item in data["events"]] == ["a"]
+        assert reloaded.log_records == 1
+        assert reloaded.log_corrupt
+        reloaded.write_snapshot(data)
+        assert not reloaded.log_corrupt
+        await reloaded.flush()
+
+
+class TestCompaction:
+    async def test_needs_compaction_after_threshold(self, tmp_path):
+        store = ScheduleStore(tmp_path / "schedules.json", compact_after=3)
+        for idx in range(3):
+            store.put_event(_event(str(idx)))
+
+        assert store.needs_compaction
+        await store.flush()
+
+    async def test_snapshot_truncates_log(self, tmp_path):
+        path = tmp_path / "schedules.json"
+        store = ScheduleStore(path)
+        store.put_event(_event("a"))
+        await store.flush()
+        store.put_event(_event("b"))
+        store.write_snapshot({"events": [_event("a"), _event("b")]})
+        store.put_event(_event("c"))
+        await store.flush()
+
+        assert store.log_records == 1
+        assert len(store.log_path.read_text().splitlines()) == 1
+        data = ScheduleStore(path).load()
+        assert data is not None
+        assert [item["event_id"] for item in data["events"]] == ["a", "b", "c"]
+
+    async def test_replaying_compacted_log_is_harmless(self, tmp_path):
+        path = tmp_path / "schedules.json"
+        store = ScheduleStore(path)
+        store.put_event(_event("a", label="Old"))
+        store.put_event(_event("a", label="New"))
+        await store.flush()
+        stale_log = store.log_path.read_text()
+        store.write_snapshot({"events": [_event("a", label="New")]})
+        await store.flush()
+        # Simulate a crash after the snapshot was replaced but before the log was removed.
+        store.log_path.write_text(stale_log)
+
+        data = ScheduleStore(path).load()
+
+        assert data is not None
+        assert data["events"] == [_event("a", label="New")]
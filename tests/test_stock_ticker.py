@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import json
+import threading
+import time
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
 import httpx
 import pulse.stock_ticker as st
 import pytest
+from websockets.sync.server import serve
 
 
 class _Router:
@@ -28,6 +32,9 @@ class _Router:
         self.finnhub_requests: list[httpx.Request] = []
         self.quote_time = 1_700_000_000  # what Yahoo stamps as regularMarketTime
         self.delayed_by = 0  # Yahoo exchangeDataDelayedBy, in minutes
+        self.chart_delay = 0.0  # seconds of simulated latency per v8 chart request
+        self.chart_failing: set[str] = set()  # Yahoo symbols whose chart request fails
+        self.chart_requests: list[str] = []
 
     def __call__(self, request: httpx.Request) -> httpx.Response:
         # Route on the parsed host/path rather than substring-matching the whole URL.
@@ -73,9 +80,12 @@ class _Router:
             result = [catalog[s] for s in self.quote_symbols if s in catalog]
             return httpx.Response(200, json={"quoteResponse": {"result": result}})
         if path.startswith("/v8/finance/chart/"):
-            if not self.chart_ok:
-                return httpx.Response(500, json={})
             symbol = path.rsplit("/chart/", 1)[1]
+            self.chart_requests.append(symbol)
+            if self.chart_delay:
+                time.sleep(self.chart_delay)
+            if not self.chart_ok or symbol in self.chart_failing:
+                return httpx.Response(500, json={})
             return httpx.Response(
                 200,
                 json={
@@ -109,6 +119,144 @@ def _ticker(symbols=("^SPX", "AAPL"), **kwargs) -> st.StockTicker:
     return st.StockTicker(list(symbols), **kwargs)
 
 
+class _TradeServer:
+    """A local stand-in for Finnhub's trade websocket."""
+
+    def __init__(self) -> None:
+        self.subscribed: list[str] = []
+        self.paths: list[str] = []
+        self._connections: list = []
+        self._server = serve(self._handler, "127.0.0.1", 0)
+        self.url = f"ws://127.0.0.1:{self._server.socket.getsockname()[1]}"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def _handler(self, ws) -> None:  # type: ignore[no-untyped-def]
+        self.paths.append(ws.request.path)
+        self._connections.append(ws)
+        for message in ws:
+            data = json.loads(message)
+            if data.get("type") == "subscribe":
+                self.subscribed.append(data["symbol"])
+
+    def wait_subscribed(self, count: int) -> None:
+        deadline = time.monotonic() + 5
+        while len(self.subscribed) < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(self.subscribed) >= count
+
+    def trade(self, *trades: tuple[str, float, int]) -> None:
+        data = [{"s": symbol, "p": price, "t": stamp * 1000, "v": 10} for symbol, price, stamp in trades]
+        for ws in self._connections:
+            ws.send(json.dumps({"type": "trade", "data": data}))
+
+    def close(self) -> None:
+        self._server.shutdown()
+
+
+@pytest.fixture
+def trade_server(monkeypatch):
+    monkeypatch.setattr(st, "_schedule_phase", lambda now=None: "regular")
+    server = _TradeServer()
+    yield server
+    server.close()
+
+
+class _Updates:
+    def __init__(self) -> None:
+        self.received: list[list[st.TickerQuote]] = []
+        self._event = threading.Event()
+
+    def __call__(self, quotes: list[st.TickerQuote]) -> None:
+        self.received.append(quotes)
+        self._event.set()
+
+    def wait(self) -> list[st.TickerQuote]:
+        assert self._event.wait(5)
+        self._event.clear()
+        return self.received[-1]
+
+
+class TestTradeStream:
+    def _streaming_ticker(self, router, trade_server, updates, **kwargs) -> st.StockTicker:
+        router.finnhub_prices = {"AAPL": {"c": 210.0, "d": 10.0, "dp": 5.0, "t": router.quote_time}}
+        ticker = _ticker(
+            ("^SPX", "AAPL"), api_key="KEY", stream=True, stream_url=trade_server.url, on_update=updates, **kwargs
+        )
+        ticker.fetch()  # polls a baseline and opens the stream
+        trade_server.wait_subscribed(1)
+        return ticker
+
+    def test_trades_fold_into_quotes_and_push_on_visible_change(self, router, trade_server):
+        updates = _Updates()
+        ticker = self._streaming_ticker(router, trade_server, updates)
+        assert trade_server.subscribed == ["AAPL"]  # indices are not on the free stream
+        assert trade_server.paths == ["/?token=KEY"]
+
+        trade_server.trade(("AAPL", 212.0, router.quote_time + 5), ("AAPL", 211.001, router.quote_time + 3))
+        aapl = {q.symbol: q for q in updates.wait()}["AAPL"]
+        assert (aapl.price, aapl.change, aapl.quote_time) == (212.0, 12.0, router.quote_time + 5)
+        assert aapl.change_pct == pytest.approx(6.0)
+
+        # A trade that doesn't move the displayed (two-decimal) values is folded silently.
+        trade_server.trade(("AAPL", 212.001, router.quote_time + 6))
+        trade_server.trade(("AAPL", 213.5, router.quote_time + 7))
+        assert {q.symbol: q for q in updates.wait()}["AAPL"].price == 213.5
+        assert len(updates.received) == 2
+        ticker.close()
+
+    def test_streamed_symbols_skip_polling(self, router, trade_server):
+        updates = _Updates()
+        ticker = self._streaming_ticker(router, trade_server, updates)
+        trade_server.trade(("AAPL", 215.0, router.quote_time + 5))
+        updates.wait()
+        router.finnhub_requests.clear()
+
+        quotes = {q.symbol: q for q in ticker.fetch()}
+
+        assert quotes["AAPL"].price == 215.0
+        assert [req.url.params["symbol"] for req in router.finnhub_requests] == ["^SPX"]
+        ticker.close()
+
+    def test_stream_closes_outside_sessions(self, router, trade_server, monkeypatch):
+        ticker = self._streaming_ticker(router, trade_server, _Updates())
+        assert ticker._trade_stream is not None and ticker._trade_stream.running
+        monkeypatch.setattr(st, "_schedule_phase", lambda now=None: "closed")
+
+        ticker.fetch()
+
+        assert not ticker._trade_stream.running
+        ticker.close()
+
+    def test_post_market_trades_only_move_the_after_hours_price(self, router, trade_server, monkeypatch):
+        updates = _Updates()
+        ticker = self._streaming_ticker(router, trade_server, updates)
+        monkeypatch.setattr(st, "_schedule_phase", lambda now=None: "post")
+
+        trade_server.trade(("AAPL", 208.5, router.quote_time + 5))
+        aapl = {q.symbol: q for q in updates.wait()}["AAPL"]
+
+        assert (aapl.price, aapl.change, aapl.after_hours) == (210.0, 10.0, 208.5)
+        assert aapl.quote_time == router.quote_time
+        ticker.fetch()
+        assert ticker._trade_stream is not None and ticker._trade_stream.running
+        ticker.close()
+
+    @pytest.mark.parametrize(("phase", "afterhours"), [("pre", True), ("post", False)])
+    def test_trades_are_ignored_when_they_cannot_be_shown(self, router, trade_server, monkeypatch, phase, afterhours):
+        updates = _Updates()
+        ticker = self._streaming_ticker(router, trade_server, updates, afterhours=afterhours)
+        monkeypatch.setattr(st, "_schedule_phase", lambda now=None: phase)
+
+        ticker._apply_trades({"AAPL": (250.0, router.quote_time + 5)})
+        ticker.fetch()
+
+        assert updates.received == []
+        assert {q.symbol: q for q in ticker.fetch()}["AAPL"].price == 210.0
+        assert ticker._trade_stream is not None and not ticker._trade_stream.running
+        ticker.close()
+
+
 class TestParseSymbols:
     def test_parses_and_dedupes_and_uppercases(self):
         assert st.parse_symbols("^spx, aapl ; msft,AAPL") == ["^SPX", "AAPL", "MSFT"]
@@ -154,6 +302,45 @@ class TestFetch:
         assert all(q.price == 50.0 and q.market_state == "" for q in quotes)
         ticker.close()
 
+    def test_chart_fallback_fetches_symbols_concurrently(self, router):
+        router.crumb_ok = False
+        router.chart_delay = 0.2
+        elapsed: dict[int, float] = {}
+        for count in (1, st.CHART_WORKERS):
+            ticker = _ticker([f"SYM{idx}" for idx in range(count)])
+            started = time.perf_counter()
+            assert len(ticker.fetch()) == count
+            elapsed[count] = time.perf_counter() - started
+            ticker.close()
+        # Sequential requests would take CHART_WORKERS x the latency.
+        assert elapsed[st.CHART_WORKERS] < elapsed[1] + 2 * router.chart_delay
+
+    def test_chart_fallback_only_refetches_failed_symbols(self, router):
+        router.crumb_ok = False
+        router.chart_failing = {"MSFT"}
+        ticker = _ticker(("AAPL", "MSFT", "^SPX"))
+        assert {q.symbol for q in ticker.fetch()} == {"AAPL", "^SPX"}
+        router.chart_requests.clear()
+        router.chart_failing = set()
+
+        quotes = ticker.fetch()
+
+        assert [q.symbol for q in quotes] == ["AAPL", "MSFT", "^SPX"]
+        assert router.chart_requests == ["MSFT"]
+        ticker.close()
+
+    def test_chart_cache_does_not_outlive_the_poll_interval(self, router):
+        router.crumb_ok = False
+        ticker = _ticker(("AAPL", "MSFT"), poll_interval=15)
+        ticker.fetch()
+        router.chart_requests.clear()
+        ticker._chart_cache = {symbol: (at - 15, quote) for symbol, (at, quote) in ticker._chart_cache.items()}
+
+        ticker.fetch()
+
+        assert sorted(router.chart_requests) == ["AAPL", "MSFT"]
+        ticker.close()
+
     def test_all_providers_fail_returns_last_good_cache(self, router):
         ticker = _ticker()
         first = ticker.fetch()
@@ -0,0 +1,178 @@
+"""Tests for the in-process alarm tone engine."""
+
+from __future__ import annotations
+
+import asyncio
+import wave
+from array import array
+
+import pytest
+from pulse.assistant.tone_engine import Tone, ToneLoop, load_tone, scale_pcm16
+
+pytestmark = pytest.mark.anyio
+
+RATE = 1000
+
+
+def _write_wav(path, samples: list[int], *, width: int = 2, rate: int = RATE) -> None:
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(width)
+        wav_file.setframerate(rate)
+        if width == 2:
+            wav_file.writeframes(array("h", samples).tobytes())
+        else:
+            wav_file.writeframes(bytes(len(samples) * width))
+
+
+def _tone(samples: list[int]) -> Tone:
+    return Tone(frames=array("h", samples).tobytes(), rate=RATE, channels=1)
+
+
+class FakeSink:
+    instances: list[FakeSink] = []
+
+    def __init__(self) -> None:
+        self.started: tuple[int, int, int] | None = None
+        self.chunks: list[bytes] = []
+        self.stopped = False
+        FakeSink.instances.append(self)
+
+    async def prewarm(self, rate: int, width: int, channels: int) -> None:
+        return None
+
+    async def start(self, rate: int, width: int, channels: int) -> None:
+        self.started = (rate, width, channels)
+
+    async def write(self, chunk: bytes) -> None:
+        self.chunks.append(chunk)
+
+    async def stop(self) -> None:
+        self.stopped = True
+
+    @property
+    def samples(self) -> array:
+        data = array("h")
+        data.frombytes(b"".join(self.chunks))
+        return data
+
+
+@pytest.fixture(autouse=True)
+def _reset_sinks():
+    FakeSink.instances = []
+    yield
+
+
+def _loop(tone: Tone, **kwargs) -> ToneLoop:
+    kwargs.setdefault("lead_seconds", 1000.0)  # never pace in tests
+    return ToneLoop(tone, sink_factory=FakeSink, **kwargs)
+
+
+class TestLoadTone:
+    def test_decodes_and_caches(self, tmp_path):
+        path = tmp_path / "beep.wav"
+        _write_wav(path, [1, 2, 3])
+
+        tone = load_tone(path)
+
+        assert (tone.rate, tone.channels, tone.frame_count) == (RATE, 1, 3)
+        assert load_tone(path) is tone
+
+    def test_rejects_non_16_bit(self, tmp_path):
+        path = tmp_path / "beep.wav"
+        _write_wav(path, [0, 0], width=1)
+
+        with pytest.raises(ValueError):
+            load_tone(path)
+
+    def test_rejects_non_wav(self, tmp_path):
+        path = tmp_path / "beep.ogg"
+        path.write_bytes(b"OggS not a wav")
+
+        with pytest.raises(wave.Error):
+            load_tone(path)
+
+
+def test_scale_pcm16():
+    frames = array("h", [1000, -1000, 32767]).tobytes()
+
+    scaled = array("h")
+    scaled.frombytes(scale_pcm16(frames, 0.5))
+
+    assert list(scaled) == [500, -500, 16383]
+    assert scale_pcm16(frames, 1.0) is frames
+
+
+class TestToneLoop:
+    async def test_streams_tone_and_gap_through_one_sink(self):
+        tone_loop = _loop(_tone([100] * 100), gap_seconds=0.1, duration=0.6)
+
+        await tone_loop.run(asyncio.Event(), _set_event())
+
+        assert len(FakeSink.instances) == 1
+        sink = FakeSink.instances[0]
+        assert sink.started == (RATE, 2, 1)
+        assert sink.stopped
+        samples = sink.samples
+        assert len(samples) == 600
+        # Beeps start exactly every 200 samples.
+        assert [idx for idx in range(len(samples)) if samples[idx] and (idx == 0 or not samples[idx - 1])] == [
+            0,
+            200,
+            400,
+        ]
+
+    async def test_gain_ramps_per_beep(self):
+        tone_loop = _loop(_tone([1000] * 100), gap_seconds=0.1, duration=0.6, start_gain=0.5, ramp_seconds=0.4)
+
+        await tone_loop.run(asyncio.Event(), _set_event())
+
+        samples = FakeSink.instances[0].samples
+        assert [samples[0], samples[200], samples[400]] == [500, 750, 1000]
+        assert tone_loop.gain_at(10_000) == 1.0
+
+    async def test_stop_ends_playback(self):
+        stop = asyncio.Event()
+        stop.set()
+
+        await _loop(_tone([1] * 10)).run(stop, _set_event())
+
+        assert FakeSink.instances == []
+
+    async def test_pause_closes_sink_and_resume_reopens(self):
+        stop = asyncio.Event()
+        resumed = _set_event()
+        tone_loop = _loop(_tone([1] * 100), gap_seconds=0.1, duration=0.6, chunk_seconds=0.05)
+
+        class PausingSink(FakeSink):
+            async def write(self, chunk: bytes) -> None:
+                await super().write(chunk)
+                if len(FakeSink.instances) == 1 and len(self.chunks) == 2:
+                    resumed.clear()
+                    asyncio.get_running_loop().call_soon(resumed.set)
+
+        tone_loop._sink_factory = PausingSink
+        await tone_loop.run(stop, resumed)
+
+        assert len(FakeSink.instances) == 2
+        assert FakeSink.instances[0].stopped
+        assert sum(len(sink.samples) for sink in FakeSink.instances) == 600
+
+    async def test_sink_failure_is_logged_not_raised(self, caplog):
+        class BrokenSink(FakeSink):
+            async def write(self, chunk: bytes) -> None:
+                raise RuntimeError("Playback process exited unexpectedly")
+
+        tone_loop = _loop(_tone([1] * 10))
+        tone_loop._sink_factory = BrokenSink
+
+        await tone_loop.run(asyncio.Event(), _set_event())
+
+        assert "Tone playback stopped" in caplog.text
+        assert FakeSink.instances[0].stopped
+
+
+def _set_event() -> asyncio.Event:
+    event = asyncio.Event()
+    event.set()
+    return event
@@ -0,0 +1,140 @@
+"""Tests for the disk-backed TTS audio cache."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import pytest
+from pulse.assistant.config import WyomingEndpoint
+from pulse.assistant.tts_cache import TtsCache
+from pulse.assistant.wyoming import SynthesizedAudio
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def endpoint():
+    return WyomingEndpoint(host="piper.local", port=10200)
+
+
+def _audio(size: int = 64, fill: bytes = b"\x01") -> SynthesizedAudio:
+    return SynthesizedAudio(rate=22050, width=2, channels=1, audio=fill * size)
+
+
+class TestCacheKey:
+    def test_whitespace_is_normalized(self, endpoint):
+        assert TtsCache.cache_key("Alarm  cancelled.", endpoint, None) == TtsCache.cache_key(
+            " Alarm cancelled. ", endpoint, None
+        )
+
+    def test_voice_changes_key(self, endpoint):
+        assert TtsCache.cache_key("Hi", endpoint, "amy") != TtsCache.cache_key("Hi", endpoint, "ryan")
+
+    def test_endpoint_changes_key(self, endpoint):
+        other = WyomingEndpoint(host="piper.local", port=10201)
+        assert TtsCache.cache_key("Hi", endpoint, None) != TtsCache.cache_key("Hi", other, None)
+
+
+class TestAccepts:
+    def test_short_text_accepted(self, tmp_path):
+        cache = TtsCache(tmp_path, max_bytes=1024)
+        assert cache.accepts("Timer cancelled.")
+
+    def test_long_text_rejected(self, tmp_path):
+        cache = TtsCache(tmp_path, max_bytes=1024, max_text_chars=10)
+        assert not cache.accepts("This response is much too long to cache.")
+
+    def test_empty_text_rejected(self, tmp_path):
+        cache = TtsCache(tmp_path, max_bytes=1024)
+        assert not cache.accepts("   ")
+
+    def test_zero_budget_disables(self, tmp_path):
+        cache = TtsCache(tmp_path, max_bytes=0)
+        assert not cache.accepts("Okay.")
+
+
+class TestGetPut:
+    async def test_round_trip(self, tmp_path, endpoint):
+        cache = TtsCache(tmp_path, max_bytes=4096)
+        await cache.put("Okay, no problem.", endpoint, None, _audio())
+
+        cached = await cache.get("Okay, no problem.", endpoint, None)
+
+        assert cached == _audio()
+        assert cache.contains("Okay, no problem.", endpoint, None)
+
+    async def test_miss_returns_none(self, tmp_path, endpoint):
+        cache = TtsCache(tmp_path, max_bytes=4096)
+        assert await cache.get("Never spoken.", endpoint, None) is None
+
+    async def test_persists_across_instances(self, tmp_path, endpoint):
+        await TtsCache(tmp_path, max_bytes=4096).put("Alarm cancelled.", endpoint, None, _audio())
+
+        reloaded = TtsCache(tmp_path, max_bytes=4096)
+
+        assert len(reloaded) == 1
+        assert await reloaded.get("Alarm cancelled.", endpoint, None) == _audio()
+
+    async def test_corrupt_entry_is_dropped(self, tmp_path, endpoint):
+        cache = TtsCache(tmp_path, max_bytes=4096)
+        await cache.put("Alarm cancelled.", endpoint, None, _audio())
+        key = TtsCache.cache_key("Alarm cancelled.", endpoint, None)
+        (tmp_path / f"{key}.pcm").write_bytes(b"garbage-without-header")
+
+        assert await cache.get("Alarm cancelled.", endpoint, None) is None
+        assert len(cache) == 0
+        assert not (tmp_path / f"{key}.pcm").exists()
+
+    async def test_oversized_entry_not_stored(self, tmp_path, endpoint):
+        cache = TtsCache(tmp_path, max_bytes=32)
+        await cache.put("Okay.", endpoint, None, _audio(size=128))
+        assert len(cache) == 0
+
+
+class TestEviction:
+    async def test_least_recently_used_evicted(self, tmp_path, endpoint):
+        # Each entry is 64 bytes of audio + 12 byte header = 76 bytes.
+        cache = TtsCache(tmp_path, max_bytes=160)
+        await cache.put("one", endpoint, None, _audio())
+        await cache.put("two", endpoint, None, _audio())
+        await cache.get("one", endpoint, None)  # "two" becomes least recently used
+        await cache.put("three", endpoint, None, _audio())
+
+        assert cache.contains("one", endpoint, None)
+        assert not cache.contains("two", endpoint, None)
+        assert cache.contains("three", endpoint, None)
+        assert cache.total_bytes <= 160
+        assert len(list(tmp_path.glob("*.pcm"))) == 2
+
+    async def test_load_trims_to_budget(self, tmp_path, endpoint):
+        big = TtsCache(tmp_path, max_bytes=4096)
+        for phrase in ("one", "two", "three"):
+            await big.put(phrase, endpoint, None, _audio())
+
+        small = TtsCache(tmp_path, max_bytes=100)
+
+        assert len(small) == 1
+        assert small.total_bytes <= 100
+
+
+class TestWarm:
+    async def test_synthesizes_only_missing_phrases(self, tmp_path, endpoint):
+        cache = TtsCache(tmp_path, max_bytes=4096)
+        await cache.put("Okay.", endpoint, None, _audio())
+        synthesize = AsyncMock(return_value=_audio())
+
+        added = await cache.warm(["Okay.", "Timer cancelled."], endpoint, None, synthesize)
+
+        assert added == 1
+        synthesize.assert_awaited_once_with("Timer cancelled.")
+        assert cache.contains("Timer cancelled.", endpoint, None)
+
+    async def test_synthesis_failure_is_skipped(self, tmp_path, endpoint):
+        cache = TtsCache(tmp_path, max_bytes=4096)
+        synthesize = AsyncMock(side_effect=[ConnectionRefusedError("down"), _audio()])
+
+        added = await cache.warm(["first", "second"], endpoint, None, synthesize)
+
+        assert added == 1
+        assert not cache.contains("first", endpoint, None)
+        assert cache.contains("second", endpoint, None)
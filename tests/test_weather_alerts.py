@@ -47,12 +47,18 @@ class _Feed:
         self.features: list[dict] = []
         self.status = 200
         self.requests: list[httpx.Request] = []
+        self.validators: dict[str, str] = {}
 
     def __call__(self, request: httpx.Request) -> httpx.Response:
         self.requests.append(request)
         if self.status != 200:
             return httpx.Response(self.status, json={})
-        return httpx.Response(200, json={"type": "FeatureCollection", "features": self.features})
+        etag = self.validators.get("etag")
+        if etag and request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers=self.validators)
+        return httpx.Response(
+            200, json={"type": "FeatureCollection", "features": self.features}, headers=self.validators
+        )
 
 
 @pytest.fixture
@@ -281,6 +287,82 @@ def test_malformed_features_are_skipped_not_fatal(feed):
     assert [alert.id for alert in _client().fetch()] == ["a"]
 
 
+# -- conditional polling ------------------------------------------------------
+
+
+def test_not_modified_reuses_the_previous_result(feed):
+    feed.validators = {"etag": '"v1"', "last-modified": "Wed, 01 Jan 2025 00:00:00 GMT"}
+    feed.features = [_feature("a", "Tornado Warning", severity="Extreme")]
+    client = _client()
+    first = client.fetch()
+
+    feed.features = []  # would clear the pill if it were re-parsed
+    second = client.fetch()
+
+    assert second == first and second[0] is first[0]
+    assert feed.requests[1].headers["if-none-match"] == '"v1"'
+    assert feed.requests[1].headers["if-modified-since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+    assert "if-none-match" not in feed.requests[0].headers
+
+
+def test_not_modified_still_drops_expired_alerts(feed):
+    feed.validators = {"etag": '"v1"'}
+    feed.features = [_feature("a", "Tornado Warning", severity="Extreme", expires_in=-1)]
+    client = _client()
+    assert len(client.fetch()) == 1
+    assert client.fetch() == []
+
+
+def test_not_modified_keeps_alerts_without_an_expiry(feed):
+    open_ended = _feature("a", "Tornado Warning", severity="Extreme")
+    open_ended["properties"]["expires"] = None
+    feed.validators = {"etag": '"v1"'}
+    feed.features = [open_ended]
+    client = _client()
+    assert len(client.fetch()) == 1
+
+    assert [alert.id for alert in client.fetch()] == ["a"]
+    assert feed.requests[1].headers["if-none-match"] == '"v1"'
+    feed.status = 500
+    assert client.fetch() == []  # a failed poll can't vouch for it
+
+
+def test_alert_without_an_expiry_returns_after_a_failed_poll(feed):
+    open_ended = _feature("a", "Tornado Warning", severity="Extreme")
+    open_ended["properties"]["expires"] = None
+    feed.validators = {"etag": '"v1"'}
+    feed.features = [open_ended]
+    client = _client()
+    assert len(client.fetch()) == 1
+    feed.status = 500
+    assert client.fetch() == []
+    feed.status = 200
+
+    assert [alert.id for alert in client.fetch()] == ["a"]
+    assert "if-none-match" not in feed.requests[-1].headers
+
+
+def test_identical_body_without_validators_is_not_reparsed(feed, monkeypatch):
+    feed.features = [_feature("a", "Tornado Warning", severity="Extreme")]
+    client = _client()
+    first = client.fetch()
+    monkeypatch.setattr(client, "_build_alert", lambda *a, **k: pytest.fail("unchanged feed was re-parsed"))
+
+    assert client.fetch()[0] is first[0]
+
+
+def test_changed_feed_is_parsed_again(feed):
+    feed.validators = {"etag": '"v1"'}
+    feed.features = [_feature("a", "Tornado Warning", severity="Extreme")]
+    client = _client()
+    client.fetch()
+
+    feed.validators = {"etag": '"v2"'}
+    feed.features = [_feature("b", "Flood Warning")]
+
+    assert [alert.id for alert in client.fetch()] == ["b"]
+
+
 # -- banner window ------------------------------------------------------------
 
 
@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 from contextlib import asynccontextmanager
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from pulse.assistant.config import MicConfig, WyomingEndpoint
 from pulse.assistant.wyoming import (
+    WyomingClientPool,
+    play_tts_pipelined,
     play_tts_stream,
     probe_synthesize,
     probe_wake_detection,
     silence_bytes,
+    split_sentences,
+    synthesize_audio,
     transcribe_audio,
 )
 from wyoming.asr import Transcript
@@ -271,6 +276,28 @@ class TestPlayTtsStream:
         mock_sink.write.assert_awaited_once_with(audio_bytes)
         mock_sink.stop.assert_awaited_once()
 
+    async def test_inference_timing_excludes_playback(self, endpoint, mock_sink, patch_tcp_client):
+        _, client = patch_tcp_client
+        client.read_event = AsyncMock(
+            side_effect=[
+                AudioStart(rate=16000, width=2, channels=1).event(),
+                AudioChunk(rate=16000, width=2, channels=1, audio=b"\x00" * 960).event(),
+                AudioChunk(rate=16000, width=2, channels=1, audio=b"\x00" * 960).event(),
+                AudioStop().event(),
+            ]
+        )
+
+        async def slow_write(chunk: bytes) -> None:
+            await asyncio.sleep(0.15)
+
+        mock_sink.write = AsyncMock(side_effect=slow_write)
+        metrics: dict[str, int] = {}
+
+        await play_tts_stream("hello", endpoint=endpoint, sink=mock_sink, timeout=5.0, metrics=metrics)
+
+        assert mock_sink.write.await_count == 2
+        assert metrics["inference_ms"] < 100
+
     async def test_with_audio_guard(self, endpoint, mock_sink, patch_tcp_client):
         _, client = patch_tcp_client
         client.read_event = AsyncMock(
@@ -358,6 +385,160 @@ class TestPlayTtsStream:
         event = first_write[0][0]
         assert "en_US-amy-medium" in str(event.data)
 
+    async def test_capture_returns_streamed_audio(self, endpoint, mock_sink, patch_tcp_client):
+        _, client = patch_tcp_client
+        client.read_event = AsyncMock(
+            side_effect=[
+                AudioStart(rate=22050, width=2, channels=1).event(),
+                AudioChunk(rate=22050, width=2, channels=1, audio=b"\x01" * 4).event(),
+                AudioChunk(rate=22050, width=2, channels=1, audio=b"\x02" * 4).event(),
+                AudioStop().event(),
+            ]
+        )
+
+        audio = await play_tts_stream("hello", endpoint=endpoint, sink=mock_sink, timeout=5.0, capture=True)
+
+        assert audio is not None
+        assert (audio.rate, audio.width, audio.channels) == (22050, 2, 1)
+        assert audio.audio == b"\x01" * 4 + b"\x02" * 4
+        assert mock_sink.write.await_count == 2
+
+    async def test_no_capture_returns_none(self, endpoint, mock_sink, patch_tcp_client):
+        _, client = patch_tcp_client
+        client.read_event = AsyncMock(
+            side_effect=[
+                AudioStart(rate=22050, width=2, channels=1).event(),
+                AudioChunk(rate=22050, width=2, channels=1, audio=b"\x01" * 4).event(),
+                AudioStop().event(),
+            ]
+        )
+
+        assert await play_tts_stream("hello", endpoint=endpoint, sink=mock_sink, timeout=5.0) is None
+
+
+# ============================================================================
+# split_sentences / play_tts_pipelined
+# ============================================================================
+
+
+class TestSplitSentences:
+    def test_splits_on_terminal_punctuation(self):
+        text = "The first headline is about rain. The second headline is about snow! Is a third one coming?"
+        assert split_sentences(text) == [
+            "The first headline is about rain.",
+            "The second headline is about snow!",
+            "Is a third one coming?",
+        ]
+
+    def test_short_fragments_merge_forward(self):
+        assert split_sentences("Okay. Starting a timer for five minutes now.") == [
+            "Okay. Starting a timer for five minutes now."
+        ]
+
+    def test_abbreviations_do_not_split(self):
+        text = "The forecast was issued by Dr. Smith this morning. Expect rain later today."
+        assert split_sentences(text, min_chars=1) == [
+            "The forecast was issued by Dr. Smith this morning.",
+            "Expect rain later today.",
+        ]
+
+    def test_decimals_do_not_split(self):
+        assert split_sentences("The stock rose 3.5 percent today.") == ["The stock rose 3.5 percent today."]
+
+    def test_empty_text(self):
+        assert split_sentences("   ") == []
+
+
+def _fake_tts_stream(delays: dict[str, float], started: list[str]):
+    async def _stream(text, *, endpoint, voice_name=None, timeout=None, **_kwargs):
+        started.append(text)
+        yield AudioStart(rate=22050, width=2, channels=1).event()
+        await asyncio.sleep(delays.get(text, 0))
+        yield AudioChunk(rate=22050, width=2, channels=1, audio=text.encode()).event()
+        yield AudioStop().event()
+
+    return _stream
+
+
+class TestPlayTtsPipelined:
+    SENTENCES = [
+        "The first headline is about rain.",
+        "The second headline is about snow.",
+        "The third headline is about wind.",
+    ]
+
+    async def test_single_sink_session_in_order(self, endpoint, mock_sink):
+        started: list[str] = []
+        with patch("pulse.assistant.wyoming._tts_event_stream", new=_fake_tts_stream({}, started)):
+            await play_tts_pipelined(" ".join(self.SENTENCES), endpoint=endpoint, sink=mock_sink)
+
+        mock_sink.start.assert_awaited_once_with(22050, 2, 1)
+        mock_sink.stop.assert_awaited_once()
+        written = [call.args[0].decode() for call in mock_sink.write.await_args_list]
+        assert written == self.SENTENCES
+
+    async def test_next_sentence_synthesized_while_current_plays(self, endpoint, mock_sink):
+        started: list[str] = []
+        delays = {self.SENTENCES[0]: 0.05}
+        with patch("pulse.assistant.wyoming._tts_event_stream", new=_fake_tts_stream(delays, started)):
+            task = asyncio.create_task(play_tts_pipelined(" ".join(self.SENTENCES), endpoint=endpoint, sink=mock_sink))
+            await asyncio.sleep(0.01)
+            # Sentence two started on its own connection before sentence one finished;
+            # sentence three waits for the lookahead slot.
+            assert started == self.SENTENCES[:2]
+            await task
+
+        assert started == self.SENTENCES
+
+    async def test_single_sentence_falls_back_to_stream(self, endpoint, mock_sink):
+        with patch("pulse.assistant.wyoming.play_tts_stream", new=AsyncMock()) as stream:
+            await play_tts_pipelined("Just one sentence here.", endpoint=endpoint, sink=mock_sink)
+        stream.assert_awaited_once()
+
+    async def test_synthesis_error_stops_sink_and_raises(self, endpoint, mock_sink):
+        async def _stream(text, *, endpoint, voice_name=None, timeout=None, **_kwargs):
+            if text == self.SENTENCES[1]:
+                raise ConnectionResetError("piper went away")
+            yield AudioStart(rate=22050, width=2, channels=1).event()
+            yield AudioChunk(rate=22050, width=2, channels=1, audio=b"\x00").event()
+            yield AudioStop().event()
+
+        with patch("pulse.assistant.wyoming._tts_event_stream", new=_stream):
+            with pytest.raises(ConnectionResetError):
+                await play_tts_pipelined(" ".join(self.SENTENCES), endpoint=endpoint, sink=mock_sink)
+
+        mock_sink.stop.assert_awaited_once()
+
+
+# ============================================================================
+# synthesize_audio
+# ============================================================================
+
+
+class TestSynthesizeAudio:
+    async def test_collects_audio_without_sink(self, endpoint, patch_tcp_client):
+        _, client = patch_tcp_client
+        client.read_event = AsyncMock(
+            side_effect=[
+                AudioStart(rate=16000, width=2, channels=1).event(),
+                AudioChunk(rate=16000, width=2, channels=1, audio=b"\x00" * 8).event(),
+                AudioStop().event(),
+            ]
+        )
+
+        audio = await synthesize_audio("hello", endpoint=endpoint, timeout=5.0)
+
+        assert audio is not None
+        assert audio.rate == 16000
+        assert len(audio.audio) == 8
+        client.disconnect.assert_awaited_once()
+
+    async def test_returns_none_without_audio(self, endpoint, patch_tcp_client):
+        _, client = patch_tcp_client
+        client.read_event = AsyncMock(return_value=None)
+
+        assert await synthesize_audio("hello", endpoint=endpoint, timeout=5.0) is None
+
 
 # ============================================================================
 # probe_synthesize
@@ -542,3 +723,141 @@ class TestProbeWakeDetection:
             )
 
         client.disconnect.assert_awaited_once()
+
+
+# ============================================================================
+# WyomingClientPool
+# ============================================================================
+
+
+def _pooled_client(*, alive: bool = True):
+    """Mock AsyncTcpClient whose stream state reports it as open (or closed)."""
+    client = AsyncMock()
+    client._reader = MagicMock()
+    client._reader.at_eof.return_value = not alive
+    client._writer = MagicMock()
+    client._writer.is_closing.return_value = not alive
+    return client
+
+
+def _transcript_events(text: str):
+    return [Transcript(text=text).event()]
+
+
+class TestWyomingClientPool:
+    async def test_connection_reused_across_requests(self, endpoint, mic):
+        client = _pooled_client()
+        client.read_event = AsyncMock(side_effect=_transcript_events("one") + _transcript_events("two"))
+        pool = WyomingClientPool()
+        with patch("pulse.assistant.wyoming.AsyncTcpClient", return_value=client) as ctor:
+            first = await transcribe_audio(b"\x00" * 960, endpoint=endpoint, mic=mic, pool=pool)
+            second = await transcribe_audio(b"\x00" * 960, endpoint=endpoint, mic=mic, pool=pool)
+
+        assert (first, second) == ("one", "two")
+        ctor.assert_called_once()
+        client.connect.assert_awaited_once()
+        client.disconnect.assert_not_awaited()
+        assert pool.idle_count(endpoint) == 1
+
+    async def test_stale_connection_retried_on_fresh_socket(self, endpoint, mic):
+        stale = _pooled_client()
+        stale.read_event = AsyncMock(return_value=None)
+        fresh = _pooled_client()
+        fresh.read_event = AsyncMock(side_effect=_transcript_events("hello"))
+        pool = WyomingClientPool()
+        with patch("pulse.assistant.wyoming.AsyncTcpClient", side_effect=[stale, fresh]):
+            await pool.prewarm(endpoint)
+            result = await transcribe_audio(b"\x00" * 960, endpoint=endpoint, mic=mic, pool=pool)
+
+        assert result == "hello"
+        stale.disconnect.assert_awaited_once()
+        fresh.connect.assert_awaited_once()
+
+    async def test_dead_idle_connection_replaced(self, endpoint, mic):
+        dead = _pooled_client()
+        fresh = _pooled_client()
+        fresh.read_event = AsyncMock(side_effect=_transcript_events("hi"))
+        pool = WyomingClientPool()
+        with patch("pulse.assistant.wyoming.AsyncTcpClient", side_effect=[dead, fresh]):
+            await pool.prewarm(endpoint)
+            dead._writer.is_closing.return_value = True
+            result = await transcribe_audio(b"\x00" * 960, endpoint=endpoint, mic=mic, pool=pool)
+
+        assert result == "hi"
+        dead.write_event.assert_not_awaited()
+        dead.disconnect.assert_awaited_once()
+
+    async def test_expired_idle_connection_not_reused(self, endpoint, mic):
+        old = _pooled_client()
+        fresh = _pooled_client()
+        fresh.read_event = AsyncMock(side_effect=_transcript_events("hi"))
+        pool = WyomingClientPool(idle_timeout=0.0)
+        with patch("pulse.assistant.wyoming.AsyncTcpClient", side_effect=[old, fresh]):
+            await pool.prewarm(endpoint)
+            await asyncio.sleep(0.01)
+            await transcribe_audio(b"\x00" * 960, endpoint=endpoint, mic=mic, pool=pool)
+
+        old.disconnect.assert_awaited_once()
+        fresh.connect.assert_awaited_once()
+
+    async def test_failed_request_not_returned_to_pool(self, endpoint, mic):
+        client = _pooled_client()
+        client.read_event = AsyncMock(side_effect=TimeoutError())
+        pool = WyomingClientPool()
+        with patch("pulse.assistant.wyoming.AsyncTcpClient", return_value=client):
+            with pytest.raises(TimeoutError):
+                await transcribe_audio(b"\x00" * 960, endpoint=endpoint, mic=mic, pool=pool)
+
+        client.disconnect.assert_awaited_once()
+        assert pool.idle_count(endpoint) == 0
+
+    async def test_prewarm_skips_when_idle_connection_healthy(self, endpoint):
+        pool = WyomingClientPool()
+        with patch("pulse.assistant.wyoming.AsyncTcpClient", return_value=_pooled_client()) as ctor:
+            assert await pool.prewarm(endpoint) is True
+            assert await pool.prewarm(endpoint) is False
+        ctor.assert_called_once()
+
+    async def test_prewarm_failure_is_swallowed(self, endpoint):
+        client = _pooled_client()
+        client.connect = AsyncMock(side_effect=ConnectionRefusedError("down"))
+        pool = WyomingClientPool()
+        with patch("pulse.assistant.wyoming.AsyncTcpClient", return_value=client):
+            assert await pool.prewarm(endpoint) is False
+        assert pool.idle_count(endpoint) == 0
+
+    async def test_tts_stream_reuses_connection(self, endpoint, mock_sink):
+        client = _pooled_client()
+        events = [
+            AudioStart(rate=22050, width=2, channels=1).event(),
+            AudioChunk(rate=22050, width=2, channels=1, audio=b"\x01\x02").event(),
+            AudioStop().event(),
+        ]
+        client.read_event = AsyncMock(side_effect=events * 2)
+        pool = WyomingClientPool()
+        with patch("pulse.assistant.wyoming.AsyncTcpClient", return_value=client) as ctor:
+            await play_tts_stream("One.", endpoint=endpoint, sink=mock_sink, pool=pool)
+            await play_tts_stream("Two.", endpoint=endpoint, sink=mock_sink, pool=pool)
+
+        ctor.assert_called_once()
+        assert mock_sink.write.await_count == 2
+        assert pool.idle_count(endpoint) == 1
+
+    async def test_metrics_split_connect_and_inference(self, endpoint, mic):
+        client = _pooled_client()
+        client.read_event = AsyncMock(side_effect=_transcript_events("hi"))
+        metrics: dict[str, int] = {}
+        with patch("pulse.assistant.wyoming.AsyncTcpClient", return_value=client):
+            await transcribe_audio(b"\x00" * 960, endpoint=endpoint, mic=mic, metrics=metrics)
+
+        assert set(metrics) == {"connect_ms", "inference_ms"}
+
+    async def test_close_disconnects_idle_clients(self, endpoint):
+        client = _pooled_client()
+        pool = WyomingClientPool()
+        with patch("pulse.assistant.wyoming.AsyncTcpClient", return_value=client):
+            await pool.prewarm(endpoint)
+        await pool.close()
+
+        client.disconnect.assert_awaited_once()
+        assert pool.idle_count(endpoint) == 0